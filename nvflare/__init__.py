@@ -16,8 +16,23 @@ from . import _version
 
 __version__ = _version.get_versions()["version"]
 
-# https://github.com/microsoft/pylance-release/issues/856
+from typing import TYPE_CHECKING
 
-from nvflare.job_config.api import FedJob
-from nvflare.job_config.defs import FilterType
-from nvflare.private.fed.app.simulator.simulator_runner import SimulatorRunner
+from nvflare.fuel.utils.import_utils import lazy_attributes
+
+# The job config and simulator stacks are imported on first access, so that "import nvflare.client" in a
+# trainer script or a job process doesn't pay for them.
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "FedJob": "nvflare.job_config.api",
+        "FilterType": "nvflare.job_config.defs",
+        "SimulatorRunner": "nvflare.private.fed.app.simulator.simulator_runner",
+    },
+)
+
+if TYPE_CHECKING:
+    # https://github.com/microsoft/pylance-release/issues/856
+    from nvflare.job_config.api import FedJob
+    from nvflare.job_config.defs import FilterType
+    from nvflare.private.fed.app.simulator.simulator_runner import SimulatorRunner
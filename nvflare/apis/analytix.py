@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from enum import Enum
+from typing import List
 
 from nvflare.apis.dxo import DXO, DataKind
 
@@ -53,6 +54,8 @@ class TrackConst(object):
     SITE_KEY = "site"
     JOB_ID_KEY = "job_id"
 
+    BATCH_SIZE_KEY = "analytics_batch_size"
+
 
 class AnalyticsDataType(Enum):
     SCALARS = "SCALARS"
@@ -226,3 +229,108 @@ class AnalyticsData:
 
     def __str__(self) -> str:
         return f"AnalyticsData(tag: {self.tag}, value: {self.value}, data_type: {self.data_type}, kwargs: {self.kwargs}, step: {self.step})"
+
+
+class AnalyticsBatch:
+    def __init__(self, sender: LogWriterName = LogWriterName.TORCH_TB):
+        """A batch of analytics records from one sender, to be sent in one message.
+
+        The records are kept in columns (tags, values, data types, steps and kwargs), so the DXO of a batch of
+        scalars is a few lists instead of one DXO per record.
+
+        Args:
+            sender (LogWriterName): Type of sender for syntax such as Tensorboard or MLflow
+        """
+        self.sender = sender
+        self.tags = []
+        self.values = []
+        self.data_types = []
+        self.steps = []
+        self.kwargs = []
+
+    def __len__(self):
+        return len(self.tags)
+
+    def add(self, data: AnalyticsData):
+        """Adds a record to the batch."""
+        kwargs = {k: v for k, v in data.kwargs.items() if k != TrackConst.GLOBAL_STEP_KEY}
+        self._append(data.tag, data.value, data.data_type, data.step, kwargs)
+
+    def add_dxo(self, dxo: DXO):
+        """Adds the record of an analytic DXO (created with AnalyticsData.to_dxo) to the batch."""
+        data = dxo.data
+        kwargs = {k: v for k, v in data.get(TrackConst.KWARGS_KEY, {}).items() if k != TrackConst.GLOBAL_STEP_KEY}
+        self._append(
+            data[TrackConst.TRACK_KEY],
+            data[TrackConst.TRACK_VALUE],
+            dxo.get_meta_prop(TrackConst.DATA_TYPE_KEY),
+            data.get(TrackConst.GLOBAL_STEP_KEY, None),
+            kwargs,
+        )
+
+    def _append(self, tag: str, value, data_type: AnalyticsDataType, step, kwargs: dict):
+        self.tags.append(tag)
+        self.values.append(value)
+        self.data_types.append(data_type.value)
+        self.steps.append(step)
+        self.kwargs.append(kwargs if kwargs else None)
+
+    def to_dxo(self) -> DXO:
+        """Converts the batch to a DXO object.
+
+        Returns:
+            DXO object
+        """
+        data = {
+            TrackConst.TRACK_KEY: self.tags,
+            TrackConst.TRACK_VALUE: self.values,
+            TrackConst.DATA_TYPE_KEY: self.data_types,
+            TrackConst.GLOBAL_STEP_KEY: self.steps,
+            TrackConst.KWARGS_KEY: self.kwargs,
+        }
+        dxo = DXO(data_kind=DataKind.ANALYTIC, data=data)
+        dxo.set_meta_prop(TrackConst.BATCH_SIZE_KEY, len(self))
+        dxo.set_meta_prop(TrackConst.TRACKER_KEY, self.sender)
+        return dxo
+
+    @staticmethod
+    def is_batch(dxo: DXO) -> bool:
+        return dxo.get_meta_prop(TrackConst.BATCH_SIZE_KEY) is not None
+
+    @classmethod
+    def get_records(cls, dxo: DXO, receiver: LogWriterName = LogWriterName.TORCH_TB) -> List[AnalyticsData]:
+        """Generates the AnalyticsData records from a DXO object of a batch or of a single record.
+
+        Args:
+            dxo (DXO): The DXO object to convert.
+            receiver: type of the experiment tracker, defaults to Tensorboard with LogWriterName.TORCH_TB.
+
+        Returns:
+            list of AnalyticsData. Records with data types not supported by the receiver are skipped.
+        """
+        if not isinstance(dxo, DXO):
+            raise TypeError("expect dxo to be an instance of DXO, but got {}.".format(type(dxo)))
+        if not cls.is_batch(dxo):
+            data = AnalyticsData.from_dxo(dxo, receiver=receiver)
+            return [data] if data else []
+
+        data = dxo.data
+        writer = dxo.get_meta_prop(TrackConst.TRACKER_KEY)
+        records = []
+        for tag, value, data_type_name, step, kwargs in zip(
+            data[TrackConst.TRACK_KEY],
+            data[TrackConst.TRACK_VALUE],
+            data[TrackConst.DATA_TYPE_KEY],
+            data[TrackConst.GLOBAL_STEP_KEY],
+            data[TrackConst.KWARGS_KEY],
+        ):
+            data_type = AnalyticsDataType(data_type_name)
+            if writer is not None and writer != receiver:
+                data_type = AnalyticsData.convert_data_type(data_type, writer, receiver)
+            if not data_type:
+                continue
+            kwargs = dict(kwargs) if kwargs else {}
+            if step is not None:
+                kwargs[TrackConst.GLOBAL_STEP_KEY] = step
+            records.append(AnalyticsData(tag, value, data_type, writer, **kwargs))
+        return records
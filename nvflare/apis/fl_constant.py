@@ -162,6 +162,7 @@ class FLContextKey(object):
     JOB_BLOCK_REASON = "__job_block_reason"  # why the job should be blocked from scheduling
     SSID = "__ssid__"
     CLIENT_TOKEN = "__client_token"
+    GET_TASK_LONG_POLL_TIME = "__get_task_long_poll_time"
     AUTHORIZATION_RESULT = "_authorization_result"
     AUTHORIZATION_REASON = "_authorization_reason"
     DISCONNECTED_CLIENT_NAME = "_disconnected_client_name"
@@ -258,6 +259,7 @@ class AdminCommandNames(object):
     APP_COMMAND = "app_command"
     CONFIGURE_JOB_LOG = "configure_job_log"
     CONFIGURE_SITE_LOG = "configure_site_log"
+    REBUILD_JOB_INDEX = "rebuild_job_index"
 
 
 class ServerCommandNames(object):
@@ -517,6 +519,16 @@ class ConfigVarName:
     # client: timeout for getTask requests
     GET_TASK_TIMEOUT = "get_task_timeout"
 
+    # client: how long the server may hold a getTask request until a task is available (long-poll).
+    # Long-poll is disabled if not set.
+    GET_TASK_LONG_POLL_TIME = "get_task_long_poll_time"
+
+    # server: max time to hold a getTask request
+    MAX_GET_TASK_LONG_POLL_TIME = "max_get_task_long_poll_time"
+
+    # server: max number of getTask requests held at the same time
+    MAX_GET_TASK_LONG_POLLS = "max_get_task_long_polls"
+
     # client: timeout for submitTaskResult requests
     SUBMIT_TASK_RESULT_TIMEOUT = "submit_task_result_timeout"
 
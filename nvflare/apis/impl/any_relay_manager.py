@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import time
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 from nvflare.apis.controller_spec import ClientTask, Task, TaskCompletionStatus
 from nvflare.apis.fl_context import FLContext
@@ -107,6 +107,12 @@ class AnyRelayTaskManager(TaskManager):
         sent_target_count[client_name] = send_count + 1
         return TaskCheckStatus.SEND
 
+    def get_eligible_clients(self, task: Task) -> Optional[List[str]]:
+        """The task is only sent to its targets, unless targets are dynamic."""
+        if task.props[_KEY_DYNAMIC_TARGETS]:
+            return None
+        return task.targets
+
     def check_task_exit(self, task: Task) -> Tuple[bool, TaskCompletionStatus]:
         """Determine whether the task should exit.
 
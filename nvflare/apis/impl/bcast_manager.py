@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import time
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 from nvflare.apis.controller_spec import ClientTask, Task, TaskCompletionStatus
 from nvflare.apis.fl_context import FLContext
@@ -39,6 +39,10 @@ class BcastTaskManager(TaskManager):
         task.props[_KEY_WAIT_TIME_AFTER_MIN_RESPS] = wait_time_after_min_received
         task.props[_KEY_MIN_RESPS_RCV_TIME] = None
 
+    def get_eligible_clients(self, task: Task) -> Optional[List[str]]:
+        """The task is only sent to its targets."""
+        return task.targets
+
     def check_task_exit(self, task: Task) -> Tuple[bool, TaskCompletionStatus]:
         """Determine if the task should exit.
 
@@ -112,6 +116,10 @@ class BcastForeverTaskManager(TaskManager):
         else:
             return TaskCheckStatus.NO_BLOCK
 
+    def get_eligible_clients(self, task: Task) -> Optional[List[str]]:
+        """The task is only sent to its targets."""
+        return task.targets
+
     def check_task_exit(self, task: Task) -> Tuple[bool, TaskCompletionStatus]:
         """Determine whether the task should exit.
 
@@ -16,20 +16,24 @@ import os
 import pathlib
 import shutil
 import tempfile
+import threading
 import time
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union
 
 from nvflare.apis.client_engine_spec import ClientEngineSpec
 from nvflare.apis.fl_context import FLContext
+from nvflare.apis.impl.job_meta_index import JobMetaIndex
 from nvflare.apis.job_def import Job, JobDataKey, JobMetaKey, job_from_meta, new_job_id
 from nvflare.apis.job_def_manager_spec import JobDefManagerSpec, RunStatus
 from nvflare.apis.server_engine_spec import ServerEngineSpec
 from nvflare.apis.storage import WORKSPACE, StorageException, StorageSpec
 from nvflare.fuel.utils import fobs
+from nvflare.fuel.utils.app_artifacts import AppPackage
 from nvflare.fuel.utils.zip_utils import unzip_all_from_bytes, zip_directory_to_bytes
 
 _OBJ_TAG_SCHEDULED = "scheduled"
+_META_INDEX_FILE = ".meta_index.db"
 
 
 class JobInfo:
@@ -102,7 +106,26 @@ class _ScheduleJobFilter(_JobFilter):
 
 
 class SimpleJobDefManager(JobDefManagerSpec):
-    def __init__(self, uri_root: str = "jobs", job_store_id: str = "job_store"):
+    def __init__(
+        self,
+        uri_root: str = "jobs",
+        job_store_id: str = "job_store",
+        use_meta_index: bool = False,
+        meta_index_file: str = None,
+    ):
+        """Job def manager that keeps jobs in the job store.
+
+        If use_meta_index is True, the metas of all jobs are also kept in a persistent index (JobMetaIndex), so
+        listing jobs and finding jobs to schedule don't need to read the meta of every job in the store.
+        The index is synced with the store when it is opened, and can be rebuilt with rebuild_index.
+
+        Args:
+            uri_root: root uri of jobs in the job store
+            job_store_id: component id of the job store
+            use_meta_index: whether to use the job meta index
+            meta_index_file: path of the index file. If not specified, the index is kept in the uri_root of
+                the job store, if the job store is on the local filesystem. Otherwise, the index is not used.
+        """
         super().__init__()
         self.uri_root = uri_root
 
@@ -113,6 +136,11 @@ class SimpleJobDefManager(JobDefManagerSpec):
 
         os.makedirs(uri_root, exist_ok=True)
         self.job_store_id = job_store_id
+        self.use_meta_index = use_meta_index
+        self.meta_index_file = meta_index_file
+        self._meta_index = None
+        self._meta_index_checked = False
+        self._meta_index_lock = threading.Lock()
 
     def _get_job_store(self, fl_ctx):
         engine = fl_ctx.get_engine()
@@ -124,6 +152,83 @@ class SimpleJobDefManager(JobDefManagerSpec):
             raise TypeError(f"engine should have a job store component of type StorageSpec, but got {type(store)}")
         return store
 
+    def _get_meta_index(self, store: StorageSpec, fl_ctx: FLContext) -> Optional[JobMetaIndex]:
+        if not self.use_meta_index:
+            return None
+
+        with self._meta_index_lock:
+            if self._meta_index_checked:
+                return self._meta_index
+            self._meta_index_checked = True
+
+            index_file = self.meta_index_file
+            if not index_file:
+                root_path = store.get_local_path(self.uri_root)
+                if not root_path:
+                    self.log_warning(fl_ctx, "job store is not on local filesystem - job meta index is not used")
+                    return None
+                index_file = os.path.join(root_path, _META_INDEX_FILE)
+
+            os.makedirs(os.path.dirname(os.path.abspath(index_file)), exist_ok=True)
+            index = JobMetaIndex(index_file)
+            num_changed = self._sync_meta_index(index, store)
+            self.log_info(fl_ctx, f"opened job meta index {index_file}: synced {num_changed} jobs")
+            self._meta_index = index
+            return index
+
+    def _sync_meta_index(self, index: JobMetaIndex, store: StorageSpec) -> int:
+        """Make the index consistent with the store.
+
+        Only the jobs that are not in the index, and the dirty ones, are read from the store.
+
+        Returns: number of jobs that were updated in the index
+        """
+        job_ids = {pathlib.PurePath(uri).name for uri in store.list_objects(self.uri_root)}
+        indexed_ids = index.get_job_ids()
+        for jid in indexed_ids - job_ids:
+            index.remove(jid)
+
+        to_load = (job_ids - indexed_ids) | (index.get_dirty_job_ids() & job_ids)
+        for jid in to_load:
+            self._refresh_index(index, store, jid)
+        return len(indexed_ids - job_ids) + len(to_load)
+
+    def _refresh_index(self, index: JobMetaIndex, store: StorageSpec, jid: str):
+        try:
+            meta = store.get_meta(self.job_uri(jid))
+        except StorageException:
+            meta = None
+
+        if meta:
+            index.put(jid, meta)
+        else:
+            index.remove(jid)
+
+    def _update_store(self, jid: str, fl_ctx: FLContext, update_f, *args, **kwargs):
+        """Call update_f to change the job in the store, and keep the index in sync with the change."""
+        store = self._get_job_store(fl_ctx)
+        index = self._get_meta_index(store, fl_ctx)
+        if not index:
+            return update_f(store, *args, **kwargs)
+
+        # mark the job before changing it, so the change is picked up by the next sync if we crash in between
+        index.mark_dirty(jid)
+        try:
+            return update_f(store, *args, **kwargs)
+        finally:
+            self._refresh_index(index, store, jid)
+
+    def rebuild_index(self, fl_ctx: FLContext) -> Optional[int]:
+        store = self._get_job_store(fl_ctx)
+        index = self._get_meta_index(store, fl_ctx)
+        if not index:
+            return None
+
+        index.clear()
+        num_jobs = self._sync_meta_index(index, store)
+        self.log_info(fl_ctx, f"rebuilt job meta index with {num_jobs} jobs")
+        return num_jobs
+
     def job_uri(self, jid: str):
         return os.path.join(self.uri_root, jid)
 
@@ -143,8 +248,11 @@ class SimpleJobDefManager(JobDefManagerSpec):
         meta[JobMetaKey.STATUS.value] = RunStatus.SUBMITTED.value
 
         # write it to the store
-        store = self._get_job_store(fl_ctx)
-        store.create_object(self.job_uri(jid), uploaded_content, meta, overwrite_existing=True)
+        self._update_store(
+            jid,
+            fl_ctx,
+            lambda store: store.create_object(self.job_uri(jid), uploaded_content, meta, overwrite_existing=True),
+        )
         return meta
 
     def clone(self, from_jid: str, meta: dict, fl_ctx: FLContext) -> Dict[str, Any]:
@@ -161,15 +269,17 @@ class SimpleJobDefManager(JobDefManagerSpec):
         meta[JobMetaKey.STATUS.value] = RunStatus.SUBMITTED.value
 
         # write it to the store
-        store = self._get_job_store(fl_ctx)
-        store.clone_object(
-            from_uri=self.job_uri(from_jid), to_uri=self.job_uri(jid), meta=meta, overwrite_existing=True
+        self._update_store(
+            jid,
+            fl_ctx,
+            lambda store: store.clone_object(
+                from_uri=self.job_uri(from_jid), to_uri=self.job_uri(jid), meta=meta, overwrite_existing=True
+            ),
         )
         return meta
 
     def delete(self, jid: str, fl_ctx: FLContext):
-        store = self._get_job_store(fl_ctx)
-        store.delete_object(self.job_uri(jid))
+        self._update_store(jid, fl_ctx, lambda store: store.delete_object(self.job_uri(jid)))
 
     def _validate_meta(self, meta):
         """Validate meta
@@ -201,9 +311,8 @@ class SimpleJobDefManager(JobDefManagerSpec):
             return None
 
     def set_results_uri(self, jid: str, result_uri: str, fl_ctx: FLContext):
-        store = self._get_job_store(fl_ctx)
         updated_meta = {JobMetaKey.RESULT_LOCATION.value: result_uri}
-        store.update_meta(self.job_uri(jid), updated_meta, replace=False)
+        self.update_meta(jid, updated_meta, fl_ctx)
         return self.get_job(jid, fl_ctx)
 
     def get_app(self, job: Job, app_name: str, fl_ctx: FLContext) -> bytes:
@@ -215,6 +324,12 @@ class SimpleJobDefManager(JobDefManagerSpec):
         shutil.rmtree(temp_dir)
         return result
 
+    def get_app_package(self, job: Job, app_name: str, fl_ctx: FLContext) -> AppPackage:
+        # read the app from the job content in memory, instead of unzipping and zipping it again
+        data_bytes = self.get_content(job.meta, fl_ctx)
+        job_folder = job.meta[JobMetaKey.JOB_FOLDER_NAME.value]
+        return AppPackage.from_zip(data_bytes, folder=f"{job_folder}/{app_name}")
+
     def _load_job_data_from_store(self, job: Job, temp_dir: str, fl_ctx: FLContext):
         data_bytes = self.get_content(job.meta, fl_ctx)
         job_id_dir = os.path.join(temp_dir, job.job_id)
@@ -280,11 +395,12 @@ class SimpleJobDefManager(JobDefManagerSpec):
                     job_meta.get(JobMetaKey.START_TIME.value), "%Y-%m-%d %H:%M:%S.%f"
                 )
                 meta[JobMetaKey.DURATION.value] = str(datetime.datetime.now() - start_time)
-        store.update_meta(uri=self.job_uri(jid), meta=meta, replace=False)
+        self.update_meta(jid, meta, fl_ctx)
 
     def update_meta(self, jid: str, meta, fl_ctx: FLContext):
-        store = self._get_job_store(fl_ctx)
-        store.update_meta(uri=self.job_uri(jid), meta=meta, replace=False)
+        self._update_store(
+            jid, fl_ctx, lambda store: store.update_meta(uri=self.job_uri(jid), meta=meta, replace=False)
+        )
 
     def refresh_meta(self, job: Job, meta_keys: list, fl_ctx: FLContext):
         """Refresh meta of the job as specified in the meta keys
@@ -313,11 +429,26 @@ class SimpleJobDefManager(JobDefManagerSpec):
 
     def get_jobs_to_schedule(self, fl_ctx: FLContext) -> List[Job]:
         job_filter = _ScheduleJobFilter(self._get_job_store(fl_ctx))
-        self._scan(job_filter, fl_ctx, skip_tag=_OBJ_TAG_SCHEDULED)
+        self._scan(job_filter, fl_ctx, skip_tag=_OBJ_TAG_SCHEDULED, statuses=[RunStatus.SUBMITTED])
         return job_filter.result
 
-    def _scan(self, job_filter: _JobFilter, fl_ctx: FLContext, skip_tag=None):
+    def _scan(self, job_filter: _JobFilter, fl_ctx: FLContext, skip_tag=None, statuses=None):
+        """Pass the jobs in the store to the job filter.
+
+        If the meta index is used, the metas are read from the index, and only the jobs in the specified
+        statuses are passed to the filter. Otherwise, the meta of each job is read from the store.
+        """
         store = self._get_job_store(fl_ctx)
+        index = self._get_meta_index(store, fl_ctx)
+        if index:
+            if statuses is not None:
+                statuses = [s.value if isinstance(s, RunStatus) else s for s in statuses]
+            for meta in index.get_metas(statuses):
+                jid = meta.get(JobMetaKey.JOB_ID.value)
+                if not job_filter.filter_job(JobInfo(meta, jid, self.job_uri(jid))):
+                    break
+            return
+
         obj_uris = store.list_objects(self.uri_root, without_tag=skip_tag)
         self.log_debug(fl_ctx, f"objects to scan: {len(obj_uris)}")
         if not obj_uris:
@@ -343,7 +474,7 @@ class SimpleJobDefManager(JobDefManagerSpec):
 
         """
         job_filter = _StatusFilter(status)
-        self._scan(job_filter, fl_ctx)
+        self._scan(job_filter, fl_ctx, statuses=job_filter.status_to_check)
         return job_filter.result
 
     def get_jobs_waiting_for_review(self, reviewer_name: str, fl_ctx: FLContext) -> List[Job]:
@@ -362,8 +493,7 @@ class SimpleJobDefManager(JobDefManagerSpec):
                 meta[JobMetaKey.APPROVALS.value] = approvals
             approvals[reviewer_name] = (approved, note)
             updated_meta = {JobMetaKey.APPROVALS.value: approvals}
-            store = self._get_job_store(fl_ctx)
-            store.update_meta(self.job_uri(jid), updated_meta, replace=False)
+            self.update_meta(jid, updated_meta, fl_ctx)
         return meta
 
     def save_workspace(self, jid: str, data: Union[bytes, str, List[str]], fl_ctx: FLContext):
@@ -0,0 +1,117 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import sqlite3
+import threading
+from typing import List, Optional, Set
+
+from nvflare.apis.job_def import JobMetaKey
+
+_SCHEMA_VERSION = 1
+
+
+class JobMetaIndex:
+    def __init__(self, db_path: str):
+        """A persistent index of job metas, kept in a SQLite database.
+
+        Each job is indexed by its status and submit time, and the whole meta is kept so a query doesn't need
+        to read the meta files of the jobs.
+
+        To keep the index consistent with the job store after a crash, a job is marked dirty before its meta
+        is changed in the store, and the mark is cleared when the new meta is put into the index.
+        Dirty jobs are reloaded from the store when the index is synced.
+
+        Args:
+            db_path: path of the database file
+        """
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id TEXT PRIMARY KEY, status TEXT, submit_time REAL, meta TEXT, dirty INTEGER NOT NULL DEFAULT 0)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, submit_time)")
+            self.conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+
+    def put(self, job_id: str, meta: dict):
+        """Put the meta of the job into the index, and clear its dirty mark."""
+        status = meta.get(JobMetaKey.STATUS.value)
+        submit_time = meta.get(JobMetaKey.SUBMIT_TIME.value)
+        if not isinstance(submit_time, (int, float)):
+            submit_time = None
+
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO jobs (job_id, status, submit_time, meta, dirty) VALUES (?, ?, ?, ?, 0) "
+                "ON CONFLICT (job_id) DO UPDATE SET "
+                "status=excluded.status, submit_time=excluded.submit_time, meta=excluded.meta, dirty=0",
+                (job_id, status, submit_time, json.dumps(meta)),
+            )
+
+    def mark_dirty(self, job_id: str):
+        """Mark the job before its meta is changed in the store."""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO jobs (job_id, dirty) VALUES (?, 1) ON CONFLICT (job_id) DO UPDATE SET dirty=1",
+                (job_id,),
+            )
+
+    def remove(self, job_id: str):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM jobs WHERE job_id=?", (job_id,))
+
+    def clear(self):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM jobs")
+
+    def get_meta(self, job_id: str) -> Optional[dict]:
+        with self.lock:
+            row = self.conn.execute("SELECT meta FROM jobs WHERE job_id=?", (job_id,)).fetchone()
+        if not row or row[0] is None:
+            return None
+        return json.loads(row[0])
+
+    def get_metas(self, statuses: Optional[List[str]] = None) -> List[dict]:
+        """Get the metas of jobs in submit time order.
+
+        Args:
+            statuses: if specified, only get the jobs in these statuses
+
+        Returns: list of job metas
+        """
+        query = "SELECT meta FROM jobs WHERE meta IS NOT NULL"
+        params = ()
+        if statuses is not None:
+            query += f" AND status IN ({','.join('?' * len(statuses))})"
+            params = tuple(statuses)
+        query += " ORDER BY submit_time"
+
+        with self.lock:
+            rows = self.conn.execute(query, params).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def get_job_ids(self) -> Set[str]:
+        with self.lock:
+            return {r[0] for r in self.conn.execute("SELECT job_id FROM jobs")}
+
+    def get_dirty_job_ids(self) -> Set[str]:
+        with self.lock:
+            return {r[0] for r in self.conn.execute("SELECT job_id FROM jobs WHERE dirty=1")}
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import time
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 from nvflare.apis.controller_spec import ClientTask, SendOrder, Task, TaskCompletionStatus
 from nvflare.apis.fl_context import FLContext
@@ -90,6 +90,10 @@ class SendTaskManager(TaskManager):
             # since this client is involved in the task, we need to wait until this task is resolved!
             return TaskCheckStatus.BLOCK
 
+    def get_eligible_clients(self, task: Task) -> Optional[List[str]]:
+        """The task is only sent to its targets."""
+        return task.targets
+
     def check_task_exit(self, task: Task) -> Tuple[bool, TaskCompletionStatus]:
         """Determine whether the task should exit.
 
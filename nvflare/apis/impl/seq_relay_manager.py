@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import time
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 from nvflare.apis.controller_spec import ClientTask, Task, TaskCompletionStatus
 from nvflare.apis.fl_context import FLContext
@@ -172,6 +172,12 @@ class SequentialRelayTaskManager(TaskManager):
         self.logger.debug("win_end_idx={}".format(win_end_idx))
         return win_start_idx, win_end_idx
 
+    def get_eligible_clients(self, task: Task) -> Optional[List[str]]:
+        """The task is only sent to its targets, unless targets are dynamic."""
+        if task.props[_KEY_DYNAMIC_TARGETS]:
+            return None
+        return task.targets
+
     def check_task_exit(self, task: Task) -> Tuple[bool, TaskCompletionStatus]:
         """Determine whether the task should exit.
 
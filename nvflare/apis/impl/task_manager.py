@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from enum import Enum
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 from nvflare.apis.controller_spec import ClientTask, Task, TaskCompletionStatus
 from nvflare.apis.fl_context import FLContext
@@ -69,6 +69,21 @@ class TaskManager(object):
         else:
             return TaskCheckStatus.NO_BLOCK
 
+    def get_eligible_clients(self, task: Task) -> Optional[List[str]]:
+        """Get the names of the clients that the task could ever be sent to.
+
+        This is used by the server to index the standing tasks by client, so a task request only
+        needs to check the tasks that the client is eligible for.
+        The default is None, which means that the task must be checked for every client.
+
+        Args:
+            task (Task): an instance of Task
+
+        Returns:
+            Optional[List[str]]: names of the eligible clients, or None if any client could be eligible
+        """
+        return None
+
     def check_task_exit(self, task: Task) -> Tuple[bool, TaskCompletionStatus]:
         """Determine whether the task should exit.
 
@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import heapq
+import itertools
 import threading
 import time
 from threading import Lock
@@ -40,6 +42,9 @@ from .task_manager import TaskCheckStatus, TaskManager
 _TASK_KEY_ENGINE = "___engine"
 _TASK_KEY_MANAGER = "___mgr"
 _TASK_KEY_DONE = "___done"
+_TASK_KEY_SEQ = "___seq"
+_TASK_KEY_WAKEUP = "___wakeup"
+_TASK_KEY_ELIGIBLE_CLIENTS = "___eligible"
 
 
 def _check_positive_int(name, value):
@@ -85,13 +90,21 @@ class WFCommServer(FLComponent, WFCommSpec):
         """Manage life cycles of tasks and their destinations.
 
         Args:
-            task_check_period (float, optional): interval for checking status of tasks. Defaults to 0.2.
+            task_check_period (float, optional): max interval for checking status of tasks. Defaults to 0.2.
+                Tasks are also checked right away when a result is submitted, a task is cancelled,
+                or a client is reported dead.
         """
         super().__init__()
         self.controller = None
         self._engine = None
         self._tasks = []  # list of standing tasks
         self._client_task_map = {}  # client_task_id => client_task
+        self._task_seq = itertools.count()
+        self._client_tasks_index = {}  # client name => {task seq => task} for tasks restricted to targets
+        self._open_tasks = {}  # task seq => task for tasks that could be sent to any client
+        self._monitor_wakeup = threading.Event()
+        self._task_change = threading.Condition()
+        self._task_change_seq = 0
         self._all_done = False
         self._task_lock = Lock()
         self._task_monitor = threading.Thread(target=self._monitor_tasks, args=(), name="wf_task", daemon=True)
@@ -164,6 +177,7 @@ class WFCommServer(FLComponent, WFCommSpec):
                 self._dead_clients[client_name] = _DeadClientStatus()
             else:
                 self.log_warning(fl_ctx, f"discarded dead client report {client_name=}: already on watch list")
+        self._monitor_wakeup.set()
 
     def process_task_request(self, client: Client, fl_ctx: FLContext) -> Tuple[str, str, Shareable]:
         """Called by runner when a client asks for a task.
@@ -197,7 +211,7 @@ class WFCommServer(FLComponent, WFCommSpec):
         client_task_to_send = None
         with self._task_lock:
             self.logger.debug("self._tasks: {}".format(self._tasks))
-            for task in self._tasks:
+            for task in self._get_eligible_tasks(client.name):
                 if task.completion_status is not None:
                     # this task is finished (and waiting for the monitor to exit it)
                     continue
@@ -300,6 +314,7 @@ class WFCommServer(FLComponent, WFCommSpec):
                 can_send_task = False
 
             if not can_send_task:
+                self._monitor_wakeup.set()
                 return self._try_again()
 
             self.logger.debug("after_task_sent_cb done on client_task_to_send: {}".format(client_task_to_send))
@@ -372,6 +387,10 @@ class WFCommServer(FLComponent, WFCommSpec):
         with self._controller_lock:
             self._do_process_submission(client, task_name, task_id, result, fl_ctx)
 
+        # the result may have completed the task, or made it available to other clients
+        self._monitor_wakeup.set()
+        self._notify_task_change()
+
     def _do_process_submission(
         self, client: Client, task_name: str, task_id: str, result: Shareable, fl_ctx: FLContext
     ):
@@ -484,12 +503,79 @@ class WFCommServer(FLComponent, WFCommSpec):
 
         task.props[_TASK_KEY_MANAGER] = manager
         task.props[_TASK_KEY_ENGINE] = self._engine
+        task.props[_TASK_KEY_WAKEUP] = threading.Event()
         task.is_standing = True
         task.schedule_time = time.time()
 
         with self._task_lock:
             self._tasks.append(task)
+            self._add_to_index(task)
             self.log_info(fl_ctx, "scheduled task {}".format(task.name))
+        self._notify_task_change()
+
+    def _notify_task_change(self):
+        with self._task_change:
+            self._task_change_seq += 1
+            self._task_change.notify_all()
+
+    def get_task_change_seq(self) -> int:
+        """Get the sequence number of the latest change of standing tasks.
+
+        A change is a task being scheduled, a result being received, or a task exiting.
+        """
+        return self._task_change_seq
+
+    def wait_for_task_change(self, last_seq: int, timeout: float) -> bool:
+        """Wait until standing tasks are changed after last_seq, which may make a task available to a client.
+
+        Args:
+            last_seq: the change sequence number got with get_task_change_seq
+            timeout: max time to wait
+
+        Returns:
+            bool: whether the standing tasks were changed
+        """
+        with self._task_change:
+            return self._task_change.wait_for(lambda: self._task_change_seq != last_seq, timeout)
+
+    def _add_to_index(self, task: Task):
+        # must be called with the task lock
+        seq = next(self._task_seq)
+        task.props[_TASK_KEY_SEQ] = seq
+        eligible_clients = task.props[_TASK_KEY_MANAGER].get_eligible_clients(task)
+        if eligible_clients is None:
+            self._open_tasks[seq] = task
+            return
+
+        eligible_clients = set(eligible_clients)
+        task.props[_TASK_KEY_ELIGIBLE_CLIENTS] = eligible_clients
+        for name in eligible_clients:
+            self._client_tasks_index.setdefault(name, {})[seq] = task
+
+    def _remove_from_index(self, task: Task):
+        # must be called with the task lock
+        seq = task.props[_TASK_KEY_SEQ]
+        self._open_tasks.pop(seq, None)
+        for name in task.props.get(_TASK_KEY_ELIGIBLE_CLIENTS, []):
+            client_tasks = self._client_tasks_index.get(name)
+            if client_tasks is not None:
+                client_tasks.pop(seq, None)
+                if not client_tasks:
+                    self._client_tasks_index.pop(name)
+
+    def _get_eligible_tasks(self, client_name: str):
+        """Get the standing tasks that could be sent to the client, in the order they were scheduled.
+
+        Must be called with the task lock.
+        """
+        client_tasks = self._client_tasks_index.get(client_name)
+        if not client_tasks:
+            return self._open_tasks.values()
+
+        if not self._open_tasks:
+            return client_tasks.values()
+
+        return heapq.merge(client_tasks.values(), self._open_tasks.values(), key=lambda t: t.props[_TASK_KEY_SEQ])
 
     def broadcast(
         self,
@@ -706,6 +792,7 @@ class WFCommServer(FLComponent, WFCommSpec):
             fl_ctx (Optional[FLContext], optional): FLContext associated with this cancellation. Defaults to None.
         """
         task.completion_status = completion_status
+        self._wake_up_task_waiters(task)
 
     def cancel_all_tasks(self, completion_status=TaskCompletionStatus.CANCELLED, fl_ctx: Optional[FLContext] = None):
         """Cancel all standing tasks in this controller.
@@ -718,6 +805,7 @@ class WFCommServer(FLComponent, WFCommSpec):
         with self._task_lock:
             for t in self._tasks:
                 t.completion_status = completion_status
+                self._wake_up_task_waiters(t)
 
     def finalize_run(self, fl_ctx: FLContext):
         """Do cleanup of the coordinator implementation.
@@ -731,6 +819,7 @@ class WFCommServer(FLComponent, WFCommSpec):
         """
         self.cancel_all_tasks()  # unconditionally cancel all tasks
         self._all_done = True
+        self._monitor_wakeup.set()
 
     def relay(
         self,
@@ -883,6 +972,9 @@ class WFCommServer(FLComponent, WFCommSpec):
 
     def _monitor_tasks(self):
         while not self._all_done:
+            # clear before checking, so a wakeup during the check triggers another check
+            self._monitor_wakeup.clear()
+
             # determine clients are still active or not
             self._check_dead_clients()
 
@@ -893,7 +985,15 @@ class WFCommServer(FLComponent, WFCommSpec):
                 with self._engine.new_context() as fl_ctx:
                     self.system_panic("Aborting job due to deployment policy violation", fl_ctx)
                 return
-            time.sleep(self._task_check_period)
+
+            # time-based conditions (timeouts, grace periods) are checked at least once every period
+            self._monitor_wakeup.wait(self._task_check_period)
+
+    def _wake_up_task_waiters(self, task: Task):
+        wakeup = task.props.get(_TASK_KEY_WAKEUP)
+        if wakeup:
+            wakeup.set()
+        self._monitor_wakeup.set()
 
     def check_tasks(self):
         with self._controller_lock:
@@ -941,6 +1041,7 @@ class WFCommServer(FLComponent, WFCommSpec):
                     "Removing task={}, completion_status={}".format(exit_task, exit_task.completion_status)
                 )
                 self._tasks.remove(exit_task)
+                self._remove_from_index(exit_task)
                 for client_task in exit_task.client_tasks:
                     self.logger.debug("Removing client_task with id={}".format(client_task.id))
                     self._client_task_map.pop(client_task.id)
@@ -950,6 +1051,9 @@ class WFCommServer(FLComponent, WFCommSpec):
         if len(exit_tasks) <= 0:
             return
 
+        # tasks blocked by the exited tasks may become available
+        self._notify_task_change()
+
         with self._engine.new_context() as fl_ctx:
             for exit_task in exit_tasks:
                 with exit_task.cb_lock:
@@ -972,6 +1076,10 @@ class WFCommServer(FLComponent, WFCommSpec):
                             exit_task.completion_status = TaskCompletionStatus.ERROR
                             exit_task.exception = e
 
+                wakeup = exit_task.props.get(_TASK_KEY_WAKEUP)
+                if wakeup:
+                    wakeup.set()
+
     def _get_task_dead_clients(self, task: Task):
         """
         See whether the task is only waiting for response from a dead client
@@ -1016,6 +1124,7 @@ class WFCommServer(FLComponent, WFCommSpec):
     def wait_for_task(self, task: Task, abort_signal: Signal):
         task.props[_TASK_KEY_DONE] = False
         task.task_done_cb = self._process_finished_task(task=task, func=task.task_done_cb)
+        wakeup = task.props.get(_TASK_KEY_WAKEUP)
         while True:
             if task.completion_status is not None:
                 break
@@ -1027,7 +1136,12 @@ class WFCommServer(FLComponent, WFCommSpec):
             task_done = task.props[_TASK_KEY_DONE]
             if task_done:
                 break
-            time.sleep(self._task_check_period)
+
+            # the wakeup is set when the task is finished; the abort signal is checked once every period
+            if wakeup:
+                wakeup.wait(self._task_check_period)
+            else:
+                time.sleep(self._task_check_period)
 
     def _job_policy_violated(self):
         if not self._engine:
@@ -156,6 +156,12 @@ class Job:
         # #     raise TypeError(f"job_def_manager must be JobDefManagerSpec type. Got: {type(job_def_manager)}")
         return job_def_manager.get_app(self, app_name, fl_ctx)
 
+    def get_application_package(self, app_name, fl_ctx: FLContext):
+        """Get the application files, addressed by the hash of their content, as an AppPackage."""
+        engine = fl_ctx.get_engine()
+        job_def_manager = engine.get_component(SystemComponents.JOB_MANAGER)
+        return job_def_manager.get_app_package(self, app_name, fl_ctx)
+
     def get_application_name(self, participant):
         """Get the application name for the specified participant."""
         for app in self.deploy_map:
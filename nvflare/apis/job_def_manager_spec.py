@@ -18,6 +18,7 @@ from typing import Any, Dict, List, Optional, Union
 from nvflare.apis.fl_component import FLComponent
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.job_def import Job, RunStatus
+from nvflare.fuel.utils.app_artifacts import AppPackage
 
 
 class JobDefManagerSpec(FLComponent, ABC):
@@ -84,6 +85,19 @@ class JobDefManagerSpec(FLComponent, ABC):
         """
         pass
 
+    def get_app_package(self, job: Job, app_name: str, fl_ctx: FLContext) -> AppPackage:
+        """Get the files of the specified app, addressed by the hash of their content.
+
+        Args:
+            job: Job object
+            app_name: name of the app to get
+            fl_ctx (FLContext): FLContext information
+
+        Returns:
+            An AppPackage of the app
+        """
+        return AppPackage.from_zip(self.get_app(job, app_name, fl_ctx))
+
     @abstractmethod
     def get_content(self, meta: dict, fl_ctx: FLContext) -> Optional[bytes]:
         """Gets the entire uploaded content for a Job.
@@ -298,3 +312,14 @@ class JobDefManagerSpec(FLComponent, ABC):
 
         """
         pass
+
+    def rebuild_index(self, fl_ctx: FLContext) -> Optional[int]:
+        """Rebuild the index of job metas from the job storage.
+
+        Args:
+            fl_ctx (FLContext): FLContext information
+
+        Returns: number of jobs in the rebuilt index, or None if the job def manager doesn't use an index.
+
+        """
+        return None
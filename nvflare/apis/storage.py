@@ -13,7 +13,7 @@
 # limitations under the License.
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
 DATA = "data"
 JOB_ZIP = "job.zip"
@@ -248,6 +248,17 @@ class StorageSpec(ABC):
         """
         pass
 
+    def get_local_path(self, uri: str) -> Optional[str]:
+        """Get the path of the specified URI on the local filesystem.
+
+        Args:
+            uri: URI of the object or path
+
+        Returns: the local path, or None if the storage is not on the local filesystem.
+
+        """
+        return None
+
     @staticmethod
     def is_valid_component(component_name):
         """Check if the component name is valid.
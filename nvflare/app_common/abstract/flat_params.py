@@ -0,0 +1,137 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Optional
+
+import numpy as np
+
+
+class FlatParams(dict):
+    def __init__(self, buffer: np.ndarray, layout: List[list]):
+        """A dict of named numpy arrays that are views of one contiguous buffer.
+
+        FlatParams can be used as the data of WEIGHTS/WEIGHT_DIFF DXOs and as FLModel params. Since it is a dict,
+        code that processes the params layer by layer works unchanged. Code that is aware of it can process the
+        whole model with single vectorized ops on the "vector".
+
+        Replacing a value in the dict detaches it from the buffer. Use is_packed() to check whether all
+        values are still views of the buffer.
+
+        Args:
+            buffer: the contiguous buffer of all params, as uint8
+            layout: a list of [name, offset, shape, dtype str] for each param. The offset is in bytes.
+        """
+        super().__init__()
+        if buffer.dtype != np.uint8:
+            buffer = buffer.reshape(-1).view(np.uint8)
+        self.buffer = buffer
+        self.layout = layout
+        self.views = []
+        dtypes = set()
+        for name, offset, shape, dtype in layout:
+            dtype = np.dtype(dtype)
+            dtypes.add(dtype)
+            size = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+            view = buffer[offset : offset + size].view(dtype).reshape(shape)
+            self.views.append(view)
+            self[name] = view
+
+        # the common dtype of all params, or None if they have different dtypes
+        self.dtype = dtypes.pop() if len(dtypes) == 1 else None
+
+    @classmethod
+    def from_dict(cls, params: dict) -> "FlatParams":
+        """Pack the params into a new FlatParams. The params are copied.
+
+        Args:
+            params: a dict of param name => numpy array or scalar
+
+        Returns: a FlatParams that has the same params
+        """
+        layout = []
+        size = 0
+        arrays = []
+        for name, value in params.items():
+            arr = np.asarray(value)
+            if arr.dtype.kind not in "biufc":
+                raise ValueError(f"param {name} of dtype {arr.dtype} can't be packed")
+
+            # align each param to its item size
+            size = -(-size // arr.dtype.itemsize) * arr.dtype.itemsize
+            layout.append([name, size, list(arr.shape), arr.dtype.str])
+            arrays.append(arr)
+            size += arr.nbytes
+
+        flat_params = cls(np.zeros(size, dtype=np.uint8), layout)
+        for (name, _, _, _), arr in zip(layout, arrays):
+            flat_params[name][...] = arr
+        return flat_params
+
+    def with_vector(self, vector: np.ndarray) -> "FlatParams":
+        """Create a new FlatParams that has the same layout, backed by the vector.
+
+        Args:
+            vector: the buffer of the new FlatParams. It must have the same number of bytes as the buffer.
+
+        Returns: a new FlatParams
+        """
+        vector = np.ascontiguousarray(vector)
+        if vector.nbytes != self.buffer.nbytes:
+            raise ValueError(f"vector must have {self.buffer.nbytes} bytes but got {vector.nbytes}")
+        return FlatParams(vector.reshape(-1).view(np.uint8), self.layout)
+
+    @property
+    def vector(self) -> Optional[np.ndarray]:
+        """The buffer as a 1-D array of the common dtype, or None if the params have different dtypes."""
+        if self.dtype is None:
+            return None
+        return self.buffer.view(self.dtype)
+
+    def is_packed(self) -> bool:
+        """Check whether all params in the dict are still the views of the buffer."""
+        if len(self) != len(self.layout):
+            return False
+
+        for entry, view in zip(self.layout, self.views):
+            if self.get(entry[0]) is not view:
+                return False
+        return True
+
+    def __reduce__(self):
+        # copy.deepcopy and pickle rebuild the copy from the buffer and the layout, so its params are views of its
+        # buffer. The params that were replaced, added or removed are replaced, added or removed in the copy too.
+        views = {entry[0]: view for entry, view in zip(self.layout, self.views)}
+        changed = {k: v for k, v in self.items() if views.get(k) is not v}
+        removed = [k for k in views if k not in self]
+        return _rebuild_flat_params, (self.__class__, self.buffer, self.layout, changed, removed)
+
+    def has_same_layout(self, other) -> bool:
+        return isinstance(other, FlatParams) and (other.layout is self.layout or other.layout == self.layout)
+
+    def copy(self) -> "FlatParams":
+        return FlatParams(self.buffer.copy(), self.layout)
+
+
+def _rebuild_flat_params(cls, buffer: np.ndarray, layout: List[list], changed: dict, removed: List[str]):
+    flat_params = cls(buffer, layout)
+    for name in removed:
+        flat_params.pop(name, None)
+    flat_params.update(changed)
+    return flat_params
+
+
+def get_packed_vector(params) -> Optional[np.ndarray]:
+    """Get the vector of the params if they are packed FlatParams with a common dtype."""
+    if isinstance(params, FlatParams) and params.dtype is not None and params.is_packed():
+        return params.vector
+    return None
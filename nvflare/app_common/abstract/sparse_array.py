@@ -0,0 +1,89 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Tuple
+
+import numpy as np
+
+
+class SparseArray:
+    def __init__(self, shape: Tuple[int, ...], indices: np.ndarray, values: np.ndarray):
+        """A numpy array of which only some entries are non-zero, kept as the flat indices and the values of them.
+
+        SparseArray can be used as a value of WEIGHT_DIFF DXOs. WeightedAggregationHelper adds it into the
+        dense total directly, so the sparse contributions are not densified one by one.
+
+        Args:
+            shape: shape of the dense array
+            indices: 1-D array of the unique flat indices (in C order) of the entries
+            values: 1-D array of the values of the entries. Its dtype is the dtype of the dense array.
+        """
+        indices = np.asarray(indices)
+        values = np.asarray(values)
+        if indices.ndim != 1 or values.ndim != 1 or indices.size != values.size:
+            raise ValueError(f"indices and values must be 1-D of the same size but got {indices.shape} {values.shape}")
+        if indices.dtype.kind not in "iu":
+            raise ValueError(f"indices must be integers but got {indices.dtype}")
+
+        self.shape = tuple(int(d) for d in shape)
+        self.size = int(np.prod(self.shape, dtype=np.int64))
+        if indices.size and (indices.min() < 0 or indices.max() >= self.size):
+            raise ValueError(f"indices out of range for shape {self.shape}")
+
+        self.indices = indices
+        self.values = values
+
+    @classmethod
+    def from_dense(cls, dense: np.ndarray, indices: np.ndarray) -> "SparseArray":
+        """Create a SparseArray of the entries of the dense array at the flat indices."""
+        return cls(dense.shape, indices, dense.reshape(-1)[indices])
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.values.dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self.indices.nbytes + self.values.nbytes
+
+    @property
+    def density(self) -> float:
+        return self.values.size / self.size if self.size else 0.0
+
+    def to_dense(self) -> np.ndarray:
+        dense = np.zeros(self.shape, dtype=self.dtype)
+        dense.reshape(-1)[self.indices] = self.values
+        return dense
+
+    def add_to(self, dense: np.ndarray, weight=1.0):
+        """Add the weighted values into the dense array in place.
+
+        Args:
+            dense: the dense array of the same shape
+            weight: the weight of the values
+
+        Returns: None
+        """
+        if dense.shape != self.shape:
+            raise ValueError(f"expect dense array of shape {self.shape} but got {dense.shape}")
+
+        values = self.values * weight if weight != 1 else self.values
+        if dense.flags.c_contiguous:
+            # the indices are unique, so fancy indexing adds each value once
+            flat = dense.reshape(-1)
+            flat[self.indices] += values
+        else:
+            dense[np.unravel_index(self.indices, self.shape)] += values
+
+    def __repr__(self):
+        return f"SparseArray(shape={self.shape}, dtype={self.dtype}, nnz={self.values.size})"
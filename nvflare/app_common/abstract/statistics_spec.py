@@ -13,7 +13,7 @@
 # limitations under the License.
 from abc import ABC, abstractmethod
 from enum import IntEnum
-from typing import Dict, List, NamedTuple, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from nvflare.apis.fl_context import FLContext
 from nvflare.app_common.abstract.init_final_component import InitFinalComponent
@@ -259,6 +259,20 @@ class Statistics(InitFinalComponent, ABC):
 
         raise NotImplementedError
 
+    def prepare_histograms(self, dataset_name: str, histogram_ranges: Dict[str, Tuple[int, float, float]]):
+        """Called before the histogram of each feature of the dataset is requested.
+
+        This method is optional. Statistics that compute the histograms of all features in one pass over
+        the data, instead of one pass per histogram() call, can do the pass here.
+
+        Args:
+            dataset_name: dataset name
+            histogram_ranges: feature name => (num_of_bins, min value, max value) of the histogram
+
+        Returns: None
+        """
+        pass
+
     def max_value(self, dataset_name: str, feature_name: str) -> float:
         """Returns max value.
 
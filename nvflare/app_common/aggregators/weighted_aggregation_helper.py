@@ -14,13 +14,59 @@
 
 import re
 import threading
+from contextlib import contextmanager
 from typing import Optional
 
+import numpy as np
+
+from nvflare.app_common.abstract.flat_params import get_packed_vector
+from nvflare.app_common.abstract.sparse_array import SparseArray
+
+# number of key shards. Each shard has its own lock so contributions can be added concurrently.
+DEFAULT_NUM_SHARDS = 16
+
+# number of elements processed at a time when adding packed FlatParams
+_FLAT_CHUNK_SIZE = 1024 * 1024
+
+
+class _Shard:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.scratch = {}  # dtype => flat array for the weighted values of numpy contributions
+
+    def get_scratch(self, dtype, shape, size):
+        buffer = self.scratch.get(dtype)
+        if buffer is None or buffer.size < size:
+            buffer = np.empty(size, dtype=dtype)
+            self.scratch[dtype] = buffer
+        return buffer[:size].reshape(shape)
+
+
+def _is_numeric_array(v) -> bool:
+    return isinstance(v, np.ndarray) and v.dtype.kind in "biufc"
+
+
+def _is_torch_tensor(v) -> bool:
+    # avoid importing torch: it is an optional dependency of app_common
+    return type(v).__module__.startswith("torch") and hasattr(v, "add_")
+
 
 class WeightedAggregationHelper(object):
-    def __init__(self, exclude_vars: Optional[str] = None, weigh_by_local_iter: bool = True):
+    def __init__(
+        self,
+        exclude_vars: Optional[str] = None,
+        weigh_by_local_iter: bool = True,
+        num_shards: int = DEFAULT_NUM_SHARDS,
+    ):
         """Perform weighted aggregation.
 
+        Numpy arrays and torch tensors are accumulated in place: an accumulator is allocated for each key
+        on its first contribution, and later contributions are multiplied and added into it without
+        allocating new arrays. SparseArray contributions are added into the dense totals by their indices.
+        Other values (e.g. scalars or encrypted vectors) are aggregated with arithmetic operators.
+        If all contributions are packed FlatParams of the same layout, the whole model is aggregated
+        with vectorized ops, and the result is a FlatParams too.
+
         Args:
             exclude_vars (str, optional): regex string to match excluded vars during aggregation. Defaults to None.
             weigh_by_local_iter (bool, optional): Whether to weight the contributions by the number of iterations
@@ -29,11 +75,14 @@ class WeightedAggregationHelper(object):
                 the number of computations on encrypted ciphertext.
                 The aggregated sum will still be divided by the provided weights and `aggregation_weights` for the
                 resulting weighted sum to be valid.
+            num_shards (int, optional): number of shards the keys are divided into. Contributions are added to
+                different shards in parallel. Defaults to 16.
         """
         super().__init__()
         self.lock = threading.Lock()
         self.exclude_vars = re.compile(exclude_vars) if exclude_vars else None
         self.weigh_by_local_iter = weigh_by_local_iter
+        self.shards = [_Shard() for _ in range(max(num_shards, 1))]
         self.reset_stats()
         self.total = dict()
         self.counts = dict()
@@ -43,24 +92,28 @@ class WeightedAggregationHelper(object):
         self.total = dict()
         self.counts = dict()
         self.history = list()
+        self.flat_total = None  # the FlatParams whose views are the totals, if all contributions are packed
+
+    def _get_shard(self, key) -> _Shard:
+        return self.shards[hash(key) % len(self.shards)]
+
+    @contextmanager
+    def _all_locked(self):
+        for shard in self.shards:
+            shard.lock.acquire()
+        try:
+            with self.lock:
+                yield
+        finally:
+            for shard in self.shards:
+                shard.lock.release()
 
     def add(self, data, weight, contributor_name, contribution_round):
         """Compute weighted sum and sum of weights."""
+        if not self._add_flat(data, weight):
+            self._add_by_key(data, weight)
+
         with self.lock:
-            for k, v in data.items():
-                if self.exclude_vars is not None and self.exclude_vars.search(k):
-                    continue
-                if self.weigh_by_local_iter:
-                    weighted_value = v * weight
-                else:
-                    weighted_value = v  # used in homomorphic encryption to reduce computations on ciphertext
-                current_total = self.total.get(k, None)
-                if current_total is None:
-                    self.total[k] = weighted_value
-                    self.counts[k] = weight
-                else:
-                    self.total[k] = current_total + weighted_value
-                    self.counts[k] = self.counts[k] + weight
             self.history.append(
                 {
                     "contributor_name": contributor_name,
@@ -69,13 +122,193 @@ class WeightedAggregationHelper(object):
                 }
             )
 
+    def _add_by_key(self, data, weight):
+        keys_by_shard = {}
+        for k in data.keys():
+            if self.exclude_vars is not None and self.exclude_vars.search(k):
+                continue
+            keys_by_shard.setdefault(id(self._get_shard(k)), []).append(k)
+
+        for shard in self.shards:
+            keys = keys_by_shard.get(id(shard))
+            if not keys:
+                continue
+            with shard.lock:
+                for k in keys:
+                    self._accumulate(shard, k, data[k], weight)
+
+    def _is_flat_total_valid(self, data=None) -> bool:
+        # must be called with all locks held
+        flat_total = self.flat_total
+        if flat_total is None or len(self.total) != len(flat_total.views):
+            return False
+
+        if data is not None and not flat_total.has_same_layout(data):
+            return False
+
+        # the per-key path may have replaced some totals
+        for entry, view in zip(flat_total.layout, flat_total.views):
+            if self.total.get(entry[0]) is not view:
+                return False
+        return True
+
+    def _add_flat(self, data, weight) -> bool:
+        vector = get_packed_vector(data)
+        if vector is None or self.exclude_vars is not None:
+            return False
+
+        with self._all_locked():
+            if not self.total:
+                if self.weigh_by_local_iter:
+                    total_vector = np.multiply(vector, weight, dtype=np.result_type(vector, weight))
+                else:
+                    total_vector = vector.copy()
+
+                if total_vector.dtype != vector.dtype:
+                    # e.g. int params with float weight
+                    return False
+
+                self.flat_total = data.with_vector(total_vector)
+                self.total.update(self.flat_total)
+                self.counts = {k: weight for k in self.flat_total.keys()}
+                return True
+
+            if not self._is_flat_total_valid(data):
+                return False
+
+            total_vector = self.flat_total.vector
+            if self._sum_dtype(total_vector, vector, weight) != total_vector.dtype:
+                # the sum would be promoted (e.g. float64 params into a float32 total)
+                return False
+
+            try:
+                for start in range(0, vector.size, _FLAT_CHUNK_SIZE):
+                    chunk = vector[start : start + _FLAT_CHUNK_SIZE]
+                    total_chunk = total_vector[start : start + _FLAT_CHUNK_SIZE]
+                    if self.weigh_by_local_iter:
+                        weighted_chunk = self.shards[0].get_scratch(total_vector.dtype, chunk.shape, chunk.size)
+                        np.multiply(chunk, weight, out=weighted_chunk)
+                    else:
+                        weighted_chunk = chunk
+                    np.add(total_chunk, weighted_chunk, out=total_chunk)
+            except TypeError:
+                # all chunks have the same dtype, so this can only happen to the first chunk before any change
+                return False
+
+            for k in self.counts.keys():
+                self.counts[k] = self.counts[k] + weight
+            return True
+
+    def _accumulate(self, shard: _Shard, k, v, weight):
+        # must be called with the lock of the shard held
+        current_total = self.total.get(k, None)
+        if current_total is None:
+            self.total[k] = self._new_total(v, weight)
+            self.counts[k] = weight
+            return
+
+        if not self._accumulate_in_place(shard, current_total, v, weight):
+            if isinstance(v, SparseArray):
+                v = v.to_dense()
+            if self.weigh_by_local_iter:
+                self.total[k] = current_total + v * weight
+            else:
+                # used in homomorphic encryption to reduce computations on ciphertext
+                self.total[k] = current_total + v
+        self.counts[k] = self.counts[k] + weight
+
+    def _accumulate_in_place(self, shard: _Shard, current_total, v, weight) -> bool:
+        if isinstance(v, SparseArray):
+            if not _is_numeric_array(current_total) or v.shape != current_total.shape:
+                return False
+            try:
+                v.add_to(current_total, weight if self.weigh_by_local_iter else 1)
+                return True
+            except TypeError:
+                return False
+        elif _is_numeric_array(current_total) and _is_numeric_array(v) and v.shape == current_total.shape:
+            if self._sum_dtype(current_total, v, weight) != current_total.dtype:
+                # the sum is promoted (e.g. float64 value into a float32 total), which can't be done in place
+                return False
+
+            try:
+                if self.weigh_by_local_iter:
+                    weighted_value = shard.get_scratch(current_total.dtype, v.shape, v.size)
+                    np.multiply(v, weight, out=weighted_value)
+                else:
+                    weighted_value = v
+                np.add(current_total, weighted_value, out=current_total)
+                return True
+            except TypeError:
+                # the total can't hold the value without losing precision (e.g. int total and float value)
+                return False
+        elif (
+            _is_torch_tensor(current_total)
+            and _is_torch_tensor(v)
+            and current_total.is_floating_point()
+            and v.shape == current_total.shape
+        ):
+            import torch
+
+            if v.device != current_total.device or torch.result_type(current_total, v) != current_total.dtype:
+                # the sum is promoted (e.g. float64 value into a float32 total), or the tensors are on different
+                # devices, which can't be done in place
+                return False
+
+            current_total.add_(v.detach(), alpha=float(weight) if self.weigh_by_local_iter else 1)
+            return True
+        return False
+
+    def _sum_dtype(self, total, v, weight):
+        # dtype of the out-of-place sum of the total and the contribution
+        if self.weigh_by_local_iter:
+            return np.result_type(total, np.result_type(v, weight))
+        return np.result_type(total, v)
+
+    def _new_total(self, v, weight):
+        # the total must be a new object since it's updated in place
+        if isinstance(v, SparseArray):
+            w = weight if self.weigh_by_local_iter else 1
+            total = np.zeros(v.shape, dtype=np.result_type(v.dtype, w))
+            v.add_to(total, w)
+            return total
+        elif _is_numeric_array(v):
+            if self.weigh_by_local_iter:
+                return np.multiply(v, weight, dtype=np.result_type(v, weight))
+            return v.copy()
+        elif _is_torch_tensor(v):
+            if self.weigh_by_local_iter:
+                return v.detach() * weight
+            return v.detach().clone()
+        elif self.weigh_by_local_iter:
+            return v * weight
+        else:
+            return v  # used in homomorphic encryption to reduce computations on ciphertext
+
     def get_result(self):
         """Divide weighted sum by sum of weights."""
-        with self.lock:
-            aggregated_dict = {k: v * (1.0 / self.counts[k]) for k, v in self.total.items()}
+        with self._all_locked():
+            if self._is_flat_total_valid() and self.flat_total.dtype.kind in "fc":
+                counts = set(self.counts.values())
+                if len(counts) == 1:
+                    aggregated_dict = self.flat_total
+                    np.multiply(aggregated_dict.vector, 1.0 / counts.pop(), out=aggregated_dict.vector)
+                    self.reset_stats()
+                    return aggregated_dict
+
+            aggregated_dict = {k: self._divide(v, self.counts[k]) for k, v in self.total.items()}
             self.reset_stats()
             return aggregated_dict
 
+    @staticmethod
+    def _divide(v, count):
+        # the totals are owned by the helper and are reset after this, so they can be scaled in place
+        if isinstance(v, np.ndarray) and v.dtype.kind in "fc":
+            return np.multiply(v, 1.0 / count, out=v)
+        elif _is_torch_tensor(v) and v.is_floating_point():
+            return v.mul_(1.0 / count)
+        return v * (1.0 / count)
+
     def get_history(self):
         return self.history
 
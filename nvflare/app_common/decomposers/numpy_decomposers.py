@@ -13,17 +13,25 @@
 # limitations under the License.
 """Decomposers for types from app_common and Machine Learning libraries."""
 import os
+import struct
+import zipfile
 from abc import ABC
 from typing import Any
 
 import numpy as np
 
 import nvflare.fuel.utils.fobs.dots as dots
+from nvflare.app_common.abstract.flat_params import FlatParams
+from nvflare.app_common.abstract.sparse_array import SparseArray
 from nvflare.fuel.utils import fobs
 from nvflare.fuel.utils.fobs.datum import DatumManager
-from nvflare.fuel.utils.fobs.decomposers.via_file import ViaFileDecomposer
+from nvflare.fuel.utils.fobs.decomposers.via_file import ItemLayoutKey, ViaFileDecomposer
 
 _NPZ_EXTENSION = ".npz"
+_NPY_EXTENSION = ".npy"
+
+# size of the fixed part of a zip local file header
+_ZIP_LOCAL_HEADER_SIZE = 30
 
 
 class NumpyScalarDecomposer(fobs.Decomposer, ABC):
@@ -84,6 +92,106 @@ class NumpyArrayDecomposer(ViaFileDecomposer):
                 result[k] = npz_obj[k]
         return result
 
+    def load_from_mapped_file(self, path: str, buffer: memoryview, fobs_ctx: dict, meta: dict = None):
+        # np.savez stores each array as an uncompressed npy member of the zip file, so the arrays can be
+        # created directly on the mapped buffer. np.load doesn't support mmap_mode for npz files.
+        result = {}
+        with zipfile.ZipFile(path) as zf:
+            for info in zf.infolist():
+                if info.compress_type != zipfile.ZIP_STORED:
+                    return None
+
+                header_start = info.header_offset
+                name_len, extra_len = struct.unpack(
+                    "<HH", buffer[header_start + 26 : header_start + _ZIP_LOCAL_HEADER_SIZE]
+                )
+                data_start = header_start + _ZIP_LOCAL_HEADER_SIZE + name_len + extra_len
+                with zf.open(info) as f:
+                    version = np.lib.format.read_magic(f)
+                    if version == (1, 0):
+                        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+                    elif version == (2, 0):
+                        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+                    else:
+                        return None
+                    data_start += f.tell()
+
+                if dtype.hasobject:
+                    return None
+
+                name = info.filename
+                if name.endswith(_NPY_EXTENSION):
+                    name = name[: -len(_NPY_EXTENSION)]
+                result[name] = np.ndarray(
+                    shape, dtype=dtype, buffer=buffer, offset=data_start, order="F" if fortran_order else "C"
+                )
+        return result
+
+    def dump_to_buffers(self, items: dict, fobs_ctx: dict):
+        layout = []
+        buffers = []
+        for k, arr in items.items():
+            if arr.dtype.hasobject or arr.dtype.fields is not None:
+                # only plain numeric arrays can be streamed as raw bytes
+                return None
+
+            if not arr.flags.c_contiguous:
+                arr = arr.copy(order="C")
+            layout.append(
+                {
+                    ItemLayoutKey.ID: k,
+                    ItemLayoutKey.DTYPE: arr.dtype.str,
+                    ItemLayoutKey.SHAPE: list(arr.shape),
+                    ItemLayoutKey.SIZE: arr.nbytes,
+                }
+            )
+            buffers.append(arr.reshape(-1).view(np.uint8))
+        return layout, buffers, None
+
+    def new_items_from_layout(self, layout, fobs_ctx: dict, meta: dict = None, storage=None):
+        items = {}
+        buffers = []
+        for i, entry in enumerate(layout):
+            dtype = np.dtype(entry[ItemLayoutKey.DTYPE])
+            if storage:
+                arr = np.frombuffer(storage[i], dtype=dtype).reshape(entry[ItemLayoutKey.SHAPE])
+            else:
+                arr = np.empty(entry[ItemLayoutKey.SHAPE], dtype=dtype)
+            items[entry[ItemLayoutKey.ID]] = arr
+            buffers.append(arr.reshape(-1).view(np.uint8))
+        return items, buffers
+
+
+class FlatParamsDecomposer(fobs.Decomposer):
+    """Sends FlatParams as one buffer, so the whole model is a single datum."""
+
+    def supported_type(self):
+        return FlatParams
+
+    def decompose(self, target: FlatParams, manager: DatumManager = None) -> Any:
+        if not target.is_packed():
+            # some params have been replaced: pack them again
+            target = FlatParams.from_dict(target)
+        return target.buffer, target.layout
+
+    def recompose(self, data: Any, manager: DatumManager = None) -> FlatParams:
+        buffer, layout = data
+        return FlatParams(buffer, layout)
+
+
+class SparseArrayDecomposer(fobs.Decomposer):
+    """Sends SparseArray as the index and value arrays."""
+
+    def supported_type(self):
+        return SparseArray
+
+    def decompose(self, target: SparseArray, manager: DatumManager = None) -> Any:
+        return list(target.shape), target.indices, target.values
+
+    def recompose(self, data: Any, manager: DatumManager = None) -> SparseArray:
+        shape, indices, values = data
+        return SparseArray(shape, indices, values)
+
 
 def register():
     if register.registered:
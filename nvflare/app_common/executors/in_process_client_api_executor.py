@@ -16,7 +16,7 @@ import threading
 import time
 from typing import Optional
 
-from nvflare.apis.analytix import ANALYTIC_EVENT_TYPE
+from nvflare.apis.analytix import ANALYTIC_EVENT_TYPE, AnalyticsData
 from nvflare.apis.event_type import EventType
 from nvflare.apis.executor import Executor
 from nvflare.apis.fl_constant import FLContextKey, FLMetaKey, ReturnCode
@@ -28,6 +28,7 @@ from nvflare.apis.workspace import Workspace
 from nvflare.app_common.abstract.params_converter import ParamsConverter
 from nvflare.app_common.app_constant import AppConstants
 from nvflare.app_common.executors.task_script_runner import TaskScriptRunner
+from nvflare.app_common.widgets.streaming import AnalyticsBatcher
 from nvflare.client.api_spec import CLIENT_API_KEY
 from nvflare.client.config import ConfigKey, ExchangeFormat, TransferType
 from nvflare.client.in_process.api import (
@@ -61,7 +62,17 @@ class InProcessClientAPIExecutor(Executor):
         evaluate_task_name: str = AppConstants.TASK_VALIDATION,
         submit_model_task_name: str = AppConstants.TASK_SUBMIT_MODEL,
         server_expected_format: str = ExchangeFormat.NUMPY,
+        log_batch_size: int = 1,
+        log_flush_interval: float = 1.0,
     ):
+        """Runs the training script of the Client API in the client job process.
+
+        Args:
+            log_batch_size (int): max number of records logged by the script (client API log) that are sent in
+                one event. The default of 1 sends each record in its own event.
+            log_flush_interval (float): max seconds a logged record waits in a batch, when log_batch_size is more
+                than 1. The batch is also sent when the script returns the task result.
+        """
         super(InProcessClientAPIExecutor, self).__init__()
         self._abort = False
         self._client_api = None
@@ -102,6 +113,9 @@ class InProcessClientAPIExecutor(Executor):
         self._fl_ctx = None
         self._task_fn_path = None
         self._task_fn_wrapper = None
+        self._log_batcher = (
+            AnalyticsBatcher(self._send_log_dxo, log_batch_size, log_flush_interval) if log_batch_size > 1 else None
+        )
 
     def handle_event(self, event_type: str, fl_ctx: FLContext):
         if event_type == EventType.START_RUN:
@@ -129,6 +143,7 @@ class InProcessClientAPIExecutor(Executor):
             self._event_manager.fire_event(TOPIC_STOP, "END_RUN received")
             if self._task_fn_thread:
                 self._task_fn_thread.join()
+            self._flush_logs()
 
     def execute(self, task_name: str, shareable: Shareable, fl_ctx: FLContext, abort_signal: Signal) -> Shareable:
         self.log_info(fl_ctx, f"execute for task ({task_name})")
@@ -168,6 +183,8 @@ class InProcessClientAPIExecutor(Executor):
                         result.set_header(AppConstants.CURRENT_ROUND, current_round)
                     if self._to_nvflare_converter is not None:
                         result = self._to_nvflare_converter.process(task_name, result, fl_ctx)
+                    # the metrics of the task are sent before its result
+                    self._flush_logs()
                     return result
                 else:
                     self.log_debug(fl_ctx, f"waiting for result, sleep for {self._result_pull_interval} secs")
@@ -233,11 +250,25 @@ class InProcessClientAPIExecutor(Executor):
 
         if "key" in result:
             result["tag"] = result.pop("key")
+        if self._log_batcher:
+            tag = result.pop("tag")
+            writer = result.pop("writer", None)
+            if writer is None:
+                self._log_batcher.add(AnalyticsData(key=tag, **result))
+            else:
+                self._log_batcher.add(AnalyticsData(key=tag, sender=writer, **result))
+            return
         dxo = create_analytic_dxo(**result)
+        self._send_log_dxo(dxo)
 
+    def _send_log_dxo(self, dxo):
         # fire_fed_event = True w/o fed_event_converter somehow did not work
         with self._engine.new_context() as fl_ctx:
             send_analytic_dxo(self, dxo=dxo, fl_ctx=fl_ctx, event_type=ANALYTIC_EVENT_TYPE, fire_fed_event=False)
 
+    def _flush_logs(self):
+        if self._log_batcher and self._engine:
+            self._log_batcher.flush()
+
     def to_abort_callback(self, topic, data, databus):
         self._abort = True
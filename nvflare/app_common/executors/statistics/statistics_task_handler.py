@@ -11,8 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from nvflare.apis.fl_constant import ReturnCode
 from nvflare.apis.fl_context import FLContext
@@ -68,6 +67,8 @@ class StatisticsTaskHandler(TaskHandler):
             for tm in target_statistics:
                 fn = self.statistic_functions()[tm.name]
                 statistics_result[tm.name] = {}
+                if tm.name == StC.STATS_HISTOGRAM:
+                    self._prepare_histograms(ds_features, tm, shareable, fl_ctx)
                 self._populate_result_statistics(statistics_result, ds_features, tm, shareable, fl_ctx, fn)
 
             # always add count for data privacy needs
@@ -221,17 +222,10 @@ class StatisticsTaskHandler(TaskHandler):
 
         return result
 
-    def get_histogram(
-        self,
-        dataset_name: str,
-        feature_name: str,
-        statistic_configs: StatisticConfig,
-        inputs: Shareable,
-        fl_ctx: FLContext,
-    ) -> Histogram:
-
+    def _get_histogram_range(
+        self, dataset_name: str, feature_name: str, statistic_configs: StatisticConfig, inputs: Shareable
+    ) -> Optional[Tuple[int, float, float]]:
         if StC.STATS_MIN in inputs and StC.STATS_MAX in inputs:
-
             global_min_value = self._get_global_value_from_input(StC.STATS_MIN, dataset_name, feature_name, inputs)
             global_max_value = self._get_global_value_from_input(StC.STATS_MAX, dataset_name, feature_name, inputs)
             if global_min_value is not None and global_max_value is not None:
@@ -240,12 +234,46 @@ class StatisticsTaskHandler(TaskHandler):
                 bin_range: List[float] = self.get_bin_range(
                     feature_name, global_min_value, global_max_value, hist_config
                 )
-                result = self.stats_generator.histogram(
-                    dataset_name, feature_name, num_of_bins, bin_range[0], bin_range[1]
-                )
-                return result
-            else:
-                return Histogram(HistogramType.STANDARD, list())
+                return num_of_bins, bin_range[0], bin_range[1]
+        return None
+
+    def _prepare_histograms(self, ds_features, statistic_configs: StatisticConfig, inputs: Shareable, fl_ctx):
+        for ds_name in ds_features:
+            histogram_ranges = {}
+            for feature in ds_features[ds_name]:
+                try:
+                    histogram_range = self._get_histogram_range(
+                        ds_name, feature.feature_name, statistic_configs, inputs
+                    )
+                except Exception:
+                    # reported when the histogram of the feature is populated
+                    histogram_range = None
+                if histogram_range:
+                    histogram_ranges[feature.feature_name] = histogram_range
+
+            if histogram_ranges:
+                try:
+                    self.stats_generator.prepare_histograms(ds_name, histogram_ranges)
+                except Exception as e:
+                    self.log_exception(
+                        fl_ctx,
+                        f"Failed to prepare histograms of dataset {ds_name} with exception: "
+                        f"{secure_format_exception(e)}",
+                    )
+
+    def get_histogram(
+        self,
+        dataset_name: str,
+        feature_name: str,
+        statistic_configs: StatisticConfig,
+        inputs: Shareable,
+        fl_ctx: FLContext,
+    ) -> Histogram:
+
+        histogram_range = self._get_histogram_range(dataset_name, feature_name, statistic_configs, inputs)
+        if histogram_range:
+            num_of_bins, min_value, max_value = histogram_range
+            return self.stats_generator.histogram(dataset_name, feature_name, num_of_bins, min_value, max_value)
         else:
             return Histogram(HistogramType.STANDARD, list())
 
@@ -14,6 +14,7 @@
 
 from .exclude_vars import ExcludeVars
 from .percentile_privacy import PercentilePrivacy
+from .sparsification import Densifier, Sparsifier
 from .svt_privacy import SVTPrivacy
 
-__all__ = ["PercentilePrivacy", "SVTPrivacy", "ExcludeVars"]
+__all__ = ["PercentilePrivacy", "SVTPrivacy", "ExcludeVars", "Sparsifier", "Densifier"]
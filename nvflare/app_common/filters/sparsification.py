@@ -0,0 +1,187 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Optional, Union
+
+import numpy as np
+
+from nvflare.apis.dxo import DataKind
+from nvflare.apis.dxo_filter import DXO, DXOFilter
+from nvflare.apis.fl_context import FLContext
+from nvflare.apis.shareable import Shareable
+from nvflare.app_common.abstract.sparse_array import SparseArray
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def _is_torch_tensor(v) -> bool:
+    # avoid importing torch: it is an optional dependency of app_common
+    return type(v).__module__.startswith("torch") and hasattr(v, "is_floating_point")
+
+
+def _to_float_array(values) -> Optional[np.ndarray]:
+    """Get the values as a float numpy array, or None if they can't be sparsified."""
+    if isinstance(values, np.ndarray):
+        return values if values.dtype.kind == "f" else None
+    if _is_torch_tensor(values):
+        if not values.is_floating_point():
+            return None
+        values = values.detach().cpu()
+        try:
+            return values.numpy()
+        except TypeError:
+            # no numpy dtype (e.g. bfloat16)
+            return values.float().numpy()
+    return None
+
+
+class Sparsifier(DXOFilter):
+    def __init__(
+        self,
+        density: float = 0.01,
+        threshold: Optional[float] = None,
+        min_size: int = 1024,
+        error_feedback: bool = True,
+    ):
+        """Sparsify the weight diff, so only the entries of the largest magnitude are sent.
+
+        Each layer is sent as a SparseArray of the flat indices and the values of the kept entries. Layers of
+        numpy arrays and torch tensors are sparsified, and the SparseArrays are numpy.
+        InTimeAccumulateWeightedAggregator aggregates SparseArrays directly. Use Densifier for other consumers.
+
+        With error feedback, the entries not sent are accumulated in a residual per layer, and added to the
+        weight diff of the next round, so all updates are sent eventually.
+
+        Args:
+            density: fraction of the entries to keep in each layer (top-k by magnitude).
+            threshold: if specified, keep the entries of which the magnitude is not less than this value
+                instead of the top-k.
+            min_size: layers with fewer entries are sent dense.
+            error_feedback: whether to accumulate the entries not sent into the next round.
+        """
+        super().__init__(supported_data_kinds=[DataKind.WEIGHT_DIFF], data_kinds_to_filter=[DataKind.WEIGHT_DIFF])
+        if not 0.0 < density <= 1.0:
+            raise ValueError(f"density must be in (0, 1] but got {density}")
+        if threshold is not None and threshold < 0:
+            raise ValueError(f"threshold must be >= 0 but got {threshold}")
+
+        self.density = density
+        self.threshold = threshold
+        self.min_size = min_size
+        self.error_feedback = error_feedback
+        self.residuals = {}  # var name => entries not sent yet
+        self.skipped = set()  # (var name, type) of the values that can't be sparsified, warned once
+
+    def _select(self, values: np.ndarray) -> Optional[np.ndarray]:
+        """Get the sorted flat indices of the entries to keep, or None if the layer should be sent dense."""
+        size = values.size
+        magnitudes = np.abs(values.reshape(-1))
+        if self.threshold is not None:
+            indices = np.flatnonzero(magnitudes >= self.threshold)
+        else:
+            k = max(int(np.ceil(self.density * size)), 1)
+            if k >= size:
+                return None
+            indices = np.argpartition(magnitudes, size - k)[size - k :]
+            indices.sort()
+
+        index_dtype = np.int32 if size <= _INT32_MAX else np.int64
+        if indices.size * (np.dtype(index_dtype).itemsize + values.itemsize) >= values.nbytes:
+            # not smaller than dense
+            return None
+        return indices.astype(index_dtype, copy=False)
+
+    def process_dxo(self, dxo: DXO, shareable: Shareable, fl_ctx: FLContext) -> Union[None, DXO]:
+        """Replace the layers of the weight diff with SparseArrays.
+
+        Args:
+            dxo (DXO): DXO to be filtered.
+            shareable: that the dxo belongs to
+            fl_ctx (FLContext): only used for logging.
+
+        Returns: filtered dxo
+        """
+        n_bytes_before = 0
+        n_bytes_after = 0
+        n_sparse = 0
+
+        # a new dict: the SparseArrays can't be packed in FlatParams
+        result = {}
+        for name, original in dxo.data.items():
+            values = _to_float_array(original)
+            if values is None:
+                value_type = type(original).__name__
+                # arrays of other dtypes (e.g. int counters) are expected to be sent dense
+                is_array = isinstance(original, np.ndarray) or _is_torch_tensor(original)
+                if not is_array and (name, value_type) not in self.skipped:
+                    self.skipped.add((name, value_type))
+                    self.log_warning(fl_ctx, f"{name} of type {value_type} is not sparsified")
+                result[name] = original
+                continue
+
+            n_bytes_before += values.nbytes
+            # the values may share memory with the original (e.g. a tensor), which must not be changed
+            owned = False
+            if self.error_feedback:
+                residual = self.residuals.get(name)
+                if residual is not None and residual.shape == values.shape:
+                    values = values + residual
+                    owned = True
+
+            indices = self._select(values) if values.size >= self.min_size else None
+            if indices is None:
+                result[name] = values if owned else original
+                n_bytes_after += values.nbytes
+                self.residuals.pop(name, None)
+                continue
+
+            sparse = SparseArray.from_dense(values, indices)
+            result[name] = sparse
+            n_bytes_after += sparse.nbytes
+            n_sparse += 1
+
+            if self.error_feedback:
+                # keep the entries not sent
+                residual = values if owned else values.copy()
+                residual.reshape(-1)[indices] = 0
+                self.residuals[name] = residual
+
+        self.log_info(
+            fl_ctx,
+            f"Sparsified {n_sparse}/{len(result)} layers from {n_bytes_before / (1024 ** 2):.2f} MB"
+            f" to {n_bytes_after / (1024 ** 2):.2f} MB",
+        )
+        dxo.data = result
+        return dxo
+
+
+class Densifier(DXOFilter):
+    def __init__(self):
+        """Convert the SparseArrays of the weight diff sparsified by Sparsifier back to dense arrays.
+
+        It's not needed before InTimeAccumulateWeightedAggregator, which aggregates SparseArrays directly.
+        """
+        super().__init__(supported_data_kinds=[DataKind.WEIGHT_DIFF], data_kinds_to_filter=[DataKind.WEIGHT_DIFF])
+
+    def process_dxo(self, dxo: DXO, shareable: Shareable, fl_ctx: FLContext) -> Union[None, DXO]:
+        """Replace the SparseArrays of the weight diff with dense arrays.
+
+        Args:
+            dxo (DXO): DXO to be filtered.
+            shareable: that the dxo belongs to
+            fl_ctx (FLContext): only used for logging.
+
+        Returns: filtered dxo
+        """
+        dxo.data = {k: v.to_dense() if isinstance(v, SparseArray) else v for k, v in dxo.data.items()}
+        return dxo
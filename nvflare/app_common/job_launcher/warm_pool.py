@@ -0,0 +1,198 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import logging
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from typing import List, Optional
+
+from nvflare.app_common.job_launcher.warm_worker import STATUS_READY, STATUS_STARTED
+
+WORKER_MODULE = "nvflare.app_common.job_launcher.warm_worker"
+
+
+class _Worker:
+    def __init__(self, process: subprocess.Popen, status_file):
+        self.process = process
+        self.status_file = status_file
+
+    def read_status(self) -> Optional[dict]:
+        line = self.status_file.readline()
+        return json.loads(line) if line else None
+
+    def kill(self):
+        try:
+            os.killpg(os.getpgid(self.process.pid), 9)
+        except OSError:
+            pass
+        self.status_file.close()
+        self.process.wait()
+
+
+class WarmProcessPool:
+    def __init__(self, size: int, preload_modules: List[str] = None):
+        """A pool of job processes that are started ahead of the jobs.
+
+        Each worker is a python interpreter that has imported the preload modules, and waits for a job on its stdin.
+        A job is handed to a ready worker, and a new worker is started in the background to replace it.
+        The workers are started with subprocess instead of forked from a process, so they don't inherit the
+        threads or the state of the parent.
+
+        Args:
+            size: number of ready workers to keep
+            preload_modules: modules to import in the workers
+        """
+        self.size = size
+        self.preload_modules = list(preload_modules or [])
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._ready = queue.Queue()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread = None
+        self._metrics = {
+            "worker_starts": 0,
+            "worker_start_secs": 0.0,
+            "warm_launches": 0,
+            "warm_launch_secs": 0.0,
+            "cold_launches": 0,
+        }
+
+    def start(self):
+        with self._lock:
+            if self._thread or self._stopped:
+                return
+            self._thread = threading.Thread(target=self._replenish, name="warm_process_pool", daemon=True)
+            self._thread.start()
+
+    def _spawn(self) -> Optional[_Worker]:
+        preload = ",".join(self.preload_modules)
+        start = time.perf_counter()
+        read_fd, write_fd = os.pipe()
+        try:
+            process = subprocess.Popen(
+                [sys.executable, "-m", WORKER_MODULE, "--status_fd", str(write_fd), "--preload", preload],
+                stdin=subprocess.PIPE,
+                pass_fds=(write_fd,),
+                preexec_fn=os.setsid,
+            )
+        finally:
+            os.close(write_fd)
+
+        worker = _Worker(process, os.fdopen(read_fd, "r"))
+        status = worker.read_status()
+        if not status or status.get("status") != STATUS_READY:
+            self.logger.warning("warm process failed to start")
+            worker.kill()
+            return None
+        if status.get("failed"):
+            self.logger.warning(f"warm process failed to preload modules: {status['failed']}")
+
+        duration = time.perf_counter() - start
+        self._record("worker_starts", "worker_start_secs", duration)
+        self.logger.debug(f"warm process {process.pid} started in {duration:.3f} secs")
+        return worker
+
+    def _replenish(self):
+        while not self._stopped:
+            if self._ready.qsize() >= self.size:
+                self._wakeup.wait(timeout=1.0)
+                self._wakeup.clear()
+                continue
+            try:
+                worker = self._spawn()
+            except Exception as e:
+                self.logger.error(f"failed to start warm process: {e}")
+                worker = None
+            if worker is None:
+                # don't retry too fast
+                time.sleep(1.0)
+            elif self._stopped:
+                worker.kill()
+            else:
+                self._ready.put(worker)
+
+    def _record(self, count_key: str, secs_key: str = None, secs: float = 0.0):
+        with self._lock:
+            self._metrics[count_key] += 1
+            if secs_key:
+                self._metrics[secs_key] += secs
+
+    def launch(self, module: str, args: List[str], env: dict, cwd: str = None) -> Optional[subprocess.Popen]:
+        """Run a job module in a ready worker, as "python -m module args".
+
+        Args:
+            module: the module to run as __main__
+            args: the command line args of the module
+            env: environment variables of the job
+            cwd: working dir of the job. The current dir if not specified.
+
+        Returns: the process of the job, or None if no worker is ready, so the job should be launched cold.
+        """
+        self._wakeup.set()
+        job = json.dumps({"module": module, "args": args, "env": env, "cwd": cwd or os.getcwd()}) + "\n"
+        while True:
+            try:
+                worker = self._ready.get_nowait()
+            except queue.Empty:
+                self._record("cold_launches")
+                return None
+
+            start = time.perf_counter()
+            try:
+                worker.process.stdin.write(job.encode("utf-8"))
+                worker.process.stdin.close()
+                status = worker.read_status()
+            except (OSError, ValueError):
+                status = None
+            if not status or status.get("status") != STATUS_STARTED:
+                # the worker is dead, try the next one
+                worker.kill()
+                continue
+
+            worker.status_file.close()
+            duration = time.perf_counter() - start
+            self._record("warm_launches", "warm_launch_secs", duration)
+            return worker.process
+
+    def get_metrics(self) -> dict:
+        """Get the startup latency metrics.
+
+        Returns: dict of the numbers of worker starts, warm and cold launches, the average secs to start a worker
+        (the startup latency of a cold launch), and the average secs to hand a job to a ready worker
+        (the startup latency of a warm launch)
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+        metrics["ready_workers"] = self._ready.qsize()
+        metrics["avg_worker_start_secs"] = metrics["worker_start_secs"] / max(metrics["worker_starts"], 1)
+        metrics["avg_warm_launch_secs"] = metrics["warm_launch_secs"] / max(metrics["warm_launches"], 1)
+        return metrics
+
+    def shutdown(self):
+        self._stopped = True
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout=5.0)
+        while True:
+            try:
+                worker = self._ready.get_nowait()
+            except queue.Empty:
+                break
+            worker.kill()
@@ -0,0 +1,83 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A pre-started job process of the WarmProcessPool.
+
+It imports the preload modules, reports "ready" on the status fd, then waits for a job on stdin: one JSON line of
+{"module": ..., "args": [...], "env": {...}, "cwd": ...}. The job module is run as __main__, as with "python -m".
+The worker exits without running anything if stdin is closed.
+"""
+import argparse
+import importlib
+import json
+import os
+import runpy
+import sys
+
+STATUS_READY = "ready"
+STATUS_STARTED = "started"
+
+
+def _write_status(status_file, status: str, **kwargs):
+    status_file.write(json.dumps({"status": status, **kwargs}) + "\n")
+    status_file.flush()
+
+
+def _apply_python_path(python_path: str):
+    # PYTHONPATH is only read at interpreter start. Its entries take precedence over the others, in their order.
+    entries = [p for p in dict.fromkeys(python_path.split(os.pathsep)) if p]
+    sys.path[:] = entries + [p for p in sys.path if p not in entries]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--status_fd", type=int, required=True)
+    parser.add_argument("--preload", type=str, default="")
+    args = parser.parse_args()
+
+    status_file = os.fdopen(args.status_fd, "w")
+    failed = []
+    for module in filter(None, args.preload.split(",")):
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            failed.append(f"{module}: {e}")
+    _write_status(status_file, STATUS_READY, failed=failed)
+
+    line = sys.stdin.readline()
+    if not line:
+        # the pool is shut down
+        return
+    job = json.loads(line)
+
+    os.environ.clear()
+    os.environ.update(job["env"])
+    _apply_python_path(job["env"].get("PYTHONPATH", ""))
+    if job.get("cwd"):
+        os.chdir(job["cwd"])
+
+    # stdin is the control channel, the job doesn't read it
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+
+    _write_status(status_file, STATUS_STARTED)
+    status_file.close()
+
+    sys.argv = [job["module"]] + job["args"]
+    runpy.run_module(job["module"], run_name="__main__", alter_sys=True)
+
+
+if __name__ == "__main__":
+    main()
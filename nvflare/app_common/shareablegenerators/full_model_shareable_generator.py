@@ -15,6 +15,7 @@
 from nvflare.apis.dxo import DataKind, from_shareable
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.shareable import Shareable
+from nvflare.app_common.abstract.flat_params import get_packed_vector
 from nvflare.app_common.abstract.model import ModelLearnable, ModelLearnableKey, model_learnable_to_dxo
 from nvflare.app_common.abstract.shareable_generator import ShareableGenerator
 from nvflare.app_common.app_constant import AppConstants
@@ -63,8 +64,19 @@ class FullModelShareableGenerator(ShareableGenerator):
             weights = base_model[ModelLearnableKey.WEIGHTS]
             if dxo.data is not None:
                 model_diff = dxo.data
-                for v_name, v_value in model_diff.items():
-                    weights[v_name] = weights[v_name] + v_value
+                weights_vector = get_packed_vector(weights)
+                diff_vector = get_packed_vector(model_diff)
+                if (
+                    weights_vector is not None
+                    and diff_vector is not None
+                    and weights.has_same_layout(model_diff)
+                    and weights_vector.dtype == diff_vector.dtype
+                ):
+                    # apply the diff to the whole model at once
+                    base_model[ModelLearnableKey.WEIGHTS] = weights.with_vector(weights_vector + diff_vector)
+                else:
+                    for v_name, v_value in model_diff.items():
+                        weights[v_name] = weights[v_name] + v_value
         elif dxo.data_kind == DataKind.WEIGHTS:
             if not base_model:
                 base_model = ModelLearnable()
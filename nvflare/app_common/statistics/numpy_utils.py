@@ -50,6 +50,22 @@ def get_std_histogram_buckets(nums: np.ndarray, num_bins: int = 10, br: Optional
     else:
         counts, buckets = np.histogram(nums, bins=num_bins)
 
+    return histogram_buckets_from_counts(counts, buckets, num_neginf, num_posinf)
+
+
+def histogram_buckets_from_counts(
+    counts: np.ndarray, buckets: np.ndarray, num_neginf: int = 0, num_posinf: int = 0
+) -> List[Bin]:
+    """Create the histogram buckets from the counts and the bin edges of np.histogram.
+
+    Args:
+        counts: counts of the finite values in each bin
+        buckets: bin edges, one more than the counts
+        num_neginf: number of the negative infinities
+        num_posinf: number of the positive infinities
+
+    Returns: list of Bin
+    """
     histogram_buckets: List[Bin] = []
     for bucket_count in range(len(counts)):
         # Add any negative or positive infinities to the first and last
@@ -20,7 +20,7 @@ import shutil
 import tempfile
 import uuid
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from nvflare.apis.storage import DATA, META, StorageException, StorageSpec
 from nvflare.apis.utils.format_check import validate_class_methods_args
@@ -420,3 +420,6 @@ class FilesystemStorage(StorageSpec):
         with open(mark_file, "w") as f:
             if data:
                 f.write(data)
+
+    def get_local_path(self, uri: str) -> Optional[str]:
+        return self._object_path(uri)
@@ -19,6 +19,7 @@ from nvflare.apis.dxo import DXO
 from nvflare.apis.event_type import EventType
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.utils.analytix_utils import send_analytic_dxo
+from nvflare.app_common.widgets.streaming import AnalyticsBatcher
 from nvflare.client.config import ConfigKey
 from nvflare.fuel.utils.attributes_exportable import AttributesExportable
 from nvflare.fuel.utils.constants import PipeChannelName
@@ -37,7 +38,17 @@ class MetricRelay(Widget, AttributesExportable):
         pipe_channel_name=PipeChannelName.METRIC,
         event_type: str = ANALYTIC_EVENT_TYPE,
         fed_event: bool = True,
+        batch_size: int = 1,
+        flush_interval: float = 1.0,
     ):
+        """Relays the metrics received from the metric pipe as analytics events.
+
+        Args:
+            batch_size (int): max number of metric records relayed in one event. The default of 1 relays each
+                record in its own event.
+            flush_interval (float): max seconds a record waits in a batch, when batch_size is more than 1.
+                The batch is also relayed after each task.
+        """
         super().__init__()
         self.pipe_id = pipe_id
         self._read_interval = read_interval
@@ -49,6 +60,7 @@ class MetricRelay(Widget, AttributesExportable):
         self._fl_ctx = None
         self._event_type = event_type
         self._fed_event = fed_event
+        self._batcher = AnalyticsBatcher(self._send_dxo, batch_size, flush_interval) if batch_size > 1 else None
 
     def handle_event(self, event_type: str, fl_ctx: FLContext):
         if event_type == EventType.ABOUT_TO_START_RUN:
@@ -71,11 +83,16 @@ class MetricRelay(Widget, AttributesExportable):
             self.pipe.open(self.pipe_channel_name)
         elif event_type == EventType.BEFORE_TASK_EXECUTION:
             self.pipe_handler.start()
+        elif event_type == EventType.AFTER_TASK_EXECUTION:
+            if self._batcher:
+                self._batcher.flush()
         elif event_type == EventType.ABOUT_TO_END_RUN:
             self.log_info(fl_ctx, "Stopping pipe handler")
             if self.pipe_handler:
                 self.pipe_handler.notify_end("end_of_job")
                 self.pipe_handler.stop()
+            if self._batcher:
+                self._batcher.flush()
 
     def _pipe_status_cb(self, msg: Message):
         self.logger.info(f"{self.pipe_channel_name} pipe status changed to {msg.topic}")
@@ -84,7 +101,13 @@ class MetricRelay(Widget, AttributesExportable):
     def _pipe_msg_cb(self, msg: Message):
         if not isinstance(msg.data, DXO):
             self.logger.error(f"bad metric data: expect DXO but got {type(msg.data)}")
-        send_analytic_dxo(self, msg.data, self._fl_ctx, self._event_type, fire_fed_event=self._fed_event)
+        elif self._batcher:
+            self._batcher.add_dxo(msg.data)
+            return
+        self._send_dxo(msg.data)
+
+    def _send_dxo(self, dxo: DXO):
+        send_analytic_dxo(self, dxo, self._fl_ctx, self._event_type, fire_fed_event=self._fed_event)
 
     def export(self, export_mode: str) -> Tuple[str, dict]:
         pipe_export_class, pipe_export_args = self.pipe.export(export_mode)
@@ -13,10 +13,18 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
-from threading import Lock
-from typing import List, Optional
+from threading import Lock, Timer
+from typing import Callable, List, Optional
 
-from nvflare.apis.analytix import ANALYTIC_EVENT_TYPE, AnalyticsDataType, LogWriterName, TrackConst
+from nvflare.apis.analytix import (
+    ANALYTIC_EVENT_TYPE,
+    AnalyticsBatch,
+    AnalyticsData,
+    AnalyticsDataType,
+    LogWriterName,
+    TrackConst,
+)
+from nvflare.apis.dxo import DXO, from_shareable
 from nvflare.apis.event_type import EventType
 from nvflare.apis.fl_constant import EventScope, FLContextKey, ReservedKey
 from nvflare.apis.fl_context import FLContext
@@ -25,8 +33,78 @@ from nvflare.apis.utils.analytix_utils import create_analytic_dxo, send_analytic
 from nvflare.widgets.widget import Widget
 
 
+class AnalyticsBatcher:
+    def __init__(self, send_func: Callable[[DXO], None], batch_size: int, flush_interval: float):
+        """Coalesces analytics records into batches.
+
+        A batch is sent when it has batch_size records, or flush_interval seconds after its first record.
+
+        Args:
+            send_func: the function to send the DXO of a batch
+            batch_size (int): max number of records in a batch
+            flush_interval (float): max seconds a record waits in the batch
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, but got {batch_size}")
+        self.send_func = send_func
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._batch = None
+        self._timer = None
+        self._lock = Lock()
+        # keeps the batches in order when flushed by the timer and by add at the same time
+        self._send_lock = Lock()
+
+    def add(self, data: AnalyticsData):
+        self._add(lambda b: b.add(data), data.sender)
+
+    def add_dxo(self, dxo: DXO):
+        self._add(lambda b: b.add_dxo(dxo), dxo.get_meta_prop(TrackConst.TRACKER_KEY))
+
+    def _add(self, add_func, sender: LogWriterName):
+        with self._send_lock:
+            with self._lock:
+                if self._batch is not None and self._batch.sender != sender:
+                    batch = self._take_batch()
+                    self._send(batch)
+                if self._batch is None:
+                    self._batch = AnalyticsBatch(sender)
+                    if self.flush_interval > 0:
+                        self._timer = Timer(self.flush_interval, self.flush)
+                        self._timer.daemon = True
+                        self._timer.start()
+                add_func(self._batch)
+                batch = self._take_batch() if len(self._batch) >= self.batch_size else None
+            self._send(batch)
+
+    def _take_batch(self) -> Optional[AnalyticsBatch]:
+        batch = self._batch
+        self._batch = None
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _send(self, batch: Optional[AnalyticsBatch]):
+        if batch:
+            self.send_func(batch.to_dxo())
+
+    def flush(self):
+        """Sends the records in the current batch."""
+        with self._send_lock:
+            with self._lock:
+                batch = self._take_batch()
+            self._send(batch)
+
+
 class AnalyticsSender(Widget):
-    def __init__(self, event_type=ANALYTIC_EVENT_TYPE, writer_name=LogWriterName.TORCH_TB):
+    def __init__(
+        self,
+        event_type=ANALYTIC_EVENT_TYPE,
+        writer_name=LogWriterName.TORCH_TB,
+        batch_size: int = 1,
+        flush_interval: float = 1.0,
+    ):
         """Sender for analytics data.
 
         This class has some legacy methods that implement some common methods following signatures from
@@ -36,11 +114,16 @@ class AnalyticsSender(Widget):
         Args:
             event_type (str): event type to fire (defaults to "analytix_log_stats").
             writer_name: the log writer for syntax information (defaults to LogWriterName.TORCH_TB)
+            batch_size (int): max number of records sent in one event. With the default of 1, each record is sent
+                in its own event. Otherwise the records are coalesced into batches, which are handled in bulk by
+                the AnalyticsReceivers.
+            flush_interval (float): max seconds a record waits in a batch, when batch_size is more than 1.
         """
         super().__init__()
         self.engine = None
         self.event_type = event_type
         self.writer = writer_name
+        self.batcher = AnalyticsBatcher(self._send_dxo, batch_size, flush_interval) if batch_size > 1 else None
 
     def get_writer_name(self) -> LogWriterName:
         return self.writer
@@ -48,6 +131,17 @@ class AnalyticsSender(Widget):
     def handle_event(self, event_type: str, fl_ctx: FLContext):
         if event_type == EventType.ABOUT_TO_START_RUN:
             self.engine = fl_ctx.get_engine()
+        elif event_type in (EventType.AFTER_TASK_EXECUTION, EventType.ABOUT_TO_END_RUN):
+            self.flush()
+
+    def flush(self):
+        """Sends the batched records."""
+        if self.batcher and self.engine:
+            self.batcher.flush()
+
+    def _send_dxo(self, dxo: DXO):
+        with self.engine.new_context() as fl_ctx:
+            send_analytic_dxo(self, dxo=dxo, fl_ctx=fl_ctx, event_type=self.event_type)
 
     def add(self, tag: str, value, data_type: AnalyticsDataType, global_step: Optional[int] = None, **kwargs):
         """Create and send a DXO by firing an event.
@@ -66,13 +160,17 @@ class AnalyticsSender(Widget):
             if not isinstance(global_step, int):
                 raise TypeError(f"Expect global step to be an instance of int, but got {type(global_step)}")
             kwargs[TrackConst.GLOBAL_STEP_KEY] = global_step
+        if self.batcher:
+            data = AnalyticsData(key=tag, value=value, data_type=data_type, sender=self.get_writer_name(), **kwargs)
+            self.batcher.add(data)
+            return
         dxo = create_analytic_dxo(tag=tag, value=value, data_type=data_type, writer=self.get_writer_name(), **kwargs)
-        with self.engine.new_context() as fl_ctx:
-            send_analytic_dxo(self, dxo=dxo, fl_ctx=fl_ctx, event_type=self.event_type)
+        self._send_dxo(dxo)
 
     def close(self):
         """Close resources."""
         if self.engine:
+            self.flush()
             self.engine = None
 
 
@@ -115,6 +213,23 @@ class AnalyticsReceiver(Widget, ABC):
         """
         pass
 
+    def save_batch(self, fl_ctx: FLContext, shareable: Shareable, record_origin: str):
+        """Saves a batch of records, sent by an AnalyticsSender with batch_size more than 1.
+
+        The default implementation calls save for each record. Receivers that can write many records at once
+        should override it.
+
+        Args:
+            fl_ctx (FLContext): fl context.
+            shareable (Shareable): the received message, with the DXO of an AnalyticsBatch.
+            record_origin (str): the sender of this message / record.
+        """
+        dxo = from_shareable(shareable)
+        writer = dxo.get_meta_prop(TrackConst.TRACKER_KEY)
+        # keep the syntax of the sender, save converts it for the receiver
+        for data in AnalyticsBatch.get_records(dxo, receiver=writer):
+            self.save(fl_ctx=fl_ctx, shareable=data.to_dxo().to_shareable(), record_origin=record_origin)
+
     @abstractmethod
     def finalize(self, fl_ctx: FLContext):
         """Finalizes the receiver.
@@ -165,7 +280,10 @@ class AnalyticsReceiver(Widget, ABC):
 
             try:
                 with self._save_lock:
-                    self.save(shareable=data, fl_ctx=fl_ctx, record_origin=record_origin)
+                    if AnalyticsBatch.is_batch(from_shareable(data)):
+                        self.save_batch(shareable=data, fl_ctx=fl_ctx, record_origin=record_origin)
+                    else:
+                        self.save(shareable=data, fl_ctx=fl_ctx, record_origin=record_origin)
             except Exception as e:
                 self.log_error(fl_ctx, f"Receiver save method failed with {e}.", fire_event=False)
 
@@ -12,13 +12,55 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import struct
 from typing import Any, Optional
 
 import torch
 from safetensors.torch import _remove_duplicate_names, load_file, save_file
 
 import nvflare.fuel.utils.fobs.dots as dots
-from nvflare.fuel.utils.fobs.decomposers.via_file import ViaFileDecomposer
+from nvflare.fuel.utils.fobs.decomposers.via_file import ItemLayoutKey, ViaFileDecomposer
+
+# dtype names used in the safetensors header
+_SAFETENSORS_DTYPES = {
+    "F64": torch.float64,
+    "F32": torch.float32,
+    "F16": torch.float16,
+    "BF16": torch.bfloat16,
+    "I64": torch.int64,
+    "I32": torch.int32,
+    "I16": torch.int16,
+    "I8": torch.int8,
+    "U8": torch.uint8,
+    "BOOL": torch.bool,
+}
+
+# dtype names used in the layout of the items, as str(tensor.dtype) without "torch."
+_LAYOUT_DTYPES = {
+    name: getattr(torch, name)
+    for name in (
+        "float64",
+        "float32",
+        "float16",
+        "bfloat16",
+        "complex128",
+        "complex64",
+        "int64",
+        "int32",
+        "int16",
+        "int8",
+        "uint64",
+        "uint32",
+        "uint16",
+        "uint8",
+        "bool",
+    )
+    if isinstance(getattr(torch, name, None), torch.dtype)
+}
+
+# the safetensors file starts with the size of the json header as little-endian u64
+_SAFETENSORS_HEADER_SIZE_LEN = 8
 
 
 class SerializationModule(torch.nn.Module):
@@ -76,6 +118,21 @@ def _safe_save(state_dict, filename: str) -> Optional[dict]:
         return None
 
 
+def _add_removed_tensors(items: dict, meta: Optional[dict]):
+    if meta:
+        # the meta keeps names of removed tensors and the name of the tensor for them
+        for kept, removed_group in meta.items():
+            for r in removed_group:
+                items[r] = items[kept]
+
+
+def _tensor_from_buffer(buffer: memoryview, dtype, shape) -> torch.Tensor:
+    if len(buffer) == 0:
+        # torch.frombuffer doesn't accept empty buffers
+        return torch.empty(shape, dtype=dtype)
+    return torch.frombuffer(buffer, dtype=dtype).reshape(shape)
+
+
 class TensorDecomposer(ViaFileDecomposer):
 
     def supported_type(self):
@@ -93,13 +150,70 @@ class TensorDecomposer(ViaFileDecomposer):
     def load_from_file(self, path: str, fobs_ctx: dict, meta: dict = None) -> Any:
         items = load_file(path)
         self.logger.debug(f"got {len(items)} tensors from file {path}")
-        if meta:
-            # the meta keeps names of removed tensors and the name of the tensor for them
-            for kept, removed_group in meta.items():
-                for r in removed_group:
-                    items[r] = items[kept]
+        _add_removed_tensors(items, meta)
+        return items
+
+    def load_from_mapped_file(self, path: str, buffer: memoryview, fobs_ctx: dict, meta: dict = None):
+        (header_size,) = struct.unpack("<Q", buffer[:_SAFETENSORS_HEADER_SIZE_LEN])
+        data_start = _SAFETENSORS_HEADER_SIZE_LEN + header_size
+        header = json.loads(bytes(buffer[_SAFETENSORS_HEADER_SIZE_LEN:data_start]))
+
+        items = {}
+        for name, info in header.items():
+            if name == "__metadata__":
+                continue
+
+            dtype = _SAFETENSORS_DTYPES.get(info["dtype"])
+            if dtype is None:
+                return None
+
+            begin, end = info["data_offsets"]
+            items[name] = _tensor_from_buffer(buffer[data_start + begin : data_start + end], dtype, info["shape"])
+        self.logger.debug(f"mapped {len(items)} tensors from file {path}")
+        _add_removed_tensors(items, meta)
         return items
 
+    def dump_to_buffers(self, items: dict, fobs_ctx: dict):
+        items = dict(items)
+        to_removes = _remove_duplicate_names(items)
+        for kept_name, to_remove_group in to_removes.items():
+            for to_remove in to_remove_group:
+                del items[to_remove]
+
+        layout = []
+        buffers = []
+        for k, t in items.items():
+            t = t.detach().cpu().contiguous()
+            layout.append(
+                {
+                    ItemLayoutKey.ID: k,
+                    ItemLayoutKey.DTYPE: str(t.dtype).split(".")[-1],
+                    ItemLayoutKey.SHAPE: list(t.shape),
+                    ItemLayoutKey.SIZE: t.numel() * t.element_size(),
+                }
+            )
+            buffers.append(t.reshape(-1).view(torch.uint8).numpy())
+        meta = {k: list(v) for k, v in to_removes.items()} if to_removes else None
+        return layout, buffers, meta
+
+    def new_items_from_layout(self, layout, fobs_ctx: dict, meta: dict = None, storage=None):
+        items = {}
+        buffers = []
+        for i, entry in enumerate(layout):
+            # the layout comes from the peer: only the names of the known dtypes are accepted
+            dtype = _LAYOUT_DTYPES.get(entry[ItemLayoutKey.DTYPE])
+            if not isinstance(dtype, torch.dtype):
+                raise RuntimeError(f"FOBS Protocol Error: unsupported tensor dtype {entry[ItemLayoutKey.DTYPE]}")
+            if storage:
+                t = _tensor_from_buffer(storage[i], dtype, entry[ItemLayoutKey.SHAPE])
+            else:
+                t = torch.empty(entry[ItemLayoutKey.SHAPE], dtype=dtype)
+            items[entry[ItemLayoutKey.ID]] = t
+            buffers.append(t.reshape(-1).view(torch.uint8).numpy())
+
+        _add_removed_tensors(items, meta)
+        return items, buffers
+
     def get_bytes_dot(self) -> int:
         return dots.TENSOR_BYTES
 
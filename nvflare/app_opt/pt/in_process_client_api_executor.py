@@ -38,6 +38,8 @@ class PTInProcessClientAPIExecutor(InProcessClientAPIExecutor):
         submit_model_task_name: str = AppConstants.TASK_SUBMIT_MODEL,
         params_exchange_format=ExchangeFormat.PYTORCH,
         server_expected_format=ExchangeFormat.NUMPY,
+        log_batch_size: int = 1,
+        log_flush_interval: float = 1.0,
     ):
         super(PTInProcessClientAPIExecutor, self).__init__(
             task_script_path=task_script_path,
@@ -54,6 +56,8 @@ class PTInProcessClientAPIExecutor(InProcessClientAPIExecutor):
             params_transfer_type=params_transfer_type,
             log_pull_interval=log_pull_interval,
             server_expected_format=server_expected_format,
+            log_batch_size=log_batch_size,
+            log_flush_interval=log_flush_interval,
         )
         fobs.register(TensorDecomposer)
         if (
@@ -25,7 +25,8 @@ DATA_TYPE = [
 # Supported Quantization Type to reduce the above input data types
 # The quantization types are mainly for reducing the model size,
 # Hence, we support 16-, 8-, and 4-bits quantization.
-# Note that 8- and 4-bits quantization needs GPU support.
+# Note that 8- and 4-bits quantization needs GPU support with ModelQuantizer,
+# and runs on CPU with CPUModelQuantizer.
 QUANTIZATION_TYPE = [
     "FLOAT16",
     "BLOCKWISE8",
@@ -0,0 +1,179 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+
+import numpy as np
+import torch
+
+from nvflare.apis.dxo import DXO, DataKind, MetaKey
+from nvflare.apis.dxo_filter import DXOFilter
+from nvflare.apis.fl_context import FLContext
+from nvflare.apis.shareable import Shareable
+from nvflare.app_opt.pt.quantization.constant import QUANTIZATION_TYPE
+from nvflare.app_opt.pt.quantization.cpu_quantization import (
+    BLOCKWISE4_BLOCK_SIZE,
+    BLOCKWISE8_BLOCK_SIZE,
+    dequantize_4bit,
+    dequantize_blockwise8,
+)
+from nvflare.app_opt.pt.quantization.cpu_quantizer import to_numpy
+
+
+class CPUModelDequantizer(DXOFilter):
+    def __init__(self, num_workers=1):
+        """Filter to dequantize Shareable object to recover from quantization, without GPU.
+
+        This is a drop-in replacement of ModelDequantizer, for the data quantized by CPUModelQuantizer.
+
+        Args:
+            num_workers: number of threads to dequantize the parameters in parallel
+
+        """
+
+        # support weight and weight_diff data kinds
+        data_kinds = [DataKind.WEIGHTS, DataKind.WEIGHT_DIFF]
+        super().__init__(supported_data_kinds=data_kinds, data_kinds_to_filter=data_kinds)
+        self.logger.info("Using CPU model dequantizator.")
+
+        if not isinstance(num_workers, int) or num_workers < 1:
+            raise ValueError(f"num_workers must be a positive int but got {num_workers}")
+        self.num_workers = num_workers
+
+    @staticmethod
+    def _dequantize_param(values, quant_state: dict, quantization_type: str, source_data_type: str):
+        """Dequantize the values of a parameter.
+
+        Returns: the dequantized values, or None if the parameter is not quantized
+
+        """
+        # only dequantize if the quantization type is lower than the source data type
+        source_data_bits = int(re.findall(r"\d+", source_data_type)[0])
+        quantization_bits = int(re.findall(r"\d+", quantization_type)[0])
+        if quantization_bits >= source_data_bits:
+            return None
+
+        if isinstance(values, np.ndarray):
+            is_torch = False
+        elif isinstance(values, torch.Tensor):
+            is_torch = True
+        else:
+            raise ValueError(f"Invalid source data type: {type(values)}, valid: numpy or torch")
+
+        if quantization_type == "float16":
+            # direct assign and convert back to higher precision
+            dequantized = values
+        else:
+            state = {k: to_numpy(v) if isinstance(v, torch.Tensor) else v for k, v in quant_state.items()}
+            if quantization_type == "blockwise8":
+                dequantized = dequantize_blockwise8(
+                    to_numpy(values),
+                    state["absmax"],
+                    state["code"],
+                    state.get("blocksize", BLOCKWISE8_BLOCK_SIZE),
+                )
+            else:
+                dequantized = dequantize_4bit(
+                    to_numpy(values),
+                    state["absmax"],
+                    state["quant_map"],
+                    tuple(state["shape"]),
+                    state.get("blocksize", BLOCKWISE4_BLOCK_SIZE),
+                )
+            if is_torch:
+                dequantized = torch.from_numpy(dequantized)
+
+        # convert back to original data type
+        if is_torch:
+            return dequantized.to(getattr(torch, source_data_type))
+        return dequantized.astype(source_data_type)
+
+    def dequantization(
+        self, params: dict, quant_state: dict, quantization_type: str, source_datatype: dict, fl_ctx: FLContext
+    ):
+        n_params = len(params.keys())
+        self.log_info(fl_ctx, f"Running dequantization on {n_params} variables with {self.num_workers} workers")
+        n_bytes_before = 0
+        n_bytes_after = 0
+        n_bytes_meta = 0
+        n_quant_params = 0
+
+        def _dequantize(name):
+            return self._dequantize_param(params[name], quant_state[name], quantization_type, source_datatype[name])
+
+        names = list(params.keys())
+        if self.num_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+                results = list(executor.map(_dequantize, names))
+        else:
+            results = [_dequantize(name) for name in names]
+
+        for param_name, values in zip(names, results):
+            if values is None:
+                self.log_info(
+                    fl_ctx,
+                    f"Skipping dequantization for {param_name}, quantization bit {quantization_type} >= source data bit {source_datatype[param_name]}",
+                )
+            else:
+                n_quant_params += 1
+                n_bytes_before += params[param_name].nbytes
+                for item in quant_state[param_name].values():
+                    if isinstance(item, (np.ndarray, torch.Tensor)):
+                        n_bytes_meta += item.nbytes
+                params[param_name] = values
+            n_bytes_after += params[param_name].nbytes
+
+        self.log_info(
+            fl_ctx,
+            f"Dequantized {n_quant_params}/{n_params} params."
+            f" Before dequantization: {n_bytes_before / (1024 ** 2):.2f} MB with meta: {n_bytes_meta / (1024 ** 2):.2f} MB."
+            f" After dequantization: {n_bytes_after / (1024 ** 2):.2f} MB.",
+        )
+        return params
+
+    def process_dxo(self, dxo: DXO, shareable: Shareable, fl_ctx: FLContext) -> Union[None, DXO]:
+        """Filter process apply to the Shareable object.
+
+        Args:
+            dxo: data to be processed
+            shareable: that the dxo belongs to
+            fl_ctx: FLContext
+
+        Returns: DXO object with dequantized weights
+
+        """
+
+        self.log_info(fl_ctx, "Running dequantization...")
+
+        # check config
+        quantization_type = dxo.get_meta_prop(key=MetaKey.PROCESSED_ALGORITHM, default=None)
+        if quantization_type.upper() not in QUANTIZATION_TYPE:
+            raise ValueError(f"Invalid quantization type: {quantization_type}, valid: {QUANTIZATION_TYPE}")
+        source_datatype = dxo.get_meta_prop(key="source_datatype", default=None)
+        dequantized_params = self.dequantization(
+            params=dxo.data,
+            quant_state=dxo.meta["quant_state"],
+            quantization_type=quantization_type,
+            source_datatype=source_datatype,
+            fl_ctx=fl_ctx,
+        )
+        # Compose new DXO with dequantized data
+        dxo.data = dequantized_params
+        dxo.remove_meta_props([MetaKey.PROCESSED_ALGORITHM, "quant_state", "source_datatype", "quantized_flag"])
+        dxo.update_shareable(shareable)
+        self.log_info(fl_ctx, f"Dequantized back to {source_datatype}")
+
+        return dxo
@@ -0,0 +1,188 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Blockwise 8- and 4-bit quantization with NumPy on CPU.
+# The values are split into blocks, and each block is scaled by its absmax, so all blocks are processed
+# with a few array operations instead of a loop.
+# The quantized data and states have the same layout as bitsandbytes:
+#   8-bit: one uint8 code index per value, with the absmax of each block and the 256-entry code
+#   4-bit: two code indexes per uint8 (first value in the high nibble), with the absmax of each block and
+#          the 16-entry quant map
+
+from typing import Tuple
+
+import numpy as np
+
+BLOCKWISE8_BLOCK_SIZE = 4096
+BLOCKWISE4_BLOCK_SIZE = 64
+
+# NormalFloat4: quantiles of the normal distribution, normalized to [-1, 1]
+NF4_CODE = np.array(
+    [
+        -1.0,
+        -0.6961928009986877,
+        -0.5250730514526367,
+        -0.39491748809814453,
+        -0.28444138169288635,
+        -0.18477343022823334,
+        -0.09105003625154495,
+        0.0,
+        0.07958029955625534,
+        0.16093020141124725,
+        0.24611230194568634,
+        0.33791524171829224,
+        0.44070982933044434,
+        0.5626170039176941,
+        0.7229568362236023,
+        1.0,
+    ],
+    dtype=np.float32,
+)
+
+# Float4 with 1 sign, 2 exponent and 1 mantissa bits, normalized to [-1, 1]
+FP4_CODE = (
+    np.array(
+        [0.0, 0.0625, 8.0, 12.0, 4.0, 6.0, 2.0, 3.0, -0.0, -0.0625, -8.0, -12.0, -4.0, -6.0, -2.0, -3.0],
+        dtype=np.float32,
+    )
+    / 12.0
+)
+
+# Linear int8 code: index i is (i - 127) / 127, so index 127 is exactly 0
+INT8_CODE = np.clip((np.arange(256, dtype=np.float32) - 127) / 127, -1.0, 1.0)
+
+QUANT_MAPS = {"nf4": NF4_CODE, "fp4": FP4_CODE}
+
+# Number of values compared at a time when searching the nearest code, so the temporaries stay in cache
+_SEARCH_CHUNK_SIZE = 65536
+
+
+def _to_blocks(values: np.ndarray, block_size: int) -> np.ndarray:
+    """Flatten the values to float32, and reshape them to blocks. The last block is padded with 0.
+
+    The blocks may share the memory of the values.
+    """
+    flat = np.asarray(values, dtype=np.float32).reshape(-1)
+    pad = -flat.size % block_size
+    if pad:
+        flat = np.concatenate([flat, np.zeros(pad, dtype=np.float32)])
+    return flat.reshape(-1, block_size)
+
+
+def _normalize(blocks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Scale each block to [-1, 1] by its absmax. The blocks are scaled in place."""
+    absmax = np.abs(blocks).max(axis=1)
+    scale = np.divide(1.0, absmax, out=np.zeros_like(absmax), where=absmax > 0)
+    blocks *= scale[:, None]
+    return blocks, absmax
+
+
+def _nearest_code(normalized: np.ndarray, code: np.ndarray) -> np.ndarray:
+    """Find the index of the nearest code of each value.
+
+    The rank of a value in the sorted codes is the number of midpoints between the sorted codes that are less
+    than the value. Comparing with the few midpoints is much faster than np.searchsorted.
+    """
+    order = np.argsort(code, kind="stable")
+    sorted_code = code[order]
+    midpoints = (sorted_code[1:] + sorted_code[:-1]) / 2
+
+    ranks = np.zeros(normalized.size, dtype=np.uint8)
+    greater = np.empty(min(_SEARCH_CHUNK_SIZE, normalized.size), dtype=bool)
+    for start in range(0, normalized.size, _SEARCH_CHUNK_SIZE):
+        values = normalized[start : start + _SEARCH_CHUNK_SIZE]
+        chunk_ranks = ranks[start : start + _SEARCH_CHUNK_SIZE]
+        chunk_greater = greater[: values.size]
+        for m in midpoints:
+            np.greater(values, m, out=chunk_greater)
+            chunk_ranks += chunk_greater.view(np.uint8)
+    return order.astype(np.uint8)[ranks]
+
+
+def quantize_blockwise8(values: np.ndarray, block_size: int = BLOCKWISE8_BLOCK_SIZE):
+    """Quantize the values to 8 bits with the absmax of each block.
+
+    Args:
+        values: the values to be quantized
+        block_size: number of values in a block
+
+    Returns: tuple of quantized values (uint8 with the shape of the values), absmax of the blocks and the code
+
+    """
+    # the blocks are scaled in place, so they are copied from the values
+    blocks, absmax = _normalize(_to_blocks(np.array(values, dtype=np.float32), block_size))
+    blocks *= 127
+    blocks += 127
+    np.rint(blocks, out=blocks)
+    quantized = blocks.astype(np.uint8).reshape(-1)[: np.size(values)]
+    return quantized.reshape(np.shape(values)), absmax, INT8_CODE.copy()
+
+
+def dequantize_blockwise8(
+    quantized: np.ndarray, absmax: np.ndarray, code: np.ndarray, block_size: int = BLOCKWISE8_BLOCK_SIZE
+) -> np.ndarray:
+    """Dequantize the values quantized with quantize_blockwise8.
+
+    Returns: float32 values with the shape of the quantized values
+
+    """
+    blocks = _to_blocks(np.asarray(code, dtype=np.float32)[np.asarray(quantized).reshape(-1)], block_size)
+    blocks *= np.asarray(absmax, dtype=np.float32)[:, None]
+    return blocks.reshape(-1)[: np.size(quantized)].reshape(np.shape(quantized))
+
+
+def quantize_4bit(values: np.ndarray, quant_type: str = "nf4", block_size: int = BLOCKWISE4_BLOCK_SIZE):
+    """Quantize the values to 4 bits with the absmax of each block.
+
+    Args:
+        values: the values to be quantized
+        quant_type: "nf4" or "fp4"
+        block_size: number of values in a block. Must be even.
+
+    Returns: tuple of packed values (uint8 of shape (n/2, 1)), absmax of the blocks and the quant map
+
+    """
+    quant_map = QUANT_MAPS.get(quant_type)
+    if quant_map is None:
+        raise ValueError(f"invalid 4-bit quant type: {quant_type}, valid: {list(QUANT_MAPS.keys())}")
+    if block_size % 2:
+        raise ValueError(f"block size must be even but got {block_size}")
+
+    # the blocks are scaled in place, so they are copied from the values
+    blocks, absmax = _normalize(_to_blocks(np.array(values, dtype=np.float32), block_size))
+    indexes = _nearest_code(blocks.reshape(-1), quant_map)
+
+    # The blocks are padded to even size, so the last value of odd-sized values is paired with a 0
+    num_values = np.size(values)
+    indexes = indexes[: num_values + num_values % 2]
+    packed = (indexes[0::2] << 4) | indexes[1::2]
+    return packed.reshape(-1, 1), absmax, quant_map.copy()
+
+
+def dequantize_4bit(
+    packed: np.ndarray, absmax: np.ndarray, quant_map: np.ndarray, shape, block_size: int = BLOCKWISE4_BLOCK_SIZE
+) -> np.ndarray:
+    """Dequantize the values quantized with quantize_4bit.
+
+    Returns: float32 values of the shape
+
+    """
+    packed = np.asarray(packed).reshape(-1)
+    indexes = np.empty(packed.size * 2, dtype=np.uint8)
+    indexes[0::2] = packed >> 4
+    indexes[1::2] = packed & 0x0F
+
+    blocks = _to_blocks(np.asarray(quant_map, dtype=np.float32)[indexes], block_size)
+    blocks *= np.asarray(absmax, dtype=np.float32)[:, None]
+    return blocks.reshape(-1)[: int(np.prod(shape))].reshape(shape)
@@ -0,0 +1,212 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+
+import numpy as np
+import torch
+
+from nvflare.apis.dxo import DXO, DataKind, MetaKey
+from nvflare.apis.dxo_filter import DXOFilter
+from nvflare.apis.fl_context import FLContext
+from nvflare.apis.shareable import Shareable
+from nvflare.app_opt.pt.quantization.constant import DATA_TYPE, QUANTIZATION_TYPE
+from nvflare.app_opt.pt.quantization.cpu_quantization import (
+    BLOCKWISE4_BLOCK_SIZE,
+    BLOCKWISE8_BLOCK_SIZE,
+    quantize_4bit,
+    quantize_blockwise8,
+)
+
+
+def get_source_data_type(values) -> str:
+    if isinstance(values, np.ndarray):
+        return values.dtype.name
+    elif isinstance(values, torch.Tensor):
+        return str(values.dtype).split(".")[1]
+    else:
+        raise ValueError(f"Invalid source data type: {type(values)}, valid: numpy or torch")
+
+
+def to_numpy(values) -> np.ndarray:
+    """Get the values as a numpy array. Torch tensors of types not supported by numpy (bfloat16) are converted to
+    float32."""
+    if isinstance(values, torch.Tensor):
+        values = values.detach().cpu()
+        if values.dtype == torch.bfloat16:
+            values = values.float()
+        return values.numpy()
+    return values
+
+
+class CPUModelQuantizer(DXOFilter):
+    def __init__(
+        self,
+        quantization_type="float16",
+        num_workers=1,
+    ):
+        """Filter to quantize Shareable object to reduce communication burden, without GPU.
+
+        This is a drop-in replacement of ModelQuantizer. The 8- and 4-bit quantizations are computed with NumPy
+        on CPU, all blocks of a parameter at once, so bitsandbytes and CUDA are not needed.
+        The quantized data and states have the same layout as ModelQuantizer, to be dequantized by
+        CPUModelDequantizer.
+
+        Args:
+            quantization_type: method used for quantization
+            num_workers: number of threads to quantize the parameters in parallel
+
+        """
+
+        # support weight and weight_diff data kinds
+        data_kinds = [DataKind.WEIGHTS, DataKind.WEIGHT_DIFF]
+        super().__init__(supported_data_kinds=data_kinds, data_kinds_to_filter=data_kinds)
+
+        # assign quantization type and check if it is valid
+        self.logger.info("Using CPU model quantizator.")
+        quantization_type = quantization_type.lower()
+        if quantization_type.upper() not in QUANTIZATION_TYPE:
+            raise ValueError(f"Invalid quantization type: {quantization_type}, valid: {QUANTIZATION_TYPE}")
+        else:
+            self.quantization_type = quantization_type
+
+        if not isinstance(num_workers, int) or num_workers < 1:
+            raise ValueError(f"num_workers must be a positive int but got {num_workers}")
+        self.num_workers = num_workers
+
+        # quantization constants
+        self.NP_FP16_MIN = np.finfo(np.float16).min
+        self.NP_FP16_MAX = np.finfo(np.float16).max
+        self.TS_FP16_MIN = torch.finfo(torch.float16).min
+        self.TS_FP16_MAX = torch.finfo(torch.float16).max
+
+    def _quantize_param(self, values):
+        """Quantize the values of a parameter.
+
+        Returns: tuple of quantized values, quantization state and source data type.
+        The quantized values are None if the parameter is not quantized.
+
+        """
+        source_data_type = get_source_data_type(values)
+        if source_data_type.upper() not in DATA_TYPE:
+            raise ValueError(f"Invalid source data type: {source_data_type}, valid: {DATA_TYPE}")
+
+        # only quantize if the quantization type is lower than the source data type
+        source_data_bits = int(re.findall(r"\d+", source_data_type)[0])
+        quantization_bits = int(re.findall(r"\d+", self.quantization_type)[0])
+        if quantization_bits >= source_data_bits:
+            return None, {}, source_data_type
+
+        is_torch = isinstance(values, torch.Tensor)
+        if self.quantization_type == "float16":
+            if is_torch:
+                return torch.clamp(values, self.TS_FP16_MIN, self.TS_FP16_MAX).to(torch.float16), {}, source_data_type
+            return np.clip(values, self.NP_FP16_MIN, self.NP_FP16_MAX).astype(np.float16), {}, source_data_type
+
+        if self.quantization_type == "blockwise8":
+            quantized, absmax, code = quantize_blockwise8(to_numpy(values))
+            quant_state = {"absmax": absmax, "code": code, "blocksize": BLOCKWISE8_BLOCK_SIZE}
+        else:
+            quant_type = "fp4" if self.quantization_type == "float4" else "nf4"
+            quantized, absmax, quant_map = quantize_4bit(to_numpy(values), quant_type)
+            quant_state = {
+                "quant_type": quant_type,
+                "absmax": absmax,
+                "blocksize": BLOCKWISE4_BLOCK_SIZE,
+                "quant_map": quant_map,
+                "dtype": source_data_type,
+                "shape": tuple(values.shape),
+            }
+
+        # keep source data format
+        if is_torch:
+            quantized = torch.from_numpy(quantized)
+            quant_state = {k: torch.from_numpy(v) if isinstance(v, np.ndarray) else v for k, v in quant_state.items()}
+        return quantized, quant_state, source_data_type
+
+    def quantization(self, params: dict, fl_ctx: FLContext):
+        n_params = len(params.keys())
+        self.log_info(fl_ctx, f"Running quantization on {n_params} variables with {self.num_workers} workers")
+        n_bytes_before = 0
+        n_bytes_after = 0
+        n_bytes_meta = 0
+        n_quant_params = 0
+        quant_state = {}
+        source_datatype = {}
+
+        names = list(params.keys())
+        if self.num_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+                results = list(executor.map(lambda name: self._quantize_param(params[name]), names))
+        else:
+            results = [self._quantize_param(params[name]) for name in names]
+
+        for param_name, (values, state, source_data_type) in zip(names, results):
+            n_bytes_before += params[param_name].nbytes
+            quant_state[param_name] = state
+            source_datatype[param_name] = source_data_type
+            if values is None:
+                self.log_info(
+                    fl_ctx,
+                    f"Skipping quantization for {param_name}, quantization bit {self.quantization_type} >= source data bit {source_data_type}",
+                )
+                continue
+
+            n_quant_params += 1
+            params[param_name] = values
+            n_bytes_after += values.nbytes
+            n_bytes_meta += sum(v.nbytes for v in state.values() if isinstance(v, (np.ndarray, torch.Tensor)))
+
+        self.log_info(
+            fl_ctx,
+            f"Quantized {n_quant_params}/{n_params} params."
+            f" Before quantization: {n_bytes_before / (1024 ** 2):.2f} MB."
+            f" After quantization: {n_bytes_after / (1024 ** 2):.2f} MB with meta: {n_bytes_meta / (1024 ** 2):.2f} MB.",
+        )
+        return params, quant_state, source_datatype
+
+    def process_dxo(self, dxo: DXO, shareable: Shareable, fl_ctx: FLContext) -> Union[None, DXO]:
+        """Filter process apply to the Shareable object.
+
+        Args:
+            dxo: data to be processed
+            shareable: that the dxo belongs to
+            fl_ctx: FLContext
+
+        Returns: DXO object with quantized weights
+
+        """
+
+        self.log_info(fl_ctx, "Running quantization...")
+
+        # for already quantized message, skip quantization (see ModelQuantizer)
+        quantized_flag = dxo.get_meta_prop("quantized_flag")
+        if quantized_flag:
+            self.log_info(fl_ctx, "Already quantized, skip quantization")
+            new_dxo = dxo
+        else:
+            # apply quantization
+            quantized_params, quant_state, source_datatype = self.quantization(params=dxo.data, fl_ctx=fl_ctx)
+            # Compose new DXO with quantized data
+            # Add quant_state to the new DXO meta
+            new_dxo = DXO(data_kind=dxo.data_kind, data=quantized_params, meta=dxo.meta)
+            new_dxo.set_meta_prop(key=MetaKey.PROCESSED_ALGORITHM, value=self.quantization_type)
+            new_dxo.set_meta_prop(key="quant_state", value=quant_state)
+            new_dxo.set_meta_prop(key="source_datatype", value=source_datatype)
+            new_dxo.set_meta_prop(key="quantized_flag", value=True)
+            self.log_info(fl_ctx, f"Quantized from {source_datatype} to {self.quantization_type}")
+
+        return new_dxo
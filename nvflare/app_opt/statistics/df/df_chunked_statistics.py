@@ -0,0 +1,304 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from math import sqrt
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from nvflare.app_common.abstract.statistics_spec import DataType, Feature, Histogram, HistogramType, Statistics
+from nvflare.app_common.app_constant import StatisticsConstants
+from nvflare.app_common.statistics.numpy_utils import dtype_to_data_type, histogram_buckets_from_counts
+from nvflare.fuel.utils.import_utils import optional_import
+
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+
+
+class _FeatureStats:
+    def __init__(self, names: List[str]):
+        """Running statistics of the numeric features of a dataset, one entry per feature."""
+        size = len(names)
+        self.index = {name: i for i, name in enumerate(names)}
+        self.count = np.zeros(size, dtype=np.int64)
+        self.failure_count = np.zeros(size, dtype=np.int64)
+        self.sum = np.zeros(size)
+        self.mean = np.zeros(size)
+        # sum of squared differences from the mean
+        self.m2 = np.zeros(size)
+        self.min = np.full(size, np.nan)
+        self.max = np.full(size, np.nan)
+        self.digests = [None] * size
+
+    def update(self, values: np.ndarray):
+        """Add a chunk of values of shape (rows, features), with NaN for the missing values."""
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0)
+        chunk_sum = np.nansum(values, axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            chunk_mean = np.where(count > 0, chunk_sum / count, 0.0)
+        chunk_m2 = np.nansum(np.square(values - chunk_mean), axis=0)
+
+        # merge the chunk's mean and m2 into the running ones (Chan et al.), which is stable for large counts
+        total = self.count + count
+        delta = chunk_mean - self.mean
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(total > 0, count / total, 0.0)
+        self.mean += delta * ratio
+        self.m2 += chunk_m2 + np.square(delta) * self.count * ratio
+        self.count = total
+        self.sum += chunk_sum
+        self.min = np.fmin(self.min, np.fmin.reduce(values, axis=0))
+        self.max = np.fmax(self.max, np.fmax.reduce(values, axis=0))
+
+
+class DFChunkedStatisticsCore(Statistics):
+    def __init__(
+        self,
+        data_sources: Optional[Dict[str, str]] = None,
+        chunk_size: int = 100_000,
+        max_bin=None,
+        digest_size: int = 1000,
+        read_args: Optional[dict] = None,
+    ):
+        """Statistics of CSV or Parquet files that are too large to be loaded in the memory.
+
+        Unlike DFStatisticsCore, the data is not loaded as a DataFrame. It's read in chunks of rows:
+
+        - count, sum, mean, stddev, min, max, failure count and the t-digest of all numeric features are computed
+          in one pass over the data, the first time any of them is requested. variance_with_mean is derived
+          from them, so it doesn't need another pass.
+        - the histograms of all features are computed in a second pass when prepare_histograms is called with
+          the global ranges. histogram() of a feature not prepared reads the data for that feature only.
+
+        The memory used is bounded by the chunk size and the t-digest size, not the size of the data.
+
+        Values of a numeric feature that can't be parsed as numbers are counted as failures.
+
+        Args:
+            data_sources: dataset name => path of the CSV or Parquet (.parquet, .pq) file. Subclasses can
+                set self.data_sources in initialize() instead, or override load_chunks() for other sources.
+            chunk_size: number of rows of each chunk
+            max_bin: number of centroids of the t-digest for the quantiles. Default is the sqrt of the count.
+            digest_size: max number of centroids of the t-digest while it's being built
+            read_args: additional args for pandas.read_csv, such as sep or na_values
+        """
+        super().__init__()
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be > 0 but got {chunk_size}")
+        self.data_sources = data_sources
+        self.chunk_size = chunk_size
+        self.max_bin = max_bin
+        self.digest_size = digest_size
+        self.read_args = read_args if read_args else {}
+        self.target_statistics: Optional[List[str]] = None
+
+        self._features: Dict[str, List[Feature]] = {}
+        self._stats: Dict[str, _FeatureStats] = {}
+        # dataset name => {(feature name, num_of_bins, min value, max value): histogram}
+        self._histograms: Dict[str, Dict[Tuple, Histogram]] = {}
+
+    def load_chunks(self, dataset_name: str, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """Read the dataset in chunks of rows.
+
+        Args:
+            dataset_name: dataset name
+            columns: columns to read. None means all columns.
+
+        Returns: iterator of DataFrames
+        """
+        path = self.data_sources[dataset_name]
+        if os.path.splitext(path)[1].lower() in PARQUET_EXTENSIONS:
+            pq, _ = optional_import(module="pyarrow.parquet")
+            parquet_file = pq.ParquetFile(path)
+            for batch in parquet_file.iter_batches(batch_size=self.chunk_size, columns=columns):
+                yield batch.to_pandas()
+        else:
+            with pd.read_csv(path, chunksize=self.chunk_size, usecols=columns, **self.read_args) as reader:
+                for chunk in reader:
+                    yield chunk
+
+    def pre_run(
+        self,
+        statistics: List[str],
+        num_of_bins: Optional[Dict[str, Optional[int]]],
+        bin_ranges: Optional[Dict[str, Optional[List[float]]]],
+    ):
+        self.target_statistics = statistics
+        return {}
+
+    def features(self) -> Dict[str, List[Feature]]:
+        for ds_name in self.data_sources:
+            if ds_name not in self._features:
+                chunks = self.load_chunks(ds_name)
+                try:
+                    df = next(chunks)
+                finally:
+                    chunks.close()
+                self._features[ds_name] = [
+                    Feature(feature_name, dtype_to_data_type(df[feature_name].dtype)) for feature_name in df
+                ]
+
+        return {ds_name: self._features[ds_name] for ds_name in self.data_sources}
+
+    def _numeric_features(self, dataset_name: str) -> List[str]:
+        features = self.features()[dataset_name]
+        return [f.feature_name for f in features if f.data_type in (DataType.INT, DataType.FLOAT)]
+
+    def _to_values(self, df: pd.DataFrame, names: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the values of the features as float64 with NaN for the missing ones, and the number of failures."""
+        values = np.empty((len(df), len(names)))
+        failures = np.zeros(len(names), dtype=np.int64)
+        for i, name in enumerate(names):
+            column = df[name]
+            if dtype_to_data_type(column.dtype) in (DataType.INT, DataType.FLOAT):
+                values[:, i] = column.to_numpy(dtype=np.float64, na_value=np.nan)
+            else:
+                parsed = pd.to_numeric(column, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+                failures[i] = np.count_nonzero(column.notna().to_numpy() & np.isnan(parsed))
+                values[:, i] = parsed
+        return values, failures
+
+    def _with_digest(self) -> bool:
+        return self.target_statistics is None or StatisticsConstants.STATS_QUANTILE in self.target_statistics
+
+    def _get_stats(self, dataset_name: str, feature_name: str) -> Tuple[_FeatureStats, int]:
+        stats = self._stats.get(dataset_name)
+        if stats is None:
+            stats = self._scan(dataset_name)
+            self._stats[dataset_name] = stats
+        return stats, stats.index[feature_name]
+
+    def _scan(self, dataset_name: str) -> _FeatureStats:
+        names = self._numeric_features(dataset_name)
+        stats = _FeatureStats(names)
+        TDigest, digest_flag = optional_import("fastdigest", name="TDigest")
+        digest_flag = digest_flag and self._with_digest()
+
+        for df in self.load_chunks(dataset_name, names):
+            if len(df) == 0:
+                continue
+            values, failures = self._to_values(df, names)
+            stats.update(values)
+            stats.failure_count += failures
+
+            if digest_flag:
+                for i in range(len(names)):
+                    feature_values = values[:, i]
+                    feature_values = feature_values[~np.isnan(feature_values)]
+                    if feature_values.size == 0:
+                        continue
+                    digest = TDigest(feature_values)
+                    if stats.digests[i] is not None:
+                        digest = stats.digests[i].merge(digest)
+                    digest.compress(self.digest_size)
+                    stats.digests[i] = digest
+
+        return stats
+
+    def count(self, dataset_name: str, feature_name: str) -> int:
+        stats, i = self._get_stats(dataset_name, feature_name)
+        return int(stats.count[i])
+
+    def failure_count(self, dataset_name: str, feature_name: str) -> int:
+        stats, i = self._get_stats(dataset_name, feature_name)
+        return int(stats.failure_count[i])
+
+    def sum(self, dataset_name: str, feature_name: str) -> float:
+        stats, i = self._get_stats(dataset_name, feature_name)
+        return float(stats.sum[i])
+
+    def mean(self, dataset_name: str, feature_name: str) -> float:
+        stats, i = self._get_stats(dataset_name, feature_name)
+        return float(stats.sum[i] / stats.count[i])
+
+    def stddev(self, dataset_name: str, feature_name: str) -> float:
+        stats, i = self._get_stats(dataset_name, feature_name)
+        return sqrt(stats.m2[i] / (stats.count[i] - 1))
+
+    def variance_with_mean(
+        self, dataset_name: str, feature_name: str, global_mean: float, global_count: float
+    ) -> float:
+        # sum((x - global_mean)^2) = m2 + count * (mean - global_mean)^2
+        stats, i = self._get_stats(dataset_name, feature_name)
+        squared_sum = stats.m2[i] + stats.count[i] * (stats.mean[i] - global_mean) ** 2
+        return float(squared_sum / (global_count - 1))
+
+    def max_value(self, dataset_name: str, feature_name: str) -> float:
+        """this is needed for histogram calculation, not used for reporting"""
+        stats, i = self._get_stats(dataset_name, feature_name)
+        return float(stats.max[i])
+
+    def min_value(self, dataset_name: str, feature_name: str) -> float:
+        """this is needed for histogram calculation, not used for reporting"""
+        stats, i = self._get_stats(dataset_name, feature_name)
+        return float(stats.min[i])
+
+    def quantiles(self, dataset_name: str, feature_name: str, percents: List) -> Dict:
+        results = {}
+        stats, i = self._get_stats(dataset_name, feature_name)
+        digest = stats.digests[i]
+        if digest is None:
+            results[StatisticsConstants.STATS_QUANTILE] = {}
+            return results
+
+        max_bin = self.max_bin if self.max_bin else round(sqrt(stats.count[i]))
+        digest.compress(max_bin)
+
+        p_results = {}
+        for p in percents:
+            v = round(digest.quantile(p), 4)
+            p_results[p] = v
+        results[StatisticsConstants.STATS_QUANTILE] = p_results
+        results[StatisticsConstants.STATS_DIGEST_COORD] = digest.to_dict()
+        return results
+
+    def prepare_histograms(self, dataset_name: str, histogram_ranges: Dict[str, Tuple[int, float, float]]):
+        histograms = self._histograms.setdefault(dataset_name, {})
+        keys = {name: (name, *histogram_range) for name, histogram_range in histogram_ranges.items()}
+        names = [name for name, key in keys.items() if key not in histograms]
+        if not names:
+            return
+
+        counts = {}
+        edges = {}
+        num_neginf = np.zeros(len(names), dtype=np.int64)
+        num_posinf = np.zeros(len(names), dtype=np.int64)
+        for df in self.load_chunks(dataset_name, names):
+            values, _ = self._to_values(df, names)
+            num_neginf += np.isneginf(values).sum(axis=0)
+            num_posinf += np.isposinf(values).sum(axis=0)
+            for i, name in enumerate(names):
+                num_of_bins, min_value, max_value = histogram_ranges[name]
+                # NaN and infinities are out of the range, so they are not counted here
+                chunk_counts, edges[name] = np.histogram(values[:, i], bins=num_of_bins, range=(min_value, max_value))
+                counts[name] = counts[name] + chunk_counts if name in counts else chunk_counts
+
+        for i, name in enumerate(names):
+            num_of_bins, min_value, max_value = histogram_ranges[name]
+            if name not in counts:
+                # no data
+                counts[name], edges[name] = np.histogram([], bins=num_of_bins, range=(min_value, max_value))
+            buckets = histogram_buckets_from_counts(counts[name], edges[name], num_neginf[i], num_posinf[i])
+            histograms[keys[name]] = Histogram(HistogramType.STANDARD, buckets)
+
+    def histogram(
+        self, dataset_name: str, feature_name: str, num_of_bins: int, global_min_value: float, global_max_value: float
+    ) -> Histogram:
+        key = (feature_name, num_of_bins, global_min_value, global_max_value)
+        histograms = self._histograms.get(dataset_name, {})
+        if key not in histograms:
+            self.prepare_histograms(dataset_name, {feature_name: (num_of_bins, global_min_value, global_max_value)})
+            histograms = self._histograms[dataset_name]
+        return histograms[key]
@@ -21,7 +21,14 @@ import mlflow
 from mlflow.entities import Metric, Param, RunTag
 from mlflow.tracking.client import MlflowClient
 
-from nvflare.apis.analytix import ANALYTIC_EVENT_TYPE, AnalyticsData, AnalyticsDataType, LogWriterName, TrackConst
+from nvflare.apis.analytix import (
+    ANALYTIC_EVENT_TYPE,
+    AnalyticsBatch,
+    AnalyticsData,
+    AnalyticsDataType,
+    LogWriterName,
+    TrackConst,
+)
 from nvflare.apis.dxo import from_shareable
 from nvflare.apis.fl_constant import ProcessType
 from nvflare.apis.fl_context import FLContext
@@ -239,32 +246,44 @@ class MLflowReceiver(AnalyticsReceiver):
         return experiment_id
 
     def save(self, fl_ctx: FLContext, shareable: Shareable, record_origin: str):
-        if self.time_start == 0:
-            self.time_start = timeit.default_timer()
-
         dxo = from_shareable(shareable)
         data = AnalyticsData.from_dxo(dxo, receiver=LogWriterName.MLFLOW)
         if not data:
             return
+        self._save_records([data], record_origin)
 
-        if data.data_type == AnalyticsDataType.TEXT:
-            mlflow_client = self.get_mlflow_client(record_origin)
-            if not mlflow_client:
-                raise RuntimeError(f"mlflow client is None for site {record_origin}.")
-            run_id = self.get_run_id(record_origin)
-            if not run_id:
-                raise RuntimeError(f"run_id is missing for site {record_origin}.")
-
-            if data.kwargs.get("path", None):
-                mlflow_client.log_text(run_id=run_id, text=data.value, artifact_file=data.kwargs.get("path"))
-        elif data.data_type == AnalyticsDataType.MODEL:
-            # not currently supported
-            pass
-        elif data.data_type == AnalyticsDataType.IMAGE:
-            # not currently supported
-            pass
-        else:
-            self.buffer_data(data, record_origin)
+    def save_batch(self, fl_ctx: FLContext, shareable: Shareable, record_origin: str):
+        records = AnalyticsBatch.get_records(from_shareable(shareable), receiver=LogWriterName.MLFLOW)
+        self._save_records(records, record_origin)
+
+    def _save_records(self, records: List[AnalyticsData], record_origin: str):
+        if self.time_start == 0:
+            self.time_start = timeit.default_timer()
+
+        buffered = False
+        for data in records:
+            if data.data_type == AnalyticsDataType.TEXT:
+                mlflow_client = self.get_mlflow_client(record_origin)
+                if not mlflow_client:
+                    raise RuntimeError(f"mlflow client is None for site {record_origin}.")
+                run_id = self.get_run_id(record_origin)
+                if not run_id:
+                    raise RuntimeError(f"run_id is missing for site {record_origin}.")
+
+                if data.kwargs.get("path", None):
+                    mlflow_client.log_text(run_id=run_id, text=data.value, artifact_file=data.kwargs.get("path"))
+            elif data.data_type == AnalyticsDataType.MODEL:
+                # not currently supported
+                pass
+            elif data.data_type == AnalyticsDataType.IMAGE:
+                # not currently supported
+                pass
+            else:
+                self.buffer_data(data, record_origin)
+                buffered = True
+
+        # the records of a batch are sent to the tracking server in one log_batch call
+        if buffered:
             self.time_since_flush += timeit.default_timer() - self.time_start
             if self.time_since_flush >= self.buff_flush_time:
                 self.flush_buffers(record_origin)
@@ -19,7 +19,7 @@ from nvflare.app_common.tracking.log_writer import LogWriter
 
 
 class MLflowWriter(LogWriter):
-    def __init__(self, event_type: str = ANALYTIC_EVENT_TYPE):
+    def __init__(self, event_type: str = ANALYTIC_EVENT_TYPE, batch_size: int = 1, flush_interval: float = 1.0):
         """MLflowWriter mimics the usage of mlflow.
 
         Users can replace the import of mlflow with MLflowWriter. They would then use
@@ -28,8 +28,12 @@ class MLflowWriter(LogWriter):
 
         Args:
             event_type (str, optional): _description_. Defaults to ANALYTIC_EVENT_TYPE.
+            batch_size (int, optional): max number of records sent in one event. Defaults to 1, which sends each
+                record in its own event.
+            flush_interval (float, optional): max seconds a record waits in a batch, when batch_size is more than 1.
+                Defaults to 1.0.
         """
-        super().__init__(event_type)
+        super().__init__(event_type, batch_size=batch_size, flush_interval=flush_interval)
 
     def get_writer_name(self) -> LogWriterName:
         """Returns "MLFLOW"."""
@@ -17,7 +17,7 @@ from typing import List, Optional
 
 from torch.utils.tensorboard import SummaryWriter
 
-from nvflare.apis.analytix import AnalyticsData, AnalyticsDataType
+from nvflare.apis.analytix import AnalyticsBatch, AnalyticsData, AnalyticsDataType
 from nvflare.apis.dxo import from_shareable
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.shareable import Shareable
@@ -111,25 +111,36 @@ class TBAnalyticsReceiver(AnalyticsReceiver):
         if not analytic_data:
             return
 
-        writer = self.writers_table.get(record_origin)
-        if writer is None:
-            peer_log_dir = os.path.join(self.root_log_dir, record_origin)
-            writer = SummaryWriter(log_dir=peer_log_dir)
-            self.writers_table[record_origin] = writer
-
         # do different things depending on the type in dxo
         self.log_debug(
             fl_ctx,
             f"try to save data {analytic_data} from {record_origin}",
             fire_event=False,
         )
-        data_records = self._convert_to_records(analytic_data, fl_ctx)
+        self._write_records(self._get_writer(record_origin), self._convert_to_records(analytic_data, fl_ctx), fl_ctx)
+
+    def save_batch(self, fl_ctx: FLContext, shareable: Shareable, record_origin: str):
+        records = AnalyticsBatch.get_records(from_shareable(shareable))
+        self.log_debug(fl_ctx, f"try to save {len(records)} records from {record_origin}", fire_event=False)
+        data_records = []
+        for analytic_data in records:
+            data_records.extend(self._convert_to_records(analytic_data, fl_ctx))
+        self._write_records(self._get_writer(record_origin), data_records, fl_ctx)
+
+    def _get_writer(self, record_origin: str) -> SummaryWriter:
+        writer = self.writers_table.get(record_origin)
+        if writer is None:
+            peer_log_dir = os.path.join(self.root_log_dir, record_origin)
+            writer = SummaryWriter(log_dir=peer_log_dir)
+            self.writers_table[record_origin] = writer
+        return writer
 
+    def _write_records(self, writer: SummaryWriter, data_records: List[AnalyticsData], fl_ctx: FLContext):
         for data_record in data_records:
             func_name = FUNCTION_MAPPING.get(data_record.data_type, None)
             if func_name is None:
                 self.log_warning(fl_ctx, f"The data_type {data_record.data_type} is not supported.", fire_event=False)
-                return
+                continue
 
             func = getattr(writer, func_name)
             if data_record.step:
@@ -19,13 +19,16 @@ from nvflare.app_common.tracking.log_writer import LogWriter
 
 
 class TBWriter(LogWriter):
-    def __init__(self, event_type=ANALYTIC_EVENT_TYPE):
+    def __init__(self, event_type=ANALYTIC_EVENT_TYPE, batch_size: int = 1, flush_interval: float = 1.0):
         """Sends experiment tracking data.
 
         Args:
             event_type (str): event type to fire.
+            batch_size (int): max number of records sent in one event. The default of 1 sends each record in its
+                own event.
+            flush_interval (float): max seconds a record waits in a batch, when batch_size is more than 1.
         """
-        super().__init__(event_type)
+        super().__init__(event_type, batch_size=batch_size, flush_interval=flush_interval)
 
     def get_writer_name(self) -> LogWriterName:
         return LogWriterName.TORCH_TB
@@ -19,8 +19,8 @@ from nvflare.app_common.tracking.log_writer import LogWriter
 
 
 class WandBWriter(LogWriter):
-    def __init__(self, event_type: str = ANALYTIC_EVENT_TYPE):
-        super().__init__(event_type)
+    def __init__(self, event_type: str = ANALYTIC_EVENT_TYPE, batch_size: int = 1, flush_interval: float = 1.0):
+        super().__init__(event_type, batch_size=batch_size, flush_interval=flush_interval)
 
     def get_writer_name(self) -> LogWriterName:
         """Returns "WEIGHTS_AND_BIASES"."""
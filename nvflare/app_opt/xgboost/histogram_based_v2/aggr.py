@@ -11,10 +11,93 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from operator import itemgetter
+from typing import List, Optional
+
+import numpy as np
+
+# Integers are summed as int64 limbs of this many bits, so up to 2**32 values can be summed without overflow,
+# and integers out of the int64 range (such as combined gh pairs) are summed exactly.
+LIMB_BITS = 31
+LIMB_MASK = (1 << LIMB_BITS) - 1
+LIMB_MIN = -(1 << LIMB_BITS)
+LIMB_MAX = 1 << LIMB_BITS
+
+# number of values checked for big ints before converting the values of a single aggregation
+NUM_PROBES = 8
+
+
+class _PlainValues:
+    def __init__(self, limbs: List[np.ndarray], is_float: bool):
+        """Clear-text values converted for vectorized aggregation.
+
+        Args:
+            limbs: for floats, the float64 values; for integers, the int64 limbs from the lowest to the highest,
+                so value = sum(limbs[k] << (LIMB_BITS * k))
+            is_float: whether the values are floats
+        """
+        self.limbs = limbs
+        self.is_float = is_float
+
+    def take(self, indices: np.ndarray) -> "_PlainValues":
+        return _PlainValues([limb[indices] for limb in self.limbs], self.is_float)
+
+
+def _split_limbs(high: np.ndarray, low: np.ndarray) -> List[np.ndarray]:
+    """Split 128-bit integers, given as the int64 high and the uint64 low words, into limbs.
+
+    The highest limb is signed, the others are in [0, 2**LIMB_BITS).
+    """
+    limbs = []
+    while True:
+        signed_low = low.view(np.int64)
+        if np.array_equal(high, signed_low >> 63) and np.all((signed_low >= LIMB_MIN) & (signed_low < LIMB_MAX)):
+            # the rest fits in one signed limb
+            limbs.append(signed_low.copy())
+            return limbs
+        limbs.append((low & LIMB_MASK).astype(np.int64))
+        low = (low >> LIMB_BITS) | (high.view(np.uint64) << (64 - LIMB_BITS))
+        high = high >> LIMB_BITS
+
+
+def _int_limbs(values: np.ndarray) -> List[np.ndarray]:
+    values = values.astype(np.int64)
+    return _split_limbs(values >> 63, values.view(np.uint64))
+
+
+def _big_int_limbs(values) -> Optional[List[np.ndarray]]:
+    """Split python ints of up to 128 bits into limbs, or return None if any is not an int or is too large."""
+    try:
+        buffer = b"".join([v.to_bytes(16, "little", signed=True) for v in values])
+    except (AttributeError, OverflowError, TypeError):
+        return None
+    words = np.frombuffer(buffer, dtype=np.uint64).reshape(-1, 2)
+    return _split_limbs(words[:, 1].view(np.int64), words[:, 0])
+
+
+def _no_ids(sample_ids) -> bool:
+    # sample_ids may be a list or a NumPy array
+    return sample_ids is None or len(sample_ids) == 0
+
+
+def _select(values, sample_ids):
+    if isinstance(values, np.ndarray):
+        return values[np.asarray(sample_ids)]
+    if len(sample_ids) == 1:
+        return [values[sample_ids[0]]]
+    return itemgetter(*sample_ids)(values)
 
 
 class Aggregator:
     def __init__(self, initial_value=0):
+        """Aggregate the gh values of the samples into the bins of a feature.
+
+        Clear-text numbers (ints or floats) are aggregated with NumPy. Other values, such as ciphertexts, or
+        any values if add() is overridden, are added one by one with add().
+
+        Args:
+            initial_value: initial value of each bin
+        """
         self.initial_value = initial_value
 
     def add(self, a, b):
@@ -33,12 +116,169 @@ class Aggregator:
         else:
             aggr[bin_id] = self.add(current_value, sample_value)
 
-    def aggregate(self, gh_values: list, sample_bin_assignment, num_bins, sample_ids):
+    def _aggregate_generic(self, gh_values, sample_bin_assignment, num_bins, sample_ids):
         aggr_result = [self.initial_value] * num_bins
-        if not sample_ids:
+        if _no_ids(sample_ids):
             for sample_id in range(len(gh_values)):
                 self._update_aggregation(gh_values, sample_bin_assignment, sample_id, aggr_result)
         else:
             for sample_id in sample_ids:
                 self._update_aggregation(gh_values, sample_bin_assignment, sample_id, aggr_result)
         return aggr_result
+
+    def _to_plain_values(self, gh_values, big_ints: bool = True) -> Optional[_PlainValues]:
+        """Convert the gh values for vectorized aggregation.
+
+        Args:
+            gh_values: gh values
+            big_ints: whether to convert python ints out of the int64 range
+
+        Returns: the converted values, or None if they are not clear-text numbers, or are big ints not to convert
+        """
+        if type(self).add is not Aggregator.add or not len(gh_values):
+            return None
+
+        if isinstance(gh_values, np.ndarray):
+            values = gh_values
+        else:
+            first = gh_values[0]
+            if isinstance(first, int) and first.bit_length() > 62:
+                # most likely out of the int64 range, such as combined gh pairs
+                limbs = _big_int_limbs(gh_values) if big_ints else None
+                return _PlainValues(limbs, False) if limbs else None
+            if not isinstance(first, (int, float, np.number)):
+                return None
+            values = np.asarray(gh_values)
+
+        if values.ndim != 1:
+            return None
+        kind = values.dtype.kind
+        if kind == "f":
+            return _PlainValues([values.astype(np.float64, copy=False)], True)
+        if kind in "bi" or (kind == "u" and values.dtype.itemsize < 8):
+            return _PlainValues(_int_limbs(values), False)
+        if kind in "uO" and big_ints:
+            limbs = _big_int_limbs(values.tolist())
+            return _PlainValues(limbs, False) if limbs else None
+        return None
+
+    def _aggregate_plain(self, values: _PlainValues, bins: np.ndarray, num_bins: int, num_groups: int, group_index):
+        """Aggregate the values into num_bins bins for each group.
+
+        Args:
+            values: values of the samples
+            bins: bin of each sample. Samples of negative bins are skipped.
+            num_bins: number of bins
+            num_groups: number of groups
+            group_index: group of each sample, or None if there is one group
+
+        Returns: list of the bins of each group
+        """
+        valid = bins >= 0
+        if not valid.all():
+            bins = bins[valid]
+            values = values.take(valid)
+            if group_index is not None:
+                group_index = group_index[valid]
+
+        if bins.size and bins.max() >= num_bins:
+            raise IndexError(f"bin {bins.max()} out of range for {num_bins} bins")
+
+        size = num_groups * num_bins
+        index = bins if group_index is None else group_index * num_bins + bins
+        if values.is_float:
+            sums = np.bincount(index, weights=values.limbs[0], minlength=size)
+        else:
+            limb_sums = []
+            for limb in values.limbs:
+                limb_sum = np.zeros(size, dtype=np.int64)
+                np.add.at(limb_sum, index, limb)
+                limb_sums.append(limb_sum)
+
+            sums = limb_sums[-1]
+            if len(limb_sums) > 1:
+                sums = sums.astype(object)
+                for limb_sum in reversed(limb_sums[:-1]):
+                    sums = (sums << LIMB_BITS) + limb_sum.astype(object)
+
+        result = sums.tolist()
+        if self.initial_value != 0:
+            counts = np.bincount(index, minlength=size)
+            result = [self.initial_value + v if c else self.initial_value for v, c in zip(result, counts)]
+        return [result[i * num_bins : (i + 1) * num_bins] for i in range(num_groups)]
+
+    def aggregate(self, gh_values: list, sample_bin_assignment, num_bins, sample_ids):
+        """Aggregate the gh values into the bins of a feature.
+
+        Args:
+            gh_values: gh value of each sample
+            sample_bin_assignment: bin of each sample. Samples of negative bins are skipped.
+            num_bins: number of bins
+            sample_ids: ids of the samples to aggregate. All samples if empty or None.
+
+        Returns: list of the aggregated value of each bin
+        """
+        # Converting python ints out of the int64 range costs about as much as adding them one by one.
+        # aggregate_batch converts them once for all features and groups.
+        ids = range(len(gh_values)) if _no_ids(sample_ids) else sample_ids
+        probe = [gh_values[i] for i in ids[:: max(len(ids) // NUM_PROBES, 1)]]
+        if any(isinstance(v, int) and v.bit_length() > 62 for v in probe):
+            return self._aggregate_generic(gh_values, sample_bin_assignment, num_bins, sample_ids)
+
+        if _no_ids(sample_ids):
+            values = self._to_plain_values(gh_values, big_ints=False)
+        else:
+            # only convert the values of the samples
+            values = self._to_plain_values(_select(gh_values, sample_ids), big_ints=False)
+
+        if values is None:
+            return self._aggregate_generic(gh_values, sample_bin_assignment, num_bins, sample_ids)
+
+        if _no_ids(sample_ids):
+            bins = np.asarray(sample_bin_assignment[: len(gh_values)])
+        else:
+            bins = np.asarray(_select(sample_bin_assignment, sample_ids))
+        return self._aggregate_plain(values, bins, num_bins, 1, None)[0]
+
+    def aggregate_batch(self, gh_values: list, features: list, sample_groups: list = None) -> list:
+        """Aggregate the gh values for all features and sample groups.
+
+        The clear-text gh values are converted once, and the bins of all groups of a feature are computed together.
+
+        Args:
+            gh_values: gh value of each sample
+            features: list of tuples of (feature_id, sample_bin_assignment, num_bins)
+            sample_groups: list of tuples of (group_id, sample_ids). If empty or None, all samples are
+                aggregated as group 0.
+
+        Returns: list of tuples of (feature_id, group_id, bins), in the order of features then groups
+        """
+        if not sample_groups:
+            sample_groups = [(0, None)]
+
+        values = self._to_plain_values(gh_values)
+        if values is None:
+            result = []
+            for fid, mask, num_bins in features:
+                for gid, sample_ids in sample_groups:
+                    result.append((fid, gid, self._aggregate_generic(gh_values, mask, num_bins, sample_ids)))
+            return result
+
+        num_samples = len(values.limbs[0])
+        if len(sample_groups) == 1 and _no_ids(sample_groups[0][1]):
+            sample_ids = None
+            group_index = None
+        else:
+            ids = [np.arange(num_samples) if _no_ids(g[1]) else np.asarray(g[1]) for g in sample_groups]
+            sample_ids = np.concatenate(ids)
+            group_index = np.repeat(np.arange(len(ids)), [len(i) for i in ids])
+            values = values.take(sample_ids)
+
+        result = []
+        for fid, mask, num_bins in features:
+            bins = np.asarray(mask)
+            bins = bins[:num_samples] if sample_ids is None else bins[sample_ids]
+            group_bins = self._aggregate_plain(values, bins, num_bins, len(sample_groups), group_index)
+            for (gid, _), aggr in zip(sample_groups, group_bins):
+                result.append((fid, gid, aggr))
+        return result
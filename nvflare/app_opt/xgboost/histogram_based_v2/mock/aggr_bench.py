@@ -0,0 +1,93 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+import time
+
+import numpy as np
+
+from nvflare.app_opt.xgboost.histogram_based_v2.aggr import Aggregator
+from nvflare.app_opt.xgboost.histogram_based_v2.sec.partial_he.util import combine
+
+"""
+This tool measures the clear-text histogram aggregation of the label client (Aggregator), with
+the combined gh pairs of the secure vertical training, or with float values.
+
+It compares the per-sample loop (used for ciphertexts), Aggregator.aggregate called for each feature and
+group, and Aggregator.aggregate_batch for all features and groups.
+
+    python -m nvflare.app_opt.xgboost.histogram_based_v2.mock.aggr_bench -s 1000000 -f 20 -g 8
+
+The following args are supported,
+
+    -s: Number of samples. Default is 100000
+    -f: Number of features. Default is 20
+    -b: Number of bins of each feature. Default is 256
+    -g: Number of sample groups (tree nodes). Default is 4. The samples are split evenly.
+    -t: Type of the gh values, combined or float. Default is combined
+    -l: Skip the per-sample loop, which is slow for many samples
+"""
+
+
+def _run(name, fn, num_values):
+    start = time.perf_counter()
+    result = fn()
+    duration = time.perf_counter() - start
+    print(f"{name:>10}: {duration:.3f} secs, {num_values / duration / 1e6:.1f}M values/sec")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", "-s", type=int, help="number of samples", default=100000)
+    parser.add_argument("--features", "-f", type=int, help="number of features", default=20)
+    parser.add_argument("--bins", "-b", type=int, help="number of bins", default=256)
+    parser.add_argument("--groups", "-g", type=int, help="number of sample groups", default=4)
+    parser.add_argument("--type", "-t", type=str, help="type of the gh values", default="combined")
+    parser.add_argument("--skip_loop", "-l", action="store_true", help="skip the per-sample loop")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    g = rng.integers(-(10**6), 10**6, args.samples)
+    h = rng.integers(0, 250000, args.samples)
+    if args.type == "combined":
+        gh_values = [combine(int(g[i]), int(h[i])) for i in range(args.samples)]
+    else:
+        gh_values = (g / 10**6).tolist()
+    features = [(fid, rng.integers(-1, args.bins, args.samples).tolist(), args.bins) for fid in range(args.features)]
+    permutation = rng.permutation(args.samples)
+    groups = [(gid, ids.tolist()) for gid, ids in enumerate(np.array_split(permutation, args.groups))]
+    num_values = args.samples * args.features
+
+    print(f"samples={args.samples} features={args.features} bins={args.bins} groups={args.groups} type={args.type}")
+    aggregator = Aggregator()
+
+    def _each(aggregate):
+        return [
+            (fid, gid, aggregate(gh_values, mask, num_bins, sample_ids))
+            for fid, mask, num_bins in features
+            for gid, sample_ids in groups
+        ]
+
+    expected = None
+    if not args.skip_loop:
+        expected = _run("loop", lambda: _each(aggregator._aggregate_generic), num_values)
+    result = _run("aggregate", lambda: _each(aggregator.aggregate), num_values)
+    batch_result = _run("batch", lambda: aggregator.aggregate_batch(gh_values, features, groups), num_values)
+
+    if args.type == "combined" and (batch_result != result or (expected is not None and result != expected)):
+        raise RuntimeError("results are different")
+
+
+if __name__ == "__main__":
+    main()
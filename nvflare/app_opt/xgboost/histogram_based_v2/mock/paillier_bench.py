@@ -0,0 +1,145 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+import secrets
+import time
+
+import numpy as np
+
+from nvflare.app_opt.xgboost.histogram_based_v2.aggr import Aggregator
+from nvflare.app_opt.xgboost.histogram_based_v2.sec.partial_he.engine import (
+    PaillierEngine,
+    PaillierPrivateKey,
+    PaillierPublicKey,
+)
+from nvflare.app_opt.xgboost.histogram_based_v2.sec.partial_he.util import combine
+
+"""
+This tool measures the PaillierEngine with the combined gh pairs of the secure vertical training:
+encryption by the label client, encrypted histogram aggregation by the other clients, and decryption of the
+histograms by the label client. The time of each stage is printed for each operation.
+
+    python -m nvflare.app_opt.xgboost.histogram_based_v2.mock.paillier_bench -s 100000 -f 10 -w 32
+
+The following args are supported,
+
+    -s: Number of samples. Default is 10000
+    -f: Number of features. Default is 4
+    -b: Number of bins of each feature. Default is 256
+    -k: Key length in bits. Default is 1024
+    -w: Number of worker processes. Default is 10
+    -n: Number of values in each batch sent to a worker. Default is 1024
+    -p: Size of the precomputed randomness table. Default is 0 (disabled)
+"""
+
+_SMALL_PRIMES = [p for p in range(3, 1000, 2) if all(p % d for d in range(3, int(p**0.5) + 1, 2))]
+
+
+def _is_probable_prime(n: int, rounds: int = 40) -> bool:
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for _ in range(rounds):
+        x = pow(secrets.randbelow(n - 3) + 2, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _random_prime(bits: int) -> int:
+    while True:
+        # the top 2 bits are set so the product of 2 primes has exactly 2 * bits bits
+        candidate = secrets.randbits(bits) | (3 << (bits - 2)) | 1
+        if _is_probable_prime(candidate):
+            return candidate
+
+
+def generate_paillier_keypair(n_length: int = 1024):
+    """Generate a Paillier key pair with a modulus of n_length bits, for benchmarks and tests.
+
+    This is not a vetted key generator. Don't use it for real training.
+
+    Returns: tuple of (PaillierPublicKey, PaillierPrivateKey)
+    """
+    while True:
+        p = _random_prime(n_length // 2)
+        q = _random_prime(n_length - n_length // 2)
+        if p != q:
+            break
+    public_key = PaillierPublicKey(p * q)
+    return public_key, PaillierPrivateKey(public_key, p, q)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", "-s", type=int, help="number of samples", default=10000)
+    parser.add_argument("--features", "-f", type=int, help="number of features", default=4)
+    parser.add_argument("--bins", "-b", type=int, help="number of bins", default=256)
+    parser.add_argument("--key_length", "-k", type=int, help="key length in bits", default=1024)
+    parser.add_argument("--workers", "-w", type=int, help="number of worker processes", default=10)
+    parser.add_argument("--batch_size", "-n", type=int, help="number of values in each batch", default=1024)
+    parser.add_argument("--precompute", "-p", type=int, help="size of the randomness table", default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    g = rng.integers(-(10**6), 10**6, args.samples)
+    h = rng.integers(0, 250000, args.samples)
+    gh_values = [combine(int(g[i]), int(h[i])) for i in range(args.samples)]
+    features = [(fid, rng.integers(-1, args.bins, args.samples), args.bins) for fid in range(args.features)]
+
+    public_key, private_key = generate_paillier_keypair(args.key_length)
+    engine = PaillierEngine(
+        public_key,
+        private_key,
+        max_workers=args.workers,
+        batch_size=args.batch_size,
+        precompute_size=args.precompute,
+    )
+    print(f"samples={args.samples} features={args.features} bins={args.bins} key={args.key_length} bits")
+    try:
+        if args.precompute:
+            print(f"waiting for {args.precompute} precomputed randomness")
+            while engine.num_precomputed() < args.precompute:
+                time.sleep(0.1)
+
+        ciphertexts = engine.encrypt(gh_values)
+        histograms = engine.add(ciphertexts, features)
+        sums = engine.decrypt([c for _, _, bins in histograms for c in bins])
+        expected = Aggregator().aggregate_batch(gh_values, features)
+        if sums != [v for _, _, bins in expected for v in bins]:
+            raise RuntimeError("decrypted histograms are different")
+
+        for op, stages in engine.get_stats().items():
+            count = stages.pop("count", 0)
+            duration = sum(v for k, v in stages.items() if k != "precomputed")
+            rate = f", {count / duration:.0f} values/sec" if duration and count else ""
+            details = " ".join(f"{k}={v:.3f}" for k, v in stages.items())
+            print(f"{op:>10}: {duration:.3f} secs{rate} ({details})")
+    finally:
+        engine.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -217,8 +217,12 @@ class ClientSecurityHandler(SecurityHandler):
             fl_ctx, f"_process_before_all_gather_v: non-label client - do encrypted aggr for {len(groups)} groups"
         )
         start = time.time()
-        aggr_result = self.adder.add(self.encrypted_ghs, self.feature_masks, groups, encode_sum=True)
+        aggr_result = self.adder.add(
+            self.encrypted_ghs, self.feature_masks, groups, encode_sum=True, pubkey=self.public_key
+        )
         self.info(fl_ctx, f"got aggr result for {len(aggr_result)} features in {time.time() - start} secs")
+        if self.adder.engine:
+            self.info(fl_ctx, f"paillier engine stats: {self.adder.engine.get_stats()}")
         start = time.time()
         encoded_str = encode_feature_aggregations(aggr_result)
         self.info(fl_ctx, f"encoded aggr result len {len(encoded_str)} in {time.time() - start} secs")
@@ -256,18 +260,8 @@ class ClientSecurityHandler(SecurityHandler):
             return
 
         t = time.time()
-        aggr_result = []  # list of (fid, gid, GH_list)
-        for fm in self.feature_masks:
-            fid, masks, num_bins = fm
-            if not groups:
-                gid = 0
-                gh_list = self.aggregator.aggregate(self.clear_ghs, masks, num_bins, None)
-                aggr_result.append((fid, gid, gh_list))
-            else:
-                for grp in groups:
-                    gid, sample_ids = grp
-                    gh_list = self.aggregator.aggregate(self.clear_ghs, masks, num_bins, sample_ids)
-                    aggr_result.append((fid, gid, gh_list))
+        # list of (fid, gid, GH_list)
+        aggr_result = self.aggregator.aggregate_batch(self.clear_ghs, self.feature_masks, groups)
         self.info(fl_ctx, f"aggregated clear-text in {time.time() - t} secs")
         self.aggr_result = aggr_result
 
@@ -461,5 +455,8 @@ class ClientSecurityHandler(SecurityHandler):
                     fl_ctx.set_prop(Constant.PARAM_KEY_CONFIG_ERROR, tenseal_error, private=True, sticky=False)
         elif event_type == EventType.END_RUN:
             self.tenseal_context = None
+            if self.adder:
+                self.adder.shutdown()
+                self.adder = None
         else:
             super().handle_event(event_type, fl_ctx)
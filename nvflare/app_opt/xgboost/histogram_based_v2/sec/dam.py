@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import struct
-from io import BytesIO
-from typing import List
+from typing import List, Union
+
+import numpy as np
 
 SIGNATURE = "NVDADAM1"  # DAM (Direct Accessible Marshalling) V1
 PREFIX_LEN = 24
@@ -24,50 +25,35 @@ DATA_TYPE_STRING = 3
 DATA_TYPE_INT_ARRAY = 257
 DATA_TYPE_FLOAT_ARRAY = 258
 
+# array elements are 8 bytes in native byte order, same as struct "q" and "d"
+ARRAY_DTYPES = {DATA_TYPE_INT_ARRAY: np.int64, DATA_TYPE_FLOAT_ARRAY: np.float64}
+
 
 class DamEncoder:
     def __init__(self, data_set_id: int):
         self.data_set_id = data_set_id
         self.entries = []
-        self.buffer = BytesIO()
 
-    def add_int_array(self, value: List[int]):
+    def add_int_array(self, value: Union[List[int], np.ndarray]):
         self.entries.append((DATA_TYPE_INT_ARRAY, value))
 
-    def add_float_array(self, value: List[float]):
+    def add_float_array(self, value: Union[List[float], np.ndarray]):
         self.entries.append((DATA_TYPE_FLOAT_ARRAY, value))
 
     def finish(self) -> bytes:
+        arrays = []
         size = PREFIX_LEN
-        for entry in self.entries:
-            size += 16
-            size += len(entry[1]) * 8
-
-        self.write_str(SIGNATURE)
-        self.write_int64(size)
-        self.write_int64(self.data_set_id)
-
-        for entry in self.entries:
-            data_type, value = entry
-            self.write_int64(data_type)
-            self.write_int64(len(value))
+        for data_type, value in self.entries:
+            array = np.asarray(value, dtype=ARRAY_DTYPES[data_type]).reshape(-1)
+            arrays.append((data_type, array))
+            size += 16 + array.nbytes
 
-            for x in value:
-                if data_type == DATA_TYPE_INT_ARRAY:
-                    self.write_int64(x)
-                else:
-                    self.write_float(x)
+        parts = [SIGNATURE.encode("utf-8"), struct.pack("qq", size, self.data_set_id)]
+        for data_type, array in arrays:
+            parts.append(struct.pack("qq", data_type, array.size))
+            parts.append(array.tobytes())
 
-        return self.buffer.getvalue()
-
-    def write_int64(self, value: int):
-        self.buffer.write(struct.pack("q", value))
-
-    def write_float(self, value: float):
-        self.buffer.write(struct.pack("d", value))
-
-    def write_str(self, value: str):
-        self.buffer.write(value.encode("utf-8"))
+        return b"".join(parts)
 
 
 class DamDecoder:
@@ -89,29 +75,36 @@ class DamDecoder:
     def get_data_set_id(self):
         return self.data_set_id
 
-    def decode_int_array(self) -> List[int]:
+    def _decode_ndarray(self, expected_type: int) -> np.ndarray:
         data_type = self.read_int64()
-        if data_type != DATA_TYPE_INT_ARRAY:
-            raise RuntimeError("Invalid data type for int array")
+        if data_type != expected_type:
+            name = "int" if expected_type == DATA_TYPE_INT_ARRAY else "float"
+            raise RuntimeError(f"Invalid data type for {name} array")
 
         num = self.read_int64()
-        result = [0] * num
-        for i in range(num):
-            result[i] = self.read_int64()
-
+        result = np.frombuffer(self.buffer, dtype=ARRAY_DTYPES[data_type], count=num, offset=self.pos)
+        self.pos += result.nbytes
         return result
 
-    def decode_float_array(self):
-        data_type = self.read_int64()
-        if data_type != DATA_TYPE_FLOAT_ARRAY:
-            raise RuntimeError("Invalid data type for float array")
+    def decode_int_ndarray(self) -> np.ndarray:
+        """Decode an int array as an int64 NumPy array.
 
-        num = self.read_int64()
-        result = [0.0] * num
-        for i in range(num):
-            result[i] = self.read_float()
+        The array is a read-only view of the buffer, not a copy.
+        """
+        return self._decode_ndarray(DATA_TYPE_INT_ARRAY)
 
-        return result
+    def decode_float_ndarray(self) -> np.ndarray:
+        """Decode a float array as a float64 NumPy array.
+
+        The array is a read-only view of the buffer, not a copy.
+        """
+        return self._decode_ndarray(DATA_TYPE_FLOAT_ARRAY)
+
+    def decode_int_array(self) -> List[int]:
+        return self.decode_int_ndarray().tolist()
+
+    def decode_float_array(self) -> List[float]:
+        return self.decode_float_ndarray().tolist()
 
     def read_string(self, length: int) -> str:
         result = self.buffer[self.pos : self.pos + length].decode("latin1")
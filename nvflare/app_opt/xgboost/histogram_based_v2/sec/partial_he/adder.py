@@ -13,18 +13,61 @@
 # limitations under the License.
 
 import concurrent.futures
+import json
 
 from nvflare.app_opt.xgboost.histogram_based_v2.aggr import Aggregator
 
-from .util import encode_encrypted_numbers_to_str
+from .engine import PaillierEngine, PaillierPublicKey
+from .util import (
+    ciphertext_to_int,
+    encode_encrypted_numbers_to_str,
+    encrypt_number,
+    get_exponent,
+    int_to_base64,
+    int_to_ciphertext,
+)
 
 
 class Adder:
     def __init__(self, max_workers=10):
-        self.exe = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+        self.exe = None
         self.num_workers = max_workers
-
-    def add(self, encrypted_numbers, features, sample_groups=None, encode_sum=True):
+        self.engine = None
+        self._ciphertexts = None  # tuple of (encrypted_numbers, ciphertext ints, exponent) of the last add
+
+    def _get_engine(self, n):
+        if self.engine is None or self.engine.public_key.n != n:
+            if self.engine:
+                self.engine.shutdown()
+            self.engine = PaillierEngine(PaillierPublicKey(n), max_workers=self.num_workers)
+        return self.engine
+
+    def shutdown(self):
+        """Stop the worker processes, and remove the ciphertexts shared with them."""
+        if self.engine:
+            self.engine.shutdown()
+            self.engine = None
+        if self.exe:
+            self.exe.shutdown(wait=True)
+            self.exe = None
+        self._ciphertexts = None
+
+    def _to_ciphertexts(self, encrypted_numbers, pubkey):
+        """Convert the encrypted numbers to ciphertext ints of the same exponent, or return None if not possible"""
+        if isinstance(pubkey, PaillierPublicKey):
+            return encrypted_numbers, None
+        if self._ciphertexts and self._ciphertexts[0] is encrypted_numbers:
+            return self._ciphertexts[1:]
+        if any(isinstance(x, int) for x in encrypted_numbers):
+            return None
+        exponents = set(get_exponent(x) for x in encrypted_numbers)
+        if len(exponents) != 1:
+            # ciphertexts of different exponents can't be added as ints
+            return None
+        self._ciphertexts = (encrypted_numbers, [ciphertext_to_int(x) for x in encrypted_numbers], exponents.pop())
+        return self._ciphertexts[1:]
+
+    def add(self, encrypted_numbers, features, sample_groups=None, encode_sum=True, pubkey=None):
         """
 
         Args:
@@ -35,11 +78,24 @@ class Adder:
             sample_groups: list of sample groups, each group is a tuple of (group_id, id_list)
                     group_id is the group id, id_list is a list of sample IDs for which the add will be applied to
             encode_sum: if true, encode the sum into a JSON string
+            pubkey: public key of the encrypted numbers. If specified, the ciphertexts are added as ints in
+                batches by a PaillierEngine. If it's a PaillierPublicKey, encrypted_numbers are ciphertext ints.
 
         Returns: list of tuples of (feature_id, group_id, sum), sum is the result of adding encrypted values of
             samples in the group for the feature.
 
         """
+        converted = (
+            self._to_ciphertexts(encrypted_numbers, pubkey) if pubkey is not None and encrypted_numbers else None
+        )
+        if converted:
+            ciphertexts, exponent = converted
+            result = self._get_engine(pubkey.n).add(ciphertexts, features, sample_groups)
+            return [(fid, gid, self._encode_sums(sums, exponent, pubkey, encode_sum)) for fid, gid, sums in result]
+
+        if self.exe is None:
+            self.exe = concurrent.futures.ProcessPoolExecutor(max_workers=self.num_workers)
+
         items = []
 
         for f in features:
@@ -59,6 +115,16 @@ class Adder:
             rl.append(r)
         return rl
 
+    @staticmethod
+    def _encode_sums(sums, exponent, pubkey, encode_sum):
+        if exponent is None:
+            # PaillierPublicKey: the ciphertexts are ints
+            return json.dumps(sums) if encode_sum else sums
+        if encode_sum:
+            # same as encode_encrypted_numbers_to_str, 0 is a bin without any sample
+            return json.dumps([(int_to_base64(c), exponent) if c else 0 for c in sums])
+        return [encrypt_number(pubkey, int_to_ciphertext(c, pubkey), exponent) if c else 0 for c in sums]
+
 
 def _do_add(item):
     encode_sum, fid, encrypted_numbers, mask, num_bins, gid, sample_id_list = item
@@ -14,12 +14,29 @@
 
 import concurrent.futures
 
+from .engine import DEFAULT_BATCH_SIZE, PaillierEngine, PaillierPrivateKey
+
 
 class Decrypter:
-    def __init__(self, private_key, max_workers=10):
+    def __init__(self, private_key, max_workers=10, batch_size=DEFAULT_BATCH_SIZE):
+        """Decrypt encrypted numbers with a process pool.
+
+        Args:
+            private_key: the private key. If it's a PaillierPrivateKey, numbers are decrypted by a PaillierEngine.
+            max_workers: number of worker processes
+            batch_size: number of numbers sent to a worker at a time
+        """
         self.max_workers = max_workers
         self.private_key = private_key
-        self.exe = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+        self.batch_size = batch_size
+        if isinstance(private_key, PaillierPrivateKey):
+            self.engine = PaillierEngine(
+                private_key.public_key, private_key, max_workers=max_workers, batch_size=batch_size
+            )
+            self.exe = self.engine.exe
+        else:
+            self.engine = None
+            self.exe = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
 
     def decrypt(self, encrypted_number_groups):
         """
@@ -31,17 +48,24 @@ class Decrypter:
         Returns: list of lists of decrypted numbers
 
         """
-        items = [None] * len(encrypted_number_groups)
-
-        for i, g in enumerate(encrypted_number_groups):
-            items[i] = (self.private_key, g)
-
-        chunk_size = int((len(items) - 1) / self.max_workers) + 1
+        # the groups are decrypted as contiguous batches of the same size
+        numbers = [v for g in encrypted_number_groups for v in g]
+        if self.engine:
+            decrypted = self.engine.decrypt(numbers)
+        else:
+            items = [
+                (self.private_key, numbers[i : i + self.batch_size]) for i in range(0, len(numbers), self.batch_size)
+            ]
+            chunk_size = max(len(items) // (self.max_workers * 4), 1)
+            decrypted = []
+            for r in self.exe.map(_do_decrypt, items, chunksize=chunk_size):
+                decrypted.extend(r)
 
-        results = self.exe.map(_do_decrypt, items, chunksize=chunk_size)
         rl = []
-        for r in results:
-            rl.append(r)
+        offset = 0
+        for g in encrypted_number_groups:
+            rl.append(decrypted[offset : offset + len(g)])
+            offset += len(g)
         return rl
 
 
@@ -14,12 +14,30 @@
 
 import concurrent.futures
 
+from .engine import DEFAULT_BATCH_SIZE, PaillierEngine, PaillierPublicKey
+
 
 class Encryptor:
-    def __init__(self, pubkey, max_workers=10):
+    def __init__(self, pubkey, max_workers=10, batch_size=DEFAULT_BATCH_SIZE, precompute_size=0):
+        """Encrypt clear-text numbers with a process pool.
+
+        Args:
+            pubkey: the public key. If it's a PaillierPublicKey, numbers are encrypted by a PaillierEngine.
+            max_workers: number of worker processes
+            batch_size: number of numbers sent to a worker at a time
+            precompute_size: size of the table of precomputed randomness of the PaillierEngine
+        """
         self.max_workers = max_workers
         self.pubkey = pubkey
-        self.exe = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+        self.batch_size = batch_size
+        if isinstance(pubkey, PaillierPublicKey):
+            self.engine = PaillierEngine(
+                pubkey, max_workers=max_workers, batch_size=batch_size, precompute_size=precompute_size
+            )
+            self.exe = self.engine.exe
+        else:
+            self.engine = None
+            self.exe = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
 
     def encrypt(self, numbers):
         """
@@ -28,18 +46,20 @@ class Encryptor:
             numbers: clear text numbers to be encrypted
         Returns: list of encrypted numbers
         """
-        items = [(self.pubkey, numbers[i]) for i in range(len(numbers))]
-        chunk_size = int(len(items) / self.max_workers)
-        if chunk_size == 0:
-            chunk_size = 1
+        if self.engine:
+            return self.engine.encrypt(numbers)
+
+        # the key is sent once for each batch
+        items = [(self.pubkey, numbers[i : i + self.batch_size]) for i in range(0, len(numbers), self.batch_size)]
+        chunk_size = max(len(items) // (self.max_workers * 4), 1)
 
         results = self.exe.map(_do_enc, items, chunksize=chunk_size)
         rl = []
         for r in results:
-            rl.append(r)
+            rl.extend(r)
         return rl
 
 
 def _do_enc(item):
-    pubkey, num = item
-    return pubkey.encrypt(num)
+    pubkey, numbers = item
+    return [pubkey.encrypt(num) for num in numbers]
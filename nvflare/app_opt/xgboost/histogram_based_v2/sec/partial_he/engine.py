@@ -0,0 +1,428 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import concurrent.futures
+import mmap
+import os
+import secrets
+import tempfile
+import threading
+import time
+import weakref
+from collections import defaultdict, deque
+from typing import List, Optional
+
+import numpy as np
+
+from nvflare.fuel.utils.import_utils import optional_import
+
+gmpy2, gmpy2_imported = optional_import(module="gmpy2")
+
+DEFAULT_BATCH_SIZE = 1024
+
+# the refill of the randomness table starts when it's below this ratio of its size
+REFILL_RATIO = 0.5
+
+
+def _powmod(base: int, exp: int, mod: int) -> int:
+    if gmpy2_imported:
+        return int(gmpy2.powmod(base, exp, mod))
+    return pow(base, exp, mod)
+
+
+def pack_ints(values, width: int) -> bytes:
+    """Pack non-negative ints into a buffer of fixed-width little-endian integers."""
+    return b"".join([v.to_bytes(width, "little") for v in values])
+
+
+def unpack_ints(buffer, width: int) -> List[int]:
+    """Unpack a buffer of fixed-width little-endian integers created by pack_ints."""
+    view = memoryview(buffer)
+    return [int.from_bytes(view[i : i + width], "little") for i in range(0, len(view), width)]
+
+
+class PaillierPublicKey:
+    def __init__(self, n: int):
+        """Paillier public key, with the generator g = n + 1.
+
+        Args:
+            n: the modulus
+        """
+        self.n = n
+        self.nsquare = n * n
+        self.max_int = n // 3
+        self.plaintext_width = (n.bit_length() + 7) // 8
+        self.ciphertext_width = (self.nsquare.bit_length() + 7) // 8
+
+    def __eq__(self, other):
+        return isinstance(other, PaillierPublicKey) and self.n == other.n
+
+    def __hash__(self):
+        return hash(self.n)
+
+
+class PaillierPrivateKey:
+    def __init__(self, public_key: PaillierPublicKey, p: int, q: int):
+        """Paillier private key. Ciphertexts are decrypted modulo p and q, and combined with CRT.
+
+        The engine doesn't generate keys: p and q must come from a vetted key generator.
+
+        Args:
+            public_key: the public key
+            p: a prime factor of n
+            q: the other prime factor of n
+        """
+        if p * q != public_key.n:
+            raise ValueError("p * q is not the n of the public key")
+        self.public_key = public_key
+        self.p = p
+        self.q = q
+
+    def get_params(self) -> tuple:
+        """Get the parameters of CRT decryption: (n, p, q, p^2, q^2, hp, hq, p^-1 mod q)"""
+        p, q, g = self.p, self.q, self.public_key.n + 1
+        psquare, qsquare = p * p, q * q
+        hp = pow((_powmod(g, p - 1, psquare) - 1) // p, -1, p)
+        hq = pow((_powmod(g, q - 1, qsquare) - 1) // q, -1, q)
+        return self.public_key.n, p, q, psquare, qsquare, hp, hq, pow(p, -1, q)
+
+
+def _obfuscators(item):
+    n, count = item
+    nsquare = n * n
+    width = (nsquare.bit_length() + 7) // 8
+    return pack_ints([_powmod(secrets.randbelow(n - 1) + 1, n, nsquare) for _ in range(count)], width)
+
+
+def _encrypt_batch(item):
+    n, plaintexts, obfuscators = item
+    nsquare = n * n
+    width = (nsquare.bit_length() + 7) // 8
+    nudes = [(1 + n * m) % nsquare for m in unpack_ints(plaintexts, (n.bit_length() + 7) // 8)]
+    if obfuscators:
+        rs = unpack_ints(obfuscators, width)
+    else:
+        rs = []
+    # precomputed r^n are used first, the rest are computed here
+    rs.extend(_powmod(secrets.randbelow(n - 1) + 1, n, nsquare) for _ in range(len(nudes) - len(rs)))
+    return pack_ints([nude * r % nsquare for nude, r in zip(nudes, rs)], width)
+
+
+def _decrypt_batch(item):
+    params, ciphertexts = item
+    n, p, q, psquare, qsquare, hp, hq, p_inverse = params
+    width = ((n * n).bit_length() + 7) // 8
+    result = []
+    for c in unpack_ints(ciphertexts, width):
+        if c == 0:
+            # a bin without any sample
+            result.append(0)
+            continue
+        mp = (_powmod(c, p - 1, psquare) - 1) // p * hp % p
+        mq = (_powmod(c, q - 1, qsquare) - 1) // q * hq % q
+        result.append(mp + (mq - mp) * p_inverse % q * p)
+    return pack_ints(result, (n.bit_length() + 7) // 8)
+
+
+# the memory-mapped ciphertexts of the current add() in a worker: (path, mmap)
+_mapped_ciphertexts = None
+
+
+def _map_ciphertexts(path: str):
+    global _mapped_ciphertexts
+    if _mapped_ciphertexts is None or _mapped_ciphertexts[0] != path:
+        if _mapped_ciphertexts is not None:
+            _mapped_ciphertexts[1].close()
+        with open(path, "rb") as f:
+            _mapped_ciphertexts = (path, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    return _mapped_ciphertexts[1]
+
+
+def _remove_file(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _add_batch(item):
+    path, nsquare, width, fid, gid, sample_ids, bins, num_bins = item
+    ciphertexts = _map_ciphertexts(path)
+    sums = [0] * num_bins
+    for i, b in zip(sample_ids.tolist(), bins.tolist()):
+        c = int.from_bytes(ciphertexts[i * width : (i + 1) * width], "little")
+        s = sums[b]
+        # 0 is the sum of no samples, it's never a ciphertext
+        sums[b] = c if s == 0 else s * c % nsquare
+    return fid, gid, pack_ints(sums, width)
+
+
+class PaillierEngine:
+    def __init__(
+        self,
+        public_key: PaillierPublicKey,
+        private_key: Optional[PaillierPrivateKey] = None,
+        max_workers: int = 10,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        precompute_size: int = 0,
+    ):
+        """Paillier encryption, decryption and addition of ciphertexts with a process pool.
+
+        Plaintexts and ciphertexts are python ints. They are sent to and from the workers in contiguous batches,
+        packed as fixed-width integer arrays. The ciphertexts to add are written once to a memory-mapped file,
+        which all workers read.
+
+        Encryption is dominated by computing the randomness r^n mod n^2. If precompute_size > 0, a table of
+        precomputed r^n is refilled in the background by the workers, and is used by encrypt() first. Each r^n
+        is only used once.
+
+        The time of each stage of each operation is reported by get_stats().
+
+        Args:
+            public_key: the public key
+            private_key: the private key. Required to decrypt.
+            max_workers: number of worker processes
+            batch_size: number of values in each batch sent to a worker
+            precompute_size: size of the table of precomputed randomness. 0 to disable it.
+        """
+        self.public_key = public_key
+        self.private_key = private_key
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.precompute_size = precompute_size
+        self.exe = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+
+        self._stats = defaultdict(lambda: defaultdict(float))
+        self._stats_lock = threading.Lock()
+        self._decrypt_params = private_key.get_params() if private_key else None
+        self._ciphertext_file = None  # tuple of (ciphertexts, path, remover) of the last add()
+
+        self._obfuscators = deque()
+        self._obfuscator_lock = threading.Lock()
+        self._refill_needed = threading.Event()
+        self._stopped = False
+        self._refill_thread = None
+        if precompute_size > 0:
+            # start the worker processes before the refill thread, so they are not forked from multiple threads
+            self.exe.submit(int).result()
+            self._refill_thread = threading.Thread(target=self._refill, name="paillier_refill", daemon=True)
+            self._refill_thread.start()
+            self._refill_needed.set()
+
+    def _record(self, operation: str, stage: str, start: float, count: int = 0):
+        with self._stats_lock:
+            self._stats[operation][stage] += time.perf_counter() - start
+            if count:
+                self._stats[operation]["count"] += count
+
+    def get_stats(self) -> dict:
+        """Get the statistics of each operation (encrypt, decrypt, add and precompute).
+
+        Returns: dict of operation name to dict of the accumulated secs of each stage, and the number of values
+        """
+        with self._stats_lock:
+            return {op: dict(stages) for op, stages in self._stats.items()}
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats.clear()
+
+    def num_precomputed(self) -> int:
+        return len(self._obfuscators)
+
+    def _refill(self):
+        n = self.public_key.n
+        width = self.public_key.ciphertext_width
+        while not self._stopped:
+            self._refill_needed.wait()
+            self._refill_needed.clear()
+            missing = self.precompute_size - len(self._obfuscators)
+            if self._stopped or missing <= 0:
+                continue
+
+            start = time.perf_counter()
+            counts = [self.batch_size] * (missing // self.batch_size)
+            if missing % self.batch_size:
+                counts.append(missing % self.batch_size)
+            try:
+                for result in self.exe.map(_obfuscators, [(n, c) for c in counts]):
+                    obfuscators = unpack_ints(result, width)
+                    self._record("precompute", "compute", start, len(obfuscators))
+                    with self._obfuscator_lock:
+                        self._obfuscators.extend(obfuscators)
+                    start = time.perf_counter()
+            except RuntimeError:
+                # the pool is shut down
+                return
+
+    def _take_obfuscators(self, count: int) -> List[int]:
+        with self._obfuscator_lock:
+            count = min(count, len(self._obfuscators))
+            taken = [self._obfuscators.popleft() for _ in range(count)]
+        if self.precompute_size and len(self._obfuscators) < self.precompute_size * REFILL_RATIO:
+            self._refill_needed.set()
+        return taken
+
+    def _batches(self, size: int):
+        return [(i, min(i + self.batch_size, size)) for i in range(0, size, self.batch_size)]
+
+    def _run(self, fn, items):
+        # a few batches for each worker, to balance the load
+        chunk_size = max(len(items) // (self.max_workers * 4), 1)
+        return list(self.exe.map(fn, items, chunksize=chunk_size))
+
+    def encrypt(self, numbers) -> List[int]:
+        """Encrypt clear-text ints.
+
+        Args:
+            numbers: ints, whose absolute values are up to public_key.max_int
+
+        Returns: list of ciphertexts
+        """
+        n = self.public_key.n
+        start = time.perf_counter()
+        plaintexts = []
+        for m in numbers:
+            if abs(m) > self.public_key.max_int:
+                raise ValueError(f"number {m} is out of the range of the key")
+            plaintexts.append(m % n)
+        obfuscators = self._take_obfuscators(len(plaintexts))
+        items = []
+        for lo, hi in self._batches(len(plaintexts)):
+            items.append(
+                (
+                    n,
+                    pack_ints(plaintexts[lo:hi], self.public_key.plaintext_width),
+                    pack_ints(obfuscators[lo:hi], self.public_key.ciphertext_width) if lo < len(obfuscators) else None,
+                )
+            )
+        self._record("encrypt", "pack", start)
+
+        start = time.perf_counter()
+        results = self._run(_encrypt_batch, items)
+        self._record("encrypt", "compute", start, len(plaintexts))
+        with self._stats_lock:
+            self._stats["encrypt"]["precomputed"] += len(obfuscators)
+
+        start = time.perf_counter()
+        ciphertexts = []
+        for r in results:
+            ciphertexts.extend(unpack_ints(r, self.public_key.ciphertext_width))
+        self._record("encrypt", "unpack", start)
+        return ciphertexts
+
+    def decrypt(self, ciphertexts) -> List[int]:
+        """Decrypt ciphertexts. 0 is not a ciphertext, it's decrypted as 0.
+
+        Args:
+            ciphertexts: ciphertexts, as ints
+
+        Returns: list of clear-text ints
+        """
+        if not self._decrypt_params:
+            raise RuntimeError("private key is required to decrypt")
+
+        start = time.perf_counter()
+        items = [
+            (self._decrypt_params, pack_ints(ciphertexts[lo:hi], self.public_key.ciphertext_width))
+            for lo, hi in self._batches(len(ciphertexts))
+        ]
+        self._record("decrypt", "pack", start)
+
+        start = time.perf_counter()
+        results = self._run(_decrypt_batch, items)
+        self._record("decrypt", "compute", start, len(ciphertexts))
+
+        start = time.perf_counter()
+        n = self.public_key.n
+        numbers = []
+        for r in results:
+            numbers.extend(
+                m - n if m > self.public_key.max_int else m for m in unpack_ints(r, self.public_key.plaintext_width)
+            )
+        self._record("decrypt", "unpack", start)
+        return numbers
+
+    def _share_ciphertexts(self, ciphertexts) -> str:
+        if self._ciphertext_file and self._ciphertext_file[0] is ciphertexts:
+            return self._ciphertext_file[1]
+
+        self._remove_ciphertext_file()
+        # /dev/shm keeps the file in memory
+        fd, path = tempfile.mkstemp(prefix="nvflare_he_", dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+        # the file is also removed if the engine is garbage collected or the process exits without shutdown()
+        remover = weakref.finalize(self, _remove_file, path)
+        with os.fdopen(fd, "wb") as f:
+            f.write(pack_ints(ciphertexts, self.public_key.ciphertext_width))
+        self._ciphertext_file = (ciphertexts, path, remover)
+        return path
+
+    def _remove_ciphertext_file(self):
+        if self._ciphertext_file:
+            self._ciphertext_file[2]()
+            self._ciphertext_file = None
+
+    def add(self, ciphertexts, features, sample_groups=None) -> list:
+        """Add the ciphertexts of the samples into the bins of each feature, for each sample group.
+
+        The ciphertexts are shared with the workers once, and kept until add() is called with another list.
+
+        Args:
+            ciphertexts: list of ciphertexts, one for each sample
+            features: list of tuples of (feature_id, mask, num_bins). mask is the bin of each sample.
+                Samples of negative bins are skipped.
+            sample_groups: list of tuples of (group_id, sample_ids). If empty or None, all samples are added
+                as group 0.
+
+        Returns: list of tuples of (feature_id, group_id, sums), in the order of features then groups.
+            A bin without any sample is 0.
+        """
+        start = time.perf_counter()
+        path = self._share_ciphertexts(ciphertexts)
+        if not sample_groups:
+            sample_groups = [(0, None)]
+
+        items = []
+        num_values = 0
+        for fid, mask, num_bins in features:
+            mask = np.asarray(mask)[: len(ciphertexts)]
+            for gid, sample_ids in sample_groups:
+                if sample_ids is None or len(sample_ids) == 0:
+                    ids = np.arange(len(mask))
+                else:
+                    ids = np.asarray(sample_ids, dtype=np.int64)
+                bins = mask[ids]
+                valid = bins >= 0
+                ids, bins = ids[valid], bins[valid]
+                if bins.size and bins.max() >= num_bins:
+                    raise IndexError(f"bin {bins.max()} out of range for {num_bins} bins")
+                num_values += len(ids)
+                items.append(
+                    (path, self.public_key.nsquare, self.public_key.ciphertext_width, fid, gid, ids, bins, num_bins)
+                )
+        self._record("add", "pack", start)
+
+        start = time.perf_counter()
+        results = self._run(_add_batch, items)
+        self._record("add", "compute", start, num_values)
+
+        start = time.perf_counter()
+        sums = [(fid, gid, unpack_ints(r, self.public_key.ciphertext_width)) for fid, gid, r in results]
+        self._record("add", "unpack", start)
+        return sums
+
+    def shutdown(self):
+        self._stopped = True
+        self._refill_needed.set()
+        self.exe.shutdown(wait=True)
+        self._remove_ciphertext_file()
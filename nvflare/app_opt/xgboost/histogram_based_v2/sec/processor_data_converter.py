@@ -13,6 +13,8 @@
 # limitations under the License.
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 from nvflare.apis.fl_context import FLContext
 from nvflare.app_opt.xgboost.histogram_based_v2.sec.dam import DamDecoder, DamEncoder
 from nvflare.app_opt.xgboost.histogram_based_v2.sec.data_converter import (
@@ -47,35 +49,30 @@ class ProcessorDataConverter(DataConverter):
         if decoder.get_data_set_id() != DATA_SET_GH_PAIRS:
             raise RuntimeError(f"Data is not for GH Pairs: {decoder.get_data_set_id()}")
 
-        float_array = decoder.decode_float_array()
-        result = []
+        float_array = decoder.decode_float_ndarray()
         self.num_samples = int(len(float_array) / 2)
 
-        for i in range(self.num_samples):
-            result.append((self.float_to_int(float_array[2 * i]), self.float_to_int(float_array[2 * i + 1])))
-
-        return result
+        # same as float_to_int: truncate towards zero
+        int_array = (float_array[: 2 * self.num_samples] * SCALE_FACTOR).astype(np.int64)
+        return list(zip(int_array[0::2].tolist(), int_array[1::2].tolist()))
 
     def decode_aggregation_context(self, buffer: bytes, fl_ctx: FLContext) -> AggregationContext:
         decoder = DamDecoder(buffer)
         if not decoder.is_valid():
             return None
         data_set_id = decoder.get_data_set_id()
-        cuts = decoder.decode_int_array()
+        cuts = decoder.decode_int_ndarray()
 
         if data_set_id == DATA_SET_AGGREGATION_WITH_FEATURES:
             self.feature_list = decoder.decode_int_array()
             num = len(self.feature_list)
-            slots = decoder.decode_int_array()
+            slots = decoder.decode_int_ndarray()
             num_samples = int(len(slots) / num)
+            # row_id => slot of each feature
+            bins = self.slots_to_bins(cuts, slots[: num_samples * num]).reshape(num_samples, num)
             for i in range(num):
-                bin_assignment = []
-                for row_id in range(num_samples):
-                    _, bin_num = self.slot_to_bin(cuts, slots[row_id * num + i])
-                    bin_assignment.append(bin_num)
-
                 bin_size = self.get_bin_size(cuts, self.feature_list[i])
-                feature_ctx = FeatureContext(self.feature_list[i], bin_assignment, bin_size)
+                feature_ctx = FeatureContext(self.feature_list[i], np.ascontiguousarray(bins[:, i]), bin_size)
                 self.features.append(feature_ctx)
         elif data_set_id != DATA_SET_AGGREGATION:
             raise RuntimeError(f"Invalid DataSet: {data_set_id}")
@@ -83,7 +80,7 @@ class ProcessorDataConverter(DataConverter):
         node_list = decoder.decode_int_array()
         sample_groups = {}
         for node in node_list:
-            row_ids = decoder.decode_int_array()
+            row_ids = decoder.decode_int_ndarray()
             sample_groups[node] = row_ids
 
         return AggregationContext(self.features, sample_groups)
@@ -120,7 +117,7 @@ class ProcessorDataConverter(DataConverter):
 
     @staticmethod
     def get_bin_size(cuts: [int], feature_id: int) -> int:
-        return cuts[feature_id + 1] - cuts[feature_id]
+        return int(cuts[feature_id + 1] - cuts[feature_id])
 
     @staticmethod
     def slot_to_bin(cuts: [int], slot: int) -> Tuple[int, int]:
@@ -138,6 +135,17 @@ class ProcessorDataConverter(DataConverter):
 
         raise RuntimeError(f"Logic error. Slot {slot}, out of range [0-{cuts[-1] - 1}]")
 
+    @staticmethod
+    def slots_to_bins(cuts: np.ndarray, slots: np.ndarray) -> np.ndarray:
+        """Same as slot_to_bin for each of the slots, returning the bin numbers."""
+        if len(slots) and slots.max() >= cuts[-1]:
+            raise RuntimeError(f"Invalid slot {slots.max()}, out of range [0-{cuts[-1] - 1}]")
+        if np.any((slots >= 0) & (slots < cuts[0])):
+            raise RuntimeError(f"Logic error. Slot out of range [0-{cuts[-1] - 1}]")
+
+        feature_ids = np.searchsorted(cuts, slots, side="right") - 1
+        return np.where(slots < 0, -1, slots - cuts[np.maximum(feature_ids, 0)])
+
     @staticmethod
     def float_to_int(value: float) -> int:
         return int(value * SCALE_FACTOR)
@@ -147,10 +155,6 @@ class ProcessorDataConverter(DataConverter):
         return value / SCALE_FACTOR
 
     @staticmethod
-    def to_float_array(result: FeatureAggregationResult) -> List[float]:
-        float_array = []
-        for g, h in result.aggregated_hist:
-            float_array.append(ProcessorDataConverter.int_to_float(g))
-            float_array.append(ProcessorDataConverter.int_to_float(h))
-
-        return float_array
+    def to_float_array(result: FeatureAggregationResult) -> np.ndarray:
+        # g0, h0, g1, h1, ...
+        return np.asarray(result.aggregated_hist, dtype=np.float64).reshape(-1) / SCALE_FACTOR
@@ -45,6 +45,7 @@ CMD_AUTHZ_PREVIEW = "authz_preview"
 CMD_JOB = "job"
 CMD_CONFIG = "config"
 CMD_PRE_INSTALL = "pre-install"
+CMD_IMPORT_TIME = "import_time"
 
 
 def def_provision_parser(sub_cmd):
@@ -138,6 +139,15 @@ def def_pre_install_parser(sub_cmd):
         sys.exit(1)
 
 
+def def_import_time_parser(sub_cmd):
+    from nvflare.tool.import_time import define_import_time_parser
+
+    cmd = CMD_IMPORT_TIME
+    import_time_parser = sub_cmd.add_parser(cmd)
+    define_import_time_parser(import_time_parser)
+    return {cmd: import_time_parser}
+
+
 def parse_args(prog_name: str):
     _parser = argparse.ArgumentParser(description=prog_name)
     _parser.add_argument("--version", "-V", action="store_true", help="print nvflare version")
@@ -152,6 +162,7 @@ def parse_args(prog_name: str):
     sub_cmd_parsers.update(def_job_cli_parser(sub_cmd))
     sub_cmd_parsers.update(def_config_parser(sub_cmd))
     sub_cmd_parsers.update(def_pre_install_parser(sub_cmd))
+    sub_cmd_parsers.update(def_import_time_parser(sub_cmd))
 
     args, argv = _parser.parse_known_args(None, None)
     cmd = args.__dict__.get("sub_command")
@@ -171,6 +182,12 @@ def handle_pre_install_cmd(args):
     handle_cmd(args)
 
 
+def handle_import_time_cmd(args):
+    from nvflare.tool.import_time import show_import_time
+
+    show_import_time(args)
+
+
 handlers = {
     CMD_POC: handle_poc_cmd,
     CMD_PROVISION: handle_provision,
@@ -181,6 +198,7 @@ handlers = {
     CMD_JOB: handle_job_cli_cmd,
     CMD_CONFIG: handle_config_cmd,
     CMD_PRE_INSTALL: handle_pre_install_cmd,
+    CMD_IMPORT_TIME: handle_import_time_cmd,
 }
 
 
@@ -15,9 +15,12 @@
 
 # https://github.com/microsoft/pylance-release/issues/856
 
+from typing import TYPE_CHECKING
+
 from nvflare.apis.analytix import AnalyticsDataType as AnalyticsDataType
 from nvflare.app_common.abstract.fl_model import FLModel as FLModel
 from nvflare.app_common.abstract.fl_model import ParamsType as ParamsType
+from nvflare.fuel.utils.import_utils import lazy_attributes
 
 from .api import get_config as get_config
 from .api import get_job_id as get_job_id
@@ -34,4 +37,9 @@ from .api import shutdown as shutdown
 from .api import system_info as system_info
 from .decorator import evaluate as evaluate
 from .decorator import train as train
-from .ipc.ipc_agent import IPCAgent
+
+# IPCAgent is only used by the client job, not by trainer scripts
+__getattr__, __dir__ = lazy_attributes(__name__, {"IPCAgent": "nvflare.client.ipc.ipc_agent"})
+
+if TYPE_CHECKING:
+    from .ipc.ipc_agent import IPCAgent
@@ -21,7 +21,6 @@ from nvflare.client.constants import CLIENT_API_CONFIG
 from nvflare.fuel.data_event.data_bus import DataBus
 
 from .api_spec import CLIENT_API_KEY, CLIENT_API_TYPE_KEY, APISpec
-from .ex_process.api import ExProcessClientAPI
 from .in_process.api import InProcessClientAPI
 
 DEFAULT_CONFIG = f"config/{CLIENT_API_CONFIG}"
@@ -60,4 +59,7 @@ class APIContext:
                 raise RuntimeError(f"api {api} is not a valid InProcessClientAPI")
             return api
         else:
+            # the ex-process API brings in the cellnet stack, only import it when it's used
+            from .ex_process.api import ExProcessClientAPI
+
             return ExProcessClientAPI(config_file=self.config_file)
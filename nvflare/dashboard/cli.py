@@ -18,7 +18,6 @@ import signal
 import subprocess
 import sys
 
-import docker
 import nvflare
 from nvflare.apis.utils.format_check import name_check
 from nvflare.dashboard.utils import EnvVar
@@ -71,6 +70,9 @@ def start(args):
         environment.update({EnvVar.CREDENTIAL: f"{email}:{pwd}:{org_name}"})
     if args.local:
         return start_local(environment)
+    # docker is only needed here, don't make every nvflare command import it
+    import docker
+
     try:
         client = docker.from_env()
     except docker.errors.DockerException:
@@ -132,6 +134,8 @@ def start_local(env):
 
 
 def stop():
+    import docker
+
     try:
         client = docker.from_env()
     except docker.errors.DockerException:
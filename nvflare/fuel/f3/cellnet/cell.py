@@ -13,8 +13,8 @@
 # limitations under the License.
 
 import concurrent.futures
-import copy
 import threading
+import time
 import uuid
 from typing import Dict, List, Union
 
@@ -22,6 +22,7 @@ from nvflare.apis.signal import Signal
 from nvflare.fuel.f3.cellnet.core_cell import CoreCell, TargetMessage
 from nvflare.fuel.f3.cellnet.defs import CellChannel, MessageHeaderKey, MessagePropKey, MessageType, ReturnCode
 from nvflare.fuel.f3.cellnet.utils import decode_payload, encode_payload, make_reply
+from nvflare.fuel.f3.comm_config import CommConfigurator
 from nvflare.fuel.f3.message import Message
 from nvflare.fuel.f3.stream_cell import StreamCell
 from nvflare.fuel.f3.streaming.stream_const import StreamHeaderKey
@@ -42,6 +43,9 @@ CHANNELS_TO_EXCLUDE = (
     CellChannel.RETURN_ONLY,
 )
 
+# max number of threads used by a cell to wait for the replies of broadcast requests
+BROADCAST_MAX_WORKERS = 64
+
 
 def _is_stream_channel(channel: str) -> bool:
     if channel is None or channel == "":
@@ -57,9 +61,18 @@ class SimpleWaiter:
         super().__init__()
         self.req_id = req_id
         self.result = result
+        self.sending_future = None
         self.receiving_future = None
         self.in_receiving = threading.Event()
 
+        # times of the stages of the request, used as the start of timeouts of the stages
+        self.send_time = None
+        self.sent_time = None
+        self.receiving_time = None
+
+    def set_sent(self):
+        self.sent_time = time.time()
+
 
 class Adapter:
     def __init__(self, cb, my_info, cell):
@@ -120,6 +133,24 @@ class Cell(StreamCell):
         self.logger = get_obj_logger(self)
         self.register_blob_cb(CellChannel.RETURN_ONLY, "*", self._process_reply)  # this should be one-time registration
         self.core_cell.update_fobs_context({FOBSContextKey.CELL: self})
+        self.broadcast_max_workers = CommConfigurator().get_broadcast_max_workers(BROADCAST_MAX_WORKERS)
+        self.broadcast_executor = None
+        self.broadcast_executor_lock = threading.Lock()
+
+    def _get_broadcast_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self.broadcast_executor_lock:
+            if not self.broadcast_executor:
+                self.broadcast_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.broadcast_max_workers, thread_name_prefix="bcast"
+                )
+            return self.broadcast_executor
+
+    def stop(self):
+        self.core_cell.stop()
+        with self.broadcast_executor_lock:
+            if self.broadcast_executor:
+                self.broadcast_executor.shutdown(wait=False)
+                self.broadcast_executor = None
 
     def update_fobs_context(self, props: dict):
         self.core_cell.update_fobs_context(props)
@@ -187,36 +218,38 @@ class Cell(StreamCell):
 
         if isinstance(targets, str):
             targets = [targets]
-        target_argument = {}
-        fixed_dict = dict(channel=channel, topic=topic, timeout=timeout, secure=secure, optional=optional)
         results = dict()
         future_to_target = {}
 
-        # encode the request now so each target thread won't need to do it again.
+        # encode the request now so the payload is shared by all targets.
         self._encode_message(request, abort_signal)
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(targets)) as executor:
-            self.logger.debug(f"broadcast to {targets=}")
-            for t in targets:
-                req = Message(copy.deepcopy(request.headers), request.payload)
-                target_argument["request"] = TargetMessage(t, channel, topic, req).message
-                target_argument["target"] = t
-                target_argument["abort_signal"] = abort_signal
-                target_argument.update(fixed_dict)
-                f = executor.submit(self._send_one_request, **target_argument)
-                future_to_target[f] = t
-                self.logger.debug(f"submitted to {t} with {target_argument.keys()=}")
-            for future in concurrent.futures.as_completed(future_to_target):
-                target = future_to_target[future]
-                self.logger.debug(f"{target} completed")
-                try:
-                    data = future.result()
-                except Exception as exc:
-                    self.logger.warning(f"{target} raises {exc}")
-                    results[target] = make_reply(ReturnCode.TIMEOUT)
-                else:
-                    results[target] = data
-                    self.logger.debug(f"{target=}: {data=}")
+        # Start sending to all targets first. Sending is asynchronous, so the replies are waited for with
+        # the broadcast executor of the cell, instead of a new thread per target.
+        self.logger.debug(f"broadcast to {targets=}")
+        waiters = {}
+        for t in targets:
+            # only the headers are copied since each target adds its own headers. The header values are shared.
+            req = Message(dict(request.headers or {}), request.payload)
+            req = TargetMessage(t, channel, topic, req).message
+            waiters[t] = self._start_request(channel, t, topic, req, secure, optional)
+
+        executor = self._get_broadcast_executor()
+        for t, waiter in waiters.items():
+            f = executor.submit(self._wait_for_reply, waiter, timeout, abort_signal)
+            future_to_target[f] = t
+
+        for future in concurrent.futures.as_completed(future_to_target):
+            target = future_to_target[future]
+            self.logger.debug(f"{target} completed")
+            try:
+                data = future.result()
+            except Exception as exc:
+                self.logger.warning(f"{target} raises {exc}")
+                results[target] = make_reply(ReturnCode.TIMEOUT)
+            else:
+                results[target] = data
+                self.logger.debug(f"{target=}: {data=}")
         self.logger.debug("About to return from broadcast_request")
         return results
 
@@ -270,11 +303,20 @@ class Cell(StreamCell):
         else:
             return WaiterRC.OK
 
-    def _future_wait(self, future, timeout, abort_signal: Signal):
+    @staticmethod
+    def _remaining_time(start_time, timeout):
+        if start_time is None or timeout is None:
+            return timeout
+        return max(0.0, start_time + timeout - time.time())
+
+    def _future_wait(self, future, timeout, abort_signal: Signal, start_time=None):
         # future could have an error!
         last_progress = 0
+
+        # the future may have started before this wait (e.g. while the replies of other targets were waited for)
+        wait_time = self._remaining_time(start_time, timeout)
         while True:
-            rc = conditional_wait(future.waiter, timeout, abort_signal, condition_cb=self._check_error, future=future)
+            rc = conditional_wait(future.waiter, wait_time, abort_signal, condition_cb=self._check_error, future=future)
             if rc == WaiterRC.IS_SET:
                 # waiter has been set!
                 break
@@ -288,6 +330,7 @@ class Cell(StreamCell):
                     # good progress
                     self.logger.debug(f"{current_progress=}")
                     last_progress = current_progress
+                    wait_time = timeout
             else:
                 # error condition: aborted or future error
                 return False
@@ -348,26 +391,48 @@ class Cell(StreamCell):
         optional=False,
         abort_signal=None,
     ):
+        waiter = self._start_request(channel, target, topic, request, secure, optional)
+        return self._wait_for_reply(waiter, timeout, abort_signal)
+
+    def _start_request(self, channel, target, topic, request, secure, optional) -> SimpleWaiter:
+        """Start to send the request to the target. The reply is waited for with _wait_for_reply."""
         req_id = str(uuid.uuid4())
         request.add_headers({StreamHeaderKey.STREAM_REQ_ID: req_id})
 
         # this future can be used to check sending progress, but not for checking return blob
-        self.logger.debug(f"{req_id=}, {channel=}, {topic=}, {target=}, {timeout=}: send_request about to send_blob")
+        self.logger.debug(f"{req_id=}, {channel=}, {topic=}, {target=}: send_request about to send_blob")
 
         waiter = SimpleWaiter(req_id=req_id, result=make_reply(ReturnCode.TIMEOUT))
         self.requests_dict[req_id] = waiter
 
         try:
+            waiter.send_time = time.time()
             future = self.send_blob(
                 channel=channel, topic=topic, target=target, message=request, secure=secure, optional=optional
             )
+            future.add_done_callback(waiter.set_sent)
+            if future.waiter.is_set() and not waiter.sent_time:
+                # already sent before the callback is added
+                waiter.set_sent()
+            waiter.sending_future = future
+        except Exception as ex:
+            self.logger.error(f"exception sending request: {secure_format_exception(ex)}")
+            waiter.sending_future = None
+        return waiter
 
+    def _wait_for_reply(self, waiter: SimpleWaiter, timeout, abort_signal=None):
+        req_id = waiter.req_id
+        future = waiter.sending_future
+        if future is None:
+            return self._get_result(req_id)
+
+        try:
             self.logger.debug(f"{req_id=}: Waiting starts")
 
             # Three stages, sending, waiting for receiving first byte, receiving
             # sending with progress timeout
             self.logger.debug(f"{req_id=}: entering sending wait {timeout=}")
-            sending_complete = self._future_wait(future, timeout, abort_signal)
+            sending_complete = self._future_wait(future, timeout, abort_signal, start_time=waiter.send_time)
             if not sending_complete:
                 self.logger.debug(f"{req_id=}: sending timeout {timeout=}")
                 return self._get_result(req_id)
@@ -377,7 +442,11 @@ class Cell(StreamCell):
             # waiting for receiving first byte
             self.logger.debug(f"{req_id=}: entering remote process wait {timeout=}")
 
-            waiter_rc = conditional_wait(waiter.in_receiving, timeout, abort_signal)
+            if not waiter.sent_time:
+                # the done callback of the future may not be called yet
+                waiter.sent_time = time.time()
+            wait_time = self._remaining_time(waiter.sent_time, timeout)
+            waiter_rc = conditional_wait(waiter.in_receiving, wait_time, abort_signal)
             if waiter_rc != WaiterRC.IS_SET:
                 self.logger.debug(f"{req_id=}: remote processing timeout {timeout=} {waiter_rc=}")
                 return self._get_result(req_id)
@@ -386,7 +455,7 @@ class Cell(StreamCell):
             # receiving with progress timeout
             r_future = waiter.receiving_future
             self.logger.debug(f"{req_id=}: entering receiving wait {timeout=}")
-            receiving_complete = self._future_wait(r_future, timeout, abort_signal)
+            receiving_complete = self._future_wait(r_future, timeout, abort_signal, start_time=waiter.receiving_time)
             if not receiving_complete:
                 self.logger.info(f"{req_id=}: receiving timeout {timeout=}")
                 return self._get_result(req_id)
@@ -413,6 +482,7 @@ class Cell(StreamCell):
             self.logger.warning(f"Receiving unknown {req_id=}, discarded: {e} headers: {headers}")
             return
         waiter.receiving_future = future
+        waiter.receiving_time = time.time()
         waiter.in_receiving.set()
 
     def _register_request_cb(self, channel: str, topic: str, cb, *args, **kwargs):
@@ -0,0 +1,350 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import lzma
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional
+
+from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey
+from nvflare.fuel.f3.comm_config import CommConfigurator
+from nvflare.fuel.f3.drivers.buffer_pool import release_receive_buffer
+from nvflare.fuel.f3.message import Message
+from nvflare.fuel.f3.stats_pool import StatsPoolManager
+from nvflare.fuel.f3.streaming.stream_const import StreamHeaderKey
+from nvflare.fuel.utils.import_utils import optional_import
+from nvflare.fuel.utils.log_utils import get_obj_logger
+
+lz4_frame, lz4_available = optional_import(module="lz4.frame")
+zstandard, zstd_available = optional_import(module="zstandard")
+
+CODEC_NONE = "none"
+
+DEFAULT_COMPRESSION_LEVEL = -1
+DEFAULT_COMPRESSION_MIN_SIZE = 4096
+
+# max size of each chunk of the decompressed zstd data
+_ZSTD_READ_SIZE = 1024 * 1024
+
+
+class Codec:
+    """A compression codec.
+
+    The payload of a message may be a list of buffers, so the data to be compressed is always given as a list.
+    """
+
+    name = ""
+
+    def compress(self, buffers: list, level: int) -> bytes:
+        """Compress the buffers into one buffer.
+
+        Args:
+            buffers: list of buffers to be compressed
+            level: compression level. Negative value means the default level of the codec.
+
+        Returns: the compressed data
+
+        """
+        raise NotImplementedError
+
+    def decompress(self, data, max_size: int) -> bytes:
+        """Decompress the data.
+
+        Args:
+            data: the compressed data
+            max_size: the max size of the decompressed data
+
+        Returns: the decompressed data
+
+        """
+        raise NotImplementedError
+
+
+class ZlibCodec(Codec):
+
+    name = "zlib"
+
+    def compress(self, buffers: list, level: int) -> bytes:
+        c = zlib.compressobj(level if level >= 0 else zlib.Z_DEFAULT_COMPRESSION)
+        result = [c.compress(b) for b in buffers]
+        result.append(c.flush())
+        return b"".join(result)
+
+    def decompress(self, data, max_size: int) -> bytes:
+        d = zlib.decompressobj()
+        result = d.decompress(data, max_size)
+        if d.unconsumed_tail:
+            raise ValueError(f"decompressed data is larger than {max_size} bytes")
+        return result
+
+
+class LzmaCodec(Codec):
+
+    name = "lzma"
+
+    def compress(self, buffers: list, level: int) -> bytes:
+        c = lzma.LZMACompressor(preset=level if level >= 0 else None)
+        result = [c.compress(b) for b in buffers]
+        result.append(c.flush())
+        return b"".join(result)
+
+    def decompress(self, data, max_size: int) -> bytes:
+        d = lzma.LZMADecompressor()
+        result = d.decompress(data, max_size)
+        if not d.eof:
+            raise ValueError(f"decompressed data is larger than {max_size} bytes")
+        return result
+
+
+class Lz4Codec(Codec):
+
+    name = "lz4"
+
+    def compress(self, buffers: list, level: int) -> bytes:
+        c = lz4_frame.LZ4FrameCompressor(compression_level=max(level, 0))
+        result = [c.begin()]
+        result.extend(c.compress(b) for b in buffers)
+        result.append(c.flush())
+        return b"".join(result)
+
+    def decompress(self, data, max_size: int) -> bytes:
+        d = lz4_frame.LZ4FrameDecompressor()
+        result = d.decompress(data, max_length=max_size)
+        if not d.eof:
+            raise ValueError(f"decompressed data is larger than {max_size} bytes")
+        return result
+
+
+class ZstdCodec(Codec):
+
+    name = "zstd"
+
+    def compress(self, buffers: list, level: int) -> bytes:
+        c = zstandard.ZstdCompressor(level=level if level >= 0 else 3).compressobj()
+        result = [c.compress(b) for b in buffers]
+        result.append(c.flush())
+        return b"".join(result)
+
+    def decompress(self, data, max_size: int) -> bytes:
+        # The content size declared in the frame is not trusted: a peer could claim a huge size to force
+        # a huge allocation. The data is decompressed in chunks, up to the max size.
+        content_size = zstandard.frame_content_size(data)
+        if content_size > max_size:
+            raise ValueError(f"decompressed data is larger than {max_size} bytes")
+
+        result = []
+        size = 0
+        with zstandard.ZstdDecompressor().stream_reader(data) as reader:
+            while True:
+                chunk = reader.read(min(max_size + 1 - size, _ZSTD_READ_SIZE))
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_size:
+                    raise ValueError(f"decompressed data is larger than {max_size} bytes")
+                result.append(chunk)
+        return b"".join(result)
+
+
+_codecs: Dict[str, Codec] = {}
+
+
+def register_codec(codec: Codec):
+    """Register a codec. A registered codec is advertised to peers and can be configured for channels.
+
+    Args:
+        codec: the codec to be registered
+
+    Returns: None
+
+    """
+    if not isinstance(codec, Codec):
+        raise TypeError(f"codec must be Codec but got {type(codec)}")
+    if not codec.name or codec.name == CODEC_NONE or "," in codec.name:
+        raise ValueError(f"invalid codec name '{codec.name}'")
+    _codecs[codec.name] = codec
+
+
+def get_codec(name: str) -> Optional[Codec]:
+    return _codecs.get(name)
+
+
+def get_codec_names() -> List[str]:
+    return list(_codecs.keys())
+
+
+register_codec(ZlibCodec())
+register_codec(LzmaCodec())
+if lz4_available:
+    register_codec(Lz4Codec())
+if zstd_available:
+    register_codec(ZstdCodec())
+
+
+class PayloadCompressor:
+    """Compresses and decompresses the encoded payloads of cell messages.
+
+    A message is compressed only when:
+
+        - A codec is configured for its channel/topic
+        - The receiving cell has advertised that it supports the codec
+        - The payload is not smaller than the min size, and the compressed payload is smaller than the original
+
+    Messages of a stream are compressed chunk by chunk, with the channel/topic of the stream.
+
+    Cells advertise the codecs they support with a header in every message they originate, so a peer that doesn't
+    support compression never receives a compressed message.
+    """
+
+    def __init__(self, fqcn: str, configurator: CommConfigurator):
+        self.default_codec = configurator.get_compression_codec(CODEC_NONE)
+        self.level = configurator.get_compression_level(DEFAULT_COMPRESSION_LEVEL)
+        self.min_size = configurator.get_compression_min_size(DEFAULT_COMPRESSION_MIN_SIZE)
+        self.rules = dict(configurator.get_compression_rules({}))
+        self.max_size = configurator.get_max_message_size()
+        self.accepted = ",".join(get_codec_names())
+        self.logger = get_obj_logger(self)
+
+        if self.default_codec != CODEC_NONE and not get_codec(self.default_codec):
+            self.logger.warning(f"compression codec '{self.default_codec}' is not available: {self.accepted}")
+            self.default_codec = CODEC_NONE
+
+        for k, name in self.rules.items():
+            if name != CODEC_NONE and not get_codec(name):
+                self.logger.warning(f"compression codec '{name}' for '{k}' is not available: {self.accepted}")
+                self.rules[k] = CODEC_NONE
+
+        self.peer_codecs = {}  # peer fqcn => (advertised header value, set of codec names)
+        self.codec_cache = {}  # (channel, topic) => codec name
+        self.lock = threading.Lock()
+
+        self.ratio_pool = StatsPoolManager.add_ratio_hist_pool(
+            "Compression_Ratio", "Compressed size / original size of payloads (sender)", scope=fqcn
+        )
+        self.time_pool = StatsPoolManager.add_time_hist_pool(
+            "Compression_Time", "CPU time (secs) spent compressing and decompressing payloads", scope=fqcn
+        )
+
+    @staticmethod
+    def _channel_topic(message: Message):
+        channel = message.get_header(StreamHeaderKey.CHANNEL)
+        if channel:
+            return channel, message.get_header(StreamHeaderKey.TOPIC, "")
+        return message.get_header(MessageHeaderKey.CHANNEL, ""), message.get_header(MessageHeaderKey.TOPIC, "")
+
+    def _find_codec(self, channel: str, topic: str) -> str:
+        key = (channel, topic)
+        name = self.codec_cache.get(key)
+        if name is None:
+            name = self.rules.get(f"{channel}:{topic}")
+            if name is None:
+                name = self.rules.get(channel, self.default_codec)
+            self.codec_cache[key] = name
+        return name
+
+    def update_peer(self, message: Message):
+        """Record the codecs advertised by the origin of a received message"""
+        accepted = message.get_header(MessageHeaderKey.ACCEPT_COMPRESSION)
+        origin = message.get_header(MessageHeaderKey.ORIGIN)
+        if accepted is None or not origin:
+            return
+        codecs = self.peer_codecs.get(origin)
+        if codecs is None or codecs[0] != accepted:
+            with self.lock:
+                self.peer_codecs[origin] = (accepted, set(accepted.split(",")))
+
+    def advertise(self, message: Message):
+        message.set_header(MessageHeaderKey.ACCEPT_COMPRESSION, self.accepted)
+
+    def compress(self, message: Message):
+        """Compress the encoded payload of the message if needed.
+
+        Args:
+            message: the message to be sent
+
+        Returns: None
+
+        """
+        if message.get_header(MessageHeaderKey.COMPRESSION) or message.get_header(MessageHeaderKey.ENCRYPTED):
+            # already compressed, or encrypted by the origin (forwarded message)
+            return
+
+        payload = message.payload
+        if not payload:
+            return
+
+        channel, topic = self._channel_topic(message)
+        name = self._find_codec(channel, topic)
+        if name == CODEC_NONE:
+            return
+
+        peer = self.peer_codecs.get(message.get_header(MessageHeaderKey.DESTINATION))
+        if not peer or name not in peer[1]:
+            return
+
+        buffers = payload if isinstance(payload, list) else [payload]
+        size = sum(len(b) for b in buffers)
+        if size < self.min_size:
+            return
+
+        start = time.thread_time()
+        compressed = get_codec(name).compress(buffers, self.level)
+        self.time_pool.record_value(category=f"compress:{channel}:{topic}", value=time.thread_time() - start)
+        self.ratio_pool.record_value(category=f"{name}:{channel}:{topic}", value=len(compressed) / size)
+
+        if len(compressed) >= size:
+            # not compressible
+            return
+
+        message.payload = compressed
+        message.add_headers(
+            {
+                MessageHeaderKey.COMPRESSION: name,
+                MessageHeaderKey.UNCOMPRESSED_LEN: size,
+            }
+        )
+
+    def decompress(self, message: Message):
+        """Decompress the payload of a received message if it's compressed.
+
+        Args:
+            message: the received message
+
+        Returns: None
+
+        """
+        name = message.get_header(MessageHeaderKey.COMPRESSION)
+        if not name:
+            return
+
+        codec = get_codec(name)
+        if not codec:
+            raise RuntimeError(f"unsupported compression codec '{name}'")
+
+        size = message.get_header(MessageHeaderKey.UNCOMPRESSED_LEN)
+        if not isinstance(size, int) or size <= 0 or size > self.max_size:
+            raise RuntimeError(f"invalid uncompressed payload size {size}")
+
+        channel, topic = self._channel_topic(message)
+        compressed = message.payload
+        start = time.thread_time()
+        message.payload = codec.decompress(compressed, size)
+        self.time_pool.record_value(category=f"decompress:{channel}:{topic}", value=time.thread_time() - start)
+        release_receive_buffer(compressed)
+
+        if len(message.payload) != size:
+            raise RuntimeError(f"Payload size changed after decompression {len(message.payload)} <> {size}")
+
+        message.remove_header(MessageHeaderKey.COMPRESSION)
+        message.remove_header(MessageHeaderKey.UNCOMPRESSED_LEN)
@@ -23,6 +23,7 @@ from typing import Dict, List, Tuple, Union
 from urllib.parse import urlparse
 
 from nvflare.apis.fl_constant import ConnectionSecurity
+from nvflare.fuel.f3.cellnet.compression import PayloadCompressor
 from nvflare.fuel.f3.cellnet.connector_manager import ConnectorManager
 from nvflare.fuel.f3.cellnet.credential_manager import CredentialManager
 from nvflare.fuel.f3.cellnet.defs import (
@@ -44,6 +45,7 @@ from nvflare.fuel.f3.cellnet.utils import decode_payload, encode_payload, format
 from nvflare.fuel.f3.comm_config import CommConfigurator
 from nvflare.fuel.f3.communicator import Communicator, MessageReceiver
 from nvflare.fuel.f3.connection import Connection
+from nvflare.fuel.f3.drivers.buffer_pool import release_receive_buffer
 from nvflare.fuel.f3.drivers.driver_params import DriverParams
 from nvflare.fuel.f3.drivers.net_utils import enhance_credential_info
 from nvflare.fuel.f3.endpoint import Endpoint, EndpointMonitor, EndpointState
@@ -275,6 +277,9 @@ class CoreCell(MessageReceiver, EndpointMonitor):
     SUB_TYPE_CLIENT = 2
     SUB_TYPE_NONE = 0
 
+    # Received payloads are sliced from the receive buffers without copying
+    accepts_buffer_view = True
+
     def __init__(
         self,
         fqcn: str,
@@ -455,6 +460,10 @@ class CoreCell(MessageReceiver, EndpointMonitor):
 
         # a cell could have any number of connectors: some for backbone, some for ad-hoc
         self.bb_ext_connector = None  # backbone external connector - only for Client cells
+
+        # additional connectors to the server to stripe messages over parallel connections
+        self.bb_ext_stripe_connectors = []
+        self.num_stripe_connectors = comm_configurator.get_streaming_connections(1) - 1
         self.bb_int_connector = None  # backbone internal connector - only for non-root cells
 
         # ad-hoc connectors: currently only support ad-hoc external connectors
@@ -503,6 +512,7 @@ class CoreCell(MessageReceiver, EndpointMonitor):
             counter_names=counter_names,
             scope=self.my_info.fqcn,
         )
+        self.compressor = PayloadCompressor(self.my_info.fqcn, comm_configurator)
         self.ALL_CELLS[fqcn] = self
 
         self.credential_manager = CredentialManager(self.endpoint)
@@ -650,6 +660,17 @@ class CoreCell(MessageReceiver, EndpointMonitor):
 
     def drop_connectors(self):
         # drop connections to all cells on server and their agents
+        # drop the stripe connectors first: they connect to the same endpoint as the backbone connector
+        for connector in self.bb_ext_stripe_connectors:
+            try:
+                self.communicator.remove_connector(connector.handle)
+            except Exception as ex:
+                self.log_error(
+                    msg=None,
+                    log_text=f"{self.my_info.fqcn}: error removing stripe connector {secure_format_exception(ex)}",
+                )
+        self.bb_ext_stripe_connectors = []
+
         # drop the backbone connector
         if self.bb_ext_connector:
             self.logger.debug(f"{self.my_info.fqcn}: removing bb_ext_connector ...")
@@ -814,6 +835,18 @@ class CoreCell(MessageReceiver, EndpointMonitor):
         else:
             raise RuntimeError(f"{self.my_info.fqcn}: cannot create backbone external connector to {self.root_url}")
 
+        # parallel connections to the server, messages are striped over all of them
+        for _ in range(self.num_stripe_connectors):
+            connector = self.connector_manager.get_external_connector(self.root_url, False)
+            if not connector:
+                self.logger.warning(f"{self.my_info.fqcn}: cannot create stripe connector to {self.root_url}")
+                break
+            self.bb_ext_stripe_connectors.append(connector)
+        if self.bb_ext_stripe_connectors:
+            self.logger.info(
+                f"{self.my_info.fqcn}: created {len(self.bb_ext_stripe_connectors)} stripe connectors to {self.root_url}"
+            )
+
     def _create_internal_connector(self, url: str, resources=None):
         self.bb_int_connector = self.connector_manager.get_internal_connector(url, resources)
         if self.bb_int_connector:
@@ -1016,7 +1049,9 @@ class CoreCell(MessageReceiver, EndpointMonitor):
 
         payload_len = message.get_header(MessageHeaderKey.CLEAR_PAYLOAD_LEN)
         origin_cert = self.cert_ex.get_certificate(origin)
-        message.payload = self.credential_manager.decrypt(origin_cert, message.payload)
+        encrypted_payload = message.payload
+        message.payload = self.credential_manager.decrypt(origin_cert, encrypted_payload)
+        release_receive_buffer(encrypted_payload)
         if len(message.payload) != payload_len:
             raise RuntimeError(f"Payload size changed after decryption {len(message.payload)} <> {payload_len}")
 
@@ -1161,6 +1196,13 @@ class CoreCell(MessageReceiver, EndpointMonitor):
         err = ""
         try:
             encode_payload(message, fobs_ctx=self.get_fobs_context())
+            if message.get_header(MessageHeaderKey.ORIGIN) == self.my_info.fqcn:
+                self.compressor.advertise(message)
+
+            # no need to compress messages to cells in the same process
+            direct_cell = self.ALL_CELLS.get(to_endpoint.name)
+            if not direct_cell:
+                self.compressor.compress(message)
             self.encrypt_payload(message)
 
             message.set_header(MessageHeaderKey.SEND_TIME, time.time())
@@ -1174,7 +1216,6 @@ class CoreCell(MessageReceiver, EndpointMonitor):
                 self.log_error(err_text, message)
                 err = ReturnCode.MSG_TOO_BIG
             else:
-                direct_cell = self.ALL_CELLS.get(to_endpoint.name)
                 msg_size_mbs = self._msg_size_mbs(message)
                 if direct_cell:
                     # create a thread and fire the cell's process_message!
@@ -1628,6 +1669,7 @@ class CoreCell(MessageReceiver, EndpointMonitor):
         self.logger.debug(f"{self.my_info.fqcn}: processing incoming request")
 
         self.decrypt_payload(message)
+        self.compressor.decompress(message)
         decode_payload(message)
         # this is a request for me - dispatch to the right CB
         channel = message.get_header(MessageHeaderKey.CHANNEL, "")
@@ -1757,6 +1799,7 @@ class CoreCell(MessageReceiver, EndpointMonitor):
         now = time.time()
         self.logger.debug(f"{self.my_info.fqcn}: processing reply from {origin} for type {msg_type}")
         self.decrypt_payload(message)
+        self.compressor.decompress(message)
         decode_payload(message)
 
         req_ids = message.get_header(MessageHeaderKey.REQ_ID)
@@ -1864,6 +1907,7 @@ class CoreCell(MessageReceiver, EndpointMonitor):
 
         self.logger.debug(f"{self.my_info.fqcn}: received message: {message.headers}")
         message.set_prop(MessagePropKey.ENDPOINT, endpoint)
+        self.compressor.update_peer(message)
 
         if connection:
             conn_props = connection.get_conn_properties()
@@ -47,6 +47,9 @@ class MessageHeaderKey:
     OPTIONAL = CELLNET_PREFIX + "optional"
     MSG_ROOT_ID = CELLNET_PREFIX + "msg_root_id"
     MSG_ROOT_TTL = CELLNET_PREFIX + "msg_root_ttl"
+    COMPRESSION = CELLNET_PREFIX + "compression"
+    UNCOMPRESSED_LEN = CELLNET_PREFIX + "uncompressed_len"
+    ACCEPT_COMPRESSION = CELLNET_PREFIX + "accept_compression"
 
 
 class ReturnReason:
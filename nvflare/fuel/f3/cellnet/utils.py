@@ -17,6 +17,7 @@ from typing import Any
 
 import nvflare.fuel.utils.fobs as fobs
 from nvflare.fuel.f3.cellnet.defs import Encoding, MessageHeaderKey
+from nvflare.fuel.f3.drivers.buffer_pool import release_receive_buffer
 from nvflare.fuel.f3.message import Message
 from nvflare.fuel.f3.streaming.stream_const import StreamHeaderKey
 from nvflare.fuel.utils.buffer_list import BufferList
@@ -180,18 +181,34 @@ def decode_payload(message: Message, encoding_key=MessageHeaderKey.PAYLOAD_ENCOD
 
     encoding = message.get_header(encoding_key)
     if not encoding:
+        _copy_raw_payload(message)
         return
 
     if encoding == Encoding.FOBS:
-        message.payload = fobs.loads(message.payload, fobs_ctx=fobs_ctx)
+        encoded_payload = message.payload
+        message.payload = fobs.loads(encoded_payload, fobs_ctx=fobs_ctx)
+        # The decoded object doesn't reference the encoded bytes so the receive buffer can be reused
+        release_receive_buffer(encoded_payload)
     elif encoding == Encoding.NONE:
         message.payload = None
     else:
         # assume to be bytes
-        pass
+        _copy_raw_payload(message)
     message.remove_header(encoding_key)
 
 
+def _copy_raw_payload(message: Message):
+    # A raw payload is passed to the application as is, so it's copied out of the receive buffer, which may be
+    # pooled, into the type it had before buffers were pooled. Stream chunks stay views: the ByteReceiver
+    # releases their buffers after they are consumed.
+    payload = message.payload
+    if not isinstance(payload, memoryview) or message.get_header(StreamHeaderKey.DATA_TYPE) is not None:
+        return
+
+    message.payload = bytes(payload) if isinstance(payload.obj, bytes) else bytearray(payload)
+    release_receive_buffer(payload)
+
+
 def format_size(size, binary=False):
     """Format size in human-readable formats like  KB, MB, KiB, MiB
 
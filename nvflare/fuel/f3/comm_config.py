@@ -39,6 +39,17 @@ class VarName:
     STREAMING_ACK_INTERVAL = "streaming_ack_interval"
     STREAMING_MAX_OUT_SEQ_CHUNKS = "streaming_max_out_seq_chunks"
     STREAMING_READ_TIMEOUT = "streaming_read_timeout"
+    STREAMING_CONNECTIONS = "streaming_connections"
+    STREAMING_ADAPTIVE_WINDOW = "streaming_adaptive_window"
+    STREAMING_MIN_WINDOW_SIZE = "streaming_min_window_size"
+    STREAMING_MAX_WINDOW_SIZE = "streaming_max_window_size"
+    RECEIVE_BUFFER_POOL_SIZE = "receive_buffer_pool_size"
+    BROADCAST_MAX_WORKERS = "broadcast_max_workers"
+    DOWNLOAD_MAX_OUTSTANDING_REQUESTS = "download_max_outstanding_requests"
+    COMPRESSION_CODEC = "compression_codec"
+    COMPRESSION_LEVEL = "compression_level"
+    COMPRESSION_MIN_SIZE = "compression_min_size"
+    COMPRESSION_RULES = "compression_rules"
 
 
 class CommConfigurator:
@@ -114,6 +125,52 @@ class CommConfigurator:
     def get_streaming_read_timeout(self, default):
         return ConfigService.get_int_var(VarName.STREAMING_READ_TIMEOUT, self.config, default)
 
+    def get_streaming_adaptive_window(self, default):
+        return ConfigService.get_bool_var(VarName.STREAMING_ADAPTIVE_WINDOW, self.config, default=default)
+
+    def get_streaming_min_window_size(self, default):
+        return ConfigService.get_int_var(VarName.STREAMING_MIN_WINDOW_SIZE, self.config, default=default)
+
+    def get_streaming_max_window_size(self, default):
+        return ConfigService.get_int_var(VarName.STREAMING_MAX_WINDOW_SIZE, self.config, default=default)
+
+    def get_streaming_connections(self, default):
+        return ConfigService.get_int_var(VarName.STREAMING_CONNECTIONS, self.config, default=default)
+
+    def get_receive_buffer_pool_size(self, default):
+        return ConfigService.get_int_var(VarName.RECEIVE_BUFFER_POOL_SIZE, self.config, default=default)
+
+    def get_broadcast_max_workers(self, default):
+        return ConfigService.get_int_var(VarName.BROADCAST_MAX_WORKERS, self.config, default=default)
+
+    def get_download_max_outstanding_requests(self, default):
+        return ConfigService.get_int_var(VarName.DOWNLOAD_MAX_OUTSTANDING_REQUESTS, self.config, default=default)
+
+    def get_compression_codec(self, default):
+        return ConfigService.get_str_var(VarName.COMPRESSION_CODEC, self.config, default=default)
+
+    def get_compression_level(self, default):
+        return ConfigService.get_int_var(VarName.COMPRESSION_LEVEL, self.config, default=default)
+
+    def get_compression_min_size(self, default):
+        return ConfigService.get_int_var(VarName.COMPRESSION_MIN_SIZE, self.config, default=default)
+
+    def get_compression_rules(self, default):
+        """Get the compression codecs of channels and topics.
+
+        The rules are a dict of "<channel>" or "<channel>:<topic>" => codec name, and can only be set in the
+        config file.
+
+        """
+        if not self.config:
+            return default
+        rules = self.config.get(VarName.COMPRESSION_RULES)
+        if rules is None:
+            return default
+        if not isinstance(rules, dict):
+            raise ValueError(f"{VarName.COMPRESSION_RULES} must be dict but got {type(rules)}")
+        return rules
+
     def get_int_var(self, name: str, default=None):
         return ConfigService.get_int_var(name, self.config, default=default)
 
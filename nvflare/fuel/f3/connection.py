@@ -15,7 +15,7 @@ import logging
 import threading
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Union
+from typing import List, Union
 
 from nvflare.fuel.f3.drivers.connector_info import ConnectorInfo, Mode
 from nvflare.fuel.f3.drivers.driver_params import DriverParams
@@ -93,6 +93,22 @@ class Connection(ABC):
         """
         pass
 
+    def send_frame_parts(self, parts: List[BytesAlike]):
+        """Send a SFM frame made of several buffers, which are sent back-to-back as one frame.
+
+        This is the vectored version of send_frame. The default implementation joins the parts
+        and calls send_frame. Drivers that can write multiple buffers natively (scatter/gather)
+        should override it to avoid copying the payload. The parts must not be modified
+        by the caller until this call returns.
+
+        Args:
+            parts: The list of buffers making up the frame
+
+        Raises:
+            CommError: If any error happens while sending the frame
+        """
+        self.send_frame(b"".join(parts))
+
     def register_frame_receiver(self, receiver: FrameReceiver):
         """Register frame receiver
 
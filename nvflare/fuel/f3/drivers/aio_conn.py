@@ -11,12 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import logging
+import threading
 from asyncio import CancelledError, IncompleteReadError, StreamReader, StreamWriter
+from typing import List
 
 from nvflare.fuel.f3.comm_error import CommError
 from nvflare.fuel.f3.connection import BytesAlike, Connection
 from nvflare.fuel.f3.drivers.aio_context import AioContext
+from nvflare.fuel.f3.drivers.buffer_pool import acquire_receive_buffer
 from nvflare.fuel.f3.drivers.connector_info import ConnectorInfo
 from nvflare.fuel.f3.drivers.driver_params import DriverParams
 from nvflare.fuel.f3.drivers.net_utils import MAX_FRAME_SIZE
@@ -26,6 +30,8 @@ from nvflare.security.logging import secure_format_exception
 
 log = logging.getLogger(__name__)
 
+WRITE_CHECK_INTERVAL = 1.0
+
 
 class AioConnection(Connection):
     def __init__(
@@ -43,6 +49,10 @@ class AioConnection(Connection):
         self.closing = False
         self.secure = secure
         self.conn_props = self._get_aio_properties()
+        if writer:
+            # drain() only returns when the transport has sent all the data. Frame parts are referenced, not copied,
+            # by the transport (Python 3.12+), so the caller can't reuse them until they are sent.
+            writer.transport.set_write_buffer_limits(high=0)
 
     def get_conn_properties(self) -> dict:
         return self.conn_props
@@ -62,6 +72,29 @@ class AioConnection(Connection):
         except Exception as ex:
             log.error(f"Error calling send coroutine for connection {self}: {secure_format_exception(ex)}")
 
+    def send_frame_parts(self, parts: List[BytesAlike]):
+        if self._in_event_loop():
+            # Called from the event loop (e.g. the handshake of a new connection). Waiting would block the loop,
+            # so the parts that the caller could change are copied before they are written.
+            try:
+                self.writer.writelines([p if isinstance(p, bytes) else bytes(p) for p in parts])
+            except Exception as ex:
+                if not self.closing:
+                    log.error(f"Error sending frame for connection {self}: {secure_format_exception(ex)}")
+            return
+
+        # The parts are referenced, not copied, so wait till the transport has sent them.
+        written = threading.Event()
+        try:
+            self.aio_ctx.run_coro(self._async_send_frame_parts(parts, written))
+        except Exception as ex:
+            log.error(f"Error calling send coroutine for connection {self}: {secure_format_exception(ex)}")
+            return
+
+        while not written.wait(WRITE_CHECK_INTERVAL):
+            if self.closing:
+                return
+
     async def read_loop(self):
         try:
             while not self.closing:
@@ -79,6 +112,12 @@ class AioConnection(Connection):
 
     # Internal methods
 
+    def _in_event_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.aio_ctx.loop
+        except RuntimeError:
+            return False
+
     async def _async_send_frame(self, frame: BytesAlike):
         try:
             self.writer.write(frame)
@@ -87,6 +126,16 @@ class AioConnection(Connection):
             if not self.closing:
                 log.error(f"Error sending frame for connection {self}: {secure_format_exception(ex)}")
 
+    async def _async_send_frame_parts(self, parts: List[BytesAlike], written: threading.Event):
+        try:
+            self.writer.writelines(parts)
+            await self.writer.drain()
+        except Exception as ex:
+            if not self.closing:
+                log.error(f"Error sending frame for connection {self}: {secure_format_exception(ex)}")
+        finally:
+            written.set()
+
     async def _async_read_frame(self):
 
         prefix_buf = await self.reader.readexactly(PREFIX_LEN)
@@ -101,7 +150,11 @@ class AioConnection(Connection):
 
         remaining = await self.reader.readexactly(prefix.length - PREFIX_LEN)
 
-        return prefix_buf + remaining
+        frame = acquire_receive_buffer(prefix.length)
+        frame[0:PREFIX_LEN] = prefix_buf
+        frame[PREFIX_LEN:] = remaining
+
+        return frame
 
     def _get_aio_properties(self) -> dict:
 
@@ -341,15 +341,17 @@ class AioGrpcDriver(BaseDriver):
 
         self.logger.debug(f"CLIENT: trying to connect {address}")
         connection = None
+        # Parallel connections to the same server must not share the same HTTP/2 connection
+        options = list(self.options) + [("grpc.use_local_subchannel_pool", 1)]
         try:
             secure = ssl_required(params)
             if secure:
                 channel = grpc.aio.secure_channel(
-                    address, options=self.options, credentials=get_grpc_client_credentials(params)
+                    address, options=options, credentials=get_grpc_client_credentials(params)
                 )
                 self.logger.info(f"created secure channel at {address}")
             else:
-                channel = grpc.aio.insecure_channel(address, options=self.options)
+                channel = grpc.aio.insecure_channel(address, options=options)
                 self.logger.info(f"created insecure channel at {address}")
 
             self.logger.debug(f"CLIENT: connected to {address}")
@@ -0,0 +1,212 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from nvflare.fuel.f3.comm_config import CommConfigurator
+from nvflare.fuel.f3.stats_pool import StatsPoolManager
+
+log = logging.getLogger(__name__)
+
+# Buffer sizes are rounded up to a multiple of this granularity
+SIZE_CLASS_GRANULARITY = 64 * 1024
+# Frames smaller than this are not worth pooling
+MIN_POOLED_SIZE = SIZE_CLASS_GRANULARITY
+# Frames larger than this are allocated on demand
+MAX_POOLED_SIZE = 16 * 1024 * 1024
+# Max bytes kept in the free lists of the pool
+DEFAULT_POOL_SIZE = 64 * 1024 * 1024
+
+CATEGORY_ALL = "all"
+
+
+class PoolCounterName:
+    HIT = "hit"
+    MISS = "miss"
+    RELEASED = "released"
+    DROPPED = "dropped"
+    BYTES_HELD = "bytes_held"
+    PEAK_BYTES_HELD = "peak_bytes_held"
+
+
+class _PooledBuffer(bytearray):
+    """A bytearray owned by a ReceiveBufferPool"""
+
+    def __init__(self, size: int, pool: "ReceiveBufferPool"):
+        super().__init__(size)
+        self.pool = pool
+        self.in_pool = False
+
+
+class ReceiveBufferPool:
+    """A size-classed pool of receive buffers.
+
+    Drivers acquire a buffer for each incoming frame and hand it upward as a memoryview.
+    The buffer is returned to the pool by release_receive_buffer() once the frame (or the payload sliced
+    from it) is consumed. A buffer that's never released is simply garbage collected, so releasing is
+    an optimization, not a requirement.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    counter_pool = StatsPoolManager.add_counter_pool(
+        name="Receive_Buffer_Pool",
+        description="Usage of the receive buffer pool",
+        counter_names=[
+            PoolCounterName.HIT,
+            PoolCounterName.MISS,
+            PoolCounterName.RELEASED,
+            PoolCounterName.DROPPED,
+            PoolCounterName.BYTES_HELD,
+            PoolCounterName.PEAK_BYTES_HELD,
+        ],
+    )
+
+    def __init__(self, max_bytes: int = DEFAULT_POOL_SIZE):
+        self.max_bytes = max_bytes
+        self.free_lists: Dict[int, List[_PooledBuffer]] = {}
+        self.bytes_held = 0
+        self.peak_bytes_held = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @classmethod
+    def get_pool(cls) -> "ReceiveBufferPool":
+        """Get the process-wide pool shared by all drivers"""
+        with cls._instance_lock:
+            if not cls._instance:
+                max_bytes = CommConfigurator().get_receive_buffer_pool_size(DEFAULT_POOL_SIZE)
+                cls._instance = ReceiveBufferPool(max_bytes)
+            return cls._instance
+
+    @staticmethod
+    def _size_class(size: int) -> int:
+        return -(-size // SIZE_CLASS_GRANULARITY) * SIZE_CLASS_GRANULARITY
+
+    @staticmethod
+    def _category(size_class: int) -> str:
+        return f"{size_class // 1024}KB"
+
+    def acquire(self, size: int) -> memoryview:
+        """Get a buffer for a frame of the size
+
+        Args:
+            size: Size of the frame in bytes
+
+        Returns:
+            A memoryview of exactly the size requested
+        """
+
+        if self.max_bytes <= 0 or size < MIN_POOLED_SIZE or size > MAX_POOLED_SIZE:
+            return memoryview(bytearray(size))
+
+        size_class = self._size_class(size)
+        with self.lock:
+            free_list = self.free_lists.get(size_class)
+            if free_list:
+                buffer = free_list.pop()
+                buffer.in_pool = False
+                self._update_bytes_held(-size_class)
+                self.hits += 1
+                counter_name = PoolCounterName.HIT
+            else:
+                buffer = None
+                self.misses += 1
+                counter_name = PoolCounterName.MISS
+
+        self.counter_pool.increment(self._category(size_class), counter_name)
+        if buffer is None:
+            buffer = _PooledBuffer(size_class, self)
+
+        return memoryview(buffer)[:size]
+
+    def release(self, buffer: _PooledBuffer) -> bool:
+        """Return a buffer to the free list
+
+        Args:
+            buffer: The buffer to return
+
+        Returns:
+            True if the buffer is kept by the pool, False if it's dropped
+        """
+
+        size_class = len(buffer)
+        with self.lock:
+            if buffer.in_pool:
+                return True
+
+            if self.bytes_held + size_class > self.max_bytes:
+                kept = False
+            else:
+                buffer.in_pool = True
+                self.free_lists.setdefault(size_class, []).append(buffer)
+                self._update_bytes_held(size_class)
+                kept = True
+
+        counter_name = PoolCounterName.RELEASED if kept else PoolCounterName.DROPPED
+        self.counter_pool.increment(self._category(size_class), counter_name)
+        return kept
+
+    def get_hit_rate(self) -> float:
+        with self.lock:
+            total = self.hits + self.misses
+            return self.hits / total if total else 0.0
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                PoolCounterName.HIT: self.hits,
+                PoolCounterName.MISS: self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                PoolCounterName.BYTES_HELD: self.bytes_held,
+                PoolCounterName.PEAK_BYTES_HELD: self.peak_bytes_held,
+            }
+
+    def _update_bytes_held(self, delta: int):
+        # Must be called with the lock held
+        self.bytes_held += delta
+        self.counter_pool.increment(CATEGORY_ALL, PoolCounterName.BYTES_HELD, delta)
+        if self.bytes_held > self.peak_bytes_held:
+            self.counter_pool.increment(
+                CATEGORY_ALL, PoolCounterName.PEAK_BYTES_HELD, self.bytes_held - self.peak_bytes_held
+            )
+            self.peak_bytes_held = self.bytes_held
+
+
+def acquire_receive_buffer(size: int) -> memoryview:
+    """Get a receive buffer from the shared pool"""
+    return ReceiveBufferPool.get_pool().acquire(size)
+
+
+def release_receive_buffer(data: Optional[Any]) -> bool:
+    """Return the buffer backing the data to its pool.
+
+    The data can be a frame, or any memoryview sliced from it. The caller must guarantee that
+    the data is no longer referenced. Data not from a pool is ignored.
+
+    Args:
+        data: The data backed by a pooled buffer
+
+    Returns:
+        True if the buffer is returned to the pool
+    """
+    buffer = data.obj if isinstance(data, memoryview) else data
+    if isinstance(buffer, _PooledBuffer):
+        return buffer.pool.release(buffer)
+
+    return False
@@ -243,17 +243,17 @@ class GrpcDriver(BaseDriver):
         address = get_address(params)
         conn_props = {DriverParams.PEER_ADDR.value: address}
         connection = None
+        # Parallel connections to the same server must not share the same HTTP/2 connection
+        options = list(self.options) + [("grpc.use_local_subchannel_pool", 1)]
         try:
             secure = ssl_required(params)
             if secure:
                 self.logger.debug("CLIENT: creating secure channel")
-                channel = grpc.secure_channel(
-                    address, options=self.options, credentials=get_grpc_client_credentials(params)
-                )
+                channel = grpc.secure_channel(address, options=options, credentials=get_grpc_client_credentials(params))
                 self.logger.info(f"created secure channel at {address}")
             else:
                 self.logger.info("CLIENT: creating insecure channel")
-                channel = grpc.insecure_channel(address, options=self.options)
+                channel = grpc.insecure_channel(address, options=options)
                 self.logger.info(f"created insecure channel at {address}")
 
             stub = StreamerStub(channel)
@@ -13,11 +13,13 @@
 # limitations under the License.
 import logging
 import socket
+import ssl
 from socketserver import BaseRequestHandler
-from typing import Any, Union
+from typing import Any, List, Union
 
 from nvflare.fuel.f3.comm_error import CommError
 from nvflare.fuel.f3.connection import BytesAlike, Connection
+from nvflare.fuel.f3.drivers.buffer_pool import acquire_receive_buffer
 from nvflare.fuel.f3.drivers.driver import ConnectorInfo
 from nvflare.fuel.f3.drivers.driver_params import DriverParams
 from nvflare.fuel.f3.drivers.net_utils import MAX_FRAME_SIZE
@@ -57,6 +59,33 @@ class SocketConnection(Connection):
             if not self.closing:
                 raise CommError(CommError.ERROR, f"Error sending frame on conn {self}: {secure_format_exception(ex)}")
 
+    def send_frame_parts(self, parts: List[BytesAlike]):
+        try:
+            if isinstance(self.sock, ssl.SSLSocket):
+                # SSL sockets don't support sendmsg, send the parts one by one without joining them
+                for part in parts:
+                    self.sock.sendall(part)
+            else:
+                self._sendmsg_all(parts)
+        except Exception as ex:
+            if not self.closing:
+                raise CommError(CommError.ERROR, f"Error sending frame on conn {self}: {secure_format_exception(ex)}")
+
+    def _sendmsg_all(self, parts: List[BytesAlike]):
+        """Gather-write all the parts with sendmsg, resuming after partial writes"""
+
+        views = [memoryview(part).cast("B") for part in parts if part]
+        while views:
+            n = self.sock.sendmsg(views)
+            while n:
+                size = len(views[0])
+                if n >= size:
+                    views.pop(0)
+                    n -= size
+                else:
+                    views[0] = views[0][n:]
+                    n = 0
+
     def read_loop(self):
         try:
             self.read_frame_loop()
@@ -89,7 +118,7 @@ class SocketConnection(Connection):
         if prefix.length > MAX_FRAME_SIZE:
             raise CommError(CommError.BAD_DATA, f"Frame exceeds limit ({prefix.length} > {MAX_FRAME_SIZE}")
 
-        frame = bytearray(prefix.length)
+        frame = acquire_receive_buffer(prefix.length)
         frame[0:PREFIX_LEN] = prefix_buf
         self.read_into(frame, PREFIX_LEN, prefix.length - PREFIX_LEN)
 
@@ -66,6 +66,11 @@ class Message:
 
 
 class MessageReceiver(ABC):
+
+    # If True, the payload is passed as a memoryview of the receive buffer, which may be pooled.
+    # Otherwise, the payload is copied into a bytes object.
+    accepts_buffer_view = False
+
     @abstractmethod
     def process_message(self, endpoint: Endpoint, connection: Connection, app_id: int, message: Message):
         pass
@@ -0,0 +1,175 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+import concurrent.futures
+import copy
+import heapq
+import itertools
+import threading
+import time
+
+from nvflare.fuel.f3.cellnet.cell import Cell
+from nvflare.fuel.f3.cellnet.core_cell import TargetMessage
+from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey, ReturnCode
+from nvflare.fuel.f3.message import Message
+from nvflare.fuel.f3.streaming.stream_const import StreamHeaderKey
+from nvflare.fuel.f3.streaming.stream_types import StreamFuture
+
+"""
+This tool measures the latency and the number of threads of Cell.broadcast_request with many targets.
+
+The targets are simulated: the blob sent to a target completes after the latency, and its reply arrives
+after another latency, so only the fan-out of the cell is measured, not the network.
+
+Two modes are compared,
+
+    legacy: A new thread pool with a thread per target is created for each broadcast, and the headers are deep-copied
+    pooled: Requests are sent to all targets first, and the replies are waited for with the executor of the cell
+
+The following args are supported,
+
+    -t: Comma separated numbers of targets. Default is 10,100,1000
+    -r: Number of broadcasts for each number of targets. Default is 5
+    -l: Simulated one-way latency in seconds. Default is 0.05
+    -s: Payload size in bytes. Default is 1MB
+
+"""
+
+
+class LegacyCell(Cell):
+    """Cell with the previous broadcast that creates a thread per target for every broadcast"""
+
+    def _broadcast_request(
+        self, channel, topic, targets, request, timeout=None, secure=False, optional=False, abort_signal=None
+    ):
+        results = dict()
+        future_to_target = {}
+        self._encode_message(request, abort_signal)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            for t in targets:
+                req = Message(copy.deepcopy(request.headers), request.payload)
+                req = TargetMessage(t, channel, topic, req).message
+                f = executor.submit(
+                    self._send_one_request, channel, t, topic, req, timeout, secure, optional, abort_signal
+                )
+                future_to_target[f] = t
+            for future in concurrent.futures.as_completed(future_to_target):
+                results[future_to_target[future]] = future.result()
+        return results
+
+
+class SimulatedNetwork:
+    """Completes the sent blobs and delivers the replies after the latency, with a single thread"""
+
+    def __init__(self, cell: Cell, latency: float):
+        self.cell = cell
+        self.latency = latency
+        self.events = []
+        self.seq = itertools.count()
+        self.lock = threading.Condition()
+        self.stopped = False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        cell.send_blob = self.send_blob
+
+    def _schedule(self, delay, action, *args):
+        with self.lock:
+            heapq.heappush(self.events, (time.time() + delay, next(self.seq), action, args))
+            self.lock.notify()
+
+    def send_blob(self, channel, topic, target, message, secure=False, optional=False) -> StreamFuture:
+        future = StreamFuture(next(self.seq), message.headers)
+        req_id = message.get_header(StreamHeaderKey.STREAM_REQ_ID)
+        self._schedule(self.latency, future.set_result, len(message.payload))
+        self._schedule(2 * self.latency, self._reply, req_id)
+        return future
+
+    def _reply(self, req_id):
+        future = StreamFuture(next(self.seq), {StreamHeaderKey.STREAM_REQ_ID: req_id})
+        future.set_result(b"")
+        self.cell._process_reply(future)
+
+    def _run(self):
+        while True:
+            with self.lock:
+                while not self.stopped and (not self.events or self.events[0][0] > time.time()):
+                    self.lock.wait(self.events[0][0] - time.time() if self.events else None)
+                if self.stopped:
+                    return
+                _, _, action, args = heapq.heappop(self.events)
+            action(*args)
+
+    def stop(self):
+        with self.lock:
+            self.stopped = True
+            self.lock.notify()
+
+
+class ThreadSampler:
+    def __init__(self):
+        self.peak = 0
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.base = threading.active_count()
+        self.thread.start()
+
+    def _run(self):
+        while not self.stopped.wait(0.001):
+            self.peak = max(self.peak, threading.active_count())
+
+    def stop(self) -> int:
+        self.stopped.set()
+        self.thread.join()
+        return self.peak - self.base
+
+
+def _run(cell_name, cell_class, num_targets, args):
+    cell = cell_class(cell_name, "grpc://localhost:0", secure=False, credentials={})
+    network = SimulatedNetwork(cell, args.latency)
+    targets = [f"site-{i}" for i in range(num_targets)]
+    payload = bytes(args.size)
+
+    latencies = []
+    sampler = ThreadSampler()
+    for _ in range(args.rounds):
+        start = time.perf_counter()
+        results = cell._broadcast_request("bench", "test", targets, Message({}, payload), timeout=10.0)
+        latencies.append(time.perf_counter() - start)
+        timeouts = [t for t, r in results.items() if r.get_header(MessageHeaderKey.RETURN_CODE) == ReturnCode.TIMEOUT]
+        assert len(results) == num_targets and not timeouts
+
+    threads = sampler.stop()
+    network.stop()
+    if cell.broadcast_executor:
+        cell.broadcast_executor.shutdown()
+    return sum(latencies) / len(latencies), threads
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--targets", "-t", type=str, help="numbers of targets", default="10,100,1000")
+    parser.add_argument("--rounds", "-r", type=int, help="number of broadcasts", default=5)
+    parser.add_argument("--latency", "-l", type=float, help="simulated one-way latency", default=0.05)
+    parser.add_argument("--size", "-s", type=int, help="payload size", default=1024 * 1024)
+    args = parser.parse_args()
+
+    print(f"rounds={args.rounds} latency={args.latency}s payload={args.size} bytes")
+    for num_targets in [int(n) for n in args.targets.split(",")]:
+        for mode, cell_class in [("legacy", LegacyCell), ("pooled", Cell)]:
+            latency, threads = _run(f"bench-{mode}-{num_targets}", cell_class, num_targets, args)
+            print(f"targets={num_targets} {mode}: latency={latency * 1000:.1f}ms peak extra threads={threads}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+import filecmp
+import os
+import tempfile
+import time
+
+from nvflare.fuel.f3.cellnet.cell import Cell
+from nvflare.fuel.f3.streaming.file_downloader import FileDownloader, _ChunkProducer, _File
+from nvflare.fuel.f3.streaming.obj_downloader import ObjDownloader
+from nvflare.fuel.utils.network_utils import get_open_ports
+
+"""
+This tool measures the file download throughput of FileDownloader on a local loopback cell pair.
+
+The latency of a WAN link is simulated by delaying each chunk request on the file owner by the round trip time.
+Requests that are in flight at the same time are delayed concurrently, as they would be on a real link.
+
+The download is run with different numbers of outstanding chunk requests. 1 is the stop-and-wait download.
+
+The following args are supported,
+
+    -s: File size in MB. Default is 64
+    -c: Chunk size in MB. Default is 1
+    -l: Simulated round trip time in seconds. Default is 0.1
+    -o: Comma separated numbers of outstanding requests. Default is 1,4,8,16
+
+"""
+
+ONE_MB = 1024 * 1024
+
+
+class _DelayedChunkProducer(_ChunkProducer):
+    def __init__(self, chunk_size, delay: float):
+        super().__init__(chunk_size)
+        self.delay = delay
+
+    def produce(self, ref_id, obj, state, requester):
+        time.sleep(self.delay)
+        return super().produce(ref_id, obj, state, requester)
+
+
+def _tx_timeout(tx_id, objs):
+    pass
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", "-s", type=int, help="file size in MB", default=64)
+    parser.add_argument("--chunk", "-c", type=int, help="chunk size in MB", default=1)
+    parser.add_argument("--latency", "-l", type=float, help="simulated round trip time", default=0.1)
+    parser.add_argument("--outstanding", "-o", type=str, help="numbers of outstanding requests", default="1,4,8,16")
+    args = parser.parse_args()
+
+    port = get_open_ports(1)[0]
+    url = f"tcp://localhost:{port}"
+    server = Cell("server", url, secure=False, credentials={})
+    client = Cell("site-1", url, secure=False, credentials={})
+    server.start()
+    client.start()
+    time.sleep(1.0)
+
+    work_dir = tempfile.mkdtemp()
+    file_name = os.path.join(work_dir, "source.bin")
+    with open(file_name, "wb") as f:
+        f.write(os.urandom(args.size * ONE_MB))
+
+    tx_id = ObjDownloader.new_transaction(
+        cell=server,
+        producer=_DelayedChunkProducer(args.chunk * ONE_MB, args.latency),
+        timeout=600.0,
+        timeout_cb=_tx_timeout,
+    )
+    ref_id = ObjDownloader.add_download_object(tx_id, _File(file_name))
+
+    print(f"size={args.size}MB chunk={args.chunk}MB rtt={args.latency}s")
+    for num in [int(n) for n in args.outstanding.split(",")]:
+        start = time.perf_counter()
+        err, path = FileDownloader.download_file(
+            from_fqcn="server",
+            ref_id=ref_id,
+            per_request_timeout=30.0,
+            cell=client,
+            location=work_dir,
+            max_outstanding_requests=num,
+        )
+        duration = time.perf_counter() - start
+        if err or not filecmp.cmp(file_name, path, shallow=False):
+            print(f"outstanding={num}: download failed: {err}")
+        else:
+            print(f"outstanding={num}: {duration:.2f}s {args.size / duration:.1f}MB/s")
+        if path:
+            os.remove(path)
+
+    ObjDownloader.delete_transaction(tx_id)
+    os.remove(file_name)
+    os.rmdir(work_dir)
+    client.stop()
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
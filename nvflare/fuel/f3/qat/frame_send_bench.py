@@ -0,0 +1,133 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+import socket
+import threading
+import time
+from typing import List
+
+from nvflare.fuel.f3.connection import BytesAlike, Connection, FrameReceiver
+from nvflare.fuel.f3.drivers.connector_info import ConnectorInfo
+from nvflare.fuel.f3.drivers.socket_conn import SocketConnection
+from nvflare.fuel.f3.endpoint import Endpoint
+from nvflare.fuel.f3.sfm.constants import Types
+from nvflare.fuel.f3.sfm.prefix import PREFIX_LEN, Prefix
+from nvflare.fuel.f3.sfm.sfm_conn import SfmConnection
+from nvflare.fuel.utils.constants import Mode
+
+"""
+This tool measures the throughput of the SFM frame send path on a pair of local sockets.
+
+Two modes are compared,
+
+    copy: The frame is assembled into a single buffer before sending (the old send path)
+    vectored: The prefix, headers and payload are sent as a list of buffers with sendmsg
+
+The following args are supported,
+
+    -s: Payload size of each frame in bytes. Default is 1MB
+    -c: Number of frames to send in each run. Default is 2000
+    -t: Transport, "tcp", "unix" or "all". Default is all
+
+"""
+
+ONE_MB = 1024 * 1024
+
+
+class CopyingSocketConnection(SocketConnection):
+    """Socket connection that joins the frame before sending, as the old send path did"""
+
+    def send_frame_parts(self, parts: List[BytesAlike]):
+        Connection.send_frame_parts(self, parts)
+
+
+class ByteCounter(FrameReceiver):
+    def __init__(self, total: int):
+        self.total = total
+        self.received = 0
+        self.done = threading.Event()
+
+    def process_frame(self, frame: BytesAlike):
+        self.received += len(frame)
+        if self.received >= self.total:
+            self.done.set()
+
+
+def _make_connector() -> ConnectorInfo:
+    return ConnectorInfo("bench", None, {}, Mode.ACTIVE, 0, 0, False, threading.Event())
+
+
+def _socket_pair(transport: str):
+    if transport == "unix":
+        return socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    client = socket.create_connection(listener.getsockname())
+    server, _ = listener.accept()
+    listener.close()
+    for s in (client, server):
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return client, server
+
+
+def _run(transport: str, conn_class, payload_size: int, count: int) -> float:
+    tx_sock, rx_sock = _socket_pair(transport)
+    tx_conn = conn_class(tx_sock, _make_connector())
+    rx_conn = SocketConnection(rx_sock, _make_connector())
+
+    sfm_conn = SfmConnection(tx_conn, Endpoint("bench"))
+    payload = memoryview(bytearray(payload_size))
+    headers = {"channel": "bench", "topic": "throughput"}
+
+    frame_size = len(SfmConnection.headers_to_bytes(headers)) + PREFIX_LEN + payload_size
+    counter = ByteCounter(frame_size * count)
+    rx_conn.register_frame_receiver(counter)
+    reader = threading.Thread(target=rx_conn.read_loop, daemon=True)
+    reader.start()
+
+    start = time.perf_counter()
+    for _ in range(count):
+        prefix = Prefix(0, 0, Types.DATA, 0, 0, 1, 1, 0)
+        sfm_conn.send_frame(prefix, headers, payload)
+    counter.done.wait()
+    elapsed = time.perf_counter() - start
+
+    tx_conn.close()
+    rx_conn.close()
+    reader.join()
+
+    return counter.received / ONE_MB / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", "-s", type=int, help="payload size in bytes", default=ONE_MB)
+    parser.add_argument("--count", "-c", type=int, help="number of frames", default=2000)
+    parser.add_argument("--transport", "-t", type=str, help="tcp, unix or all", default="all")
+    args = parser.parse_args()
+
+    transports = ["tcp", "unix"] if args.transport == "all" else [args.transport]
+    for transport in transports:
+        copy_rate = _run(transport, CopyingSocketConnection, args.size, args.count)
+        vectored_rate = _run(transport, SocketConnection, args.size, args.count)
+        print(
+            f"{transport}: payload={args.size} frames={args.count} "
+            f"copy={copy_rate:.1f}MB/s vectored={vectored_rate:.1f}MB/s gain={vectored_rate / copy_rate:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+import queue
+import threading
+import time
+
+from nvflare.fuel.f3.cellnet.cell import Cell
+from nvflare.fuel.f3.cellnet.core_cell import CoreCell
+from nvflare.fuel.f3.comm_config import CommConfigurator
+from nvflare.fuel.f3.message import Message
+from nvflare.fuel.f3.streaming.byte_streamer import ByteStreamer, TxTask
+from nvflare.fuel.utils.network_utils import get_open_ports
+
+"""
+This tool measures the throughput of a BLOB stream between two cells over a simulated WAN link.
+
+The cells are in the same process, and the messages between them are delivered by a link model
+instead of the network. Each direction of the link sends messages one by one at the bandwidth,
+and delivers them after the one-way latency (half of the RTT), so a stream can only fill the link
+if its flow-control window is larger than the bandwidth-delay product.
+
+Two modes are compared,
+
+    static: The window is fixed at the configured streaming_window_size (16MB by default)
+    adaptive: The window is sized from the measured RTT and delivery rate
+
+The following args are supported,
+
+    -s: BLOB size in MB. Default is 256
+    -l: Simulated RTT in seconds. Default is 0.2
+    -b: Simulated bandwidth in MB/s. Default is 200
+    -r: Number of BLOBs sent in each mode. Default is 2
+
+"""
+
+ONE_MB = 1024 * 1024
+
+
+class SimulatedLink:
+    """Delivers the direct messages between cells with the latency and bandwidth of a WAN link"""
+
+    def __init__(self, rtt: float, bandwidth: float):
+        self.latency = rtt / 2
+        self.bandwidth = bandwidth
+        self.lock = threading.Lock()
+        self.directions = {}  # (from fqcn, to fqcn) => (queue, time the link is free)
+        self.original_send = CoreCell._send_direct_message
+        link = self
+
+        def _send_direct_message(cell, target_cell, message):
+            link.send(cell, target_cell, message)
+
+        CoreCell._send_direct_message = _send_direct_message
+
+    def send(self, cell, target_cell, message):
+        # The chunk buffer of the sender is reused, so the payload is copied like it's put on the wire
+        payload = message.payload
+        if isinstance(payload, (bytearray, memoryview)):
+            payload = bytes(payload)
+        message = Message(dict(message.headers), payload)
+        size = len(payload) if payload else 0
+
+        key = (cell.get_fqcn(), target_cell.get_fqcn())
+        with self.lock:
+            direction = self.directions.get(key)
+            if not direction:
+                q = queue.Queue()
+                threading.Thread(target=self._deliver, args=(q,), daemon=True).start()
+                direction = [q, 0.0]
+                self.directions[key] = direction
+            direction[1] = max(direction[1], time.monotonic()) + size / self.bandwidth
+            direction[0].put((direction[1] + self.latency, cell, target_cell, message))
+
+    def _deliver(self, q: queue.Queue):
+        while True:
+            item = q.get()
+            if item is None:
+                return
+            delivery_time, cell, target_cell, message = item
+            delay = delivery_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self.original_send(cell, target_cell, message)
+
+    def stop(self):
+        with self.lock:
+            for q, _ in self.directions.values():
+                q.put(None)
+        CoreCell._send_direct_message = self.original_send
+
+
+def _send_blobs(server, client, blob, rounds):
+    received = []
+    done = threading.Event()
+
+    def _blob_cb(future):
+        received.append(len(future.result()))
+        done.set()
+
+    client.register_blob_cb("bench", "blob", _blob_cb)
+
+    goodputs = []
+    windows = []
+    for _ in range(rounds):
+        done.clear()
+        tasks = []
+        original_transmit = ByteStreamer._transmit_task
+
+        def _transmit_task(task: TxTask):
+            tasks.append(task)
+            original_transmit(task)
+
+        ByteStreamer._transmit_task = staticmethod(_transmit_task)
+        try:
+            start = time.perf_counter()
+            future = server.send_blob("bench", "blob", client.get_fqcn(), Message(None, blob))
+            future.result(timeout=600)
+            if not done.wait(600):
+                raise RuntimeError("BLOB is not received")
+            duration = time.perf_counter() - start
+        finally:
+            ByteStreamer._transmit_task = staticmethod(original_transmit)
+
+        goodputs.append(len(blob) / duration / ONE_MB)
+        windows.append(tasks[0].get_flow_stats()["max_window"] / ONE_MB)
+
+    if received != [len(blob)] * rounds:
+        raise RuntimeError(f"wrong BLOB sizes received: {received}")
+    return sum(goodputs) / len(goodputs), max(windows)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", "-s", type=int, help="BLOB size in MB", default=256)
+    parser.add_argument("--latency", "-l", type=float, help="simulated RTT", default=0.2)
+    parser.add_argument("--bandwidth", "-b", type=float, help="simulated bandwidth in MB/s", default=200)
+    parser.add_argument("--rounds", "-r", type=int, help="number of BLOBs in each mode", default=2)
+    args = parser.parse_args()
+
+    port = get_open_ports(1)[0]
+    url = f"tcp://localhost:{port}"
+    server = Cell("server", url, secure=False, credentials={})
+    client = Cell("site-1", url, secure=False, credentials={})
+    server.start()
+    client.start()
+    time.sleep(1.0)
+
+    link = SimulatedLink(args.latency, args.bandwidth * ONE_MB)
+    blob = bytes(args.size * ONE_MB)
+    bdp = args.bandwidth * args.latency
+    print(f"size={args.size}MB rtt={args.latency}s bandwidth={args.bandwidth}MB/s bdp={bdp:.1f}MB")
+
+    original_adaptive = CommConfigurator.get_streaming_adaptive_window
+    try:
+        for mode in ["static", "adaptive"]:
+            CommConfigurator.get_streaming_adaptive_window = lambda self, default, m=mode: m == "adaptive"
+            goodput, window = _send_blobs(server, client, blob, args.rounds)
+            print(f"{mode}: goodput={goodput:.1f}MB/s max window={window:.0f}MB")
+    finally:
+        CommConfigurator.get_streaming_adaptive_window = original_adaptive
+        link.stop()
+        client.stop()
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -20,8 +20,10 @@ from typing import Dict, List, Optional
 
 import msgpack
 
+from nvflare.fuel.f3.comm_config import CommConfigurator
 from nvflare.fuel.f3.comm_error import CommError
 from nvflare.fuel.f3.connection import BytesAlike, Connection, ConnState, FrameReceiver
+from nvflare.fuel.f3.drivers.buffer_pool import release_receive_buffer
 from nvflare.fuel.f3.drivers.connector_info import ConnectorInfo, Mode
 from nvflare.fuel.f3.drivers.driver import ConnMonitor, Driver
 from nvflare.fuel.f3.drivers.driver_params import DriverCap, DriverParams
@@ -32,7 +34,7 @@ from nvflare.fuel.f3.sfm.constants import HandshakeKeys, Types
 from nvflare.fuel.f3.sfm.heartbeat_monitor import HeartbeatMonitor
 from nvflare.fuel.f3.sfm.prefix import PREFIX_LEN, Prefix
 from nvflare.fuel.f3.sfm.sfm_conn import SfmConnection
-from nvflare.fuel.f3.sfm.sfm_endpoint import SfmEndpoint
+from nvflare.fuel.f3.sfm.sfm_endpoint import MAX_STRIPED_CONNS, SfmEndpoint
 from nvflare.fuel.f3.stats_pool import StatsPoolManager
 from nvflare.fuel.utils.buffer_list import BufferList
 from nvflare.security.logging import secure_format_exception, secure_format_traceback
@@ -43,6 +45,7 @@ INIT_WAIT = 1
 MAX_WAIT = 10
 SILENT_RECONNECT_TIME = 5
 SELF_ADDR = "0.0.0.0:0"
+STREAMING_CONNECTIONS = 1
 
 log = logging.getLogger(__name__)
 
@@ -87,6 +90,9 @@ class ConnManager(ConnMonitor):
         self.frame_mgr_executor = ThreadPoolExecutor(FRAME_THREAD_POOL_SIZE, "frame_mgr")
         self.lock = threading.Lock()
         self.null_conn = NullConnection()
+        # Number of parallel connections opened to a peer. Advertised in handshake so the peer keeps all of them
+        num_conns = CommConfigurator().get_streaming_connections(STREAMING_CONNECTIONS)
+        self.num_conns = min(max(num_conns, 1), MAX_STRIPED_CONNS)
         stats = StatsPoolManager.get_pool("sfm_send_frame")
         if not stats:
             stats = StatsPoolManager.add_time_hist_pool(
@@ -332,14 +338,18 @@ class ConnManager(ConnMonitor):
 
     def process_frame_task(self, sfm_conn: SfmConnection, frame: BytesAlike):
 
+        # The frame may be a pooled buffer. It's released here unless the payload is handed to a receiver
+        release_frame = True
         try:
-            prefix = Prefix.from_bytes(frame)
+            # Headers and payload are sliced from the frame without copying
+            view = memoryview(frame)
+            prefix = Prefix.from_bytes(view)
             log.debug(f"Received frame: {prefix} on {sfm_conn.conn}")
 
             if prefix.header_len == 0:
                 headers = None
             else:
-                headers = msgpack.unpackb(frame[PREFIX_LEN : PREFIX_LEN + prefix.header_len])
+                headers = msgpack.unpackb(view[PREFIX_LEN : PREFIX_LEN + prefix.header_len])
 
             if prefix.type in (Types.HELLO, Types.READY):
                 if prefix.type == Types.HELLO:
@@ -353,13 +363,16 @@ class ConnManager(ConnMonitor):
                 log.debug(f"PONG received for {sfm_conn.conn}")
                 # No action is needed for PONG. The last_activity is already updated
             elif prefix.type == Types.DATA:
-                if prefix.length > PREFIX_LEN + prefix.header_len:
-                    payload = frame[PREFIX_LEN + prefix.header_len :]
-                else:
+                receiver = self.receivers.get(prefix.app_id)
+                if prefix.length <= PREFIX_LEN + prefix.header_len:
                     payload = None
+                elif receiver and receiver.accepts_buffer_view:
+                    payload = view[PREFIX_LEN + prefix.header_len :]
+                    release_frame = False
+                else:
+                    payload = bytes(view[PREFIX_LEN + prefix.header_len :])
 
                 message = Message(headers, payload)
-                receiver = self.receivers.get(prefix.app_id)
                 if receiver:
                     receiver.process_message(sfm_conn.sfm_endpoint.endpoint, sfm_conn.conn, prefix.app_id, message)
                 else:
@@ -370,6 +383,9 @@ class ConnManager(ConnMonitor):
         except Exception as ex:
             log.error(f"Error processing frame: {secure_format_exception(ex)}")
             log.debug(secure_format_traceback())
+        finally:
+            if release_frame:
+                release_receive_buffer(frame)
 
     def process_frame(self, sfm_conn: SfmConnection, frame: BytesAlike):
         if self.stopped:
@@ -381,6 +397,9 @@ class ConnManager(ConnMonitor):
     def update_endpoint(self, sfm_conn: SfmConnection, data: dict):
 
         endpoint_name = data.pop(HandshakeKeys.ENDPOINT_NAME)
+        peer_conns = data.pop(HandshakeKeys.CONNECTIONS, 1)
+        if not isinstance(peer_conns, int):
+            peer_conns = 1
         if not endpoint_name:
             raise CommError(CommError.BAD_DATA, f"Handshake without endpoint name for connection {sfm_conn.get_name()}")
 
@@ -395,13 +414,17 @@ class ConnManager(ConnMonitor):
         if conn_props:
             endpoint.conn_props.update(conn_props)
 
+        # Keep all the parallel connections opened by either side
+        max_conns = min(max(peer_conns, self.num_conns), MAX_STRIPED_CONNS)
+
         sfm_endpoint = self.sfm_endpoints.get(endpoint_name)
         if sfm_endpoint:
             old_state = sfm_endpoint.endpoint.state
             sfm_endpoint.endpoint = endpoint
+            sfm_endpoint.max_conns = max_conns
         else:
             old_state = EndpointState.IDLE
-            sfm_endpoint = SfmEndpoint(endpoint)
+            sfm_endpoint = SfmEndpoint(endpoint, max_conns)
 
         sfm_endpoint.add_connection(sfm_conn)
         sfm_conn.sfm_endpoint = sfm_endpoint
@@ -426,7 +449,7 @@ class ConnManager(ConnMonitor):
 
     def handle_new_connection(self, connection: Connection):
 
-        sfm_conn = SfmConnection(connection, self.local_endpoint)
+        sfm_conn = SfmConnection(connection, self.local_endpoint, self.num_conns)
         with self.lock:
             self.sfm_conns[sfm_conn.get_name()] = sfm_conn
 
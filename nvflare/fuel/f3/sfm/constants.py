@@ -26,6 +26,7 @@ class Types:
 class HandshakeKeys:
     ENDPOINT_NAME = "endpoint_name"
     TIMESTAMP = "timestamp"
+    CONNECTIONS = "connections"
 
 
 class Flags:
@@ -56,9 +56,10 @@ class SfmConnection:
 
     """
 
-    def __init__(self, conn: Connection, local_endpoint: Endpoint):
+    def __init__(self, conn: Connection, local_endpoint: Endpoint, num_conns: int = 1):
         self.conn = conn
         self.local_endpoint = local_endpoint
+        self.num_conns = num_conns
         self.sfm_endpoint = None
         self.last_activity = 0
         self.sequence = 0
@@ -81,6 +82,8 @@ class SfmConnection:
         """Send HELLO/READY frame"""
 
         data = {HandshakeKeys.ENDPOINT_NAME: self.local_endpoint.name, HandshakeKeys.TIMESTAMP: time.time()}
+        if self.num_conns > 1:
+            data[HandshakeKeys.CONNECTIONS] = self.num_conns
 
         if self.local_endpoint.properties:
             data.update(self.local_endpoint.properties)
@@ -129,23 +132,21 @@ class SfmConnection:
         prefix.header_len = header_len
         prefix.sequence = self.next_sequence()
 
-        buffer: bytearray = bytearray(length)
-
-        offset = 0
-        prefix.to_buffer(buffer, offset)
-        offset += PREFIX_LEN
+        # The frame is sent as a list of buffers so the payload is never copied
+        prefix_buf = bytearray(PREFIX_LEN)
+        prefix.to_buffer(prefix_buf, 0)
+        parts = [prefix_buf]
 
         if headers_bytes:
-            buffer[offset:] = headers_bytes
-            offset += header_len
+            parts.append(headers_bytes)
 
         if payload:
-            buffer[offset:] = payload
+            parts.append(payload)
 
         log.debug(f"Sending frame: {prefix} on {self.conn}")
         # Only one thread can send data on a connection. Otherwise, the frames may interleave.
         with self.lock:
-            self.conn.send_frame(buffer)
+            self.conn.send_frame_parts(parts)
 
     @staticmethod
     def headers_to_bytes(headers: Optional[dict]) -> Optional[bytes]:
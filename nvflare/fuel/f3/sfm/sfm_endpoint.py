@@ -21,6 +21,8 @@ from nvflare.fuel.f3.sfm.sfm_conn import SfmConnection
 # Hard-coded stream ID to be used by packets before handshake
 RESERVED_STREAM_ID = 16
 MAX_CONN_PER_ENDPOINT = 1
+# Upper limit of parallel connections to an endpoint when striping is enabled
+MAX_STRIPED_CONNS = 16
 
 log = logging.getLogger(__name__)
 
@@ -28,22 +30,24 @@ log = logging.getLogger(__name__)
 class SfmEndpoint:
     """An endpoint wrapper to keep SFM internal data"""
 
-    def __init__(self, endpoint: Endpoint):
+    def __init__(self, endpoint: Endpoint, max_conns: int = MAX_CONN_PER_ENDPOINT):
         self.endpoint = endpoint
         self.stream_id: int = RESERVED_STREAM_ID
         self.lock = threading.Lock()
         self.connections: List[SfmConnection] = []
+        # Messages are striped over all connections, so it's more than 1 if parallel connections are opened
+        self.max_conns = max_conns
 
     def add_connection(self, sfm_conn: SfmConnection):
 
         with self.lock:
-            while len(self.connections) >= MAX_CONN_PER_ENDPOINT:
+            while len(self.connections) >= self.max_conns:
                 first_conn = self.connections[0]
                 first_conn.conn.close()
                 self.connections.pop(0)
                 log.info(
                     f"Connection {first_conn.get_name()} is evicted for {sfm_conn.get_name()} "
-                    f"from endpoint {self.endpoint.name} for exceeding limit {MAX_CONN_PER_ENDPOINT}"
+                    f"from endpoint {self.endpoint.name} for exceeding limit {self.max_conns}"
                 )
 
             self.connections.append(sfm_conn)
@@ -363,6 +363,18 @@ def new_message_size_pool(name: str, description="", marks=None, record_writer=N
     return HistPool(name=name, description=description, marks=marks, unit="MB", record_writer=record_writer)
 
 
+def new_ratio_pool(name: str, description="", marks=None, record_writer=None) -> HistPool:
+    if not marks:
+        marks = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+    return HistPool(name=name, description=description, marks=marks, unit="ratio", record_writer=record_writer)
+
+
+def new_rate_pool(name: str, description="", marks=None, record_writer=None) -> HistPool:
+    if not marks:
+        marks = (1, 5, 10, 20, 50, 100, 200, 500, 1000)
+    return HistPool(name=name, description=description, marks=marks, unit="MB/s", record_writer=record_writer)
+
+
 def parse_hist_mode(mode: str) -> str:
     if not mode:
         return StatsMode.COUNT
@@ -441,6 +453,24 @@ class StatsPoolManager:
         cls.pools[name] = p
         return p
 
+    @classmethod
+    def add_ratio_hist_pool(cls, name: str, description: str, marks=None, scope=None):
+        keep_records = cls._keep_hist_records(name)
+        name = cls._check_name(name, scope)
+        record_writer = cls.record_writer if keep_records else None
+        p = new_ratio_pool(name, description, marks, record_writer=record_writer)
+        cls.pools[name] = p
+        return p
+
+    @classmethod
+    def add_rate_hist_pool(cls, name: str, description: str, marks=None, scope=None):
+        keep_records = cls._keep_hist_records(name)
+        name = cls._check_name(name, scope)
+        record_writer = cls.record_writer if keep_records else None
+        p = new_rate_pool(name, description, marks, record_writer=record_writer)
+        cls.pools[name] = p
+        return p
+
     @classmethod
     def add_counter_pool(cls, name: str, description: str, counter_names: list, scope=None):
         name = cls._check_name(name, scope)
@@ -76,6 +76,9 @@ class StreamCell:
                 resume: True if this is a restarted stream
                     It returns the offset to resume from if this is a restarted stream
 
+            The data returned by stream.read() may be backed by a pooled receive buffer. It's only valid
+            till the next read() or close(), so it must be copied if it needs to be kept.
+
         Args:
             channel: the channel of the request
             topic: topic of the request
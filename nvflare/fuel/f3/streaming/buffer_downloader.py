@@ -0,0 +1,261 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import bisect
+from typing import Any, List, Optional
+
+from nvflare.fuel.f3.cellnet.cell import Cell
+from nvflare.fuel.f3.connection import BytesAlike
+from nvflare.fuel.f3.streaming.obj_downloader import Consumer, ObjDownloader, Producer, ProduceRC, download_object
+from nvflare.fuel.utils.validation_utils import check_positive_int
+
+DEFAULT_CHUNK_SIZE = 5 * 1024 * 1024
+
+"""
+This package implements downloading of a list of in-memory buffers based on the ObjDownloader framework.
+
+The buffers are treated as one logical byte stream: the concatenation of all buffers in order.
+The chunks are sliced directly from the buffers on the sending side, and written directly into
+pre-allocated buffers on the receiving side, so no intermediate file or full copy of the data is created.
+"""
+
+
+class _StateKey:
+    RECEIVED_BYTES = "received_bytes"
+
+
+class _BufferList:
+    def __init__(self, buffers: List[BytesAlike]):
+        """This is the "object" to be downloaded.
+
+        Args:
+            buffers: the buffers to be downloaded. They must not be modified while being downloaded.
+        """
+        self.buffers = [memoryview(b).cast("B") for b in buffers]
+        self.offsets = []  # start offset of each buffer in the logical stream
+        size = 0
+        for b in self.buffers:
+            self.offsets.append(size)
+            size += len(b)
+        self.size = size
+
+    def read(self, offset: int, length: int) -> BytesAlike:
+        """Read data from the logical stream.
+
+        A view is returned if the data is in a single buffer. Otherwise, the pieces are joined.
+        """
+        end = min(offset + length, self.size)
+        pieces = []
+        index = bisect.bisect_right(self.offsets, offset) - 1
+        while offset < end:
+            buf = self.buffers[index]
+            start = offset - self.offsets[index]
+            stop = min(len(buf), end - self.offsets[index])
+            if stop > start:
+                pieces.append(buf[start:stop])
+                offset += stop - start
+            index += 1
+
+        if len(pieces) == 1:
+            return pieces[0]
+        return b"".join(pieces)
+
+
+class _ChunkProducer(Producer):
+    def __init__(self, chunk_size=None):
+        Producer.__init__(self)
+        if not chunk_size:
+            chunk_size = DEFAULT_CHUNK_SIZE
+
+        check_positive_int("chunk_size", chunk_size)
+        self.chunk_size = chunk_size
+
+    def produce(self, ref_id: str, obj, state: dict, requester: str) -> (str, Any, dict):
+        assert isinstance(obj, _BufferList)
+        received_bytes = 0
+        if state:
+            received_bytes = state.get(_StateKey.RECEIVED_BYTES, 0)
+
+        if not isinstance(received_bytes, int) or received_bytes < 0:
+            self.logger.error(f"bad {_StateKey.RECEIVED_BYTES} {received_bytes} from {requester}")
+            return ProduceRC.ERROR, None, None
+
+        if received_bytes >= obj.size:
+            # already done
+            return ProduceRC.EOF, None, None
+
+        chunk = obj.read(received_bytes, self.chunk_size)
+        self.logger.debug(f"{received_bytes=}; sending {len(chunk)} bytes")
+        return ProduceRC.OK, chunk, {_StateKey.RECEIVED_BYTES: received_bytes + len(chunk)}
+
+
+class BufferDownloader(ObjDownloader):
+    @classmethod
+    def new_transaction(
+        cls,
+        cell: Cell,
+        timeout: float,
+        timeout_cb=None,
+        chunk_size=None,
+        **cb_kwargs,
+    ):
+        """Create a new buffer download transaction.
+
+        Args:
+            cell: the cell for communication with recipients
+            timeout: timeout for the transaction
+            timeout_cb: CB to be called when the transaction is timed out
+            chunk_size: size of each chunk sent. Default is 5MB.
+            **cb_kwargs: args to be passed to the CB
+
+        Returns: transaction id
+
+        The timeout_cb must follow this signature:
+
+            cb(tx_id, buffer_lists: List[List[memoryview]], **cb_args)
+
+        """
+        return ObjDownloader.new_transaction(
+            cell=cell,
+            producer=_ChunkProducer(chunk_size),
+            timeout=timeout,
+            timeout_cb=cls._tx_timeout,
+            app_timeout_cb=timeout_cb,
+            **cb_kwargs,
+        )
+
+    @classmethod
+    def _tx_timeout(cls, tx_id: str, objs: List[Any], app_timeout_cb, **cb_kwargs):
+        if app_timeout_cb:
+            app_timeout_cb(tx_id, [obj.buffers for obj in objs], **cb_kwargs)
+
+    @classmethod
+    def add_buffers(
+        cls,
+        transaction_id: str,
+        buffers: List[BytesAlike],
+        ref_id=None,
+    ) -> str:
+        """Add a list of buffers to be downloaded to the specified transaction.
+
+        Args:
+            transaction_id: ID of the transaction
+            buffers: the buffers to be downloaded. The buffers are referenced, not copied.
+            ref_id: ref id to be used, if provided
+
+        Returns: reference id for the buffers.
+
+        """
+        return ObjDownloader.add_download_object(
+            transaction_id=transaction_id,
+            obj=_BufferList(buffers),
+            ref_id=ref_id,
+        )
+
+    @classmethod
+    def download_buffers(
+        cls,
+        from_fqcn: str,
+        ref_id: str,
+        buffers: List[BytesAlike],
+        per_request_timeout: float,
+        cell: Cell,
+        secure=False,
+        optional=False,
+        abort_signal=None,
+        max_outstanding_requests: int = None,
+    ) -> Optional[str]:
+        """Download the referenced buffers into the provided buffers.
+
+        Args:
+            from_fqcn: FQCN of the buffer owner.
+            ref_id: reference ID of the buffers to be downloaded.
+            buffers: writable buffers to receive the data. Their sizes must match the ones of the sender.
+            per_request_timeout: timeout for requests sent to the buffer owner.
+            cell: cell to be used for communicating to the buffer owner.
+            secure: P2P private mode for communication
+            optional: supress log messages of communication
+            abort_signal: signal for aborting download.
+            max_outstanding_requests: max number of chunk requests in flight. If not specified, use the
+                "download_max_outstanding_requests" comm config var.
+
+        Returns: error message if any.
+
+        """
+        consumer = _ChunkConsumer(buffers)
+        download_object(
+            from_fqcn=from_fqcn,
+            ref_id=ref_id,
+            consumer=consumer,
+            per_request_timeout=per_request_timeout,
+            cell=cell,
+            secure=secure,
+            optional=optional,
+            abort_signal=abort_signal,
+            max_outstanding_requests=max_outstanding_requests,
+        )
+
+        if not consumer.error and consumer.total_bytes != consumer.buffer_list.size:
+            consumer.error = f"expect {consumer.buffer_list.size} bytes but got {consumer.total_bytes}"
+        return consumer.error
+
+
+class _ChunkConsumer(Consumer):
+    def __init__(self, buffers: List[BytesAlike]):
+        Consumer.__init__(self)
+        self.buffer_list = _BufferList(buffers)
+        self.total_bytes = 0
+        self.error = None
+
+    def consume(self, ref_id, state: dict, data: Any) -> dict:
+        view = memoryview(data).cast("B")
+        length = len(view)
+        if self.total_bytes + length > self.buffer_list.size:
+            raise RuntimeError(f"received more than {self.buffer_list.size} bytes")
+
+        # write the chunk into the target buffers, it may span multiple buffers.
+        # chunks may be received out of order when the requests are pipelined.
+        offset = state.get(_StateKey.RECEIVED_BYTES, 0) - length if state else self.total_bytes
+        if offset < 0 or offset + length > self.buffer_list.size:
+            raise RuntimeError(f"chunk of {length} bytes at {offset} is out of {self.buffer_list.size} bytes")
+        index = bisect.bisect_right(self.buffer_list.offsets, offset) - 1
+        pos = 0
+        while pos < length:
+            buf = self.buffer_list.buffers[index]
+            start = offset + pos - self.buffer_list.offsets[index]
+            n = min(len(buf) - start, length - pos)
+            if n > 0:
+                buf[start : start + n] = view[pos : pos + n]
+                pos += n
+            index += 1
+
+        self.total_bytes += length
+        self.logger.debug(f"received {self.total_bytes} of {self.buffer_list.size} bytes")
+        return {_StateKey.RECEIVED_BYTES: self.total_bytes}
+
+    def get_pipeline_states(self, ref_id: str, state: dict) -> Optional[List[dict]]:
+        size = self.buffer_list.size
+        chunk_size = self.total_bytes
+        if chunk_size <= 0:
+            return None
+
+        states = [{_StateKey.RECEIVED_BYTES: offset} for offset in range(chunk_size, size, chunk_size)]
+        states.append({_StateKey.RECEIVED_BYTES: size})
+        return states
+
+    def download_failed(self, ref_id, reason: str):
+        self.logger.error(f"failed to download buffers with ref {ref_id}: {reason}")
+        self.error = reason
+
+    def download_completed(self, ref_id: str):
+        self.logger.debug(f"downloaded {self.total_bytes} bytes for ref {ref_id}")
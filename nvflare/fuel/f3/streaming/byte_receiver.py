@@ -21,6 +21,7 @@ from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey
 from nvflare.fuel.f3.cellnet.registry import Callback, Registry
 from nvflare.fuel.f3.comm_config import CommConfigurator
 from nvflare.fuel.f3.connection import BytesAlike
+from nvflare.fuel.f3.drivers.buffer_pool import release_receive_buffer
 from nvflare.fuel.f3.message import Message
 from nvflare.fuel.f3.stats_pool import StatsPoolManager
 from nvflare.fuel.f3.streaming.stream_const import (
@@ -67,9 +68,14 @@ class RxTask:
         # The reassembled chunks in a double-ended queue
         self.chunks: Deque[Tuple[bool, BytesAlike]] = deque()
         self.chunk_offset = 0  # Start of the remaining data for partially read left-most chunk
+        # The last chunk handed to the reader. Its buffer is released on the next read
+        self.consumed_chunk: Optional[BytesAlike] = None
 
         # Out-of-sequence chunks to be assembled
         self.out_seq_chunks: Dict[int, Tuple[bool, BytesAlike]] = {}
+        self.out_seq_size = 0
+        # The flow-control window of the sender. It's None if the sender doesn't send it
+        self.window = None
         self.stream_future = None
         self.next_seq = 0
         self.offset = 0
@@ -159,6 +165,9 @@ class RxTask:
     def _handle_incoming_data(self, seq: int, message: Message):
 
         data_type = message.get_header(StreamHeaderKey.DATA_TYPE)
+        window = message.get_header(StreamHeaderKey.WINDOW)
+        if window:
+            self.window = window
 
         last_chunk = data_type == StreamDataType.FINAL
         if last_chunk:
@@ -174,15 +183,17 @@ class RxTask:
             # Try to reassemble out-of-seq chunks
             while self.next_seq in self.out_seq_chunks:
                 chunk = self.out_seq_chunks.pop(self.next_seq)
+                self.out_seq_size -= self._chunk_size(chunk[1])
                 self._append(chunk)
         else:
-            # Save out-of-seq chunks
-            if len(self.out_seq_chunks) >= self.max_out_seq:
+            # Save out-of-seq chunks. More chunks are allowed if they fit in the window of the sender
+            if len(self.out_seq_chunks) >= self.max_out_seq and (not self.window or self.out_seq_size >= self.window):
                 self.stop(StreamError(f"{self} Too many out-of-sequence chunks: {len(self.out_seq_chunks)}"))
                 return
             else:
                 if seq not in self.out_seq_chunks:
                     self.out_seq_chunks[seq] = last_chunk, message.payload
+                    self.out_seq_size += self._chunk_size(message.payload)
                 else:
                     log.warning(f"{self} Duplicate out-of-seq chunk ignored {seq=}")
 
@@ -228,6 +239,8 @@ class RxTask:
     def _try_to_read(self, size: int) -> Tuple[int, Optional[BytesAlike]]:
 
         with self.lock:
+            self.release_consumed_chunk()
+
             if self.eos:
                 return RESULT_EOS, None
 
@@ -253,13 +266,14 @@ class RxTask:
 
                 self.chunk_offset = 0
                 self.chunks.popleft()
+                self.consumed_chunk = buf
 
                 if last_chunk:
                     self.eos = True
 
             self.offset += len(result)
 
-            if not self.last_chunk_received and (self.offset - self.offset_ack > self.ack_interval):
+            if not self.last_chunk_received and (self.offset - self.offset_ack > self._ack_interval()):
                 # Send ACK
                 message = Message()
                 message.add_headers(
@@ -276,6 +290,25 @@ class RxTask:
 
             return RESULT_DATA, result
 
+    def _ack_interval(self) -> int:
+        # ACK at least 4 times per window, so a small window of the sender doesn't stall
+        if self.window:
+            return min(self.ack_interval, self.window // 4)
+        return self.ack_interval
+
+    @staticmethod
+    def _chunk_size(buf: Optional[BytesAlike]) -> int:
+        return len(buf) if buf is not None else 0
+
+    def release_consumed_chunk(self):
+        """Return the buffer of the consumed chunk to the receive buffer pool.
+
+        The data returned by read() is only valid till the next read() or close()
+        """
+        if self.consumed_chunk is not None:
+            release_receive_buffer(self.consumed_chunk)
+            self.consumed_chunk = None
+
     def _append(self, buf: Tuple[bool, BytesAlike]):
         if self.eos:
             log.error(f"{self} Data after EOS is ignored")
@@ -303,6 +336,9 @@ class RxStream(Stream):
         return self.task.read(size)
 
     def close(self):
+        with self.task.lock:
+            self.task.release_consumed_chunk()
+
         if not self.task.stream_future.done():
             self.task.stream_future.set_result(self.task.offset)
         self.closed = True
@@ -13,6 +13,7 @@
 # limitations under the License.
 import logging
 import threading
+import time
 from typing import Callable, Optional
 
 from nvflare.fuel.f3.cellnet.core_cell import CoreCell
@@ -20,6 +21,7 @@ from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey
 from nvflare.fuel.f3.comm_config import CommConfigurator
 from nvflare.fuel.f3.message import Message
 from nvflare.fuel.f3.stats_pool import StatsPoolManager
+from nvflare.fuel.f3.streaming.flow_control import AdaptiveWindow
 from nvflare.fuel.f3.streaming.stream_const import (
     STREAM_ACK_TOPIC,
     STREAM_CHANNEL,
@@ -38,6 +40,8 @@ from nvflare.fuel.f3.streaming.stream_utils import (
 
 STREAM_CHUNK_SIZE = 1024 * 1024
 STREAM_WINDOW_SIZE = 16 * STREAM_CHUNK_SIZE
+STREAM_MIN_WINDOW_SIZE = 4 * STREAM_CHUNK_SIZE
+STREAM_MAX_WINDOW_SIZE = 256 * STREAM_CHUNK_SIZE
 STREAM_ACK_WAIT = 300
 
 STREAM_TYPE_BYTE = "byte"
@@ -90,12 +94,44 @@ class TxTask(StreamTaskSpec):
         self.window_size = CommConfigurator().get_streaming_window_size(STREAM_WINDOW_SIZE)
         self.ack_wait = CommConfigurator().get_streaming_ack_wait(STREAM_ACK_WAIT)
 
+        # The window starts with the configured size, and adapts to the measured RTT and delivery rate
+        self.window = None
+        if CommConfigurator().get_streaming_adaptive_window(True):
+            self.window = AdaptiveWindow(
+                self.window_size,
+                CommConfigurator().get_streaming_min_window_size(STREAM_MIN_WINDOW_SIZE),
+                CommConfigurator().get_streaming_max_window_size(STREAM_MAX_WINDOW_SIZE),
+            )
+        self.start_time = None
+        self.end_time = None
+
     def __str__(self):
         return f"Tx[SID:{self.sid} to {self.target} for {self.channel}/{self.topic}]"
 
+    def get_window_size(self) -> int:
+        return self.window.size if self.window else self.window_size
+
+    def get_flow_stats(self) -> dict:
+        """Get the flow-control telemetry of the stream
+
+        Returns: a dict with RTT and min RTT in seconds, current and max window sizes in bytes, and goodput in
+        bytes per second. The RTTs are 0 if no ACKs are received or the window is not adaptive.
+
+        """
+        end_time = self.end_time if self.end_time else time.monotonic()
+        duration = end_time - self.start_time if self.start_time else 0
+        return {
+            "rtt": self.window.srtt if self.window else 0.0,
+            "min_rtt": self.window.min_rtt if self.window else 0.0,
+            "window": self.get_window_size(),
+            "max_window": self.window.max_window if self.window else self.window_size,
+            "goodput": self.offset / duration if duration > 0 else 0.0,
+        }
+
     def send_loop(self):
         """Read/send loop to transmit the whole stream with flow control"""
 
+        self.start_time = time.monotonic()
         while not self.stopped:
             buf = self.stream.read(self.chunk_size)
             if not buf:
@@ -107,8 +143,8 @@ class TxTask(StreamTaskSpec):
             # Flow control
             window = self.offset - self.offset_ack
             # It may take several ACKs to clear up the window
-            while window > self.window_size:
-                log.debug(f"{self} window size {window} exceeds limit: {self.window_size}")
+            while window > self.get_window_size():
+                log.debug(f"{self} window size {window} exceeds limit: {self.get_window_size()}")
                 self.ack_waiter.clear()
 
                 if not self.ack_waiter.wait(timeout=self.ack_wait):
@@ -159,6 +195,7 @@ class TxTask(StreamTaskSpec):
                 StreamHeaderKey.SEQUENCE: self.seq,
                 StreamHeaderKey.OFFSET: self.offset,
                 StreamHeaderKey.OPTIONAL: self.optional,
+                StreamHeaderKey.WINDOW: self.get_window_size(),
             }
         )
 
@@ -176,6 +213,8 @@ class TxTask(StreamTaskSpec):
         self.offset += self.buffer_size
         self.buffer_size = 0
         self.direct_buf = None
+        if self.window:
+            self.window.on_send(self.offset)
 
         # Update future
         self.stream_future.set_progress(self.offset)
@@ -186,6 +225,7 @@ class TxTask(StreamTaskSpec):
             return
 
         self.stopped = True
+        self.end_time = time.monotonic()
 
         if self.task_future:
             self.task_future.cancel()
@@ -232,6 +272,9 @@ class TxTask(StreamTaskSpec):
         if offset > self.offset_ack:
             self.offset_ack = offset
 
+        if self.window:
+            self.window.on_ack(offset)
+
         if not self.ack_waiter.is_set():
             self.ack_waiter.set()
 
@@ -255,6 +298,14 @@ class ByteStreamer:
 
     sent_stream_size_pool = StatsPoolManager.add_msg_size_pool("Sent_Stream_Sizes", "Sizes of streams sent (MBs)")
 
+    stream_rtt_pool = StatsPoolManager.add_time_hist_pool("Stream_RTT", "Smoothed RTT of streams in secs (sender)")
+
+    stream_window_pool = StatsPoolManager.add_msg_size_pool(
+        "Stream_Window_Sizes", "Max flow-control window sizes of streams (MBs)"
+    )
+
+    stream_goodput_pool = StatsPoolManager.add_rate_hist_pool("Stream_Goodput", "Goodput of streams (MB/s)")
+
     def __init__(self, cell: CoreCell):
         self.cell = cell
         self.cell.register_request_cb(channel=STREAM_CHANNEL, topic=STREAM_ACK_TOPIC, cb=self._ack_handler)
@@ -296,6 +347,7 @@ class ByteStreamer:
 
         try:
             task.send_loop()
+            ByteStreamer._record_flow_stats(task)
         except Exception as ex:
             msg = f"{task} Error while sending: {ex}"
             if task.optional:
@@ -309,6 +361,19 @@ class ByteStreamer:
                 ByteStreamer.tx_task_map.pop(task.sid, None)
                 log.debug(f"{task} is removed")
 
+    @staticmethod
+    def _record_flow_stats(task: TxTask):
+        if not task.stream_future.done() or task.stream_future.error:
+            return
+
+        stats = task.get_flow_stats()
+        log.debug(f"{task} flow stats: {stats}")
+        category = stream_stats_category(task.cell.my_info.fqcn, task.channel, task.topic)
+        if stats["rtt"]:
+            ByteStreamer.stream_rtt_pool.record_value(category=category, value=stats["rtt"])
+        ByteStreamer.stream_window_pool.record_value(category=category, value=stats["max_window"] / ONE_MB)
+        ByteStreamer.stream_goodput_pool.record_value(category=category, value=stats["goodput"] / ONE_MB)
+
     @staticmethod
     def _ack_handler(message: Message):
 
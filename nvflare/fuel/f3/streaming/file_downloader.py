@@ -13,6 +13,7 @@
 # limitations under the License.
 import os.path
 import tempfile
+import threading
 import uuid
 from typing import Any, List, Optional
 
@@ -30,6 +31,7 @@ It provides implementation of the Producer and Consumer objects, required by Obj
 
 class _StateKey:
     RECEIVED_BYTES = "received_bytes"
+    SIZE = "size"
 
 
 class _File:
@@ -37,11 +39,54 @@ class _File:
     def __init__(self, file_name):
         """This is the "object" to be downloaded.
 
+        The file is opened once and kept open until the transaction is deleted, so it's not reopened for every
+        chunk. Chunks are read with positional reads, so multiple chunks can be read at the same time.
+
         Args:
             file_name: name of the file.
         """
         self.name = file_name
         self.size = os.path.getsize(file_name)
+        self.file = None
+        self.lock = threading.Lock()
+        self.num_readers = 0  # number of positional reads in progress, which use the fd without the lock
+        self.close_pending = False
+
+    def read(self, offset: int, length: int) -> bytes:
+        with self.lock:
+            if not self.file:
+                self.file = open(self.name, "rb")
+
+            if not hasattr(os, "pread"):
+                self.file.seek(offset)
+                return self.file.read(length)
+
+            # the file is kept open until the read is done
+            fd = self.file.fileno()
+            self.num_readers += 1
+
+        try:
+            return os.pread(fd, length, offset)
+        finally:
+            with self.lock:
+                self.num_readers -= 1
+                if self.close_pending and self.num_readers == 0:
+                    self._close()
+
+    def close(self):
+        with self.lock:
+            if self.num_readers > 0:
+                # closed by the last read in progress
+                self.close_pending = True
+            else:
+                self._close()
+
+    def _close(self):
+        # must be called with the lock held
+        if self.file:
+            self.file.close()
+            self.file = None
+        self.close_pending = False
 
 
 class _ChunkProducer(Producer):
@@ -69,12 +114,14 @@ class _ChunkProducer(Producer):
             return ProduceRC.EOF, None, None
 
         num_bytes_to_send = min(self.chunk_size, obj.size - received_bytes)
-        with open(obj.name, "rb") as f:
-            f.seek(received_bytes)
-            chunk = f.read(num_bytes_to_send)
+        chunk = obj.read(received_bytes, num_bytes_to_send)
 
         self.logger.debug(f"{received_bytes=}; sending {len(chunk)} bytes")
-        return ProduceRC.OK, chunk, {_StateKey.RECEIVED_BYTES: received_bytes + len(chunk)}
+        return ProduceRC.OK, chunk, {_StateKey.RECEIVED_BYTES: received_bytes + len(chunk), _StateKey.SIZE: obj.size}
+
+    def release(self, obj):
+        assert isinstance(obj, _File)
+        obj.close()
 
 
 class FileDownloader(ObjDownloader):
@@ -168,6 +215,7 @@ class FileDownloader(ObjDownloader):
         secure=False,
         optional=False,
         abort_signal=None,
+        max_outstanding_requests: int = None,
     ) -> (str, Optional[str]):
         """Download the referenced file from the file owner.
 
@@ -180,6 +228,8 @@ class FileDownloader(ObjDownloader):
             secure: P2P private mode for communication
             optional: supress log messages of communication
             abort_signal: signal for aborting download.
+            max_outstanding_requests: max number of chunk requests in flight. If not specified, use the
+                "download_max_outstanding_requests" comm config var.
 
         Returns: tuple of (error message if any, full path of the downloaded file).
 
@@ -203,6 +253,7 @@ class FileDownloader(ObjDownloader):
             secure=secure,
             optional=optional,
             abort_signal=abort_signal,
+            max_outstanding_requests=max_outstanding_requests,
         )
 
         return consumer.error, consumer.file_path
@@ -221,11 +272,27 @@ class _ChunkConsumer(Consumer):
 
     def consume(self, ref_id, state: dict, data: Any) -> dict:
         assert isinstance(data, bytes)
+
+        # chunks may be received out of order when the requests are pipelined
+        offset = state.get(_StateKey.RECEIVED_BYTES, 0) - len(data) if state else self.total_bytes
+        if offset != self.file.tell():
+            self.file.seek(offset)
         self.file.write(data)
         self.total_bytes += len(data)
         self.logger.debug(f"received {self.total_bytes} bytes for file {self.file_path}")
         return {_StateKey.RECEIVED_BYTES: self.total_bytes}
 
+    def get_pipeline_states(self, ref_id: str, state: dict) -> Optional[List[dict]]:
+        size = state.get(_StateKey.SIZE) if state else None
+        chunk_size = self.total_bytes
+        if not isinstance(size, int) or chunk_size <= 0:
+            # the file owner doesn't tell the size
+            return None
+
+        states = [{_StateKey.RECEIVED_BYTES: offset} for offset in range(chunk_size, size, chunk_size)]
+        states.append({_StateKey.RECEIVED_BYTES: size})
+        return states
+
     def download_failed(self, ref_id, reason: str):
         self.logger.error(f"failed to download file with ref {ref_id}: {reason}")
         self.error = reason
@@ -245,7 +312,8 @@ def download_file(
     secure=False,
     optional=False,
     abort_signal=None,
+    max_outstanding_requests: int = None,
 ) -> (str, Optional[str]):
     return FileDownloader.download_file(
-        from_fqcn, ref_id, per_request_timeout, cell, location, secure, optional, abort_signal
+        from_fqcn, ref_id, per_request_timeout, cell, location, secure, optional, abort_signal, max_outstanding_requests
     )
@@ -0,0 +1,107 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+from collections import deque
+
+# The window is this many times of the estimated bandwidth-delay product
+WINDOW_GAIN = 2.0
+# Number of the latest delivery rate samples to find the max rate
+RATE_SAMPLES = 10
+# Weight of the new sample in smoothed RTT
+RTT_ALPHA = 0.125
+# The delivery rate is sampled over at least this fraction of the min RTT, so bunched ACKs don't inflate it
+RATE_INTERVAL_RTT = 0.25
+
+
+class AdaptiveWindow:
+    """Flow-control window of a stream, sized from the ACKs like BBR.
+
+    The window is WINDOW_GAIN times the bandwidth-delay product, estimated as the max delivery rate of the latest
+    ACKs times the min RTT of the stream. A window limited by itself doubles every RTT till the delivery rate stops
+    growing, and shrinks when the receiver reads slower.
+
+    The RTT is measured from the time a chunk is sent to the time the ACK covering it is received. The min RTT is
+    kept for the life of the stream, so the queueing delay of a slow receiver doesn't inflate the window.
+    """
+
+    def __init__(self, initial_size: int, min_size: int, max_size: int):
+        if min_size > max_size:
+            raise ValueError(f"min window size {min_size} is larger than max window size {max_size}")
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.size = min(max(initial_size, min_size), max_size)
+
+        self.sent = deque()  # (end offset, send time) of chunks not acknowledged
+        self.rate_samples = deque(maxlen=RATE_SAMPLES)
+        self.min_rtt = 0.0
+        self.srtt = 0.0
+        self.max_rate = 0.0
+        self.max_window = self.size
+        self.ack_offset = 0
+        self.ack_time = None
+        self.lock = threading.Lock()
+
+    def on_send(self, end_offset: int, now: float = None):
+        """Record a chunk that's sent.
+
+        Args:
+            end_offset: the offset of the stream after the chunk
+            now: the send time
+
+        Returns: None
+
+        """
+        with self.lock:
+            self.sent.append((end_offset, now if now is not None else time.monotonic()))
+
+    def on_ack(self, offset: int, now: float = None):
+        """Update the estimates and the window size with an ACK.
+
+        Args:
+            offset: the offset acknowledged by the receiver
+            now: the time the ACK is received
+
+        Returns: None
+
+        """
+        if now is None:
+            now = time.monotonic()
+
+        with self.lock:
+            send_time = None
+            while self.sent and self.sent[0][0] <= offset:
+                _, send_time = self.sent.popleft()
+
+            if send_time is None:
+                # old or duplicate ACK
+                return
+
+            rtt = now - send_time
+            self.srtt = rtt if not self.srtt else (1 - RTT_ALPHA) * self.srtt + RTT_ALPHA * rtt
+
+            self.min_rtt = rtt if not self.min_rtt else min(self.min_rtt, rtt)
+
+            if self.ack_time is None:
+                self.ack_offset = offset
+                self.ack_time = now
+            elif now - self.ack_time >= RATE_INTERVAL_RTT * self.min_rtt and now > self.ack_time:
+                self.rate_samples.append((offset - self.ack_offset) / (now - self.ack_time))
+                self.max_rate = max(self.rate_samples)
+                bdp = self.max_rate * self.min_rtt
+                self.size = int(min(max(WINDOW_GAIN * bdp, self.min_size), self.max_size))
+                self.max_window = max(self.max_window, self.size)
+                self.ack_offset = offset
+                self.ack_time = now
@@ -11,16 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import concurrent.futures
 import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List, Optional
 
 from nvflare.apis.signal import Signal
 from nvflare.fuel.f3.cellnet.cell import Cell
 from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey, ReturnCode
 from nvflare.fuel.f3.cellnet.utils import make_reply, new_cell_message
+from nvflare.fuel.f3.comm_config import CommConfigurator
 from nvflare.fuel.f3.message import Message
 from nvflare.fuel.utils.log_utils import get_obj_logger
 from nvflare.fuel.utils.validation_utils import check_callable, check_object_type
@@ -29,6 +31,15 @@ from nvflare.security.logging import secure_format_exception
 OBJ_DOWNLOADER_CHANNEL = "obj_downloader__"
 OBJ_DOWNLOADER_TOPIC = "obj_downloader__download"
 
+# max number of chunk requests in flight when downloading an object
+DEFAULT_MAX_OUTSTANDING_REQUESTS = 4
+
+# max number of chunk requests in flight for all downloads of the process
+REQUEST_POOL_SIZE = 32
+
+# the pipelined chunk requests of all downloads are sent by this pool, so concurrent downloads don't multiply threads
+_request_pool = concurrent.futures.ThreadPoolExecutor(REQUEST_POOL_SIZE, thread_name_prefix="obj_dl")
+
 """
 This package provides a framework for building object downloading capability (e.g. file download).
 
@@ -90,6 +101,12 @@ called since the site somehow didn't finish the downloading. In reality the time
 
 Unlike with Object Streamer that the object owner pushes small objects to the recipients; with Object Downloader, 
 each recipient pulls the data from the object owner.
+
+By default, the recipient sends the next request after the reply of the previous one is received. On a link with
+high latency, this limits the download speed to one small object per round trip. If the Consumer can tell the states
+of the following requests in advance (e.g. the offsets of the chunks of a file), it can implement 
+get_pipeline_states, and multiple requests are kept in flight. The replies are then consumed in the order they are
+received, so the Consumer must be able to process them out of order.
 """
 
 
@@ -161,6 +178,18 @@ class Producer(ABC):
         """
         pass
 
+    def release(self, obj: Any):
+        """Called when the transaction of the object is deleted, to release resources held for the object
+        (e.g. open files).
+
+        Args:
+            obj: the large object
+
+        Returns: None
+
+        """
+        pass
+
 
 class _Transaction:
 
@@ -341,6 +370,10 @@ class ObjDownloader:
         # remove all refs
         for r in tx.refs:
             cls._ref_table.pop(r.rid, None)
+            try:
+                tx.producer.release(r.obj)
+            except Exception as ex:
+                cls._logger.error(f"exception releasing object {r.rid}: {secure_format_exception(ex)}")
 
     @classmethod
     def _handle_download(cls, request: Message) -> Message:
@@ -448,6 +481,22 @@ class Consumer(ABC):
         """
         pass
 
+    def get_pipeline_states(self, ref_id: str, state: dict) -> Optional[List[dict]]:
+        """Called after the first data is consumed, to get the states of all the remaining requests, so that
+        they can be sent without waiting for the replies of previous requests.
+
+        The last state must be the one for which the Producer returns EOF. It is sent after the replies of all
+        other requests are received.
+
+        Args:
+            ref_id: ref id of the object being downloaded
+            state: state received with the first data
+
+        Returns: list of states of the remaining requests, or None if requests can't be pipelined.
+
+        """
+        return None
+
 
 def download_object(
     from_fqcn: str,
@@ -458,6 +507,7 @@ def download_object(
     secure=False,
     optional=False,
     abort_signal: Signal = None,
+    max_outstanding_requests: int = None,
 ):
     """Download a large object from the object owner.
 
@@ -470,52 +520,50 @@ def download_object(
         secure: use P2P private communication with the data owner
         optional: supress log messages
         abort_signal: for signaling abort
+        max_outstanding_requests: max number of requests in flight, if the consumer supports pipelining.
+            If not specified, use the "download_max_outstanding_requests" comm config var.
 
     Returns: None
 
     """
-    request = new_cell_message(
-        headers={},
-        payload={
-            _PropKey.REF_ID: ref_id,
-        },
-    )
+    if max_outstanding_requests is None:
+        max_outstanding_requests = CommConfigurator().get_download_max_outstanding_requests(
+            DEFAULT_MAX_OUTSTANDING_REQUESTS
+        )
 
-    while True:
-        reply = cell.send_request(
+    def _send(s: Optional[dict]) -> Message:
+        payload = {_PropKey.REF_ID: ref_id}
+        if s is not None:
+            payload[_PropKey.STATE] = s
+        return cell.send_request(
             channel=OBJ_DOWNLOADER_CHANNEL,
             target=from_fqcn,
             topic=OBJ_DOWNLOADER_TOPIC,
-            request=request,
+            request=new_cell_message(headers={}, payload=payload),
             timeout=per_request_timeout,
             secure=secure,
             optional=optional,
             abort_signal=abort_signal,
         )
 
+    request_state = None
+    while True:
+        reply = _send(request_state)
+
         if abort_signal and abort_signal.triggered:
             consumer.download_failed(ref_id, "download aborted")
             return
 
-        assert isinstance(reply, Message)
-        rc = reply.get_header(MessageHeaderKey.RETURN_CODE)
-        if rc != ReturnCode.OK:
-            consumer.download_failed(ref_id, f"error requesting data from {from_fqcn}: {rc}")
+        error, status, data, state = _parse_reply(reply, from_fqcn)
+        if error:
+            consumer.download_failed(ref_id, error)
             return
 
-        payload = reply.payload
-        assert isinstance(payload, dict)
-        status = payload.get(_PropKey.STATUS)
         if status == ProduceRC.EOF:
             consumer.download_completed(ref_id)
             return
-        elif status == ProduceRC.ERROR:
-            consumer.download_failed(ref_id, "producer error")
-            return
 
         # continue
-        data = payload.get(_PropKey.DATA)
-        state = payload.get(_PropKey.STATE)
         try:
             new_state = consumer.consume(ref_id, state, data)
         except Exception as ex:
@@ -530,5 +578,98 @@ def download_object(
             consumer.download_failed(ref_id, "download aborted")
             return
 
+        if max_outstanding_requests > 1:
+            pipeline_states = consumer.get_pipeline_states(ref_id, state)
+            if pipeline_states:
+                _download_pipelined(
+                    from_fqcn, ref_id, pipeline_states, max_outstanding_requests, _send, consumer, abort_signal
+                )
+                return
+
         # ask for more
-        request = new_cell_message(headers={}, payload={_PropKey.REF_ID: ref_id, _PropKey.STATE: new_state})
+        request_state = new_state
+
+
+def _parse_reply(reply: Message, from_fqcn: str) -> (Optional[str], Any, Any, Any):
+    """Parse the reply from the object owner.
+
+    Returns: a tuple of (error, status, data, state)
+
+    """
+    assert isinstance(reply, Message)
+    rc = reply.get_header(MessageHeaderKey.RETURN_CODE)
+    if rc != ReturnCode.OK:
+        return f"error requesting data from {from_fqcn}: {rc}", None, None, None
+
+    payload = reply.payload
+    assert isinstance(payload, dict)
+    status = payload.get(_PropKey.STATUS)
+    if status == ProduceRC.ERROR:
+        return "producer error", status, None, None
+    return None, status, payload.get(_PropKey.DATA), payload.get(_PropKey.STATE)
+
+
+def _download_pipelined(
+    from_fqcn: str,
+    ref_id: str,
+    states: List[dict],
+    max_outstanding_requests: int,
+    send_f,
+    consumer: Consumer,
+    abort_signal: Signal,
+):
+    """Send the requests of the states with up to max_outstanding_requests in flight, and consume the replies
+    in the order they are received. The request of the last state is sent after all others are done.
+    """
+    error = None
+    next_index = 0
+    pending = set()
+    last_index = len(states) - 1
+    while not error and (next_index < last_index or pending):
+        while next_index < last_index and len(pending) < max_outstanding_requests:
+            try:
+                pending.add(_request_pool.submit(send_f, states[next_index]))
+            except RuntimeError:
+                # the pool is shut down
+                error = "download aborted"
+                break
+            next_index += 1
+
+        if not pending:
+            break
+
+        done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+        for f in done:
+            if abort_signal and abort_signal.triggered:
+                error = "download aborted"
+                break
+
+            error, status, data, state = _parse_reply(f.result(), from_fqcn)
+            if error:
+                break
+
+            if status == ProduceRC.EOF:
+                error = "producer reached EOF before all data is received"
+                break
+
+            try:
+                consumer.consume(ref_id, state, data)
+            except Exception as ex:
+                error = f"exception when consuming data: {secure_format_exception(ex)}"
+                break
+
+    # wait for the outstanding requests
+    concurrent.futures.wait(pending)
+
+    if not error:
+        error, status, _, _ = _parse_reply(send_f(states[last_index]), from_fqcn)
+        if not error and status != ProduceRC.EOF:
+            error = "producer has more data than expected"
+
+    if abort_signal and abort_signal.triggered:
+        error = "download aborted"
+
+    if error:
+        consumer.download_failed(ref_id, error)
+    else:
+        consumer.download_completed(ref_id)
@@ -54,3 +54,4 @@ class StreamHeaderKey:
     STREAM_REQ_ID = STREAM_PREFIX + "ri"
     PAYLOAD_ENCODING = STREAM_PREFIX + "pe"
     OPTIONAL = STREAM_PREFIX + "op"
+    WINDOW = STREAM_PREFIX + "wn"
@@ -0,0 +1,281 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from nvflare.fuel.utils.zip_utils import normpath_for_zip
+
+# entries of the deploy data, which is a zip of the manifest and the blobs the site doesn't have
+MANIFEST_ENTRY = "manifest.json"
+BLOB_PREFIX = "blobs/"
+
+# name of the artifact cache dir in the workspace root of a site
+CACHE_DIR_NAME = ".app_cache"
+DEFAULT_CACHE_MAX_SIZE = 1024 * 1024 * 1024
+
+# number of app zips cached by the server
+DEFAULT_MAX_CACHED_APPS = 16
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class MissingArtifactsError(Exception):
+    def __init__(self, digests: List[str]):
+        super().__init__(f"missing {len(digests)} app artifacts in the cache")
+        self.digests = digests
+
+
+class AppPackage:
+    def __init__(self, files: Dict[str, bytes], dirs: Iterable[str] = ()):
+        """The files of an app, addressed by the hash of their content.
+
+        Args:
+            files: dict of the path of each file, relative to the app dir, to its content
+            dirs: paths of the dirs of the app, relative to the app dir
+        """
+        self.files = files
+        self.dirs = sorted(dirs)
+        self.manifest = {path: content_hash(data) for path, data in files.items()}
+        self.digest = content_hash(json.dumps(self.get_manifest(), sort_keys=True).encode("utf-8"))
+
+    def get_manifest(self) -> dict:
+        return {"files": self.manifest, "dirs": self.dirs}
+
+    def get_digests(self) -> Set[str]:
+        return set(self.manifest.values())
+
+    @staticmethod
+    def from_zip(data: bytes, folder: str = "") -> "AppPackage":
+        """Create the package from a zip.
+
+        Args:
+            data: the zip
+            folder: path of the app folder in the zip. The whole zip is the app if empty.
+        """
+        prefix = normpath_for_zip(folder).strip("/") + "/" if folder else ""
+        files = {}
+        dirs = []
+        with ZipFile(io.BytesIO(data), "r") as z:
+            for info in z.infolist():
+                name = info.filename
+                if not name.startswith(prefix) or len(name) == len(prefix):
+                    continue
+                path = name[len(prefix) :]
+                if info.is_dir():
+                    dirs.append(path.rstrip("/"))
+                else:
+                    files[path] = z.read(info)
+        return AppPackage(files, dirs)
+
+    def to_zip(self, compression=ZIP_DEFLATED) -> bytes:
+        """Create the zip of the app, with the same layout as zip_directory_to_bytes."""
+        bio = io.BytesIO()
+        with ZipFile(bio, "w", compression=compression) as z:
+            for path in self.dirs:
+                z.writestr(path + "/", b"")
+            for path, data in self.files.items():
+                z.writestr(path, data)
+        return bio.getvalue()
+
+    def make_deploy_data(self, known_digests: Set[str]) -> bytes:
+        """Create the deploy data for a site: the manifest, and the blobs that are not known to be in its cache."""
+        bio = io.BytesIO()
+        with ZipFile(bio, "w", compression=ZIP_DEFLATED) as z:
+            z.writestr(MANIFEST_ENTRY, json.dumps(self.get_manifest()))
+            sent = set(known_digests)
+            for path, digest in self.manifest.items():
+                if digest not in sent:
+                    z.writestr(BLOB_PREFIX + digest, self.files[path])
+                    sent.add(digest)
+        return bio.getvalue()
+
+
+class ArtifactCache:
+    def __init__(self, root_dir: str, max_size: int = DEFAULT_CACHE_MAX_SIZE):
+        """Local cache of app file contents of a site, keyed by the hash of the content.
+
+        The least recently used blobs are removed when the total size is over max_size.
+
+        Args:
+            root_dir: dir of the cache
+            max_size: max total size of the blobs in bytes
+        """
+        self.root_dir = root_dir
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _get_path(self, digest: str) -> str:
+        if len(digest) != 64 or not all(c in "0123456789abcdef" for c in digest):
+            raise ValueError(f"invalid digest '{digest}'")
+        return os.path.join(self.root_dir, digest[:2], digest)
+
+    def has(self, digest: str) -> bool:
+        return os.path.exists(self._get_path(digest))
+
+    def get(self, digest: str) -> Optional[bytes]:
+        path = self._get_path(digest)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        if content_hash(data) != digest:
+            # corrupted
+            os.remove(path)
+            return None
+        # the mtime is the time of the last use
+        os.utime(path)
+        return data
+
+    def put(self, data: bytes, digest: str = None) -> str:
+        """Add a blob to the cache.
+
+        Args:
+            data: content of the blob
+            digest: expected hash of the content, if known
+
+        Returns: hash of the content
+        """
+        actual = content_hash(data)
+        if digest and digest != actual:
+            raise ValueError(f"content doesn't match digest '{digest}'")
+
+        path = self._get_path(actual)
+        if os.path.exists(path):
+            os.utime(path)
+            return actual
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.root_dir)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        return actual
+
+    def put_package(self, package: AppPackage):
+        for path, digest in package.manifest.items():
+            self.put(package.files[path], digest)
+        self.evict()
+
+    def evict(self):
+        with self._lock:
+            blobs = []
+            total = 0
+            for entry in os.scandir(self.root_dir):
+                if not entry.is_dir():
+                    continue
+                for blob in os.scandir(entry.path):
+                    stat = blob.stat()
+                    blobs.append((stat.st_mtime, stat.st_size, blob.path))
+                    total += stat.st_size
+
+            for _, size, path in sorted(blobs):
+                if total <= self.max_size:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+
+    def load_package(self, deploy_data: bytes) -> AppPackage:
+        """Load the app package from the deploy data. The blobs in the deploy data are added to the cache.
+
+        Raises: MissingArtifactsError if any file is neither in the deploy data nor in the cache
+        """
+        with ZipFile(io.BytesIO(deploy_data), "r") as z:
+            manifest = json.loads(z.read(MANIFEST_ENTRY))
+            blobs = {}
+            for name in z.namelist():
+                if name.startswith(BLOB_PREFIX):
+                    digest = name[len(BLOB_PREFIX) :]
+                    blobs[digest] = z.read(name)
+                    self.put(blobs[digest], digest)
+
+        files = {}
+        missing = set()
+        for path, digest in manifest["files"].items():
+            data = blobs.get(digest)
+            if data is None:
+                data = self.get(digest)
+            if data is None:
+                missing.add(digest)
+            else:
+                files[path] = data
+        if missing:
+            raise MissingArtifactsError(sorted(missing))
+
+        self.evict()
+        return AppPackage(files, manifest["dirs"])
+
+
+class DeployArtifactManager:
+    def __init__(self, max_cached_apps: int = DEFAULT_MAX_CACHED_APPS):
+        """Server side of the app artifact cache.
+
+        It caches the zips of the most recently deployed app packages, and tracks the blobs in the cache of each
+        client, so that only the blobs a client doesn't have are sent to it.
+
+        Args:
+            max_cached_apps: max number of app zips to cache
+        """
+        self.max_cached_apps = max_cached_apps
+        self._zips = OrderedDict()
+        self._client_digests = {}
+        self._lock = threading.Lock()
+
+    def get_app_zip(self, package: AppPackage) -> bytes:
+        with self._lock:
+            data = self._zips.get(package.digest)
+            if data is not None:
+                self._zips.move_to_end(package.digest)
+                return data
+
+        data = package.to_zip()
+        with self._lock:
+            self._zips[package.digest] = data
+            while len(self._zips) > self.max_cached_apps:
+                self._zips.popitem(last=False)
+        return data
+
+    def get_deploy_data(self, package: AppPackage, client_name: str) -> Optional[bytes]:
+        """Get the deploy data of the package for the client.
+
+        Returns: the deploy data, or None if the client doesn't support the artifact cache (yet)
+        """
+        with self._lock:
+            known = self._client_digests.get(client_name)
+        if known is None:
+            return None
+        return package.make_deploy_data(known)
+
+    def deployed(self, client_name: str, package: AppPackage):
+        """Record that the client has all blobs of the package in its cache."""
+        with self._lock:
+            self._client_digests.setdefault(client_name, set()).update(package.get_digests())
+
+    def reset(self, client_name: str):
+        """Forget what's in the cache of the client, such as when it reports missing blobs."""
+        with self._lock:
+            self._client_digests.pop(client_name, None)
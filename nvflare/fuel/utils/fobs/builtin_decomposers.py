@@ -22,11 +22,13 @@ BUILTIN_DECOMPOSERS: set[str] = {
     "nvflare.apis.utils.decomposers.flare_decomposers.WorkspaceDecomposer",
     "nvflare.app_common.decomposers.common_decomposers.FLModelDecomposer",
     "nvflare.app_common.decomposers.common_decomposers.FLModelDecomposer",
+    "nvflare.app_common.decomposers.numpy_decomposers.FlatParamsDecomposer",
     "nvflare.app_common.decomposers.numpy_decomposers.Float32ScalarDecomposer",
     "nvflare.app_common.decomposers.numpy_decomposers.Float64ScalarDecomposer",
     "nvflare.app_common.decomposers.numpy_decomposers.Int32ScalarDecomposer",
     "nvflare.app_common.decomposers.numpy_decomposers.Int64ScalarDecomposer",
     "nvflare.app_common.decomposers.numpy_decomposers.NumpyArrayDecomposer",
+    "nvflare.app_common.decomposers.numpy_decomposers.SparseArrayDecomposer",
     "nvflare.app_common.statistics.statisitcs_objects_decomposer.BinDecomposer",
     "nvflare.app_common.statistics.statisitcs_objects_decomposer.BinRangeDecomposer",
     "nvflare.app_common.statistics.statisitcs_objects_decomposer.DataTypeDecomposer",
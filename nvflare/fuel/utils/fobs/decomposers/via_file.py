@@ -12,19 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import json
+import mmap
 import os
 import threading
 import time
 import uuid
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, List, Optional, Tuple
 
 from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey
+from nvflare.fuel.f3.connection import BytesAlike
+from nvflare.fuel.f3.streaming.buffer_downloader import BufferDownloader
 from nvflare.fuel.f3.streaming.file_downloader import FileDownloader
 from nvflare.fuel.utils import fobs
+from nvflare.fuel.utils.config_service import ConfigService
 from nvflare.fuel.utils.fobs.datum import Datum, DatumManager, DatumType
 from nvflare.fuel.utils.fobs.lobs import get_datum_dir
-from nvflare.fuel.utils.log_utils import get_obj_logger
+from nvflare.fuel.utils.log_utils import get_module_logger, get_obj_logger
 from nvflare.fuel.utils.msg_root_utils import subscribe_to_msg_root
 
 # if the file size for collected items is < _MIN_SIZE_FOR_FILE, they will be attached to the message.
@@ -32,22 +38,66 @@ _MIN_SIZE_FOR_FILE = 1024 * 1024 * 2
 
 _MIN_DOWNLOAD_TIMEOUT = 60  # allow at least 1 minute gap between download activities
 
+# config var to enable/disable streaming of items from memory. If disabled, items are always dumped to files.
+# It's disabled by default: the items are referenced, not copied, so the sender must not change them in place
+# (e.g. by the next training step) until all receivers have downloaded them.
+MEMORY_STREAM_CONFIG_VAR = "via_file_memory_stream"
+
+# config var to enable/disable memory-mapped loading of received items. If enabled, received items are backed by
+# datum files that are paged in lazily, instead of being fully resident in memory.
+MMAP_LOAD_CONFIG_VAR = "via_file_mmap_load"
+
+# config var to enable/disable publishing of items in shared memory. If enabled, items sent to receivers on the same
+# host are copied once into a shared memory segment per msg root, which every receiver maps copy-on-write.
+SHARED_MEMORY_CONFIG_VAR = "via_file_shared_memory"
+
+# value of SHARED_MEMORY_CONFIG_VAR for the decomposers created from now on, if the var is not configured
+_shared_memory_default = False
+
+# start offset of each item in a memory-mapped datum file is aligned to this
+_MMAP_ITEM_ALIGNMENT = 64
+
+
+def set_shared_memory_default(enabled: bool):
+    """Set whether the decomposers created from now on in this process publish items in shared memory, unless
+    SHARED_MEMORY_CONFIG_VAR is configured.
+
+    Args:
+        enabled: whether to publish items in shared memory by default
+    """
+    global _shared_memory_default
+    _shared_memory_default = enabled
+
 
 class _FileRefKey:
     LOCATION = "location"
     FILE_REF_ID = "file_ref_id"
     FQCN = "fqcn"
     FILE_META = "file_meta"
+    LAYOUT = "layout"
+    SHM_NAME = "shm_name"
 
 
 class _FileLocation:
     REMOTE_CELL = "remote_cell"
+    REMOTE_CELL_MEMORY = "remote_cell_memory"
+    SHARED_MEMORY = "shared_memory"
+
+
+class ItemLayoutKey:
+    """Keys of an item's entry in the layout used for memory streaming"""
+
+    ID = "id"
+    DTYPE = "dtype"
+    SHAPE = "shape"
+    SIZE = "size"
 
 
 class _CtxKey:
     MSG_ROOT_ID = "msg_root_id"
     MSG_ROOT_TTL = "msg_root_ttl"
     FILES = "files"  # files to be downloaded
+    BUFFERS = "buffers"  # in-memory buffers to be downloaded
     FINAL_CB_REGISTERED = "final_cb_registered"
 
 
@@ -82,6 +132,22 @@ class _DecomposeCtx:
         return len(self.target_items)
 
 
+class _SharedSegment:
+
+    def __init__(self, shm: shared_memory.SharedMemory, layout: List[dict], meta, items: list):
+        self.shm = shm
+        self.layout = layout
+        self.meta = meta
+
+        # keep the published items, so their ids are not reused while the segment is cached
+        self.items = items
+
+
+# shared memory segments published by this process: (msg_root_id, decomposer, item ids) => _SharedSegment
+_shared_segments = {}
+_shared_segments_lock = threading.Lock()
+
+
 class ViaFileDecomposer(fobs.Decomposer, ABC):
 
     def __init__(self):
@@ -90,7 +156,13 @@ class ViaFileDecomposer(fobs.Decomposer, ABC):
         self.decompose_ctx_key = f"{self.prefix}_dc"  # kept in fobs_ctx: each target type has its own DecomposeCtx
         self.items_key = f"{self.prefix}_items"  # in fobs_ctx: each target type has its own set of items
         self.file_downloader_class = FileDownloader
+        self.buffer_downloader_class = BufferDownloader
         self.min_size_for_file = _MIN_SIZE_FOR_FILE
+        self.memory_stream = ConfigService.get_bool_var(name=MEMORY_STREAM_CONFIG_VAR, default=False)
+        self.mmap_load = ConfigService.get_bool_var(name=MMAP_LOAD_CONFIG_VAR, default=False)
+        # the default is not passed to ConfigService, which would keep it as the value of the var
+        shared_memory = ConfigService.get_bool_var(name=SHARED_MEMORY_CONFIG_VAR)
+        self.shared_memory = _shared_memory_default if shared_memory is None else shared_memory
 
     def set_file_downloader_class(self, file_downloader_class):
         # used only for offline testing!
@@ -100,6 +172,15 @@ class ViaFileDecomposer(fobs.Decomposer, ABC):
         # used only for testing!
         self.min_size_for_file = size
 
+    def set_memory_stream(self, enabled: bool):
+        self.memory_stream = enabled
+
+    def set_mmap_load(self, enabled: bool):
+        self.mmap_load = enabled
+
+    def set_shared_memory(self, enabled: bool):
+        self.shared_memory = enabled
+
     @abstractmethod
     def dump_to_file(self, items: dict, path: str, fobs_ctx: dict) -> (Optional[str], Optional[dict]):
         """Dump the items to the file with the specified path
@@ -137,6 +218,66 @@ class ViaFileDecomposer(fobs.Decomposer, ABC):
         """
         pass
 
+    def load_from_mapped_file(self, path: str, buffer: memoryview, fobs_ctx: dict, meta: dict = None) -> Optional[dict]:
+        """Load target object items from the specified file as views of its memory mapping.
+
+        Args:
+            path: the absolute path to the file to be loaded.
+            buffer: the copy-on-write memory mapping of the whole file.
+            fobs_ctx: FOBS Context.
+            meta: meta info of the file.
+
+        Returns: a dict of target objects backed by the buffer, or None if the file cannot be mapped.
+
+        The items are paged in lazily when accessed. Changes to the items are not written back to the file.
+        The file is removed after all items are released. If None is returned, the file is loaded with
+        load_from_file instead.
+
+        The default implementation returns None.
+
+        """
+        return None
+
+    def dump_to_buffers(self, items: dict, fobs_ctx: dict) -> Optional[Tuple[List[dict], List[BytesAlike], dict]]:
+        """Get the raw buffers of the items so they can be streamed to the receiver from memory, without a file.
+
+        Args:
+            items: a dict of items of target object type to be sent
+            fobs_ctx: FOBS Context
+
+        Returns: a tuple of (layout, buffers, meta info), or None if memory streaming is not supported.
+
+        The layout is a list of dicts, one for each item, that is sent to the receiver to allocate the items
+        with new_items_from_layout. It must be JSON serializable, and should contain the ItemLayoutKey.SIZE of
+        each item to allow the receiver to back the items with a memory-mapped file. The buffers are the contiguous
+        raw bytes of the items, in the same order as the layout. The buffers are referenced, not copied, until they
+        are downloaded.
+
+        The default implementation returns None, so the items are always dumped to a file.
+
+        """
+        return None
+
+    def new_items_from_layout(
+        self, layout: List[dict], fobs_ctx: dict, meta: dict = None, storage: List[memoryview] = None
+    ) -> Tuple[dict, List[BytesAlike]]:
+        """Allocate the items described by the layout on the receiving side.
+
+        Args:
+            layout: the layout created by dump_to_buffers
+            fobs_ctx: FOBS Context
+            meta: meta info created by dump_to_buffers
+            storage: if provided, the memory of each item, in the order of the layout.
+
+        Returns: a tuple of (dict of allocated items, writable buffers of the items in the order of the layout).
+
+        The received bytes are written directly into the buffers. If storage is provided, the items must be
+        created as views of it instead of being allocated. The storage is a memory-mapped datum file, or a shared
+        memory segment that already holds the items.
+
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support memory streaming")
+
     def supported_dots(self):
         return [self.get_bytes_dot(), self.get_file_dot()]
 
@@ -226,7 +367,7 @@ class ViaFileDecomposer(fobs.Decomposer, ABC):
         self.logger.debug(f"ViaFile: created ref for target {target_id}: {item_id}")
         return item_id
 
-    def _create_download_tx(self, fobs_ctx: dict):
+    def _create_download_tx(self, fobs_ctx: dict, downloader_class, timeout_cb=None):
         msg_root_id, msg_root_ttl = self._determine_msg_root(fobs_ctx)
 
         if msg_root_ttl:
@@ -242,10 +383,10 @@ class ViaFileDecomposer(fobs.Decomposer, ABC):
         tx_id = None
         cell = fobs_ctx.get(fobs.FOBSContextKey.CELL)
         if cell:
-            tx_id = self.file_downloader_class.new_transaction(
+            tx_id = downloader_class.new_transaction(
                 cell=cell,
                 timeout=timeout,
-                timeout_cb=self._delete_download_tx,
+                timeout_cb=timeout_cb,
             )
 
         if msg_root_id:
@@ -294,8 +435,18 @@ class ViaFileDecomposer(fobs.Decomposer, ABC):
             mgr.set_error(f"exception creating datum in {type(self)}")
 
     def _create_datum(self, fobs_ctx: dict):
-        file_name, size, meta = self._create_file(fobs_ctx)
         cell = fobs_ctx.get(fobs.FOBSContextKey.CELL)
+        if cell and self.shared_memory:
+            datum = self._create_shared_memory_datum(fobs_ctx)
+            if datum:
+                return datum
+
+        if cell and self.memory_stream:
+            datum = self._create_memory_datum(fobs_ctx, cell)
+            if datum:
+                return datum
+
+        file_name, size, meta = self._create_file(fobs_ctx)
 
         if meta:
             use_file_dot = True
@@ -332,13 +483,119 @@ class ViaFileDecomposer(fobs.Decomposer, ABC):
             datum = Datum(datum_type=DatumType.TEXT, value=json.dumps(file_ref), dot=self.get_file_dot())
         return datum
 
+    def _create_memory_datum(self, fobs_ctx: dict, cell):
+        dc = fobs_ctx.get(self.decompose_ctx_key)
+        assert isinstance(dc, _DecomposeCtx)
+        try:
+            result = self.dump_to_buffers(dc.target_items, fobs_ctx)
+        except Exception as e:
+            self.logger.warning(f"cannot stream {dc.get_item_count()} items from memory, fall back to file: {e}")
+            return None
+
+        if not result:
+            return None
+
+        layout, buffers, meta = result
+        size = sum(memoryview(b).nbytes for b in buffers)
+        dc.set_file_size(size)
+        if size <= self.min_size_for_file:
+            # small enough to be attached to the message
+            return None
+
+        buffer_list = fobs_ctx.get(_CtxKey.BUFFERS)
+        if not buffer_list:
+            buffer_list = []
+            fobs_ctx[_CtxKey.BUFFERS] = buffer_list
+
+        ref_id = str(uuid.uuid4())
+        buffer_list.append((ref_id, buffers))
+
+        file_ref = {
+            _FileRefKey.LOCATION: _FileLocation.REMOTE_CELL_MEMORY,
+            _FileRefKey.FQCN: cell.get_fqcn(),
+            _FileRefKey.FILE_REF_ID: ref_id,
+            _FileRefKey.FILE_META: meta,
+            _FileRefKey.LAYOUT: layout,
+        }
+        self.logger.debug(f"created memory ref for {len(layout)} items of {self.__class__.__name__}: {size=}")
+        return Datum(datum_type=DatumType.TEXT, value=json.dumps(file_ref), dot=self.get_file_dot())
+
+    def _create_shared_memory_datum(self, fobs_ctx: dict):
+        msg_root_id, _ = self._determine_msg_root(fobs_ctx)
+        if not msg_root_id:
+            # the segment is released when the msg root is deleted
+            return None
+
+        dc = fobs_ctx.get(self.decompose_ctx_key)
+        assert isinstance(dc, _DecomposeCtx)
+
+        # the same items sent to many receivers (e.g. the task data broadcast to all clients) are published once
+        key = (msg_root_id, self.prefix, tuple((item_id, id(item)) for item_id, item in dc.target_items.items()))
+        with _shared_segments_lock:
+            segment = _shared_segments.get(key)
+            if not segment:
+                segment = self._publish_shared_memory(dc, fobs_ctx)
+                if not segment:
+                    return None
+                _shared_segments[key] = segment
+                subscribe_to_msg_root(msg_root_id=msg_root_id, cb=_release_shared_memory_on_msg_root, key=key)
+
+        dc.set_file_size(segment.shm.size)
+        file_ref = {
+            _FileRefKey.LOCATION: _FileLocation.SHARED_MEMORY,
+            _FileRefKey.SHM_NAME: segment.shm.name,
+            _FileRefKey.FILE_META: segment.meta,
+            _FileRefKey.LAYOUT: segment.layout,
+        }
+        self.logger.debug(f"created shared memory ref {segment.shm.name} for {len(segment.layout)} items")
+        return Datum(datum_type=DatumType.TEXT, value=json.dumps(file_ref), dot=self.get_file_dot())
+
+    def _publish_shared_memory(self, dc: _DecomposeCtx, fobs_ctx: dict) -> Optional[_SharedSegment]:
+        try:
+            result = self.dump_to_buffers(dc.target_items, fobs_ctx)
+        except Exception as e:
+            self.logger.warning(f"cannot publish {dc.get_item_count()} items in shared memory: {e}")
+            return None
+
+        if not result:
+            return None
+
+        layout, buffers, meta = result
+        placement = _get_item_placement(layout)
+        if not placement:
+            return None
+
+        offsets, total_size = placement
+        if sum(size for _, size in offsets) <= self.min_size_for_file:
+            # small enough to be attached to the message
+            return None
+
+        shm = shared_memory.SharedMemory(create=True, size=total_size)
+        for (offset, size), buffer in zip(offsets, buffers):
+            shm.buf[offset : offset + size] = memoryview(buffer).cast("B")
+        self.logger.debug(f"published {len(layout)} items in shared memory {shm.name} of {total_size} bytes")
+        return _SharedSegment(shm, layout, meta, list(dc.target_items.values()))
+
     def _finalize_download_tx(self, mgr: DatumManager):
         self.logger.debug("ViaFile: finalizing download tx")
         fobs_ctx = mgr.fobs_ctx
-        files = fobs_ctx.get(_CtxKey.FILES)
 
+        buffer_list = fobs_ctx.get(_CtxKey.BUFFERS)
+        if buffer_list:
+            download_tx_id = self._create_download_tx(fobs_ctx, self.buffer_downloader_class)
+            for ref_id, buffers in buffer_list:
+                self.logger.debug(f"ViaFile: adding {len(buffers)} buffers to downloader: {download_tx_id=}")
+                self.buffer_downloader_class.add_buffers(
+                    transaction_id=download_tx_id,
+                    buffers=buffers,
+                    ref_id=ref_id,
+                )
+
+        files = fobs_ctx.get(_CtxKey.FILES)
         if files:
-            download_tx_id = self._create_download_tx(fobs_ctx)
+            download_tx_id = self._create_download_tx(
+                fobs_ctx, self.file_downloader_class, timeout_cb=self._delete_download_tx
+            )
             for file_ref_id, file_name in files:
                 self.logger.debug(f"ViaFile: adding file to downloader: {download_tx_id=} {file_name=}")
                 self.file_downloader_class.add_file(
@@ -373,6 +630,12 @@ class ViaFileDecomposer(fobs.Decomposer, ABC):
         For file DOT, the data is in a file, and the location of the file is further specified:
             - If the location is local, then the file is on local file system;
             - If the location is remote_cell, then the file is on a remote cell, and needs to be downloaded.
+            - If the location is remote_cell_memory, then the items are downloaded from the memory of a remote cell.
+            - If the location is shared_memory, then the items are mapped copy-on-write from a shared memory segment
+              published by the sender on the same host.
+
+        If mmap_load is enabled, the received items are backed by memory-mapped datum files, which are removed
+        after the items are released.
 
         Args:
             datum: datum to be processed.
@@ -391,7 +654,15 @@ class ViaFileDecomposer(fobs.Decomposer, ABC):
             # data is in a file
             file_ref = json.loads(datum.value)
             location = file_ref.get(_FileRefKey.LOCATION)
-            if location == _FileLocation.REMOTE_CELL:
+            if location == _FileLocation.SHARED_MEMORY:
+                # items are views of the shared memory segment, without any copy
+                fobs_ctx[self.items_key] = self._map_items_from_shared_memory(fobs_ctx, file_ref)
+                return
+            elif location == _FileLocation.REMOTE_CELL_MEMORY:
+                # items are streamed from the memory of the remote cell into newly allocated items
+                fobs_ctx[self.items_key] = self._download_from_remote_cell_memory(fobs_ctx, file_ref)
+                return
+            elif location == _FileLocation.REMOTE_CELL:
                 # file is on remote cell - need to download it
                 file_path = self._download_from_remote_cell(manager.fobs_ctx, file_ref)
                 remove_after_loading = True
@@ -400,7 +671,11 @@ class ViaFileDecomposer(fobs.Decomposer, ABC):
                 raise RuntimeError(f"unsupported file location {location}")
 
             file_meta = file_ref.get(_FileRefKey.FILE_META, None)
-            items = self._load_items_from_file(file_path, remove_after_loading, fobs_ctx, file_meta)
+            items = None
+            if self.mmap_load:
+                items = self._load_items_from_mapped_file(file_path, fobs_ctx, file_meta)
+            if items is None:
+                items = self._load_items_from_file(file_path, remove_after_loading, fobs_ctx, file_meta)
         fobs_ctx[self.items_key] = items
 
     def recompose(self, data: Any, manager: DatumManager = None) -> Any:
@@ -445,8 +720,92 @@ class ViaFileDecomposer(fobs.Decomposer, ABC):
             os.remove(file_path)
         return items
 
-    def _download_from_remote_cell(self, fobs_ctx: dict, file_ref: dict):
-        self.logger.debug(f"trying to download_from_remote_cell for {file_ref=}")
+    def _load_items_from_mapped_file(self, file_path: str, fobs_ctx: dict, file_meta) -> Optional[dict]:
+        if os.path.getsize(file_path) == 0:
+            return None
+
+        mm, finalizer = _map_datum_file(file_path, mmap.ACCESS_COPY)
+        try:
+            items = self.load_from_mapped_file(file_path, memoryview(mm), fobs_ctx, file_meta)
+        except Exception as e:
+            self.logger.warning(f"cannot map file {file_path}, loading it instead: {e}")
+            items = None
+
+        if items is None:
+            # not mapped: the file will be loaded and removed by the caller
+            finalizer.detach()
+            return None
+
+        if not isinstance(items, dict):
+            self.logger.error(f"items loaded from mapped file should be dict but got {type(items)}")
+            items = {}
+        self.logger.debug(f"mapped {len(items)} items from file {file_path}")
+        return items
+
+    def _new_mapped_storage(self, layout: List[dict]) -> Optional[List[memoryview]]:
+        # create a datum file to back the items to be downloaded
+        placement = _get_item_placement(layout)
+        if not placement:
+            return None
+
+        offsets, total_size = placement
+
+        file_path = self._get_temp_file_name()
+        with open(file_path, "wb") as f:
+            f.truncate(total_size)
+
+        mm, _ = _map_datum_file(file_path, mmap.ACCESS_WRITE)
+        buffer = memoryview(mm)
+        self.logger.debug(f"created datum file {file_path} of {total_size} bytes for {len(layout)} items")
+        return [buffer[offset : offset + size] for offset, size in offsets]
+
+    def _map_items_from_shared_memory(self, fobs_ctx: dict, file_ref: dict) -> dict:
+        name = file_ref.get(_FileRefKey.SHM_NAME)
+        layout = file_ref.get(_FileRefKey.LAYOUT)
+        placement = _get_item_placement(layout) if isinstance(layout, list) else None
+        if not name or not placement:
+            self.logger.error(f"missing {_FileRefKey.SHM_NAME} or {_FileRefKey.LAYOUT} from shared memory ref")
+            raise RuntimeError("FOBS Protocol Error")
+
+        try:
+            buffer = memoryview(_map_shared_memory(name))
+        except OSError as e:
+            self.logger.error(f"cannot map shared memory {name}: {e}")
+            raise RuntimeError(f"failed to map shared memory {name}")
+
+        offsets, _ = placement
+        storage = [buffer[offset : offset + size] for offset, size in offsets]
+        items, _ = self.new_items_from_layout(layout, fobs_ctx, file_ref.get(_FileRefKey.FILE_META), storage)
+        self.logger.debug(f"mapped {len(items)} items from shared memory {name}")
+        return items
+
+    def _download_from_remote_cell_memory(self, fobs_ctx: dict, file_ref: dict) -> dict:
+        self.logger.debug(f"trying to download_from_remote_cell_memory for ref {file_ref.get(_FileRefKey.FILE_REF_ID)}")
+        cell, ref_id, fqcn, req_timeout, abort_signal = self._get_download_source(fobs_ctx, file_ref)
+
+        layout = file_ref.get(_FileRefKey.LAYOUT)
+        if not isinstance(layout, list):
+            self.logger.error(f"missing {_FileRefKey.LAYOUT} from memory ref {ref_id}")
+            raise RuntimeError("FOBS Protocol Error")
+
+        storage = self._new_mapped_storage(layout) if self.mmap_load else None
+        items, buffers = self.new_items_from_layout(layout, fobs_ctx, file_ref.get(_FileRefKey.FILE_META), storage)
+        err = self.buffer_downloader_class.download_buffers(
+            from_fqcn=fqcn,
+            ref_id=ref_id,
+            buffers=buffers,
+            per_request_timeout=req_timeout,
+            cell=cell,
+            abort_signal=abort_signal,
+        )
+        if err:
+            self.logger.error(f"failed to download items from {fqcn} for memory ref {ref_id}: {err}")
+            raise RuntimeError(f"failed to download items from {fqcn}")
+
+        self.logger.debug(f"downloaded {len(items)} items from memory of {fqcn}")
+        return items
+
+    def _get_download_source(self, fobs_ctx: dict, file_ref: dict):
         cell = fobs_ctx.get(fobs.FOBSContextKey.CELL)
         if not cell:
             self.logger.error("cannot download from remote cell since cell not available in fobs context")
@@ -464,6 +823,11 @@ class ViaFileDecomposer(fobs.Decomposer, ABC):
 
         req_timeout = fobs_ctx.get(fobs.FOBSContextKey.DOWNLOAD_REQ_TIMEOUT, 10.0)
         abort_signal = fobs_ctx.get(fobs.FOBSContextKey.ABORT_SIGNAL)
+        return cell, file_ref_id, fqcn, req_timeout, abort_signal
+
+    def _download_from_remote_cell(self, fobs_ctx: dict, file_ref: dict):
+        self.logger.debug(f"trying to download_from_remote_cell for {file_ref=}")
+        cell, file_ref_id, fqcn, req_timeout, abort_signal = self._get_download_source(fobs_ctx, file_ref)
 
         self.logger.debug(f"trying to download file: {file_ref_id=} {fqcn=}")
         err, file_path = self.file_downloader_class.download_file(
@@ -480,3 +844,79 @@ class ViaFileDecomposer(fobs.Decomposer, ABC):
         else:
             self.logger.debug(f"downloaded file to {file_path}")
         return file_path
+
+
+def _remove_datum_file(file_path: str):
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        get_module_logger(__name__).warning(f"cannot remove datum file {file_path}: {e}")
+
+
+def _get_item_placement(layout: List[dict]) -> Optional[Tuple[List[Tuple[int, int]], int]]:
+    """Place the items of the layout in one buffer, each at an aligned offset.
+
+    Returns: a tuple of (list of (offset, size) of each item, total size), or None if the layout doesn't have
+    the item sizes or the items are empty.
+
+    """
+    offsets = []
+    total_size = 0
+    for entry in layout:
+        size = entry.get(ItemLayoutKey.SIZE)
+        if not isinstance(size, int):
+            # the sender didn't provide item sizes
+            return None
+        offsets.append((total_size, size))
+        total_size += -(-size // _MMAP_ITEM_ALIGNMENT) * _MMAP_ITEM_ALIGNMENT
+
+    if total_size == 0:
+        return None
+    return offsets, total_size
+
+
+def _map_shared_memory(name: str) -> mmap.mmap:
+    """Map the shared memory segment copy-on-write.
+
+    The pages are shared by all receivers until they are changed: changes are private to the receiver.
+    The mapping is released when it is garbage collected, which happens only after all items backed by it
+    are released. It stays valid after the publisher removes the segment.
+
+    """
+    with _shared_segments_lock:
+        published_here = any(segment.shm.name == name for segment in _shared_segments.values())
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        if not published_here:
+            # the segment is owned by the publisher: don't let the resource tracker remove it when this process exits
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return mmap.mmap(shm._fd, shm.size, access=mmap.ACCESS_COPY)
+    finally:
+        shm.close()
+
+
+def _release_shared_memory_on_msg_root(msg_root_id: str, key):
+    # this CB is triggered when msg root is deleted: no more receivers will map the segment
+    with _shared_segments_lock:
+        segment = _shared_segments.pop(key, None)
+    if segment:
+        get_module_logger(__name__).debug(f"removing shared memory {segment.shm.name} of {msg_root_id=}")
+        segment.shm.close()
+        segment.shm.unlink()
+
+
+def _map_datum_file(file_path: str, access: int):
+    """Map the datum file into memory.
+
+    The file is removed when the mapping is garbage collected, which happens only after all items
+    backed by the mapping are released (e.g. after the aggregator is done with them).
+
+    Returns: a tuple of (mmap object, finalizer that removes the file)
+
+    """
+    with open(file_path, "r+b") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=access)
+    return mm, weakref.finalize(mm, _remove_datum_file, file_path)
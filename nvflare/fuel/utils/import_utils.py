@@ -33,8 +33,9 @@
 """
 Part of code is Adapted from from https://github.com/Project-MONAI/MONAI/blob/dev/monai/utils/module.py#L282
 """
+import sys
 from importlib import import_module
-from typing import Any, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 from nvflare.security.logging import secure_format_exception
 
@@ -192,3 +193,31 @@ def optional_import(
             raise self._exception
 
     return _LazyRaise(name), False
+
+
+def lazy_attributes(module_name: str, attributes: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List]]:
+    """
+    Makes the attributes of a module imported on first access, as described in PEP 562.
+    This keeps the import of a package cheap when its heavy attributes are not used.
+    Args:
+        module_name: name of the module that exposes the attributes, usually __name__.
+        attributes: dict of attribute name to the name of the module that defines it.
+    Returns:
+        The __getattr__ and __dir__ functions of the module.
+    Examples::
+        >>> __getattr__, __dir__ = lazy_attributes(__name__, {"FedJob": "nvflare.job_config.api"})
+    """
+
+    def __getattr__(name: str):
+        source = attributes.get(name)
+        if source is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(import_module(source), name)
+        # later accesses don't go through __getattr__
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[module_name])) | set(attributes))
+
+    return __getattr__, __dir__
@@ -31,6 +31,7 @@ class SpecialTaskName(object):
 
 class TaskConstant(object):
     WAIT_TIME = "__wait_time__"
+    LONG_POLL_TIME = "__long_poll_time__"
 
 
 class EngineConstant(object):
@@ -92,6 +93,11 @@ class RequestHeader(object):
     SUBMITTER_ROLE = ConnProps.SUBMITTER_ROLE
     REQUIRE_AUTHZ = "require_authz"
 
+    # in a deploy request: the body is the app manifest and the blobs the client doesn't have in its artifact cache
+    # in a deploy reply: the client supports the artifact cache
+    APP_ARTIFACTS = "app_artifacts"
+    APP_ARTIFACTS_MISSING = "app_artifacts_missing"
+
 
 class SysCommandTopic(object):
 
@@ -19,7 +19,6 @@ import sys
 from sys import platform
 
 from nvflare.fuel.utils.log_utils import LogMode
-from nvflare.private.fed.app.simulator.simulator_runner import SimulatorRunner
 from nvflare.private.fed.app.utils import version_check
 
 
@@ -28,7 +27,9 @@ def define_simulator_parser(simulator_parser):
     simulator_parser.add_argument("-w", "--workspace", type=str, help="WORKSPACE folder")
     simulator_parser.add_argument("-n", "--n_clients", type=int, help="number of clients")
     simulator_parser.add_argument("-c", "--clients", type=str, help="client names list")
-    simulator_parser.add_argument("-t", "--threads", type=int, help="number of parallel running clients")
+    simulator_parser.add_argument(
+        "-t", "--threads", type=int, help="number of parallel running clients, 0 for one per CPU core"
+    )
     simulator_parser.add_argument("-gpu", "--gpu", type=str, help="list of GPU Device Ids, comma separated")
     simulator_parser.add_argument(
         "-l",
@@ -47,6 +48,8 @@ def define_simulator_parser(simulator_parser):
 
 
 def run_simulator(simulator_args):
+    from nvflare.private.fed.app.simulator.simulator_runner import SimulatorRunner
+
     simulator = SimulatorRunner(
         job_folder=simulator_args.job_folder,
         workspace=simulator_args.workspace,
@@ -53,6 +53,7 @@ from nvflare.fuel.sec.audit import AuditService
 from nvflare.fuel.utils import log_utils
 from nvflare.fuel.utils.argument_utils import parse_vars
 from nvflare.fuel.utils.config_service import ConfigService
+from nvflare.fuel.utils.fobs.decomposers.via_file import set_shared_memory_default
 from nvflare.fuel.utils.gpu_utils import get_host_gpu_ids
 from nvflare.fuel.utils.log_utils import dynamic_log_config
 from nvflare.fuel.utils.network_utils import get_open_ports
@@ -196,6 +197,11 @@ class SimulatorRunner(FLComponent):
         if not os.path.exists(self.args.workspace):
             os.makedirs(self.args.workspace)
         os.chdir(self.args.workspace)
+
+        # the server and the clients run on this host: the task data sent to the clients is published once
+        # in shared memory, and mapped by each client process, instead of being streamed to each of them.
+        # Only the decomposers of this process are changed, and only if the user hasn't configured it.
+        set_shared_memory_default(True)
         nvflare_fobs_initialize()
         AuthorizationService.initialize(EmptyAuthorizer())
         AuditService.the_auditor = SimulatorAuditor()
@@ -226,6 +232,10 @@ class SimulatorRunner(FLComponent):
             if self.args.gpu is None and self.args.threads is None:
                 self.args.threads = 1
                 self.logger.warning("The number of threads is not provided. Set it to default: 1")
+            if self.args.threads == 0:
+                # one client process per CPU core
+                self.args.threads = min(os.cpu_count() or 1, len(self.client_names))
+                self.logger.info(f"Set the number of threads to the number of CPU cores: {self.args.threads}")
 
             if self.max_clients < len(self.client_names):
                 self.logger.error(
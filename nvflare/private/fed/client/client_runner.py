@@ -158,6 +158,7 @@ class ClientRunner(TBI):
         self.task_check_interval = self.get_positive_float_var(ConfigVarName.TASK_CHECK_INTERVAL, 5.0)
         self.job_heartbeat_interval = self.get_positive_float_var(ConfigVarName.JOB_HEARTBEAT_INTERVAL, 10.0)
         self.get_task_timeout = self.get_positive_float_var(ConfigVarName.GET_TASK_TIMEOUT, None)
+        self.get_task_long_poll_time = self.get_positive_float_var(ConfigVarName.GET_TASK_LONG_POLL_TIME, None)
         self.submit_task_result_timeout = self.get_positive_float_var(ConfigVarName.SUBMIT_TASK_RESULT_TIMEOUT, None)
         self._register_aux_message_handlers(engine)
         self.register_event_handler(EventType.TASK_ASSIGNMENT_SENT, self._handle_task_sent_event)
@@ -508,6 +509,10 @@ class ClientRunner(TBI):
         """
         default_task_fetch_interval = self.default_task_fetch_interval
         self.log_debug(fl_ctx, "fetching task from server ...")
+        if self.get_task_long_poll_time:
+            fl_ctx.set_prop(
+                FLContextKey.GET_TASK_LONG_POLL_TIME, self.get_task_long_poll_time, private=True, sticky=False
+            )
         task = self.engine.get_task_assignment(fl_ctx, self.get_task_timeout)
 
         if not task:
@@ -540,6 +545,9 @@ class ClientRunner(TBI):
         self.log_debug(fl_ctx, "firing event EventType.AFTER_SEND_TASK_RESULT")
         self.fire_event(EventType.AFTER_SEND_TASK_RESULT, fl_ctx)
 
+        if self.get_task_long_poll_time:
+            # the next request is held by the server until a task is available, so send it right away
+            task_fetch_interval = 0.0
         return task_fetch_interval, True
 
     def _send_task_result(self, result: Shareable, task_id: str, fl_ctx: FLContext):
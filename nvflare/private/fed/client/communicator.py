@@ -39,6 +39,7 @@ from nvflare.private.defs import (
     CellMessageHeaderKeys,
     ClientType,
     SpecialTaskName,
+    TaskConstant,
     new_cell_message,
 )
 from nvflare.private.fed.authenticator import Authenticator
@@ -353,6 +354,11 @@ class Communicator:
         if self.last_task_id:
             shareable.set_header(ServerCommandKey.LAST_TASK_ID, self.last_task_id)
 
+        # ask the server to hold the request until a task is available
+        long_poll_time = fl_ctx.get_prop(FLContextKey.GET_TASK_LONG_POLL_TIME)
+        if long_poll_time:
+            shareable.set_header(TaskConstant.LONG_POLL_TIME, long_poll_time)
+
         task_message = new_cell_message(
             {
                 CellMessageHeaderKeys.PROJECT_NAME: project_name,
@@ -364,6 +370,9 @@ class Communicator:
         if not timeout:
             timeout = self.timeout
 
+        if long_poll_time:
+            timeout += long_poll_time
+
         parent_fqcn = determine_parent_fqcn(self.client_config, fl_ctx)
         self.logger.debug(f"pulling task from parent FQCN: {parent_fqcn}")
 
@@ -15,10 +15,12 @@
 import json
 import os
 from typing import List
+from zipfile import ZIP_STORED
 
 from nvflare.apis.job_def import JobMetaKey
 from nvflare.apis.workspace import Workspace
 from nvflare.fuel.hci.proto import MetaStatusValue, make_meta
+from nvflare.fuel.utils.app_artifacts import CACHE_DIR_NAME, AppPackage, ArtifactCache, MissingArtifactsError
 from nvflare.fuel.utils.argument_utils import parse_vars
 from nvflare.lighter.utils import verify_folder_signature
 from nvflare.private.admin_defs import Message, error_reply, ok_reply
@@ -113,13 +115,35 @@ class DeployProcessor(RequestProcessor):
             if not verify_folder_signature(app_path, root_ca_path):
                 return error_reply(f"app {app_name} does not pass signature verification")
 
+        # the app files are cached by the hash of their content, so the server only sends the files not in the cache
+        workspace = Workspace(root_dir=engine.args.workspace, site_name=client_name)
+        cache = ArtifactCache(os.path.join(workspace.get_root_dir(), CACHE_DIR_NAME))
+        app_data = req.body
+        package = None
+        if req.get_header(RequestHeader.APP_ARTIFACTS):
+            try:
+                package = cache.load_package(app_data)
+            except MissingArtifactsError as e:
+                reply = error_reply(f"failed to deploy {app_name} to {client_name}: {e}")
+                reply.set_header(RequestHeader.APP_ARTIFACTS_MISSING, True)
+                return reply
+            app_data = package.to_zip(compression=ZIP_STORED)
+
         err = engine.deploy_app(
-            app_name=app_name, job_id=job_id, job_meta=job_meta, client_name=client_name, app_data=req.body
+            app_name=app_name, job_id=job_id, job_meta=job_meta, client_name=client_name, app_data=app_data
         )
         if err:
             return error_reply(err)
 
-        return ok_reply(body=f"deployed {app_name} to {client_name}")
+        reply = ok_reply(body=f"deployed {app_name} to {client_name}")
+        try:
+            if package is None:
+                cache.put_package(AppPackage.from_zip(app_data))
+            reply.set_header(RequestHeader.APP_ARTIFACTS, True)
+        except Exception:
+            # the app is deployed, only the cache is not updated
+            pass
+        return reply
 
 
 class DeleteRunNumberProcessor(RequestProcessor):
@@ -105,6 +105,13 @@ class JobCommandModule(CommandModule, CommandUtil, BinaryTransfer):
                     handler_func=self.list_jobs,
                     authz_func=self.command_authz_required,
                 ),
+                CommandSpec(
+                    name=AdminCommandNames.REBUILD_JOB_INDEX,
+                    description="rebuild the job meta index from the job store",
+                    usage=AdminCommandNames.REBUILD_JOB_INDEX,
+                    handler_func=self.rebuild_job_index,
+                    authz_func=self.command_authz_required,
+                ),
                 CommandSpec(
                     name=AdminCommandNames.GET_JOB_META,
                     description="get meta info of specified job",
@@ -366,6 +373,30 @@ class JobCommandModule(CommandModule, CommandUtil, BinaryTransfer):
 
         conn.append_success("")
 
+    def rebuild_job_index(self, conn: Connection, args: List[str]):
+        engine = conn.app_ctx
+        job_def_manager = engine.job_def_manager
+        if not isinstance(job_def_manager, JobDefManagerSpec):
+            raise TypeError(
+                f"job_def_manager in engine is not of type JobDefManagerSpec, but got {type(job_def_manager)}"
+            )
+
+        try:
+            with engine.new_context() as fl_ctx:
+                num_jobs = job_def_manager.rebuild_index(fl_ctx)
+        except Exception as e:
+            conn.append_error(
+                f"exception occurred: {secure_format_exception(e)}",
+                meta=make_meta(MetaStatusValue.INTERNAL_ERROR, f"exception {type(e)}"),
+            )
+            return
+
+        if num_jobs is None:
+            conn.append_string("Job meta index is not used.")
+        else:
+            conn.append_string(f"Job meta index rebuilt with {num_jobs} jobs.")
+        conn.append_success("", meta=make_meta(MetaStatusValue.OK))
+
     def delete_job(self, conn: Connection, args: List[str]):
         job = conn.get_prop(self.JOB)
         if not job:
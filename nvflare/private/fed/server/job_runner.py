@@ -26,6 +26,7 @@ from nvflare.apis.fl_context import FLContext
 from nvflare.apis.job_def import ALL_SITES, Job, JobMetaKey, RunStatus
 from nvflare.apis.job_scheduler_spec import DispatchInfo
 from nvflare.apis.workspace import Workspace
+from nvflare.fuel.utils.app_artifacts import DeployArtifactManager
 from nvflare.fuel.utils.argument_utils import parse_vars
 from nvflare.lighter.utils import verify_folder_signature
 from nvflare.private.admin_defs import Message, MsgHeader, ReturnCode
@@ -81,6 +82,7 @@ class JobRunner(FLComponent):
         self.scheduler = None
         self.running_jobs = {}
         self.lock = threading.Lock()
+        self.artifact_manager = DeployArtifactManager()
 
     def handle_event(self, event_type: str, fl_ctx: FLContext):
         if event_type == EventType.SYSTEM_START:
@@ -92,9 +94,11 @@ class JobRunner(FLComponent):
             self.stop()
 
     @staticmethod
-    def _make_deploy_message(job: Job, app_data, app_name, fl_ctx):
+    def _make_deploy_message(job: Job, app_data, app_name, fl_ctx, artifacts=False):
         message = Message(topic=TrainingTopic.DEPLOY, body=app_data)
         message.set_header(RequestHeader.REQUIRE_AUTHZ, "true")
+        if artifacts:
+            message.set_header(RequestHeader.APP_ARTIFACTS, True)
 
         message.set_header(RequestHeader.ADMIN_COMMAND, AdminCommandNames.SUBMIT_JOB)
         message.set_header(RequestHeader.JOB_ID, job.job_id)
@@ -124,11 +128,14 @@ class JobRunner(FLComponent):
         client_deploy_requests = {}
         client_token_to_name = {}
         client_token_to_reply = {}
+        client_token_to_app = {}
         deploy_detail = []
         fl_ctx.set_prop(FLContextKey.JOB_DEPLOY_DETAIL, deploy_detail)
 
         for app_name, participants in job.get_deployment().items():
-            app_data = job.get_application(app_name, fl_ctx)
+            # the zip of the same app content is cached
+            app_package = job.get_application_package(app_name, fl_ctx)
+            app_data = self.artifact_manager.get_app_zip(app_package)
             participants = extract_participants(participants)
 
             if len(participants) == 1 and participants[0].upper() == ALL_SITES:
@@ -183,8 +190,17 @@ class JobRunner(FLComponent):
                 for c in clients:
                     assert isinstance(c, Client)
                     client_token_to_name[c.token] = c.name
-                    client_deploy_requests[c.token] = message
                     client_token_to_reply[c.token] = None
+                    client_token_to_app[c.token] = (app_name, app_package, message)
+
+                    # clients with an artifact cache only get the manifest and the files they don't have
+                    deploy_data = self.artifact_manager.get_deploy_data(app_package, c.name)
+                    if deploy_data is None:
+                        client_deploy_requests[c.token] = message
+                    else:
+                        client_deploy_requests[c.token] = self._make_deploy_message(
+                            job, deploy_data, app_name, fl_ctx, artifacts=True
+                        )
 
                 display_sites = ",".join(client_sites)
                 self.log_info(
@@ -201,6 +217,9 @@ class JobRunner(FLComponent):
             client_token_to_reply = admin_server.send_requests_and_get_reply_dict(
                 client_deploy_requests, timeout_secs=admin_server.timeout
             )
+            client_token_to_reply = self._handle_artifact_replies(
+                client_token_to_reply, client_token_to_name, client_token_to_app, admin_server, fl_ctx
+            )
 
             # check replies and see whether required clients are okay
             for client_token, reply in client_token_to_reply.items():
@@ -234,6 +253,40 @@ class JobRunner(FLComponent):
         self.fire_event(EventType.JOB_DEPLOYED, fl_ctx)
         return run_number, failed_clients
 
+    def _handle_artifact_replies(
+        self, client_token_to_reply, client_token_to_name, client_token_to_app, admin_server, fl_ctx: FLContext
+    ):
+        """Track the artifact caches of the clients, and resend the full app to the clients missing artifacts.
+
+        Returns: the replies, with the replies of the resent requests
+        """
+        resend_requests = {}
+        for client_token, reply in client_token_to_reply.items():
+            if not isinstance(reply, Message):
+                continue
+            client_name = client_token_to_name[client_token]
+            app_name, app_package, full_message = client_token_to_app[client_token]
+            if reply.get_header(RequestHeader.APP_ARTIFACTS_MISSING):
+                self.log_info(
+                    fl_ctx, f"resend app {app_name} to {client_name} due to missing artifacts", fire_event=False
+                )
+                self.artifact_manager.reset(client_name)
+                resend_requests[client_token] = full_message
+            elif reply.get_header(RequestHeader.APP_ARTIFACTS):
+                self.artifact_manager.deployed(client_name, app_package)
+
+        if resend_requests:
+            resend_replies = admin_server.send_requests_and_get_reply_dict(
+                resend_requests, timeout_secs=admin_server.timeout
+            )
+            for client_token, reply in resend_replies.items():
+                if isinstance(reply, Message) and reply.get_header(RequestHeader.APP_ARTIFACTS):
+                    self.artifact_manager.deployed(
+                        client_token_to_name[client_token], client_token_to_app[client_token][1]
+                    )
+            client_token_to_reply.update(resend_replies)
+        return client_token_to_reply
+
     def _start_run(self, job_id: str, job: Job, client_sites: Dict[str, DispatchInfo], fl_ctx: FLContext):
         """Start the application
 
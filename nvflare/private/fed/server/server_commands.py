@@ -160,6 +160,9 @@ class GetTaskCommand(CommandProcessor, ServerStateCheck):
         client = data.get_header(ServerCommandKey.FL_CLIENT)
         self.logger.debug(f"Got the GET_TASK request from client: {client.name}")
         fl_ctx.set_peer_context(shared_fl_ctx)
+        long_poll_time = data.get_header(TaskConstant.LONG_POLL_TIME)
+        if long_poll_time:
+            fl_ctx.set_prop(FLContextKey.GET_TASK_LONG_POLL_TIME, long_poll_time, private=True, sticky=False)
         server_runner = fl_ctx.get_prop(FLContextKey.RUNNER)
         if not server_runner:
             # this is possible only when the client request is received before the
@@ -18,8 +18,9 @@ import time
 from nvflare.apis.client import Client
 from nvflare.apis.event_type import EventType
 from nvflare.apis.fl_component import FLComponent
-from nvflare.apis.fl_constant import FilterKey, FLContextKey, ReservedKey, ReservedTopic, ReturnCode
+from nvflare.apis.fl_constant import ConfigVarName, FilterKey, FLContextKey, ReservedKey, ReservedTopic, ReturnCode
 from nvflare.apis.fl_context import FLContext
+from nvflare.apis.impl.wf_comm_server import WFCommServer
 from nvflare.apis.server_engine_spec import ServerEngineSpec
 from nvflare.apis.shareable import ReservedHeaderKey, Shareable, make_reply
 from nvflare.apis.signal import Signal
@@ -34,6 +35,16 @@ from nvflare.private.privacy_manager import Scope
 from nvflare.security.logging import secure_format_exception
 from nvflare.widgets.info_collector import GroupInfoCollector, InfoCollector
 
+# held getTask requests check the tasks at least this often, for conditions not signaled as task changes
+_LONG_POLL_RECHECK_INTERVAL = 1.0
+
+
+class _LongPollStatsKey:
+    HELD = "held"
+    REJECTED = "rejected"
+    GOT_TASK = "got_task"
+    POLLS_SAVED = "polls_saved"
+
 
 class ServerRunnerConfig(object):
     def __init__(
@@ -103,6 +114,17 @@ class ServerRunner(TBI):
         self.current_wf_index = 0
         self.status = "init"
         self.turn_to_cold = False
+
+        self.max_long_poll_time = self.get_positive_float_var(ConfigVarName.MAX_GET_TASK_LONG_POLL_TIME, 30.0)
+        self.max_long_polls = self.get_positive_int_var(ConfigVarName.MAX_GET_TASK_LONG_POLLS, 32)
+        self.long_poll_lock = threading.Lock()
+        self.num_long_polls = 0  # number of getTask requests being held
+        self.long_poll_stats = {
+            _LongPollStatsKey.HELD: 0,
+            _LongPollStatsKey.REJECTED: 0,
+            _LongPollStatsKey.GOT_TASK: 0,
+            _LongPollStatsKey.POLLS_SAVED: 0,
+        }
         self._register_aux_message_handler(engine)
 
     def _register_aux_message_handler(self, engine):
@@ -239,9 +261,16 @@ class ServerRunner(TBI):
 
                 with self.wf_lock:
                     if self.current_wf:
+                        with self.long_poll_lock:
+                            long_poll_stats = dict(self.long_poll_stats)
                         collector.set_info(
                             group_name="ServerRunner",
-                            info={"job_id": self.job_id, "status": self.status, "workflow": self.current_wf.id},
+                            info={
+                                "job_id": self.job_id,
+                                "status": self.status,
+                                "workflow": self.current_wf.id,
+                                "task_long_polls": long_poll_stats,
+                            },
                         )
         elif event_type == EventType.FATAL_SYSTEM_ERROR:
             fl_ctx.set_prop(key=FLContextKey.FATAL_SYSTEM_ERROR, value=True, private=True, sticky=True)
@@ -249,11 +278,39 @@ class ServerRunner(TBI):
             self.log_error(fl_ctx, "Aborting current RUN due to FATAL_SYSTEM_ERROR received: {}".format(reason))
             self.abort(fl_ctx)
 
-    def _task_try_again(self) -> (str, str, Shareable):
+    def _task_try_again(self, held_time: float = 0.0) -> (str, str, Shareable):
+        # a request that was held already waited for part of the interval
         task_data = Shareable()
-        task_data.set_header(TaskConstant.WAIT_TIME, self.config.task_request_interval)
+        task_data.set_header(TaskConstant.WAIT_TIME, max(0.0, self.config.task_request_interval - held_time))
         return SpecialTaskName.TRY_AGAIN, "", task_data
 
+    def _reserve_long_poll(self, fl_ctx: FLContext) -> float:
+        """Determine how long to hold the task request of the client.
+
+        Returns: the time to hold the request. 0 if the request should not be held.
+        """
+        long_poll_time = fl_ctx.get_prop(FLContextKey.GET_TASK_LONG_POLL_TIME)
+        if not isinstance(long_poll_time, (int, float)) or long_poll_time <= 0:
+            return 0.0
+
+        with self.long_poll_lock:
+            if self.num_long_polls >= self.max_long_polls:
+                # held requests occupy request threads, so their number is limited
+                self.long_poll_stats[_LongPollStatsKey.REJECTED] += 1
+                return 0.0
+            self.num_long_polls += 1
+        return min(long_poll_time, self.max_long_poll_time)
+
+    def _release_long_poll(self, held_time: float, got_task: bool):
+        with self.long_poll_lock:
+            self.num_long_polls -= 1
+            self.long_poll_stats[_LongPollStatsKey.HELD] += 1
+            if got_task:
+                self.long_poll_stats[_LongPollStatsKey.GOT_TASK] += 1
+
+            # the client would have sent a request every task_request_interval
+            self.long_poll_stats[_LongPollStatsKey.POLLS_SAVED] += int(held_time / self.config.task_request_interval)
+
     def process_task_request(self, client: Client, fl_ctx: FLContext) -> (str, str, Shareable):
         """Process task request from a client.
 
@@ -298,13 +355,18 @@ class ServerRunner(TBI):
             return SpecialTaskName.END_RUN, "", None
 
         try:
-            task_name, task_id, task_data = self._try_to_get_task(
-                # client, fl_ctx, self.config.task_request_timeout, self.config.task_retry_interval
-                client,
-                fl_ctx,
-            )
+            long_poll_time = self._reserve_long_poll(fl_ctx)
+            start_time = time.time()
+            task_name = None
+            try:
+                task_name, task_id, task_data = self._try_to_get_task(client, fl_ctx, long_poll_time)
+            finally:
+                held_time = time.time() - start_time
+                if long_poll_time:
+                    self._release_long_poll(held_time, bool(task_name) and task_name != SpecialTaskName.TRY_AGAIN)
+
             if not task_name or task_name == SpecialTaskName.TRY_AGAIN:
-                return self._task_try_again()
+                return self._task_try_again(held_time)
 
             # filter task data
             self.log_debug(fl_ctx, "firing event EventType.BEFORE_TASK_DATA_FILTER")
@@ -342,6 +404,10 @@ class ServerRunner(TBI):
             return self._task_try_again()
 
     def _try_to_get_task(self, client, fl_ctx, timeout=None, retry_interval=0.005):
+        """Try to get a task for the client.
+
+        If timeout is specified, the request is held until a task is available or the timeout is reached.
+        """
         start = time.time()
         while True:
             with self.wf_lock:
@@ -349,6 +415,12 @@ class ServerRunner(TBI):
                     self.log_debug(fl_ctx, "no current workflow - asked client to try again later")
                     return "", "", None
 
+                communicator = self.current_wf.controller.communicator
+                task_change_seq = None
+                if isinstance(communicator, WFCommServer):
+                    # get the seq before checking the tasks, so no change is missed while waiting
+                    task_change_seq = communicator.get_task_change_seq()
+
                 self.log_debug(fl_ctx, "firing event EventType.BEFORE_PROCESS_TASK_REQUEST")
                 self.fire_event(EventType.BEFORE_PROCESS_TASK_REQUEST, fl_ctx)
                 task_name, task_id, task_data = self.current_wf.controller.communicator.process_task_request(
@@ -382,10 +454,14 @@ class ServerRunner(TBI):
 
                     return task_name, task_id, task_data
 
-            if timeout is None or time.time() - start > timeout:
+            remaining = timeout - (time.time() - start) if timeout else 0.0
+            if remaining <= 0.0 or self.status == "done" or self.abort_signal.triggered:
                 break
 
-            time.sleep(retry_interval)
+            if task_change_seq is None:
+                time.sleep(retry_interval)
+            else:
+                communicator.wait_for_task_change(task_change_seq, min(remaining, _LONG_POLL_RECHECK_INTERVAL))
 
         # ask client to retry
         return "", "", None
@@ -49,6 +49,7 @@ COMMAND_CATEGORIES = {
     AC.SET_TIMEOUT: CommandCategory.OPERATE,
     AC.CALL: CommandCategory.OPERATE,
     AC.CONFIGURE_SITE_LOG: CommandCategory.OPERATE,
+    AC.REBUILD_JOB_INDEX: CommandCategory.OPERATE,
     AC.SHELL_CAT: CommandCategory.SHELL_COMMANDS,
     AC.SHELL_GREP: CommandCategory.SHELL_COMMANDS,
     AC.SHELL_HEAD: CommandCategory.SHELL_COMMANDS,
@@ -0,0 +1,109 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+import subprocess
+import sys
+from typing import List, NamedTuple
+
+IMPORT_TIME_PREFIX = "import time:"
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_secs: float
+    cumulative_secs: float
+    depth: int
+
+
+def parse_import_times(output: str) -> List[ImportRecord]:
+    """Parse the output of "python -X importtime".
+
+    Args:
+        output: the stderr of the python process
+
+    Returns: the import records, in the order the imports finished
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        fields = line[len(IMPORT_TIME_PREFIX) :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # the header line
+            continue
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        # each level of nested imports is indented by 2 spaces
+        depth = (len(name) - len(module) - 1) // 2
+        records.append(ImportRecord(module, int(fields[0]) / 1e6, int(fields[1]) / 1e6, depth))
+    return records
+
+
+def profile_imports(module: str) -> List[ImportRecord]:
+    """Import a module in a new python process, and get the import time of every module it imports.
+
+    Args:
+        module: name of the module to import
+
+    Returns: the import records of the module and all modules it imports
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"failed to import {module}: {result.stderr.strip().splitlines()[-1:]}")
+    return parse_import_times(result.stderr)
+
+
+def get_import_secs(records: List[ImportRecord], module: str) -> float:
+    """Get the cumulative import time of a module. It includes its parent packages, which are imported first."""
+    for r in records:
+        if r.module == module:
+            return r.cumulative_secs
+    return 0.0
+
+
+def define_import_time_parser(parser):
+    parser.add_argument("module", type=str, nargs="?", default="nvflare", help="module to import")
+    parser.add_argument("-n", "--top", type=int, default=30, help="number of modules to show")
+    parser.add_argument("-s", "--sort", choices=["cumulative", "self"], default="cumulative", help="sort order")
+    parser.add_argument("-a", "--all", action="store_true", help="show all modules, not only nvflare modules")
+
+
+def show_import_time(args):
+    records = profile_imports(args.module)
+    nvflare_records = [r for r in records if r.module.split(".")[0] == "nvflare"]
+    print(f"import {args.module}: {get_import_secs(records, args.module):.3f} secs")
+    print(f"{len(records)} modules imported by the process, {len(nvflare_records)} from nvflare")
+
+    if not args.all:
+        records = nvflare_records
+    key = (lambda r: r.cumulative_secs) if args.sort == "cumulative" else (lambda r: r.self_secs)
+    records = sorted(records, key=key, reverse=True)[: args.top]
+
+    width = max([len(r.module) for r in records] + [len("module")])
+    print(f"{'module':<{width}}  {'self (ms)':>10}  {'cumulative (ms)':>15}")
+    for r in records:
+        print(f"{r.module:<{width}}  {r.self_secs * 1000:>10.1f}  {r.cumulative_secs * 1000:>15.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser("nvflare import time")
+    define_import_time_parser(parser)
+    args = parser.parse_args()
+    show_import_time(args)
+
+
+if __name__ == "__main__":
+    main()
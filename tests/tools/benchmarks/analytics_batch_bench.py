@@ -0,0 +1,85 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import time
+
+from nvflare.apis.analytix import AnalyticsBatch, AnalyticsData, AnalyticsDataType, LogWriterName
+from nvflare.apis.dxo import from_shareable
+from nvflare.apis.utils.analytix_utils import create_analytic_dxo
+from nvflare.app_common.widgets.streaming import AnalyticsBatcher
+from nvflare.fuel.utils import fobs
+
+"""
+This tool measures the analytics messages of sites that log scalars at every step, sent one record per message
+vs. coalesced into batches by AnalyticsBatcher.
+
+It reports the number of messages, the serialized bytes, the sender time (creating and serializing the messages)
+and the receiver time (deserializing the messages and decoding the records).
+
+The following args are supported,
+
+    -s: Number of sites. Default is 100
+    -n: Number of steps logged by each site. Default is 200
+    -k: Number of scalars logged at each step. Default is 2
+    -b: Comma separated batch sizes. Default is 1,16,64,256
+"""
+
+
+def _run(sites, steps, keys, batch_size):
+    messages = []
+    start = time.perf_counter()
+    for _ in range(sites):
+        if batch_size == 1:
+            for step in range(steps):
+                for k in range(keys):
+                    dxo = create_analytic_dxo(f"metric_{k}", 0.5, AnalyticsDataType.SCALAR, global_step=step)
+                    messages.append(fobs.dumps(dxo.to_shareable()))
+        else:
+            batcher = AnalyticsBatcher(lambda d: messages.append(fobs.dumps(d.to_shareable())), batch_size, 0)
+            for step in range(steps):
+                for k in range(keys):
+                    data = AnalyticsData(
+                        f"metric_{k}", 0.5, AnalyticsDataType.SCALAR, LogWriterName.TORCH_TB, global_step=step
+                    )
+                    batcher.add(data)
+            batcher.flush()
+    send_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    records = 0
+    for msg in messages:
+        records += len(AnalyticsBatch.get_records(from_shareable(fobs.loads(msg))))
+    receive_time = time.perf_counter() - start
+    assert records == sites * steps * keys
+    return len(messages), sum(len(m) for m in messages), send_time, receive_time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sites", "-s", type=int, default=100)
+    parser.add_argument("--steps", "-n", type=int, default=200)
+    parser.add_argument("--keys", "-k", type=int, default=2)
+    parser.add_argument("--batch_sizes", "-b", type=str, default="1,16,64,256")
+    args = parser.parse_args()
+
+    print(f"{args.sites} sites, {args.steps} steps, {args.keys} scalars per step")
+    print(f"{'batch size':>10} {'messages':>10} {'MB':>8} {'send (s)':>9} {'receive (s)':>12}")
+    for batch_size in [int(b) for b in args.batch_sizes.split(",")]:
+        count, size, send_time, receive_time = _run(args.sites, args.steps, args.keys, batch_size)
+        print(f"{batch_size:>10} {count:>10} {size / 1e6:>8.2f} {send_time:>9.3f} {receive_time:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import statistics
+import sys
+
+from nvflare.tool.import_time import get_import_secs, profile_imports
+
+"""
+This tool checks the import time of a module against a budget. It exits with 1 if the median import time
+is over the budget, or if any of the modules that should be loaded lazily is imported.
+
+The following args are supported,
+
+    -m: Module to import. Default is nvflare.client
+    -b: Budget of the median import time in secs. Default is 0.3
+    -r: Number of runs. Default is 5
+    -x: Comma separated module prefixes that must not be imported. Default is the job config, the simulator
+        and the cellnet stacks
+"""
+
+DEFAULT_EXCLUDED = ",".join(
+    [
+        "nvflare.job_config",
+        "nvflare.private.fed.app.simulator",
+        "nvflare.fuel.f3.cellnet",
+        "nvflare.client.ipc",
+    ]
+)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", "-m", type=str, default="nvflare.client")
+    parser.add_argument("--budget", "-b", type=float, default=0.3)
+    parser.add_argument("--runs", "-r", type=int, default=5)
+    parser.add_argument("--excluded", "-x", type=str, default=DEFAULT_EXCLUDED)
+    args = parser.parse_args()
+
+    times = []
+    records = []
+    for _ in range(args.runs):
+        records = profile_imports(args.module)
+        times.append(get_import_secs(records, args.module))
+    median = statistics.median(times)
+    print(f"import {args.module}: median {median:.3f} secs, min {min(times):.3f}, max {max(times):.3f}")
+
+    failed = False
+    if median > args.budget:
+        print(f"FAILED: over the budget of {args.budget:.3f} secs")
+        failed = True
+
+    excluded = [p for p in args.excluded.split(",") if p]
+    imported = sorted({r.module for r in records if any(r.module.startswith(p) for p in excluded)})
+    if imported:
+        print(f"FAILED: modules that should be loaded lazily are imported: {imported}")
+        failed = True
+
+    if failed:
+        sys.exit(1)
+    print("PASSED")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+import os
+import time
+
+import numpy as np
+
+from nvflare.apis.fl_context import FLContext
+from nvflare.app_opt.pt.quantization.cpu_dequantizer import CPUModelDequantizer
+from nvflare.app_opt.pt.quantization.cpu_quantizer import CPUModelQuantizer
+
+"""
+This tool measures the CPU quantization filters (CPUModelQuantizer and CPUModelDequantizer) on a float32 model.
+
+For each quantization type, it reports the compression ratio (quantized size with the quantization states / original
+size), the quantization and dequantization throughput in MB of the original model per second, the throughput per
+core used (min of the worker threads and the CPUs), and the mean relative error.
+
+The following args are supported,
+
+    -k: Number of layers (keys) in the model. Default is 64
+    -e: Number of elements in each layer. Default is 1M
+    -w: Comma separated numbers of worker threads. Default is 1,4
+    -q: Comma separated quantization types. Default is float16,blockwise8,float4,normfloat4
+
+"""
+
+ONE_MB = 1024 * 1024
+
+
+def _nbytes(params: dict, quant_state: dict) -> int:
+    size = sum(v.nbytes for v in params.values())
+    for state in quant_state.values():
+        size += sum(v.nbytes for v in state.values() if isinstance(v, np.ndarray))
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", "-k", type=int, help="number of keys", default=64)
+    parser.add_argument("--elements", "-e", type=int, help="number of elements per key", default=1024 * 1024)
+    parser.add_argument("--workers", "-w", type=str, help="numbers of worker threads", default="1,4")
+    parser.add_argument(
+        "--types", "-q", type=str, help="quantization types", default="float16,blockwise8,float4,normfloat4"
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    model = {f"layer{i}": rng.standard_normal(args.elements).astype(np.float32) for i in range(args.keys)}
+    model_bytes = sum(v.nbytes for v in model.values())
+    model_mb = model_bytes / ONE_MB
+    fl_ctx = FLContext()
+
+    print(f"keys={args.keys} elements={args.elements} model={model_mb:.1f}MB cpus={os.cpu_count()}")
+    for quantization_type in args.types.split(","):
+        for num_workers in [int(n) for n in args.workers.split(",")]:
+            cores = min(num_workers, os.cpu_count())
+            quantizer = CPUModelQuantizer(quantization_type=quantization_type, num_workers=num_workers)
+            dequantizer = CPUModelDequantizer(num_workers=num_workers)
+
+            start = time.perf_counter()
+            params, quant_state, source_datatype = quantizer.quantization(dict(model), fl_ctx)
+            quantize_time = time.perf_counter() - start
+            ratio = _nbytes(params, quant_state) / model_bytes
+
+            start = time.perf_counter()
+            params = dequantizer.dequantization(params, quant_state, quantization_type, source_datatype, fl_ctx)
+            dequantize_time = time.perf_counter() - start
+
+            error = np.mean([np.abs(params[k] - v).mean() / np.abs(v).mean() for k, v in model.items()])
+            quantize_rate = model_mb / quantize_time
+            dequantize_rate = model_mb / dequantize_time
+            print(
+                f"{quantization_type:>10} workers={num_workers}: ratio={ratio:.3f}"
+                f" quantize={quantize_rate:.0f}MB/s ({quantize_rate / cores:.0f}MB/s per core)"
+                f" dequantize={dequantize_rate:.0f}MB/s ({dequantize_rate / cores:.0f}MB/s per core)"
+                f" error={error:.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the model broadcast to the clients of the simulator.
+
+By default, the simulator is run end to end with "-t 0" (one client process per CPU core) on a small numpy job:
+ScatterAndGather with NPTrainer clients, and a global model of --size_mb MB. Each number of clients is run
+twice, with the task data published once in shared memory (NVFLARE_VIA_FILE_SHARED_MEMORY=true) and streamed to
+each client (NVFLARE_VIA_FILE_SHARED_MEMORY=false), and the wall-clock time of SimulatorRunner.run() is reported.
+
+    python tests/tools/benchmarks/simulator_broadcast_bench.py -c 8,32,128 -s 8 -r 3
+
+With --micro, only the hand-off of the model to the clients is measured instead, in a pool of processes: the
+model is either sent to each client process (a copy per client, as when it is streamed), or published once in
+shared memory by the ViaFileDecomposer and mapped by each client.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from nvflare.app_common.decomposers.numpy_decomposers import NumpyArrayDecomposer
+from nvflare.fuel.utils.fobs.decomposers.via_file import _CtxKey, _DecomposeCtx
+from nvflare.fuel.utils.msg_root_utils import delete_msg_root
+
+SHARED_MEMORY_ENV_VAR = "NVFLARE_VIA_FILE_SHARED_MEMORY"
+
+# the line printed by the simulator process with the duration of the run
+_RESULT_PREFIX = "SIMULATOR_BENCH_RESULT="
+
+_decomposer = NumpyArrayDecomposer()
+
+
+def _make_model(size_mb: int, num_layers: int) -> dict:
+    layer_size = size_mb * 1024 * 1024 // 4 // num_layers
+    return {f"layer{i}": np.random.rand(layer_size).astype(np.float32) for i in range(num_layers)}
+
+
+def _train(items: dict) -> float:
+    return float(sum(v.sum(dtype=np.float64) for v in items.values()))
+
+
+def _run_client_with_copy(payload) -> float:
+    layout, buffers = payload
+    items, new_buffers = _decomposer.new_items_from_layout(layout, {})
+    for src, dst in zip(buffers, new_buffers):
+        dst[:] = np.frombuffer(src, dtype=np.uint8)
+    return _train(items)
+
+
+def _run_client_with_shared_memory(file_ref: str) -> float:
+    return _train(_decomposer._map_items_from_shared_memory({}, json.loads(file_ref)))
+
+
+def _bench_copy(pool, model: dict, num_clients: int) -> float:
+    start = time.perf_counter()
+    layout, buffers, _ = _decomposer.dump_to_buffers(model, {})
+    payload = (layout, [b.tobytes() for b in buffers])
+    pool.map(_run_client_with_copy, [payload] * num_clients, chunksize=1)
+    return time.perf_counter() - start
+
+
+def _bench_shared_memory(pool, model: dict, num_clients: int, round_num: int) -> float:
+    start = time.perf_counter()
+    msg_root_id = f"bench_round_{num_clients}_{round_num}"
+    dc = _DecomposeCtx()
+    for v in model.values():
+        dc.add_item(v)
+
+    # the server serializes the task for each client: the model is published once
+    refs = []
+    for _ in range(num_clients):
+        datum = _decomposer._create_shared_memory_datum(
+            {_decomposer.decompose_ctx_key: dc, _CtxKey.MSG_ROOT_ID: msg_root_id}
+        )
+        if not datum:
+            raise RuntimeError(f"model of {sum(v.nbytes for v in model.values())} bytes not published in shared memory")
+        refs.append(datum.value)
+    pool.map(_run_client_with_shared_memory, refs, chunksize=1)
+    duration = time.perf_counter() - start
+
+    # the task is done
+    delete_msg_root(msg_root_id)
+    return duration
+
+
+def _make_job(root: str, num_clients: int, size_mb: int, rounds: int) -> str:
+    model_dir = os.path.join(root, "model")
+    os.makedirs(model_dir)
+    np.save(os.path.join(model_dir, "model.npy"), np.random.rand(size_mb * 1024 * 1024 // 4).astype(np.float32))
+
+    job_folder = os.path.join(root, f"numpy_bench_{num_clients}")
+    config_dir = os.path.join(job_folder, "app", "config")
+    os.makedirs(config_dir)
+    meta = {"name": "numpy_bench", "resource_spec": {}, "min_clients": num_clients, "deploy_map": {"app": ["@ALL"]}}
+    server_config = {
+        "format_version": 2,
+        "components": [
+            {
+                "id": "persistor",
+                "path": "nvflare.app_common.np.np_model_persistor.NPModelPersistor",
+                # an absolute model dir is used as is
+                "args": {"model_dir": model_dir, "model_name": "model.npy"},
+            },
+            {
+                "id": "shareable_generator",
+                "path": "nvflare.app_common.shareablegenerators.full_model_shareable_generator."
+                "FullModelShareableGenerator",
+                "args": {},
+            },
+            {
+                "id": "aggregator",
+                "path": "nvflare.app_common.aggregators.intime_accumulate_model_aggregator."
+                "InTimeAccumulateWeightedAggregator",
+                "args": {"expected_data_kind": "WEIGHTS"},
+            },
+        ],
+        "workflows": [
+            {
+                "id": "scatter_and_gather",
+                "path": "nvflare.app_common.workflows.scatter_and_gather.ScatterAndGather",
+                "args": {
+                    "min_clients": num_clients,
+                    "num_rounds": rounds,
+                    "wait_time_after_min_received": 0,
+                    "aggregator_id": "aggregator",
+                    "persistor_id": "persistor",
+                    "shareable_generator_id": "shareable_generator",
+                    "train_task_name": "train",
+                },
+            }
+        ],
+    }
+    client_config = {
+        "format_version": 2,
+        "executors": [{"tasks": ["train"], "executor": {"path": "nvflare.app_common.np.np_trainer.NPTrainer"}}],
+    }
+    for name, config in [
+        (os.path.join(job_folder, "meta.json"), meta),
+        (os.path.join(config_dir, "config_fed_server.json"), server_config),
+        (os.path.join(config_dir, "config_fed_client.json"), client_config),
+    ]:
+        with open(name, "w") as f:
+            json.dump(config, f, indent=2)
+    return job_folder
+
+
+def _simulate(job_folder: str, workspace: str, num_clients: int):
+    """Run the simulator in this process, and print the duration of the run."""
+    from nvflare.private.fed.app.simulator.simulator_runner import SimulatorRunner
+
+    runner = SimulatorRunner(
+        job_folder=job_folder,
+        workspace=workspace,
+        n_clients=num_clients,
+        threads=0,
+        max_clients=max(num_clients, 100),
+    )
+    start = time.perf_counter()
+    run_status = runner.run()
+    print(f"{_RESULT_PREFIX}{json.dumps({'secs': time.perf_counter() - start, 'status': run_status})}", flush=True)
+
+
+def _bench_simulator(root: str, job_folder: str, num_clients: int, shared_memory: bool, round_num: int) -> float:
+    workspace = os.path.join(root, f"workspace_{num_clients}_{shared_memory}_{round_num}")
+    env = dict(os.environ)
+    env[SHARED_MEMORY_ENV_VAR] = "true" if shared_memory else "false"
+    # a new process for each run, with its own environment
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--simulate", job_folder, workspace, str(num_clients)],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    for line in proc.stdout.splitlines():
+        if line.startswith(_RESULT_PREFIX):
+            result = json.loads(line[len(_RESULT_PREFIX) :])
+            if result["status"]:
+                raise RuntimeError(f"simulator failed with status {result['status']}, see {workspace}")
+            return result["secs"]
+    raise RuntimeError(f"simulator failed:\n{proc.stdout[-2000:]}")
+
+
+def main_simulator(args):
+    cpus = os.cpu_count() or 1
+    print(f"model: {args.size_mb} MB, rounds: {args.rounds}, CPU cores: {cpus}, runs: {args.repeats}")
+    print(f"{'clients':>8}  {'streamed (s)':>12}  {'shared memory (s)':>18}  {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as root:
+        for num_clients in [int(c) for c in args.clients.split(",")]:
+            job_root = os.path.join(root, str(num_clients))
+            job_folder = _make_job(job_root, num_clients, args.size_mb, args.rounds)
+            streamed_secs = 0.0
+            shm_secs = 0.0
+            for r in range(args.repeats):
+                streamed_secs += _bench_simulator(job_root, job_folder, num_clients, False, r)
+                shm_secs += _bench_simulator(job_root, job_folder, num_clients, True, r)
+            streamed_secs /= args.repeats
+            shm_secs /= args.repeats
+            print(
+                f"{num_clients:>8}  {streamed_secs:>12.3f}  {shm_secs:>18.3f}  {streamed_secs / shm_secs:>7.2f}x",
+                flush=True,
+            )
+
+
+def main_micro(args):
+    processes = args.processes or os.cpu_count() or 1
+    model = _make_model(args.size_mb, args.layers)
+    print(f"model: {args.size_mb} MB in {args.layers} layers, client processes: {processes}, rounds: {args.rounds}")
+    print(f"{'clients':>8}  {'copy (s)':>10}  {'shared memory (s)':>18}  {'speedup':>8}")
+    with Pool(processes) as pool:
+        for num_clients in [int(c) for c in args.clients.split(",")]:
+            copy_secs = 0.0
+            shm_secs = 0.0
+            for r in range(args.rounds):
+                copy_secs += _bench_copy(pool, model, num_clients)
+                shm_secs += _bench_shared_memory(pool, model, num_clients, r)
+            copy_secs /= args.rounds
+            shm_secs /= args.rounds
+            print(f"{num_clients:>8}  {copy_secs:>10.3f}  {shm_secs:>18.3f}  {copy_secs / shm_secs:>7.1f}x")
+
+
+def main():
+    if len(sys.argv) == 5 and sys.argv[1] == "--simulate":
+        _simulate(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+        return
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-c", "--clients", type=str, default="8,32,128", help="comma separated numbers of clients")
+    parser.add_argument("-s", "--size_mb", type=int, default=8, help="model size in MB")
+    parser.add_argument("-r", "--rounds", type=int, default=3, help="number of rounds")
+    parser.add_argument("-n", "--repeats", type=int, default=1, help="number of runs of the simulator to average")
+    parser.add_argument("--micro", action="store_true", help="only measure the hand-off of the model to the clients")
+    parser.add_argument("-l", "--layers", type=int, default=16, help="number of layers of the model, with --micro")
+    parser.add_argument("-p", "--processes", type=int, default=0, help="client processes with --micro, 0 for CPU cores")
+    args = parser.parse_args()
+
+    if args.micro:
+        main_micro(args)
+    else:
+        main_simulator(args)
+
+
+if __name__ == "__main__":
+    main()
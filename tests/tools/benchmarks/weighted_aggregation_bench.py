@@ -0,0 +1,110 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+
+from nvflare.app_common.aggregators.weighted_aggregation_helper import WeightedAggregationHelper
+
+"""
+This tool compares the in-place WeightedAggregationHelper with the previous implementation, which
+allocated two new arrays for every key of every contribution under one global lock.
+
+The following args are supported,
+
+    -k: Number of layers (keys) in the model. Default is 500
+    -e: Number of elements in each layer. Default is 50000
+    -c: Number of contributions (clients). Default is 100
+    -t: Number of threads adding the contributions concurrently. Default is 1
+
+"""
+
+
+class LegacyWeightedAggregationHelper:
+    """The previous implementation of WeightedAggregationHelper"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.total = {}
+        self.counts = {}
+
+    def add(self, data, weight, contributor_name, contribution_round):
+        with self.lock:
+            for k, v in data.items():
+                weighted_value = v * weight
+                current_total = self.total.get(k, None)
+                if current_total is None:
+                    self.total[k] = weighted_value
+                    self.counts[k] = weight
+                else:
+                    self.total[k] = current_total + weighted_value
+                    self.counts[k] = self.counts[k] + weight
+
+    def get_result(self):
+        with self.lock:
+            return {k: v * (1.0 / self.counts[k]) for k, v in self.total.items()}
+
+
+def _run(helper, contributions, num_threads: int):
+    def _add(indices):
+        for i in indices:
+            helper.add(contributions[i], 1.0 + i % 5, f"site-{i}", 0)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    threads = [
+        threading.Thread(target=_add, args=(range(t, len(contributions), num_threads),)) for t in range(num_threads)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    result = helper.get_result()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", "-k", type=int, help="number of keys", default=500)
+    parser.add_argument("--elements", "-e", type=int, help="number of elements per key", default=50000)
+    parser.add_argument("--contributions", "-c", type=int, help="number of contributions", default=100)
+    parser.add_argument("--threads", "-t", type=int, help="number of threads", default=1)
+    args = parser.parse_args()
+
+    # contributions share the arrays to keep the memory of the benchmark itself small
+    rng = np.random.default_rng(0)
+    layers = [rng.standard_normal(args.elements).astype(np.float32) for _ in range(args.keys)]
+    model = {f"layer{i}": layers[i] for i in range(args.keys)}
+    contributions = [model] * args.contributions
+
+    legacy_result, legacy_time, legacy_peak = _run(LegacyWeightedAggregationHelper(), contributions, args.threads)
+    result, new_time, new_peak = _run(WeightedAggregationHelper(), contributions, args.threads)
+    for k, v in legacy_result.items():
+        assert np.allclose(v, result[k], rtol=1e-4)
+
+    model_mb = args.keys * args.elements * 4 / 1024 / 1024
+    print(f"keys={args.keys} elements={args.elements} contributions={args.contributions} threads={args.threads}")
+    print(f"legacy:   {legacy_time:.2f}s peak={legacy_peak / 1024 / 1024:.1f}MB (model={model_mb:.1f}MB)")
+    print(f"in-place: {new_time:.2f}s peak={new_peak / 1024 / 1024:.1f}MB (model={model_mb:.1f}MB)")
+    print(f"speedup={legacy_time / new_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+import threading
+import time
+import uuid
+
+from nvflare.apis.client import Client
+from nvflare.apis.controller_spec import Task
+from nvflare.apis.fl_context import FLContextManager
+from nvflare.apis.impl.wf_comm_server import WFCommServer
+from nvflare.apis.shareable import Shareable
+from nvflare.apis.signal import Signal
+
+"""
+This tool measures the round latency of WFCommServer with many simulated clients.
+
+In each round, a task is broadcast to all clients with broadcast_and_wait. Each simulated client asks for a task
+once every poll interval, and submits its result as soon as it gets the task. The round latency is the time
+from the broadcast to the return of broadcast_and_wait.
+
+Two modes are compared,
+
+    legacy: Waiters and the task monitor poll every task_check_period, and every task request scans all tasks
+    event: Waiters are woken up by submissions, and task requests only check the tasks of the client
+
+The following args are supported,
+
+    -n: Number of simulated clients. Default is 1000
+    -r: Number of rounds. Default is 5
+    -b: Number of standing background tasks that target other clients. Default is 100
+    -p: Poll interval of each client in seconds. Default is 0.1
+    -w: Number of threads that run the simulated clients. Default is 8
+    -c: task_check_period of the server in seconds. Default is 0.2
+
+"""
+
+
+class LegacyWFCommServer(WFCommServer):
+    """WFCommServer with the previous polling loops and linear task scan"""
+
+    def _get_eligible_tasks(self, client_name: str):
+        return self._tasks
+
+    def _monitor_tasks(self):
+        while not self._all_done:
+            self._check_dead_clients()
+            self.check_tasks()
+            time.sleep(self._task_check_period)
+
+    def wait_for_task(self, task: Task, abort_signal: Signal):
+        task.props["___done"] = False
+        task.task_done_cb = self._process_finished_task(task=task, func=task.task_done_cb)
+        while task.completion_status is None and not task.props["___done"]:
+            time.sleep(self._task_check_period)
+
+
+class _BenchEngine:
+    def __init__(self, clients):
+        self.clients = clients
+        self.context_manager = FLContextManager(engine=self, identity_name="server", job_id="bench")
+
+    def get_clients(self):
+        return self.clients
+
+    def new_context(self):
+        return self.context_manager.new_context()
+
+
+class _ClientRunner:
+    def __init__(self, server: WFCommServer, engine: _BenchEngine, clients, poll_interval: float):
+        self.server = server
+        self.engine = engine
+        self.clients = clients
+        self.poll_interval = poll_interval
+        self.request_time = 0.0
+        self.request_count = 0
+        self.stopped = False
+
+    def run(self):
+        fl_ctx = self.engine.new_context()
+        next_poll = {c.name: 0.0 for c in self.clients}
+        while not self.stopped:
+            busy = False
+            for client in self.clients:
+                now = time.perf_counter()
+                if next_poll[client.name] > now:
+                    continue
+
+                busy = True
+                task_name, task_id, _ = self.server.process_task_request(client, fl_ctx)
+                self.request_time += time.perf_counter() - now
+                self.request_count += 1
+                if task_name:
+                    self.server.process_submission(client, task_name, task_id, Shareable(), fl_ctx)
+                    # ask for the next task right away, as a client does after submitting a result
+                    next_poll[client.name] = now
+                else:
+                    next_poll[client.name] = now + self.poll_interval
+
+            if not busy:
+                time.sleep(0.001)
+
+
+def _run(server_class, args) -> (float, float):
+    clients = [Client(f"site-{i}", str(uuid.uuid4())) for i in range(args.num_clients)]
+    engine = _BenchEngine(clients)
+    server = server_class(task_check_period=args.check_period)
+    fl_ctx = engine.new_context()
+    server.initialize_run(fl_ctx)
+
+    for i in range(args.background_tasks):
+        server.send(Task(name=f"background_{i}", data=Shareable()), fl_ctx, targets=[f"other-{i}"])
+
+    runners = [_ClientRunner(server, engine, clients[i :: args.workers], args.poll) for i in range(args.workers)]
+    threads = [threading.Thread(target=r.run, daemon=True) for r in runners]
+    for t in threads:
+        t.start()
+
+    latencies = []
+    for i in range(args.rounds):
+        task = Task(name=f"round_{i}", data=Shareable())
+        start = time.perf_counter()
+        server.broadcast_and_wait(task, fl_ctx, targets=None, min_responses=args.num_clients)
+        latencies.append(time.perf_counter() - start)
+
+    for r in runners:
+        r.stopped = True
+    for t in threads:
+        t.join()
+    server.finalize_run(fl_ctx)
+
+    request_time = sum(r.request_time for r in runners) / max(1, sum(r.request_count for r in runners))
+    return sum(latencies) / len(latencies), request_time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_clients", "-n", type=int, help="number of simulated clients", default=1000)
+    parser.add_argument("--rounds", "-r", type=int, help="number of rounds", default=5)
+    parser.add_argument("--background_tasks", "-b", type=int, help="number of background tasks", default=100)
+    parser.add_argument("--poll", "-p", type=float, help="poll interval of clients", default=0.1)
+    parser.add_argument("--workers", "-w", type=int, help="number of client threads", default=8)
+    parser.add_argument("--check_period", "-c", type=float, help="task_check_period of server", default=0.2)
+    args = parser.parse_args()
+
+    print(
+        f"clients={args.num_clients} rounds={args.rounds} background_tasks={args.background_tasks} "
+        f"poll={args.poll}s check_period={args.check_period}s"
+    )
+    for mode, server_class in [("legacy", LegacyWFCommServer), ("event", WFCommServer)]:
+        latency, request_time = _run(server_class, args)
+        print(f"{mode}: round latency={latency * 1000:.1f}ms task request={request_time * 1e6:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
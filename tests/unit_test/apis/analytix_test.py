@@ -14,9 +14,10 @@
 
 import pytest
 
-from nvflare.apis.analytix import AnalyticsData, AnalyticsDataType, LogWriterName, TrackConst
-from nvflare.apis.dxo import DXO, DataKind
+from nvflare.apis.analytix import AnalyticsBatch, AnalyticsData, AnalyticsDataType, LogWriterName, TrackConst
+from nvflare.apis.dxo import DXO, DataKind, from_shareable
 from nvflare.apis.utils.analytix_utils import create_analytic_dxo
+from nvflare.fuel.utils import fobs
 
 FROM_DXO_TEST_CASES = [
     ("hello", 3.0, 1, AnalyticsDataType.SCALAR),
@@ -105,3 +106,37 @@ class TestAnalytix:
     def test_from_dxo_invalid(self, dxo, expected_error, expected_msg):
         with pytest.raises(expected_error, match=expected_msg):
             _ = AnalyticsData.from_dxo(dxo)
+
+    def test_batch(self):
+        batch = AnalyticsBatch(LogWriterName.TORCH_TB)
+        batch.add(AnalyticsData(key="loss", value=0.5, data_type=AnalyticsDataType.SCALAR, global_step=1))
+        batch.add(AnalyticsData(key="acc", value={"a": 1.0}, data_type=AnalyticsDataType.SCALARS))
+        batch.add_dxo(create_analytic_dxo("note", "text", AnalyticsDataType.TEXT, global_step=2, path="/tmp/"))
+        assert len(batch) == 3
+
+        dxo = batch.to_dxo()
+        assert AnalyticsBatch.is_batch(dxo)
+        assert dxo.data[TrackConst.TRACK_KEY] == ["loss", "acc", "note"]
+        # the batch goes through the wire as a shareable
+        dxo = from_shareable(fobs.loads(fobs.dumps(dxo.to_shareable())))
+
+        records = AnalyticsBatch.get_records(dxo)
+        assert [(r.tag, r.value, r.data_type, r.step) for r in records] == [
+            ("loss", 0.5, AnalyticsDataType.SCALAR, 1),
+            ("acc", {"a": 1.0}, AnalyticsDataType.SCALARS, None),
+            ("note", "text", AnalyticsDataType.TEXT, 2),
+        ]
+        assert records[2].path == "/tmp/"
+
+        # converted to the syntax of the receiver
+        records = AnalyticsBatch.get_records(dxo, receiver=LogWriterName.MLFLOW)
+        assert [r.data_type for r in records] == [
+            AnalyticsDataType.METRIC,
+            AnalyticsDataType.METRICS,
+            AnalyticsDataType.TEXT,
+        ]
+
+        # a single record
+        single = create_analytic_dxo("loss", 0.5, AnalyticsDataType.SCALAR)
+        assert not AnalyticsBatch.is_batch(single)
+        assert [r.tag for r in AnalyticsBatch.get_records(single)] == ["loss"]
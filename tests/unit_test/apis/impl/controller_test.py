@@ -109,7 +109,7 @@ def get_ready(thread, sleep_time=0.1):
     time.sleep(sleep_time)
 
 
-def _setup_system(num_clients=1):
+def _setup_system(num_clients=1, task_check_period=0.2):
     clients_list = [create_client(f"__test_client{i}") for i in range(num_clients)]
     mock_server_engine = Mock(spec=ServerEngineSpec)
     context_manager = FLContextManager(
@@ -124,7 +124,7 @@ def _setup_system(num_clients=1):
 
     controller = DummyController()
     fl_ctx = mock_server_engine.new_context()
-    communicator = WFCommServer()
+    communicator = WFCommServer(task_check_period=task_check_period)
     controller.set_communicator(communicator)
     controller.initialize(fl_ctx)
     controller.communicator.initialize_run(fl_ctx=fl_ctx)
@@ -137,8 +137,10 @@ class TestController:
     ALL_APIS = NO_RELAY + RELAY
 
     @staticmethod
-    def setup_system(num_of_clients=1):
-        controller, server_engine, fl_ctx, clients_list = _setup_system(num_clients=num_of_clients)
+    def setup_system(num_of_clients=1, task_check_period=0.2):
+        controller, server_engine, fl_ctx, clients_list = _setup_system(
+            num_clients=num_of_clients, task_check_period=task_check_period
+        )
         return controller, fl_ctx, clients_list
 
     @staticmethod
@@ -2193,3 +2195,87 @@ class TestSendBehavior(TestController):
         assert task.completion_status == TaskCompletionStatus.OK
         launch_thread.join()
         self.teardown_system(controller, fl_ctx)
+
+
+class TestEventDrivenDispatch(TestController):
+    # the period is long enough that the tests fail if waiters rely on polling
+    TASK_CHECK_PERIOD = 10.0
+
+    @pytest.mark.parametrize("method", ["broadcast_and_wait", "send_and_wait", "relay_and_wait"])
+    def test_wait_returns_on_submission(self, method):
+        controller, fl_ctx, clients = self.setup_system(task_check_period=self.TASK_CHECK_PERIOD)
+        client = clients[0]
+        task = create_task("__test_task")
+        launch_thread = threading.Thread(
+            target=launch_task,
+            kwargs={
+                "controller": controller,
+                "task": task,
+                "method": method,
+                "fl_ctx": fl_ctx,
+                "kwargs": {"targets": [client]},
+            },
+        )
+        get_ready(launch_thread)
+
+        task_name, client_task_id, _ = controller.communicator.process_task_request(client, fl_ctx)
+        assert task_name == "__test_task"
+        start = time.time()
+        controller.communicator.process_submission(
+            client=client, task_name=task_name, task_id=client_task_id, fl_ctx=fl_ctx, result=Shareable()
+        )
+        launch_thread.join(timeout=self.TASK_CHECK_PERIOD / 2)
+        assert not launch_thread.is_alive()
+        assert time.time() - start < 1.0
+        assert task.completion_status == TaskCompletionStatus.OK
+        self.teardown_system(controller, fl_ctx)
+
+    def test_wait_returns_on_cancel(self):
+        controller, fl_ctx, clients = self.setup_system(task_check_period=self.TASK_CHECK_PERIOD)
+        task = create_task("__test_task")
+        launch_thread = threading.Thread(
+            target=launch_task,
+            kwargs={
+                "controller": controller,
+                "task": task,
+                "method": "broadcast_and_wait",
+                "fl_ctx": fl_ctx,
+                "kwargs": {"targets": clients},
+            },
+        )
+        get_ready(launch_thread)
+
+        controller.cancel_task(task=task)
+        launch_thread.join(timeout=self.TASK_CHECK_PERIOD / 2)
+        assert not launch_thread.is_alive()
+        assert task.completion_status == TaskCompletionStatus.CANCELLED
+        self.teardown_system(controller, fl_ctx)
+
+    def test_client_only_checks_eligible_tasks(self):
+        controller, fl_ctx, clients = self.setup_system(num_of_clients=3)
+        communicator = controller.communicator
+        task1 = create_task("__test_task1")
+        task2 = create_task("__test_task2")
+        task3 = create_task("__test_task3")
+        controller.send(task=task1, fl_ctx=fl_ctx, targets=[clients[0]])
+        controller.relay(task=task2, fl_ctx=fl_ctx, targets=[clients[1]], dynamic_targets=True)
+        controller.broadcast(task=task3, fl_ctx=fl_ctx, targets=[clients[0], clients[1]])
+
+        with communicator._task_lock:
+            assert list(communicator._get_eligible_tasks(clients[0].name)) == [task1, task2, task3]
+            assert list(communicator._get_eligible_tasks(clients[1].name)) == [task2, task3]
+            assert list(communicator._get_eligible_tasks(clients[2].name)) == [task2]
+
+        controller.cancel_task(task=task1)
+        controller.cancel_task(task=task2)
+        communicator.check_tasks()
+        with communicator._task_lock:
+            assert list(communicator._get_eligible_tasks(clients[0].name)) == [task3]
+            assert list(communicator._get_eligible_tasks(clients[2].name)) == []
+
+        # the client that is not a target still gets nothing
+        task_name, _, _ = communicator.process_task_request(clients[2], fl_ctx)
+        assert task_name == ""
+        task_name, _, _ = communicator.process_task_request(clients[1], fl_ctx)
+        assert task_name == "__test_task3"
+        self.teardown_system(controller, fl_ctx)
@@ -20,9 +20,10 @@ from unittest import mock
 
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.impl.job_def_manager import SimpleJobDefManager
-from nvflare.apis.job_def import JobMetaKey
+from nvflare.apis.job_def import JobMetaKey, RunStatus, job_from_meta
 from nvflare.apis.storage import WORKSPACE
 from nvflare.app_common.storages.filesystem_storage import FilesystemStorage
+from nvflare.fuel.utils.app_artifacts import AppPackage
 from nvflare.fuel.utils.zip_utils import zip_directory_to_bytes
 from nvflare.private.fed.server.job_meta_validator import JobMetaValidator
 
@@ -54,6 +55,17 @@ class TestJobManager(unittest.TestCase):
         meta = self.job_manager.create(meta, data, self.fl_ctx)
         return data, meta
 
+    def test_get_app_package(self):
+        with mock.patch("nvflare.apis.impl.job_def_manager.SimpleJobDefManager._get_job_store") as mock_store:
+            mock_store.return_value = FilesystemStorage()
+
+            _, meta = self._create_job()
+            meta[JobMetaKey.JOB_FOLDER_NAME.value] = "valid_job"
+            job = job_from_meta(meta)
+            package = self.job_manager.get_app_package(job, "sag", self.fl_ctx)
+            assert sorted(package.files) == ["config/config_fed_client.json", "config/config_fed_server.json"]
+            assert package.digest == AppPackage.from_zip(self.job_manager.get_app(job, "sag", self.fl_ctx)).digest
+
     def test_save_workspace(self):
         with mock.patch("nvflare.apis.impl.job_def_manager.SimpleJobDefManager._get_job_store") as mock_store:
             mock_store.return_value = FilesystemStorage()
@@ -63,3 +75,61 @@ class TestJobManager(unittest.TestCase):
             self.job_manager.save_workspace(job_id, data, self.fl_ctx)
             result = self.job_manager.get_storage_component(job_id, WORKSPACE, self.fl_ctx)
             assert result == data
+
+
+class TestJobManagerWithMetaIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        self.uri_root = tempfile.mkdtemp()
+        self.data_folder = os.path.join(dir_path, "../../data/jobs")
+        self.store = FilesystemStorage()
+        self.fl_ctx = FLContext()
+        patcher = mock.patch("nvflare.apis.impl.job_def_manager.SimpleJobDefManager._get_job_store")
+        patcher.start().return_value = self.store
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.uri_root)
+
+    def _new_job_manager(self):
+        return SimpleJobDefManager(uri_root=self.uri_root, use_meta_index=True)
+
+    def _create_job(self, job_manager):
+        data = zip_directory_to_bytes(self.data_folder, "valid_job")
+        valid, error, meta = JobMetaValidator().validate("valid_job", data)
+        return job_manager.create(meta, data, self.fl_ctx)
+
+    def test_status_queries(self):
+        job_manager = self._new_job_manager()
+        job_ids = [self._create_job(job_manager)[JobMetaKey.JOB_ID.value] for _ in range(3)]
+        assert os.path.exists(os.path.join(self.uri_root, ".meta_index.db"))
+
+        job_manager.set_status(job_ids[0], RunStatus.RUNNING, self.fl_ctx)
+        job_manager.delete(job_ids[2], self.fl_ctx)
+
+        assert [j.job_id for j in job_manager.get_jobs_to_schedule(self.fl_ctx)] == [job_ids[1]]
+        assert [j.job_id for j in job_manager.get_jobs_by_status(RunStatus.RUNNING, self.fl_ctx)] == [job_ids[0]]
+        assert [j.job_id for j in job_manager.get_all_jobs(self.fl_ctx)] == job_ids[:2]
+
+        # the index is persistent, and the store is not scanned when the index is complete
+        job_manager = self._new_job_manager()
+        with mock.patch.object(self.store, "get_meta", side_effect=AssertionError("meta read from store")):
+            jobs = job_manager.get_jobs_by_status([RunStatus.SUBMITTED, RunStatus.RUNNING], self.fl_ctx)
+        assert [j.job_id for j in jobs] == job_ids[:2]
+
+    def test_sync_and_rebuild(self):
+        job_manager = self._new_job_manager()
+        job_id = self._create_job(job_manager)[JobMetaKey.JOB_ID.value]
+
+        # changed behind the index, e.g. the server crashed before the index was updated
+        other_id = self._create_job(SimpleJobDefManager(uri_root=self.uri_root))[JobMetaKey.JOB_ID.value]
+        self.store.update_meta(job_manager.job_uri(job_id), {JobMetaKey.STATUS.value: RunStatus.RUNNING.value}, False)
+        job_manager._meta_index.mark_dirty(job_id)
+
+        job_manager = self._new_job_manager()
+        assert [j.job_id for j in job_manager.get_jobs_to_schedule(self.fl_ctx)] == [other_id]
+        assert [j.job_id for j in job_manager.get_jobs_by_status(RunStatus.RUNNING, self.fl_ctx)] == [job_id]
+
+        shutil.rmtree(job_manager.job_uri(other_id))
+        assert job_manager.rebuild_index(self.fl_ctx) == 1
+        assert [j.job_id for j in job_manager.get_all_jobs(self.fl_ctx)] == [job_id]
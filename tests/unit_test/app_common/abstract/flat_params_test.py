@@ -0,0 +1,107 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from nvflare.apis.dxo import DXO, DataKind, from_bytes
+from nvflare.apis.utils.decomposers import flare_decomposers
+from nvflare.app_common.abstract.flat_params import FlatParams, get_packed_vector
+from nvflare.app_common.decomposers import numpy_decomposers
+
+
+class TestFlatParams:
+    @classmethod
+    def setup_class(cls):
+        flare_decomposers.register()
+        numpy_decomposers.register()
+
+    def test_from_dict(self):
+        params = {
+            "a": np.arange(12, dtype=np.float32).reshape(3, 4),
+            "b": np.ones(5, dtype=np.float32),
+            "c": np.float32(2),
+        }
+        fp = FlatParams.from_dict(params)
+        assert fp.keys() == params.keys()
+        for k, v in params.items():
+            assert np.array_equal(fp[k], v)
+
+        assert fp.is_packed()
+        assert fp.dtype == np.float32
+        assert fp.vector.size == 18
+
+        # the params are views of the vector
+        fp.vector[:] = 0
+        assert not fp["a"].any()
+
+    def test_mixed_dtypes(self):
+        fp = FlatParams.from_dict({"a": np.ones(3, dtype=np.int8), "b": np.ones(2, dtype=np.float64)})
+        assert fp.dtype is None
+        assert fp.vector is None
+        assert np.array_equal(fp["b"], [1.0, 1.0])
+        assert get_packed_vector(fp) is None
+
+    def test_replaced_param(self):
+        fp = FlatParams.from_dict({"a": np.ones(3), "b": np.ones(2)})
+        fp["a"] = np.zeros(3)
+        assert not fp.is_packed()
+        assert get_packed_vector(fp) is None
+
+    def test_with_vector(self):
+        fp = FlatParams.from_dict({"a": np.ones((2, 2)), "b": np.ones(2)})
+        new_fp = fp.with_vector(fp.vector * 3)
+        assert new_fp.has_same_layout(fp)
+        assert np.array_equal(new_fp["a"], np.full((2, 2), 3.0))
+        with pytest.raises(ValueError):
+            fp.with_vector(np.ones(5))
+
+    @pytest.mark.parametrize("copier", [copy.deepcopy, lambda fp: pickle.loads(pickle.dumps(fp))])
+    def test_copy(self, copier):
+        fp = FlatParams.from_dict({"a": np.ones((2, 2), dtype=np.float32), "b": np.ones(2, dtype=np.float32)})
+        fp_copy = copier(fp)
+        assert isinstance(fp_copy, FlatParams)
+        assert fp_copy.is_packed()
+        assert fp_copy.buffer is not fp.buffer
+
+        # the params of the copy are views of its own vector
+        fp_copy.vector[:] = 3
+        assert np.array_equal(fp_copy["a"], np.full((2, 2), 3.0))
+        assert np.array_equal(get_packed_vector(fp_copy), np.full(6, 3.0))
+        assert np.array_equal(fp.vector, np.ones(6))
+
+        # replaced, added and removed params are kept
+        fp["a"] = np.zeros((2, 2), dtype=np.float32)
+        fp["c"] = np.float32(4)
+        del fp["b"]
+        fp_copy = copier(fp)
+        assert not fp_copy.is_packed()
+        assert fp_copy.keys() == {"a", "c"}
+        assert not fp_copy["a"].any()
+        assert fp_copy["c"] == 4
+
+    def test_in_dxo(self):
+        fp = FlatParams.from_dict({"a": np.arange(6, dtype=np.float32).reshape(2, 3), "b": np.float32(5)})
+        dxo = from_bytes(DXO(DataKind.WEIGHTS, fp).to_bytes())
+        assert isinstance(dxo.data, FlatParams)
+        assert dxo.data.is_packed()
+        assert np.array_equal(dxo.data.vector, fp.vector)
+
+        # replaced params are packed again
+        fp["b"] = np.float32(7)
+        dxo = from_bytes(DXO(DataKind.WEIGHTS, fp).to_bytes())
+        assert dxo.data.is_packed()
+        assert dxo.data["b"] == 7
@@ -0,0 +1,66 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pytest
+
+from nvflare.apis.dxo import DXO, DataKind, from_bytes
+from nvflare.apis.utils.decomposers import flare_decomposers
+from nvflare.app_common.abstract.sparse_array import SparseArray
+from nvflare.app_common.decomposers import numpy_decomposers
+
+
+class TestSparseArray:
+    @classmethod
+    def setup_class(cls):
+        flare_decomposers.register()
+        numpy_decomposers.register()
+
+    def test_to_dense(self):
+        dense = np.arange(12, dtype=np.float32).reshape(3, 4)
+        sparse = SparseArray.from_dense(dense, np.array([1, 5, 11], dtype=np.int32))
+        assert sparse.shape == (3, 4)
+        assert sparse.dtype == np.float32
+        assert sparse.nbytes == 24
+        assert sparse.density == 0.25
+
+        expected = np.zeros((3, 4), dtype=np.float32)
+        expected.reshape(-1)[[1, 5, 11]] = [1, 5, 11]
+        assert np.array_equal(sparse.to_dense(), expected)
+
+    @pytest.mark.parametrize("order", ["C", "F"])
+    def test_add_to(self, order):
+        sparse = SparseArray((2, 3), np.array([0, 4]), np.array([1.0, 2.0]))
+        dense = np.ones((2, 3), order=order)
+        sparse.add_to(dense, 2.0)
+        assert np.array_equal(dense, [[3.0, 1.0, 1.0], [1.0, 5.0, 1.0]])
+
+        with pytest.raises(ValueError):
+            sparse.add_to(np.ones(6))
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            SparseArray((2, 2), np.array([0, 4]), np.array([1.0, 2.0]))
+        with pytest.raises(ValueError):
+            SparseArray((2, 2), np.array([0.0]), np.array([1.0]))
+        with pytest.raises(ValueError):
+            SparseArray((2, 2), np.array([0, 1]), np.array([1.0]))
+
+    def test_in_dxo(self):
+        sparse = SparseArray((100, 10), np.array([3, 500, 999], dtype=np.int32), np.array([1, 2, 3], dtype=np.float32))
+        dxo = from_bytes(DXO(DataKind.WEIGHT_DIFF, {"a": sparse}).to_bytes())
+        result = dxo.data["a"]
+        assert isinstance(result, SparseArray)
+        assert result.shape == (100, 10)
+        assert np.array_equal(result.indices, sparse.indices)
+        assert np.array_equal(result.values, sparse.values)
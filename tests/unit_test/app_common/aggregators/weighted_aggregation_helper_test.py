@@ -0,0 +1,171 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+import numpy as np
+import pytest
+
+from nvflare.app_common.abstract.flat_params import FlatParams
+from nvflare.app_common.abstract.sparse_array import SparseArray
+from nvflare.app_common.aggregators.weighted_aggregation_helper import WeightedAggregationHelper
+
+
+def _make_data(seed: int, num_keys: int = 20, float_only: bool = False):
+    rng = np.random.default_rng(seed)
+    data = {f"layer{i}": rng.standard_normal((8, 4)).astype(np.float32) for i in range(num_keys)}
+    if not float_only:
+        data["step"] = np.array([seed, seed + 1])
+        data["scalar"] = float(seed)
+    return data
+
+
+def _expected(contributions, weigh_by_local_iter=True):
+    totals = {}
+    counts = {}
+    for data, weight in contributions:
+        for k, v in data.items():
+            weighted = v * weight if weigh_by_local_iter else v
+            totals[k] = totals[k] + weighted if k in totals else weighted
+            counts[k] = counts.get(k, 0) + weight
+    return {k: v * (1.0 / counts[k]) for k, v in totals.items()}
+
+
+class TestWeightedAggregationHelper:
+    @pytest.mark.parametrize("weigh_by_local_iter", [True, False])
+    def test_numpy(self, weigh_by_local_iter):
+        contributions = [(_make_data(i), i + 1) for i in range(5)]
+        originals = [{k: np.copy(v) for k, v in data.items()} for data, _ in contributions]
+
+        helper = WeightedAggregationHelper(weigh_by_local_iter=weigh_by_local_iter)
+        for i, (data, weight) in enumerate(contributions):
+            helper.add(data, weight, f"site-{i}", 0)
+        result = helper.get_result()
+
+        expected = _expected(contributions, weigh_by_local_iter)
+        assert result.keys() == expected.keys()
+        for k, v in expected.items():
+            assert np.allclose(result[k], v, rtol=1e-6)
+            assert np.asarray(result[k]).dtype == np.asarray(v).dtype
+
+        # contributions must not be changed
+        for (data, _), original in zip(contributions, originals):
+            for k, v in original.items():
+                assert np.array_equal(data[k], v)
+
+        assert helper.get_len() == 0
+
+    def test_exclude_vars_and_mixed_dtypes(self):
+        helper = WeightedAggregationHelper(exclude_vars="skip.*")
+        helper.add({"a": np.array([1, 2]), "skip_me": np.ones(2)}, 1, "site-1", 0)
+        helper.add({"a": np.array([0.5, 0.5])}, 3, "site-2", 0)
+        assert helper.get_len() == 2
+        result = helper.get_result()
+        assert list(result.keys()) == ["a"]
+        assert np.allclose(result["a"], (np.array([1, 2]) + np.array([1.5, 1.5])) / 4)
+
+    @pytest.mark.parametrize("weigh_by_local_iter", [True, False])
+    @pytest.mark.parametrize("flat", [True, False])
+    def test_promoted_dtype(self, weigh_by_local_iter, flat):
+        # a float64 contribution added to a float32 total promotes the total, as the out-of-place sum does
+        contributions = [
+            ({"w": np.full(4, 1.1, dtype=np.float32)}, 1),
+            ({"w": np.full(4, 1.0 + 1e-9, dtype=np.float64)}, 3),
+        ]
+        helper = WeightedAggregationHelper(weigh_by_local_iter=weigh_by_local_iter)
+        for i, (data, weight) in enumerate(contributions):
+            helper.add(FlatParams.from_dict(data) if flat else data, weight, f"site-{i}", 0)
+        result = helper.get_result()
+
+        expected = _expected(contributions, weigh_by_local_iter)
+        assert result["w"].dtype == np.float64
+        assert np.array_equal(result["w"], expected["w"])
+
+    def test_torch(self):
+        torch = pytest.importorskip("torch")
+        t1 = {"w": torch.ones(3, 2), "i": torch.tensor([1, 2])}
+        t2 = {"w": torch.full((3, 2), 3.0), "i": torch.tensor([3, 4])}
+        helper = WeightedAggregationHelper()
+        helper.add(t1, 1, "site-1", 0)
+        helper.add(t2, 3, "site-2", 0)
+        result = helper.get_result()
+        assert torch.allclose(result["w"], torch.full((3, 2), 2.5))
+        assert torch.allclose(result["i"].double(), torch.tensor([2.5, 3.5], dtype=torch.float64))
+        assert torch.equal(t1["w"], torch.ones(3, 2))
+
+    @pytest.mark.parametrize("weigh_by_local_iter", [True, False])
+    def test_torch_promoted_dtype(self, weigh_by_local_iter):
+        torch = pytest.importorskip("torch")
+        helper = WeightedAggregationHelper(weigh_by_local_iter=weigh_by_local_iter)
+        helper.add({"w": torch.ones(3, dtype=torch.float32)}, 1, "site-1", 0)
+        helper.add({"w": torch.full((3,), 1e-9, dtype=torch.float64)}, 1, "site-2", 0)
+        result = helper.get_result()
+        assert result["w"].dtype == torch.float64
+        # the contribution is added at float64 precision
+        assert torch.equal(result["w"], torch.full((3,), (1 + 1e-9) / 2, dtype=torch.float64))
+
+    def test_concurrent_add(self):
+        contributions = [(_make_data(i, num_keys=50), 1 + i % 3) for i in range(16)]
+        helper = WeightedAggregationHelper(num_shards=4)
+        threads = [
+            threading.Thread(target=helper.add, args=(data, weight, f"site-{i}", 0))
+            for i, (data, weight) in enumerate(contributions)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert helper.get_len() == len(contributions)
+        result = helper.get_result()
+        for k, v in _expected(contributions).items():
+            assert np.allclose(result[k], v, rtol=1e-5)
+
+    def test_flat_params(self):
+        contributions = [(_make_data(i, float_only=True), i + 1) for i in range(4)]
+        helper = WeightedAggregationHelper()
+        for i, (data, weight) in enumerate(contributions):
+            helper.add(FlatParams.from_dict(data), weight, f"site-{i}", 0)
+        result = helper.get_result()
+
+        assert isinstance(result, FlatParams)
+        for k, v in _expected(contributions).items():
+            assert np.allclose(result[k], v, rtol=1e-5)
+
+    def test_flat_params_mixed_with_dict(self):
+        contributions = [(_make_data(i, float_only=True), i + 1) for i in range(4)]
+        helper = WeightedAggregationHelper()
+        for i, (data, weight) in enumerate(contributions):
+            helper.add(FlatParams.from_dict(data) if i % 2 == 0 else data, weight, f"site-{i}", 0)
+        result = helper.get_result()
+
+        for k, v in _expected(contributions).items():
+            assert np.allclose(result[k], v, rtol=1e-5)
+
+    @pytest.mark.parametrize("weigh_by_local_iter", [True, False])
+    def test_sparse_arrays(self, weigh_by_local_iter):
+        contributions = [(_make_data(i, float_only=True), i + 1) for i in range(4)]
+        helper = WeightedAggregationHelper(weigh_by_local_iter=weigh_by_local_iter)
+        for i, (data, weight) in enumerate(contributions):
+            # the even contributions, including the first one, are sparse with every other entry
+            if i % 2 == 0:
+                for k, v in data.items():
+                    v.reshape(-1)[1::2] = 0
+                data = {k: SparseArray.from_dense(v, np.arange(0, v.size, 2)) for k, v in data.items()}
+            helper.add(data, weight, f"site-{i}", 0)
+        result = helper.get_result()
+
+        for k, v in _expected(contributions, weigh_by_local_iter).items():
+            assert isinstance(result[k], np.ndarray)
+            assert result[k].dtype == np.float32
+            assert np.allclose(result[k], v, rtol=1e-5)
@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import gc
+import json
 import os
 from typing import Any
 
@@ -23,8 +25,11 @@ from nvflare.app_common.abstract.fl_model import FLModel, ParamsType
 from nvflare.app_common.abstract.learnable import Learnable
 from nvflare.app_common.abstract.model import ModelLearnable
 from nvflare.app_common.decomposers import common_decomposers
+from nvflare.app_common.decomposers.numpy_decomposers import NumpyArrayDecomposer
 from nvflare.app_common.widgets.event_recorder import _CtxPropReq, _EventReq, _EventStats
 from nvflare.fuel.utils import fobs
+from nvflare.fuel.utils.fobs.decomposers.via_file import _CtxKey, _DecomposeCtx, _map_shared_memory
+from nvflare.fuel.utils.msg_root_utils import delete_msg_root
 
 FIVE_M = 5 * 1024 * 1024
 
@@ -108,6 +113,78 @@ class TestCommonDecomposers:
 
         assert (new_npa == npa).all()
 
+    def test_np_array_buffers(self):
+
+        items = {
+            "T0": np.arange(24, dtype=np.float32).reshape(4, 6)[:, ::2],
+            "T1": np.array(3.5),
+            "T2": np.zeros((0, 3), dtype=np.int16),
+        }
+        decomposer = NumpyArrayDecomposer()
+        layout, buffers, meta = decomposer.dump_to_buffers(items, {})
+        new_items, new_buffers = decomposer.new_items_from_layout(layout, {}, meta)
+        for src, dst in zip(buffers, new_buffers):
+            dst[:] = src
+
+        assert new_items.keys() == items.keys()
+        for k, v in items.items():
+            assert new_items[k].dtype == v.dtype
+            assert np.array_equal(new_items[k], v)
+
+    def test_np_array_mapped_file(self):
+
+        items = {
+            "T0": np.arange(24, dtype=np.float32).reshape(4, 6),
+            "T1": np.asfortranarray(np.ones((3, 5))),
+            "T2": np.array(7),
+        }
+        decomposer = NumpyArrayDecomposer()
+        decomposer.set_mmap_load(True)
+        path, _ = decomposer.dump_to_file(items, decomposer._get_temp_file_name(), {})
+        new_items = decomposer._load_items_from_mapped_file(path, {}, None)
+
+        assert new_items.keys() == items.keys()
+        for k, v in items.items():
+            assert np.array_equal(new_items[k], v)
+
+        # the file is kept while the items are in use, and removed once they are released
+        assert os.path.exists(path)
+        del new_items
+        gc.collect()
+        assert not os.path.exists(path)
+
+    def test_np_array_shared_memory(self):
+
+        items = {"T0": np.arange(24, dtype=np.float32).reshape(4, 6), "T1": np.array(7)}
+        decomposer = NumpyArrayDecomposer()
+        decomposer.set_min_size_for_file(0)
+        dc = _DecomposeCtx()
+        for v in items.values():
+            dc.add_item(v)
+
+        def _create_ref():
+            fobs_ctx = {decomposer.decompose_ctx_key: dc, _CtxKey.MSG_ROOT_ID: "shm_test_root"}
+            return json.loads(decomposer._create_shared_memory_datum(fobs_ctx).value)
+
+        # the items sent to many receivers are published once
+        ref = _create_ref()
+        assert _create_ref() == ref
+
+        new_items = decomposer._map_items_from_shared_memory({}, ref)
+        assert new_items.keys() == items.keys()
+        for k, v in items.items():
+            assert np.array_equal(new_items[k], v)
+
+        # changes are not visible to other receivers
+        new_items["T0"] += 1
+        assert np.array_equal(decomposer._map_items_from_shared_memory({}, ref)["T0"], items["T0"])
+
+        # the segment is removed with the msg root, while the mapped items are still valid
+        delete_msg_root("shm_test_root")
+        with pytest.raises(FileNotFoundError):
+            _map_shared_memory(ref["shm_name"])
+        assert np.array_equal(new_items["T0"], items["T0"] + 1)
+
     def test_ctx_prop_req(self):
 
         cpr = _CtxPropReq("data_type", True, False, True)
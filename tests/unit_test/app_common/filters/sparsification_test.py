@@ -0,0 +1,154 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from nvflare.apis.dxo import DXO, DataKind, MetaKey, from_shareable
+from nvflare.apis.fl_constant import ReservedKey
+from nvflare.apis.fl_context import FLContext
+from nvflare.app_common.abstract.sparse_array import SparseArray
+from nvflare.app_common.aggregators.intime_accumulate_model_aggregator import InTimeAccumulateWeightedAggregator
+from nvflare.app_common.app_constant import AppConstants
+from nvflare.app_common.filters import Densifier, Sparsifier
+
+
+def _weight_diff(seed):
+    rng = np.random.default_rng(seed)
+    return {
+        "conv.weight": rng.standard_normal((32, 64)).astype(np.float32),
+        "fc.bias": rng.standard_normal(10).astype(np.float32),
+        "step": np.array([1, 2]),
+    }
+
+
+def _filter(f, data, fl_ctx):
+    return from_shareable(f.process(DXO(DataKind.WEIGHT_DIFF, data).to_shareable(), fl_ctx)).data
+
+
+class TestSparsification:
+    def test_top_k(self):
+        data = _weight_diff(0)
+        original = {k: v.copy() for k, v in data.items()}
+        result = _filter(Sparsifier(density=0.1, min_size=100), data, FLContext())
+
+        sparse = result["conv.weight"]
+        assert isinstance(sparse, SparseArray)
+        assert sparse.values.size == int(np.ceil(0.1 * 32 * 64))
+        assert sparse.indices.dtype == np.int32
+        assert np.all(np.diff(sparse.indices) > 0)
+
+        # the kept entries are the largest ones
+        magnitudes = np.abs(original["conv.weight"].reshape(-1))
+        assert np.abs(sparse.values).min() >= np.delete(magnitudes, sparse.indices).max()
+        assert np.array_equal(sparse.values, original["conv.weight"].reshape(-1)[sparse.indices])
+
+        # small and non-float layers are not changed
+        assert np.array_equal(result["fc.bias"], original["fc.bias"])
+        assert np.array_equal(result["step"], original["step"])
+
+        # the input is not changed
+        for k, v in original.items():
+            assert np.array_equal(data[k], v)
+
+    def test_threshold(self):
+        data = _weight_diff(1)
+        result = _filter(Sparsifier(threshold=2.0, min_size=100), data, FLContext())
+        sparse = result["conv.weight"]
+        assert np.array_equal(sparse.indices, np.flatnonzero(np.abs(data["conv.weight"]) >= 2.0))
+
+        # dense if not smaller
+        result = _filter(Sparsifier(threshold=0.0, min_size=100), data, FLContext())
+        assert isinstance(result["conv.weight"], np.ndarray)
+
+    @pytest.mark.parametrize("error_feedback", [True, False])
+    def test_error_feedback(self, error_feedback):
+        sparsifier = Sparsifier(density=0.05, min_size=100, error_feedback=error_feedback)
+        fl_ctx = FLContext()
+        total_input = np.zeros((32, 64), dtype=np.float32)
+        total_sent = np.zeros((32, 64), dtype=np.float32)
+        for r in range(20):
+            data = _weight_diff(r)
+            total_input += data["conv.weight"]
+            result = _filter(sparsifier, data, fl_ctx)
+            result["conv.weight"].add_to(total_sent)
+
+        if error_feedback:
+            # nothing is lost: the updates not sent yet are in the residual
+            np.testing.assert_allclose(total_sent + sparsifier.residuals["conv.weight"], total_input, atol=1e-4)
+        else:
+            assert not sparsifier.residuals
+
+    def test_densifier(self):
+        data = _weight_diff(2)
+        fl_ctx = FLContext()
+        sparse = _filter(Sparsifier(density=0.1, min_size=100), data, fl_ctx)
+        dense = _filter(Densifier(), sparse, fl_ctx)
+        assert np.array_equal(dense["conv.weight"], sparse["conv.weight"].to_dense())
+        assert np.array_equal(dense["fc.bias"], data["fc.bias"])
+
+    def test_aggregation(self):
+        n_clients = 5
+        aggregator = InTimeAccumulateWeightedAggregator(expected_data_kind=DataKind.WEIGHT_DIFF)
+        aggregator._initialize(aggregator.aggregation_weights, aggregator.exclude_vars, aggregator.expected_data_kind)
+        fl_ctx = FLContext()
+        fl_ctx.set_prop(AppConstants.CURRENT_ROUND, 0)
+        # each client has its own residual, so the sparsifier here doesn't keep any
+        sparsifier = Sparsifier(density=0.1, min_size=100, error_feedback=False)
+        weighted_sum = 0
+        for i in range(n_clients):
+            data = {k: v for k, v in _weight_diff(i).items() if k != "step"}
+            sparse = _filter(sparsifier, data, fl_ctx)
+            weighted_sum = weighted_sum + sparse["conv.weight"].to_dense() * (i + 1)
+
+            s = DXO(DataKind.WEIGHT_DIFF, data=sparse, meta={MetaKey.NUM_STEPS_CURRENT_ROUND: i + 1}).to_shareable()
+            s.set_peer_props({ReservedKey.IDENTITY_NAME: f"site-{i}"})
+            s.add_cookie(AppConstants.CONTRIBUTION_ROUND, 0)
+            assert aggregator.accept(s, fl_ctx)
+
+        result = from_shareable(aggregator.aggregate(fl_ctx)).data
+        assert isinstance(result["conv.weight"], np.ndarray)
+        np.testing.assert_allclose(result["conv.weight"], weighted_sum / 15, rtol=1e-5)
+
+    def test_torch(self):
+        torch = pytest.importorskip("torch")
+        sparsifier = Sparsifier(density=0.1, min_size=100)
+        sparsifier.log_warning = Mock()
+        fl_ctx = FLContext()
+        for r in range(2):
+            data = {k: torch.from_numpy(v) for k, v in _weight_diff(r).items()}
+            data["bf16"] = torch.ones(32, 64, dtype=torch.bfloat16)
+            data["names"] = ["a", "b"]
+            original = {k: v.clone() for k, v in data.items() if isinstance(v, torch.Tensor)}
+            result = _filter(sparsifier, data, fl_ctx)
+
+            sparse = result["conv.weight"]
+            assert isinstance(sparse, SparseArray)
+            assert sparse.values.size == int(np.ceil(0.1 * 32 * 64))
+            assert isinstance(result["bf16"], SparseArray)
+            assert result["step"] is data["step"]
+
+            # the input is not changed by error feedback
+            for k, v in original.items():
+                assert torch.equal(data[k], v)
+
+        # the values that can't be sparsified are warned once
+        sparsifier.log_warning.assert_called_once()
+
+    def test_invalid_args(self):
+        with pytest.raises(ValueError):
+            Sparsifier(density=0)
+        with pytest.raises(ValueError):
+            Sparsifier(threshold=-1.0)
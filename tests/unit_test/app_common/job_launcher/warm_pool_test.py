@@ -0,0 +1,124 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+import sys
+import time
+
+import pytest
+
+from nvflare.apis.job_launcher_spec import JobReturnCode
+from nvflare.app_common.job_launcher.process_launcher import ProcessHandle, ProcessJobLauncher
+from nvflare.app_common.job_launcher.warm_pool import WarmProcessPool
+from nvflare.app_common.job_launcher.warm_worker import _apply_python_path
+
+JOB_MODULE = """
+import json
+import os
+import sys
+
+with open(sys.argv[1], "w") as f:
+    json.dump({"argv": sys.argv[1:], "env": os.environ.get("WARM_TEST"), "cwd": os.getcwd(), "name": __name__}, f)
+sys.exit(int(sys.argv[2]))
+"""
+
+
+class CommandLauncher(ProcessJobLauncher):
+    def __init__(self, command, **kwargs):
+        super().__init__(**kwargs)
+        self.command = command
+
+    def get_command(self, job_meta, fl_ctx) -> str:
+        return self.command
+
+
+@pytest.fixture
+def custom_dir(tmp_path):
+    custom = tmp_path / "custom"
+    custom.mkdir()
+    (custom / "warm_test_job.py").write_text(JOB_MODULE)
+    return str(custom)
+
+
+def _wait_ready(pool, count):
+    deadline = time.time() + 60
+    while pool.get_metrics()["ready_workers"] < count and time.time() < deadline:
+        time.sleep(0.05)
+    assert pool.get_metrics()["ready_workers"] == count
+
+
+def _job_env(custom_dir):
+    env = os.environ.copy()
+    env["WARM_TEST"] = "warm"
+    env["PYTHONPATH"] = os.pathsep.join(sys.path + [custom_dir])
+    return env
+
+
+class TestWarmProcessPool:
+    def test_launch(self, custom_dir, tmp_path):
+        pool = WarmProcessPool(2, preload_modules=["json", "no_such_module"])
+        try:
+            pool.start()
+            _wait_ready(pool, 2)
+
+            out = str(tmp_path / "out.json")
+            process = pool.launch("warm_test_job", [out, "0"], _job_env(custom_dir), cwd=str(tmp_path))
+            assert process is not None
+            assert process.wait(timeout=30) == 0
+            with open(out) as f:
+                result = json.load(f)
+            assert result == {"argv": [out, "0"], "env": "warm", "cwd": str(tmp_path), "name": "__main__"}
+
+            # the pool is replenished, without the job module: it's run by the job, not imported
+            _wait_ready(pool, 2)
+            assert pool.preload_modules == ["json", "no_such_module"]
+            metrics = pool.get_metrics()
+            assert metrics["warm_launches"] == 1
+            assert metrics["worker_starts"] >= 3
+            assert metrics["avg_worker_start_secs"] > 0
+        finally:
+            pool.shutdown()
+        assert pool.get_metrics()["ready_workers"] == 0
+
+    def test_no_ready_worker(self, custom_dir, tmp_path):
+        pool = WarmProcessPool(1)
+        try:
+            assert pool.launch("warm_test_job", [str(tmp_path / "out.json"), "0"], _job_env(custom_dir)) is None
+            assert pool.get_metrics()["cold_launches"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_launcher(self, custom_dir, tmp_path):
+        out = str(tmp_path / "out.json")
+        launcher = CommandLauncher(f"{sys.executable} -m warm_test_job {out} 9", warm_pool_size=1)
+        try:
+            launcher.warm_pool.start()
+            _wait_ready(launcher.warm_pool, 1)
+
+            process = launcher._launch_warm(launcher.command, _job_env(custom_dir))
+            handle = ProcessHandle(process)
+            handle.wait()
+            assert handle.poll() == JobReturnCode.ABORTED
+            assert launcher.get_startup_metrics()["warm_launches"] == 1
+
+            # not a "python -m" command
+            assert launcher._launch_warm("/bin/echo test", _job_env(custom_dir)) is None
+        finally:
+            launcher.warm_pool.shutdown()
+
+
+def test_apply_python_path(monkeypatch):
+    monkeypatch.setattr(sys, "path", ["", "/lib/python", "/b"])
+    _apply_python_path(os.pathsep.join(["/a", "", "/b", "/c", "/a"]))
+    assert sys.path == ["/a", "/b", "/c", "", "/lib/python"]
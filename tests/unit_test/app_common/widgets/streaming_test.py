@@ -12,15 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
 from typing import Optional
 
 import pytest
 
-from nvflare.apis.analytix import AnalyticsDataType, LogWriterName, TrackConst
-from nvflare.apis.dxo import DXO, DataKind
+from nvflare.apis.analytix import AnalyticsBatch, AnalyticsData, AnalyticsDataType, LogWriterName, TrackConst
+from nvflare.apis.dxo import DXO, DataKind, from_shareable
 from nvflare.apis.fl_component import FLComponent
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.utils.analytix_utils import create_analytic_dxo, send_analytic_dxo
+from nvflare.app_common.widgets.streaming import AnalyticsBatcher, AnalyticsReceiver
 
 INVALID_TEST_CASES = [
     (list(), dict(), FLContext(), TypeError, f"expect comp to be an instance of FLComponent, but got {type(list())}"),
@@ -223,3 +225,65 @@ class TestAnalyticsSender:
     def test_add_invalid(self, tag, value, data_type, global_step, kwargs, expected_error, expected_msg):
         with pytest.raises(expected_error, match=expected_msg):
             dxo = mock_add(tag=tag, value=value, data_type=data_type, global_step=global_step, **kwargs)
+
+
+def _scalar(i, sender=LogWriterName.TORCH_TB):
+    return AnalyticsData(
+        key=f"loss_{i}", value=float(i), data_type=AnalyticsDataType.SCALAR, sender=sender, global_step=i
+    )
+
+
+class MockReceiver(AnalyticsReceiver):
+    def __init__(self):
+        super().__init__()
+        self.saved = []
+
+    def initialize(self, fl_ctx: FLContext):
+        pass
+
+    def save(self, fl_ctx: FLContext, shareable, record_origin: str):
+        self.saved.append((record_origin, from_shareable(shareable)))
+
+    def finalize(self, fl_ctx: FLContext):
+        pass
+
+
+class TestAnalyticsBatcher:
+    def test_batch_size(self):
+        sent = []
+        batcher = AnalyticsBatcher(sent.append, batch_size=3, flush_interval=0)
+        for i in range(7):
+            batcher.add(_scalar(i))
+        assert [len(AnalyticsBatch.get_records(dxo)) for dxo in sent] == [3, 3]
+
+        batcher.flush()
+        records = [r for dxo in sent for r in AnalyticsBatch.get_records(dxo)]
+        assert [r.step for r in records] == list(range(7))
+
+        # a different sender starts a new batch
+        batcher.add(_scalar(7))
+        batcher.add_dxo(create_analytic_dxo("m", 1.0, AnalyticsDataType.METRIC, writer=LogWriterName.MLFLOW))
+        assert len(sent) == 4
+        assert sent[-1].get_meta_prop(TrackConst.TRACKER_KEY) == LogWriterName.TORCH_TB
+
+    def test_flush_interval(self):
+        sent = []
+        batcher = AnalyticsBatcher(sent.append, batch_size=100, flush_interval=0.1)
+        batcher.add(_scalar(0))
+        batcher.add(_scalar(1))
+        deadline = time.time() + 5
+        while not sent and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(sent) == 1 and len(AnalyticsBatch.get_records(sent[0])) == 2
+
+    def test_receiver_save_batch(self):
+        batch = AnalyticsBatch(LogWriterName.TORCH_TB)
+        for i in range(3):
+            batch.add(_scalar(i))
+        receiver = MockReceiver()
+        receiver.save_batch(FLContext(), batch.to_dxo().to_shareable(), "site-1")
+        assert [(origin, dxo.data[TrackConst.TRACK_KEY]) for origin, dxo in receiver.saved] == [
+            ("site-1", "loss_0"),
+            ("site-1", "loss_1"),
+            ("site-1", "loss_2"),
+        ]
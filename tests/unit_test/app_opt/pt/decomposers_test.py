@@ -0,0 +1,38 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+import torch
+
+from nvflare.app_opt.pt.decomposers import TensorDecomposer
+from nvflare.fuel.utils.fobs.decomposers.via_file import ItemLayoutKey
+
+
+class TestTensorDecomposer:
+    def test_items_from_layout(self):
+        decomposer = TensorDecomposer()
+        items = {"a": torch.arange(6, dtype=torch.float32).reshape(2, 3), "b": torch.tensor([True, False])}
+        layout, buffers, meta = decomposer.dump_to_buffers(items, {})
+
+        new_items, new_buffers = decomposer.new_items_from_layout(layout, {}, meta)
+        for src, dst in zip(buffers, new_buffers):
+            dst[:] = src
+        assert new_items.keys() == items.keys()
+        for k, v in items.items():
+            assert torch.equal(new_items[k], v)
+
+    @pytest.mark.parametrize("dtype", ["float128", "Tensor", "load", "__dict__"])
+    def test_unsupported_dtype(self, dtype):
+        layout = [{ItemLayoutKey.ID: "a", ItemLayoutKey.DTYPE: dtype, ItemLayoutKey.SHAPE: [2]}]
+        with pytest.raises(RuntimeError):
+            TensorDecomposer().new_items_from_layout(layout, {})
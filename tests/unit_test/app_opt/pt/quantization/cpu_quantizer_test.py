@@ -0,0 +1,120 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pytest
+import torch
+
+from nvflare.apis.dxo import DXO, DataKind, MetaKey, from_shareable
+from nvflare.apis.fl_context import FLContext
+from nvflare.app_opt.pt.quantization.cpu_dequantizer import CPUModelDequantizer
+from nvflare.app_opt.pt.quantization.cpu_quantization import (
+    FP4_CODE,
+    NF4_CODE,
+    dequantize_4bit,
+    dequantize_blockwise8,
+    quantize_4bit,
+    quantize_blockwise8,
+)
+from nvflare.app_opt.pt.quantization.cpu_quantizer import CPUModelQuantizer
+
+# max abs error relative to the absmax of a block
+TOLERANCES = {"float16": 1e-3, "blockwise8": 1 / 127, "float4": 1 / 6, "normfloat4": 1 / 6}
+
+
+def _params(fmt):
+    rng = np.random.default_rng(0)
+    params = {
+        "conv.weight": rng.standard_normal((64, 3, 3, 3)).astype(np.float32),
+        "fc.weight": rng.standard_normal((10, 1001)).astype(np.float32) * 100,
+        "fc.bias": rng.standard_normal(7).astype(np.float32),
+        "zero": np.zeros((4, 4), dtype=np.float32),
+    }
+    if fmt == "torch":
+        params = {k: torch.from_numpy(v) for k, v in params.items()}
+        params["bf16"] = torch.randn(33, 65).bfloat16()
+    return params
+
+
+class TestCPUQuantization:
+    @pytest.mark.parametrize("size", [1, 63, 4096, 10000])
+    def test_blockwise8(self, size):
+        values = np.random.default_rng(1).standard_normal(size).astype(np.float32)
+        original = values.copy()
+        quantized, absmax, code = quantize_blockwise8(values)
+        assert quantized.dtype == np.uint8 and quantized.shape == values.shape
+        assert absmax.shape == ((size + 4095) // 4096,)
+        np.testing.assert_array_equal(values, original)
+
+        dequantized = dequantize_blockwise8(quantized, absmax, code)
+        assert np.abs(dequantized - values).max() <= np.abs(values).max() / 127 / 2 + 1e-6
+
+    @pytest.mark.parametrize("quant_type,code", [("nf4", NF4_CODE), ("fp4", FP4_CODE)])
+    @pytest.mark.parametrize("shape", [(1,), (7,), (64,), (3, 1001)])
+    def test_4bit(self, quant_type, code, shape):
+        values = np.random.default_rng(2).standard_normal(shape).astype(np.float32)
+        packed, absmax, quant_map = quantize_4bit(values, quant_type)
+        size = values.size
+        assert packed.dtype == np.uint8 and packed.shape == ((size + 1) // 2, 1)
+        assert absmax.shape == ((size + 63) // 64,)
+
+        dequantized = dequantize_4bit(packed, absmax, quant_map, shape)
+        assert dequantized.shape == shape
+
+        # each value is quantized to the nearest code of its block
+        scale = np.repeat(absmax, 64)[:size].reshape(shape)
+        nearest = np.abs(values[..., None] / scale[..., None] - code).min(axis=-1) * scale
+        np.testing.assert_allclose(np.abs(dequantized - values), nearest, atol=1e-5)
+
+    def test_invalid_4bit(self):
+        with pytest.raises(ValueError):
+            quantize_4bit(np.ones(4, dtype=np.float32), "int4")
+        with pytest.raises(ValueError):
+            quantize_4bit(np.ones(4, dtype=np.float32), "nf4", block_size=63)
+
+
+class TestCPUModelQuantizer:
+    @pytest.mark.parametrize("fmt", ["numpy", "torch"])
+    @pytest.mark.parametrize("quantization_type", ["float16", "blockwise8", "float4", "normfloat4"])
+    @pytest.mark.parametrize("num_workers", [1, 4])
+    def test_round_trip(self, fmt, quantization_type, num_workers):
+        params = _params(fmt)
+        original = {k: v.clone() if fmt == "torch" else v.copy() for k, v in params.items()}
+        fl_ctx = FLContext()
+
+        shareable = DXO(data_kind=DataKind.WEIGHTS, data=params).to_shareable()
+        quantizer = CPUModelQuantizer(quantization_type=quantization_type, num_workers=num_workers)
+        quantized_dxo = from_shareable(quantizer.process(shareable, fl_ctx))
+        assert quantized_dxo.get_meta_prop(MetaKey.PROCESSED_ALGORITHM) == quantization_type
+        assert quantized_dxo.get_meta_prop("quantized_flag")
+        for name, values in quantized_dxo.data.items():
+            assert type(values) is type(original[name])
+            if quantization_type != "float16" and name != "bf16":
+                assert values.nbytes < original[name].nbytes / 3
+
+        dequantizer = CPUModelDequantizer(num_workers=num_workers)
+        dxo = from_shareable(dequantizer.process(quantized_dxo.to_shareable(), fl_ctx))
+        assert dxo.get_meta_prop("quant_state") is None
+        for name, values in dxo.data.items():
+            expected = original[name]
+            assert values.dtype == expected.dtype and values.shape == expected.shape
+            if fmt == "torch":
+                values, expected = values.float().numpy(), expected.float().numpy()
+            tolerance = TOLERANCES[quantization_type] * max(np.abs(expected).max(), 1.0)
+            assert np.abs(values - expected).max() <= tolerance
+
+    def test_invalid_args(self):
+        with pytest.raises(ValueError):
+            CPUModelQuantizer(quantization_type="int2")
+        with pytest.raises(ValueError):
+            CPUModelQuantizer(num_workers=0)
@@ -0,0 +1,173 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pandas as pd
+import pytest
+
+from nvflare.apis.shareable import Shareable
+from nvflare.app_common.abstract.statistics_spec import DataType, StatisticConfig
+from nvflare.app_common.app_constant import StatisticsConstants as StC
+from nvflare.app_common.executors.statistics.statistics_task_handler import StatisticsTaskHandler
+from nvflare.app_opt.statistics.df.df_chunked_statistics import DFChunkedStatisticsCore
+from nvflare.app_opt.statistics.df.df_core_statistics import DFStatisticsCore
+from nvflare.fuel.utils.import_utils import optional_import
+
+TDigest, TDIGEST_AVAILABLE = optional_import("fastdigest", name="TDigest")
+_, PYARROW_AVAILABLE = optional_import(module="pyarrow.parquet")
+
+NUMERIC_FEATURES = ["age", "income", "score"]
+
+
+def _data(rows=1000):
+    rng = np.random.default_rng(0)
+    income = rng.lognormal(10, 1, rows)
+    income[rng.choice(rows, 50, replace=False)] = np.nan
+    return pd.DataFrame(
+        {
+            "name": [f"p{i}" for i in range(rows)],
+            "age": rng.integers(0, 100, rows),
+            "income": income,
+            "score": rng.standard_normal(rows) * 5 + 1e6,
+        }
+    )
+
+
+class MockDFStatistics(DFStatisticsCore):
+    def __init__(self, df):
+        super().__init__()
+        self.data = {"train": df}
+
+
+class CountingChunkedStatistics(DFChunkedStatisticsCore):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.passes = 0
+
+    def load_chunks(self, dataset_name, columns=None):
+        self.passes += 1
+        return super().load_chunks(dataset_name, columns)
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = str(tmp_path / "train.csv")
+    _data().to_csv(path, index=False)
+    return path
+
+
+class TestDFChunkedStatistics:
+    @pytest.mark.parametrize("chunk_size", [1, 77, 1000, 5000])
+    def test_same_as_df_statistics(self, csv_path, chunk_size):
+        stats = DFChunkedStatisticsCore(data_sources={"train": csv_path}, chunk_size=chunk_size)
+        expected = MockDFStatistics(pd.read_csv(csv_path))
+
+        features = {f.feature_name: f.data_type for f in stats.features()["train"]}
+        assert features == {f.feature_name: f.data_type for f in expected.features()["train"]}
+        assert features["name"] == DataType.STRING
+
+        for name in NUMERIC_FEATURES:
+            assert stats.count("train", name) == expected.count("train", name)
+            assert stats.failure_count("train", name) == 0
+            assert stats.sum("train", name) == pytest.approx(expected.sum("train", name), rel=1e-12)
+            assert stats.mean("train", name) == pytest.approx(expected.mean("train", name), rel=1e-12)
+            assert stats.stddev("train", name) == pytest.approx(expected.stddev("train", name), rel=1e-9)
+            assert stats.min_value("train", name) == expected.min_value("train", name)
+            assert stats.max_value("train", name) == expected.max_value("train", name)
+
+            global_mean = stats.mean("train", name) + 1.5
+            global_count = stats.count("train", name) * 3
+            assert stats.variance_with_mean("train", name, global_mean, global_count) == pytest.approx(
+                expected.variance_with_mean("train", name, global_mean, global_count), rel=1e-9
+            )
+
+            min_value = stats.min_value("train", name)
+            max_value = (min_value + stats.max_value("train", name)) / 2
+            assert stats.histogram("train", name, 10, min_value, max_value) == expected.histogram(
+                "train", name, 10, min_value, max_value
+            )
+
+    def test_passes(self, csv_path):
+        stats = CountingChunkedStatistics(data_sources={"train": csv_path}, chunk_size=100)
+        stats.features()
+        assert stats.passes == 1
+
+        for name in NUMERIC_FEATURES:
+            stats.count("train", name)
+            stats.stddev("train", name)
+            stats.variance_with_mean("train", name, 0.0, 10000)
+        assert stats.passes == 2
+
+        ranges = {
+            name: (5, stats.min_value("train", name), stats.max_value("train", name)) for name in NUMERIC_FEATURES
+        }
+        stats.prepare_histograms("train", ranges)
+        for name, (bins, min_value, max_value) in ranges.items():
+            histogram = stats.histogram("train", name, bins, min_value, max_value)
+            assert sum(b.sample_count for b in histogram.bins) == stats.count("train", name)
+        assert stats.passes == 3
+
+    def test_task_handler_prepares_histograms(self, csv_path):
+        stats = CountingChunkedStatistics(data_sources={"train": csv_path}, chunk_size=100)
+        handler = StatisticsTaskHandler(generator_id="")
+        handler.stats_generator = stats
+
+        inputs = Shareable()
+        inputs[StC.STATS_MIN] = {"train": {name: stats.min_value("train", name) for name in NUMERIC_FEATURES}}
+        inputs[StC.STATS_MAX] = {"train": {name: stats.max_value("train", name) for name in NUMERIC_FEATURES}}
+        tm = StatisticConfig(StC.STATS_HISTOGRAM, {"*": {"bins": 8}})
+        passes = stats.passes
+
+        result = {tm.name: {}}
+        handler._prepare_histograms(handler.get_numeric_features(), tm, inputs, None)
+        handler._populate_result_statistics(
+            result, handler.get_numeric_features(), tm, inputs, None, handler.get_histogram
+        )
+        assert stats.passes == passes + 1
+        for name in NUMERIC_FEATURES:
+            assert len(result[tm.name]["train"][name].bins) == 8
+
+    def test_failures(self, tmp_path):
+        path = str(tmp_path / "train.csv")
+        pd.DataFrame({"a": [1, 2, 3, 4, 5, 6]}).to_csv(path, index=False)
+        with open(path, "a") as f:
+            f.write("bad\n\n7\n")
+
+        # the first chunk is numeric, the last one is not
+        stats = DFChunkedStatisticsCore(data_sources={"train": path}, chunk_size=4)
+        assert stats.features()["train"][0].data_type == DataType.INT
+        assert stats.count("train", "a") == 7
+        assert stats.failure_count("train", "a") == 1
+        assert stats.sum("train", "a") == 28
+
+    @pytest.mark.skipif(not TDIGEST_AVAILABLE, reason="fastdigest is not installed")
+    def test_quantiles(self, csv_path):
+        stats = DFChunkedStatisticsCore(data_sources={"train": csv_path}, chunk_size=100)
+        df = pd.read_csv(csv_path)
+        for name in NUMERIC_FEATURES:
+            result = stats.quantiles("train", name, [0.1, 0.5, 0.9])
+            values = df[name].dropna()
+            for p, v in result[StC.STATS_QUANTILE].items():
+                assert v == pytest.approx(values.quantile(p), rel=0.05)
+            assert TDigest.from_dict(result[StC.STATS_DIGEST_COORD])
+
+    @pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow is not installed")
+    def test_parquet(self, tmp_path):
+        path = str(tmp_path / "train.parquet")
+        df = _data()
+        df.to_parquet(path)
+        stats = DFChunkedStatisticsCore(data_sources={"train": path}, chunk_size=128)
+        expected = MockDFStatistics(df)
+        for name in NUMERIC_FEATURES:
+            assert stats.count("train", name) == expected.count("train", name)
+            assert stats.mean("train", name) == pytest.approx(expected.mean("train", name), rel=1e-12)
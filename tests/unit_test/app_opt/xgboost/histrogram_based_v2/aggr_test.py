@@ -0,0 +1,138 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import random
+
+import numpy as np
+import pytest
+
+from nvflare.app_opt.xgboost.histogram_based_v2.aggr import Aggregator
+from nvflare.app_opt.xgboost.histogram_based_v2.sec.partial_he.util import combine
+
+NUM_SAMPLES = 500
+NUM_BINS = 16
+
+
+class Cipher:
+    """A value that only supports add, like a ciphertext"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __add__(self, other):
+        return Cipher(self.value + other.value)
+
+
+def _gh_values(kind):
+    rng = random.Random(0)
+    if kind == "int":
+        return [rng.randint(-(10**6), 10**6) for _ in range(NUM_SAMPLES)]
+    if kind == "int64":
+        return np.array([rng.randint(-(2**62), 2**62) for _ in range(NUM_SAMPLES)], dtype=np.int64)
+    if kind == "combined":
+        # combined gh pairs are out of the int64 range
+        return [combine(rng.randint(-(10**7), 10**7), rng.randint(0, 10**6)) for _ in range(NUM_SAMPLES)]
+    return [rng.uniform(-1, 1) for _ in range(NUM_SAMPLES)]
+
+
+def _mask(seed):
+    rng = random.Random(seed)
+    return [rng.randint(-1, NUM_BINS - 1) for _ in range(NUM_SAMPLES)]
+
+
+def _generic(aggregator, gh_values, mask, sample_ids):
+    # python ints, so the reference doesn't overflow
+    gh_values = gh_values.tolist() if isinstance(gh_values, np.ndarray) else gh_values
+    return aggregator._aggregate_generic(gh_values, mask, NUM_BINS, sample_ids)
+
+
+def _assert_same(result, expected, kind):
+    if kind == "float":
+        np.testing.assert_allclose(result, expected, atol=1e-9)
+    else:
+        assert result == expected
+        assert all(type(v) is int for v in result)
+
+
+class TestAggregator:
+    @pytest.mark.parametrize("kind", ["int", "int64", "combined", "float"])
+    @pytest.mark.parametrize("sample_ids", [None, [], [1, 3, 5, 7, 499, 250], list(range(0, NUM_SAMPLES, 3))])
+    @pytest.mark.parametrize("initial_value", [0, 10])
+    def test_aggregate(self, kind, sample_ids, initial_value):
+        aggregator = Aggregator(initial_value=initial_value)
+        gh_values = _gh_values(kind)
+        mask = _mask(1)
+        expected = _generic(aggregator, gh_values, mask, sample_ids)
+        result = aggregator.aggregate(gh_values, mask, NUM_BINS, sample_ids)
+        _assert_same(result, expected, kind)
+
+    @pytest.mark.parametrize("kind", ["int", "combined", "float"])
+    @pytest.mark.parametrize("groups", [None, [(3, [1, 2, 3, 100, 400])], [(1, [0, 5, 9]), (2, []), (4, [7, 8])]])
+    def test_aggregate_batch(self, kind, groups):
+        aggregator = Aggregator()
+        gh_values = _gh_values(kind)
+        features = [(fid, _mask(fid), NUM_BINS) for fid in range(4)]
+        result = aggregator.aggregate_batch(gh_values, features, groups)
+
+        expected_groups = groups if groups else [(0, None)]
+        assert len(result) == len(features) * len(expected_groups)
+        i = 0
+        for fid, mask, _ in features:
+            for gid, sample_ids in expected_groups:
+                result_fid, result_gid, bins = result[i]
+                assert (result_fid, result_gid) == (fid, gid)
+                _assert_same(bins, _generic(aggregator, gh_values, mask, sample_ids), kind)
+                i += 1
+
+    @pytest.mark.parametrize("kind", ["int", "combined", "float"])
+    def test_ndarray_ids(self, kind):
+        # as decoded by ProcessorDataConverter
+        aggregator = Aggregator()
+        gh_values = _gh_values(kind)
+        mask = _mask(4)
+        sample_ids = np.array([4, 8, 15, 16, 23, 42])
+        expected = _generic(aggregator, gh_values, mask, sample_ids.tolist())
+        _assert_same(aggregator.aggregate(gh_values, np.array(mask), NUM_BINS, sample_ids), expected, kind)
+
+        result = aggregator.aggregate_batch(gh_values, [(0, np.array(mask), NUM_BINS)], [(1, sample_ids)])
+        _assert_same(result[0][2], expected, kind)
+
+    def test_ciphertext(self):
+        aggregator = Aggregator()
+        gh_values = [Cipher(v) for v in _gh_values("int")]
+        mask = _mask(2)
+        expected = _generic(Aggregator(), _gh_values("int"), mask, None)
+
+        bins = aggregator.aggregate(gh_values, mask, NUM_BINS, None)
+        assert [b.value if isinstance(b, Cipher) else b for b in bins] == expected
+
+        result = aggregator.aggregate_batch(gh_values, [(0, mask, NUM_BINS)], [(1, [1, 2, 3])])
+        assert len(result) == 1 and result[0][:2] == (0, 1)
+
+    def test_overridden_add(self):
+        class TupleAggregator(Aggregator):
+            def __init__(self):
+                Aggregator.__init__(self, initial_value=(0, 0))
+
+            def add(self, a, b):
+                return a[0] + b[0], a[1] + b[1]
+
+        gh_values = [(g, g + 1) for g in _gh_values("int")]
+        mask = _mask(3)
+        bins = TupleAggregator().aggregate(gh_values, mask, NUM_BINS, None)
+        g = Aggregator().aggregate([v[0] for v in gh_values], mask, NUM_BINS, None)
+        assert [b[0] for b in bins] == g
+
+    def test_invalid_bin(self):
+        with pytest.raises(IndexError):
+            Aggregator().aggregate([1, 2, 3], [0, 1, NUM_BINS], NUM_BINS, None)
@@ -11,7 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from nvflare.app_opt.xgboost.histogram_based_v2.sec.dam import DamDecoder, DamEncoder
+import struct
+
+import numpy as np
+import pytest
+
+from nvflare.app_opt.xgboost.histogram_based_v2.sec.dam import (
+    DATA_TYPE_FLOAT_ARRAY,
+    DATA_TYPE_INT_ARRAY,
+    SIGNATURE,
+    DamDecoder,
+    DamEncoder,
+)
 
 DATA_SET = 123456
 INT_ARRAY = [123, 456, 789]
@@ -34,3 +45,45 @@ class TestDam:
 
         float_array = decoder.decode_float_array()
         assert float_array == FLOAT_ARRAY
+
+    def test_wire_format(self):
+        encoder = DamEncoder(DATA_SET)
+        encoder.add_int_array(np.array(INT_ARRAY))
+        encoder.add_float_array(FLOAT_ARRAY)
+        buffer = encoder.finish()
+
+        # element by element, as written by the XGBoost plugin
+        expected = SIGNATURE.encode("utf-8") + struct.pack("qq", len(buffer), DATA_SET)
+        expected += struct.pack("qq", DATA_TYPE_INT_ARRAY, len(INT_ARRAY))
+        expected += b"".join(struct.pack("q", x) for x in INT_ARRAY)
+        expected += struct.pack("qq", DATA_TYPE_FLOAT_ARRAY, len(FLOAT_ARRAY))
+        expected += b"".join(struct.pack("d", x) for x in FLOAT_ARRAY)
+        assert buffer == expected
+
+    def test_ndarray(self):
+        ints = np.arange(-5, 1000, dtype=np.int32)
+        floats = np.linspace(-1, 1, 77)
+        encoder = DamEncoder(DATA_SET)
+        encoder.add_int_array(ints)
+        encoder.add_float_array(floats)
+        encoder.add_int_array([])
+        buffer = encoder.finish()
+
+        decoder = DamDecoder(buffer)
+        int_array = decoder.decode_int_ndarray()
+        assert int_array.dtype == np.int64
+        np.testing.assert_array_equal(int_array, ints)
+
+        float_array = decoder.decode_float_ndarray()
+        np.testing.assert_array_equal(float_array, floats)
+        # a view of the buffer, not a copy
+        assert not float_array.flags.writeable and float_array.base is not None
+
+        assert decoder.decode_int_ndarray().size == 0
+
+    def test_invalid_type(self):
+        encoder = DamEncoder(DATA_SET)
+        encoder.add_int_array(INT_ARRAY)
+        decoder = DamDecoder(encoder.finish())
+        with pytest.raises(RuntimeError):
+            decoder.decode_float_ndarray()
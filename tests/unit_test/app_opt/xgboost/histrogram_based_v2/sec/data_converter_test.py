@@ -13,6 +13,7 @@
 # limitations under the License.
 from typing import Dict, List
 
+import numpy as np
 import pytest
 
 from nvflare.app_opt.xgboost.histogram_based_v2.sec.dam import DamDecoder, DamEncoder
@@ -98,16 +99,32 @@ class TestDataConverter:
         assert len(gh_pair) == data_converter.num_samples
 
         context = data_converter.decode_aggregation_context(aggr_buffer, None)
+        assert {k: v.tolist() for k, v in context.sample_groups.items()} == {0: [0, 3, 6, 8], 1: [1, 2, 4, 5, 7, 9]}
         assert len(context.features) == 2
         f1 = context.features[0]
         assert f1.feature_id == 0
         assert f1.num_bins == 2
-        assert f1.sample_bin_assignment == [0, 1, 1, 0, 0, 0, 1, 0, 0, 1]
+        assert f1.sample_bin_assignment.tolist() == [0, 1, 1, 0, 0, 0, 1, 0, 0, 1]
 
         f2 = context.features[1]
         assert f2.feature_id == 2
         assert f2.num_bins == 5
-        assert f2.sample_bin_assignment == [0, 4, 1, 2, 4, 3, 0, 1, 3, 0]
+        assert f2.sample_bin_assignment.tolist() == [0, 4, 1, 2, 4, 3, 0, 1, 3, 0]
+
+    def test_decode_values(self, data_converter, gh_buffer):
+        gh = DamDecoder(gh_buffer).decode_float_array()
+        gh_pairs = data_converter.decode_gh_pairs(gh_buffer, None)
+        assert gh_pairs == [
+            (data_converter.float_to_int(gh[2 * i]), data_converter.float_to_int(gh[2 * i + 1]))
+            for i in range(len(gh) // 2)
+        ]
+
+        cuts = np.array([0, 2, 5, 10])
+        slots = np.array([-1, 0, 1, 2, 4, 5, 9])
+        bins = data_converter.slots_to_bins(cuts, slots)
+        assert bins.tolist() == [data_converter.slot_to_bin(cuts, slot)[1] for slot in slots]
+        with pytest.raises(RuntimeError):
+            data_converter.slots_to_bins(cuts, np.array([10]))
 
     def test_encode(self, data_converter, aggr_results):
 
@@ -0,0 +1,158 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import gc
+import json
+import os
+import random
+import time
+
+import pytest
+
+from nvflare.app_opt.xgboost.histogram_based_v2.aggr import Aggregator
+from nvflare.app_opt.xgboost.histogram_based_v2.mock.paillier_bench import generate_paillier_keypair
+from nvflare.app_opt.xgboost.histogram_based_v2.sec.partial_he.adder import Adder
+from nvflare.app_opt.xgboost.histogram_based_v2.sec.partial_he.decrypter import Decrypter
+from nvflare.app_opt.xgboost.histogram_based_v2.sec.partial_he.encryptor import Encryptor
+from nvflare.app_opt.xgboost.histogram_based_v2.sec.partial_he.engine import PaillierEngine, pack_ints, unpack_ints
+from nvflare.app_opt.xgboost.histogram_based_v2.sec.partial_he.util import combine
+
+NUM_SAMPLES = 200
+NUM_BINS = 8
+
+
+@pytest.fixture(scope="module")
+def keys():
+    return generate_paillier_keypair(512)
+
+
+@pytest.fixture(scope="module")
+def engine(keys):
+    engine = PaillierEngine(keys[0], keys[1], max_workers=2, batch_size=16)
+    yield engine
+    engine.shutdown()
+
+
+def _gh_values():
+    rng = random.Random(0)
+    return [combine(rng.randint(-(10**7), 10**7), rng.randint(0, 10**6)) for _ in range(NUM_SAMPLES)]
+
+
+class TestPaillierEngine:
+    def test_keys(self, keys):
+        public_key, private_key = keys
+        assert public_key.n.bit_length() == 512
+        assert private_key.p * private_key.q == public_key.n
+
+    def test_pack(self):
+        values = [0, 1, 2**100, 2**128 - 1]
+        assert unpack_ints(pack_ints(values, 16), 16) == values
+
+    def test_encrypt_decrypt(self, keys, engine):
+        numbers = _gh_values() + [0, 1, -1, keys[0].max_int, -keys[0].max_int]
+        ciphertexts = engine.encrypt(numbers)
+        assert len(ciphertexts) == len(numbers)
+        assert len(set(ciphertexts)) == len(ciphertexts)
+        assert engine.decrypt(ciphertexts) == numbers
+
+        stats = engine.get_stats()
+        assert stats["encrypt"]["count"] == len(numbers)
+        assert set(stats["decrypt"]) >= {"pack", "compute", "unpack", "count"}
+
+    def test_out_of_range(self, keys, engine):
+        with pytest.raises(ValueError):
+            engine.encrypt([keys[0].max_int + 1])
+
+    def test_add(self, engine):
+        gh_values = _gh_values()
+        ciphertexts = engine.encrypt(gh_values)
+        rng = random.Random(1)
+        features = [(fid, [rng.randint(-1, NUM_BINS - 1) for _ in range(NUM_SAMPLES)], NUM_BINS) for fid in range(3)]
+        groups = [(1, [0, 5, 9, 100]), (2, list(range(0, NUM_SAMPLES, 3))), (3, [])]
+
+        result = engine.add(ciphertexts, features, groups)
+        expected = Aggregator().aggregate_batch(gh_values, features, groups)
+        assert [(fid, gid) for fid, gid, _ in result] == [(fid, gid) for fid, gid, _ in expected]
+        for (_, _, sums), (_, _, bins) in zip(result, expected):
+            assert engine.decrypt(sums) == bins
+
+        with pytest.raises(IndexError):
+            engine.add(ciphertexts, [(0, [NUM_BINS] * NUM_SAMPLES, NUM_BINS)])
+
+    def test_ciphertext_file_removed(self, keys):
+        features = [(0, [0, 1, 0, 1], 2)]
+        engine = PaillierEngine(keys[0], max_workers=1)
+        engine.add([1, 2, 3, 4], features)
+        path = engine._ciphertext_file[1]
+        assert os.path.exists(path)
+        engine.shutdown()
+        assert not os.path.exists(path)
+
+        # the file is removed even without shutdown()
+        engine = PaillierEngine(keys[0], max_workers=1)
+        engine.add([1, 2, 3, 4], features)
+        path = engine._ciphertext_file[1]
+        engine.exe.shutdown(wait=True)
+        del engine
+        gc.collect()
+        assert not os.path.exists(path)
+
+    @staticmethod
+    def _wait_precomputed(engine, size):
+        deadline = time.time() + 30
+        while engine.num_precomputed() < size and time.time() < deadline:
+            time.sleep(0.05)
+        assert engine.num_precomputed() == size
+
+    def test_precompute(self, keys):
+        engine = PaillierEngine(keys[0], keys[1], max_workers=2, batch_size=8, precompute_size=40)
+        try:
+            self._wait_precomputed(engine, 40)
+
+            numbers = list(range(-15, 15))
+            ciphertexts = engine.encrypt(numbers)
+            assert engine.decrypt(ciphertexts) == numbers
+            assert engine.get_stats()["encrypt"]["precomputed"] == 30
+
+            # the table is refilled in the background
+            self._wait_precomputed(engine, 40)
+            assert engine.get_stats()["precompute"]["count"] == 70
+        finally:
+            engine.shutdown()
+
+    def test_encryptor_decrypter_adder(self, keys):
+        public_key, private_key = keys
+        encryptor = Encryptor(public_key, max_workers=2, batch_size=32)
+        decrypter = Decrypter(private_key, max_workers=2, batch_size=32)
+        adder = Adder(max_workers=2)
+        try:
+            gh_values = _gh_values()
+            encrypted = encryptor.encrypt(gh_values)
+            mask = [i % NUM_BINS for i in range(NUM_SAMPLES)]
+            groups = [(0, list(range(50))), (1, list(range(50, NUM_SAMPLES)))]
+
+            result = adder.add(encrypted, [(7, mask, NUM_BINS)], groups, encode_sum=True, pubkey=public_key)
+            decrypted = decrypter.decrypt([json.loads(sums) for _, _, sums in result] + [encrypted[:3]])
+
+            expected = Aggregator().aggregate_batch(gh_values, [(7, mask, NUM_BINS)], groups)
+            assert decrypted[:2] == [bins for _, _, bins in expected]
+            assert decrypted[2] == gh_values[:3]
+
+            path = adder.engine._ciphertext_file[1]
+            adder.shutdown()
+            assert adder.engine is None
+            assert not os.path.exists(path)
+        finally:
+            for engine in (encryptor.engine, decrypter.engine):
+                engine.shutdown()
+            adder.shutdown()
@@ -0,0 +1,121 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+
+import pytest
+
+from nvflare.fuel.f3.cellnet.cell import Cell
+from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey, ReturnCode
+from nvflare.fuel.f3.cellnet.fqcn import FQCN
+from nvflare.fuel.f3.message import Message
+from nvflare.fuel.f3.streaming.stream_const import StreamHeaderKey
+from nvflare.fuel.f3.streaming.stream_types import StreamFuture
+
+
+class _FakeNetwork:
+    """Completes all sends right away, and replies to the targets that are not stalled"""
+
+    def __init__(self, cell: Cell, stalled=()):
+        self.cell = cell
+        self.stalled = stalled
+        self.sent = {}
+        cell.send_blob = self.send_blob
+
+    def send_blob(self, channel, topic, target, message, secure=False, optional=False):
+        self.sent[target] = message
+        future = StreamFuture(len(self.sent), message.headers)
+        future.set_result(len(message.payload))
+        if target not in self.stalled:
+            reply = StreamFuture(0, {StreamHeaderKey.STREAM_REQ_ID: message.get_header(StreamHeaderKey.STREAM_REQ_ID)})
+            reply.set_result(target.encode())
+            self.cell._process_reply(reply)
+        return future
+
+
+class TestCellBroadcast:
+    @pytest.fixture
+    def cell(self, request):
+        cell = Cell(f"bcast-{request.node.name}", "grpc://localhost:0", secure=False, credentials={})
+        cell.broadcast_max_workers = 4
+        yield cell
+        cell.broadcast_executor.shutdown()
+
+    def test_broadcast_with_bounded_executor(self, cell):
+        network = _FakeNetwork(cell)
+        targets = [f"site-{i}" for i in range(100)]
+        payload = bytes(1024)
+        request = Message({"key": "value"}, payload)
+
+        num_threads = threading.active_count()
+        results = cell._broadcast_request("test", "bcast", targets, request, timeout=5.0)
+        assert threading.active_count() - num_threads <= 4
+
+        assert sorted(results.keys()) == sorted(targets)
+        for t, reply in results.items():
+            assert reply.payload == t.encode()
+            sent = network.sent[t]
+            assert sent.payload is payload
+            assert sent.get_header(MessageHeaderKey.DESTINATION) == t
+            assert sent.get_header("key") == "value"
+
+        # the headers of the request are not changed by targets
+        assert MessageHeaderKey.DESTINATION not in request.headers
+
+        # the executor is reused
+        executor = cell.broadcast_executor
+        cell._broadcast_request("test", "bcast", targets, Message({}, payload), timeout=5.0)
+        assert cell.broadcast_executor is executor
+
+    def test_stalled_targets_time_out_together(self, cell):
+        stalled = [f"site-{i}" for i in range(16)]
+        _FakeNetwork(cell, stalled=stalled)
+        targets = [f"site-{i}" for i in range(20)]
+
+        start = time.time()
+        results = cell._broadcast_request("test", "bcast", targets, Message({}, b"data"), timeout=0.5)
+
+        # the timeouts of stalled targets start when the request is sent, not when a worker starts to wait
+        assert time.time() - start < 1.2
+        for t, reply in results.items():
+            rc = reply.get_header(MessageHeaderKey.RETURN_CODE)
+            if t in stalled:
+                assert rc == ReturnCode.TIMEOUT
+            else:
+                assert reply.payload == t.encode()
+
+
+class _Connector:
+    def __init__(self, handle):
+        self.handle = handle
+
+
+class TestCellConnectors:
+    def test_drop_stripe_connectors_before_endpoint(self):
+        core_cell = Cell("site-1", "grpc://localhost:0", secure=False, credentials={}).core_cell
+        calls = []
+        core_cell.communicator.remove_connector = lambda handle: calls.append(("connector", handle))
+        core_cell.communicator.remove_endpoint = lambda name: calls.append(("endpoint", name))
+        core_cell.bb_ext_connector = _Connector("bb")
+        core_cell.bb_ext_stripe_connectors = [_Connector("stripe1"), _Connector("stripe2")]
+
+        core_cell.drop_connectors()
+        assert calls == [
+            ("connector", "stripe1"),
+            ("connector", "stripe2"),
+            ("connector", "bb"),
+            ("endpoint", FQCN.ROOT_SERVER),
+        ]
+        assert core_cell.bb_ext_connector is None
+        assert core_cell.bb_ext_stripe_connectors == []
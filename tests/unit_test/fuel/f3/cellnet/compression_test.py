@@ -0,0 +1,222 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+import pytest
+
+from nvflare.fuel.f3.cellnet.cell import Cell
+from nvflare.fuel.f3.cellnet.compression import PayloadCompressor, get_codec, get_codec_names
+from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey, MessageType
+from nvflare.fuel.f3.endpoint import Endpoint
+from nvflare.fuel.f3.message import Message
+from nvflare.fuel.f3.stats_pool import StatsPoolManager
+from nvflare.fuel.f3.streaming.stream_const import StreamHeaderKey
+
+DATA = b"federated learning " * 1000
+
+
+class _Configurator:
+    def __init__(self, codec="zlib", rules=None, min_size=100):
+        self.codec = codec
+        self.rules = rules or {}
+        self.min_size = min_size
+
+    def get_compression_codec(self, default):
+        return self.codec
+
+    def get_compression_level(self, default):
+        return default
+
+    def get_compression_min_size(self, default):
+        return self.min_size
+
+    def get_compression_rules(self, default):
+        return self.rules
+
+    def get_max_message_size(self):
+        return 1024 * 1024
+
+
+def _message(payload, channel="ch", topic="tp", destination="site-1"):
+    return Message(
+        {
+            MessageHeaderKey.CHANNEL: channel,
+            MessageHeaderKey.TOPIC: topic,
+            MessageHeaderKey.ORIGIN: "server",
+            MessageHeaderKey.DESTINATION: destination,
+        },
+        payload,
+    )
+
+
+class TestPayloadCompressor:
+    @pytest.fixture
+    def make_compressor(self, request):
+        names = []
+
+        def make(**kwargs):
+            name = f"compressor-{request.node.name}-{len(names)}"
+            names.append(name)
+            compressor = PayloadCompressor(name, _Configurator(**kwargs))
+            peer = Message({MessageHeaderKey.ORIGIN: "site-1"})
+            compressor.advertise(peer)
+            compressor.update_peer(peer)
+            return compressor
+
+        yield make
+        for name in names:
+            StatsPoolManager.delete_pool(f"compression_ratio@{name}")
+            StatsPoolManager.delete_pool(f"compression_time@{name}")
+
+    @pytest.mark.parametrize("name", get_codec_names())
+    def test_codec_round_trip(self, name):
+        codec = get_codec(name)
+        buffers = [DATA[:1000], memoryview(DATA)[1000:5000], bytearray(DATA[5000:])]
+        compressed = codec.compress(buffers, -1)
+        assert len(compressed) < len(DATA)
+        assert codec.decompress(compressed, len(DATA)) == DATA
+
+        with pytest.raises(Exception):
+            codec.decompress(compressed, len(DATA) - 1)
+
+    def test_zstd_declared_size(self):
+        zstandard = pytest.importorskip("zstandard")
+        codec = get_codec("zstd")
+
+        # the frame declares its content size, which must not be trusted
+        compressed = zstandard.ZstdCompressor(write_content_size=True).compress(DATA)
+        assert codec.decompress(compressed, len(DATA)) == DATA
+        with pytest.raises(ValueError):
+            codec.decompress(compressed, len(DATA) - 1)
+
+        # without the declared size, the data is decompressed up to the max size
+        compressed = zstandard.ZstdCompressor(write_content_size=False).compress(DATA * 4)
+        with pytest.raises(ValueError):
+            codec.decompress(compressed, len(DATA))
+
+    def test_round_trip(self, make_compressor):
+        compressor = make_compressor()
+        message = _message([DATA[:100], DATA[100:]])
+        compressor.compress(message)
+        assert message.get_header(MessageHeaderKey.COMPRESSION) == "zlib"
+        assert len(message.payload) < len(DATA)
+
+        compressor.decompress(message)
+        assert message.payload == DATA
+        assert MessageHeaderKey.COMPRESSION not in message.headers
+
+        assert compressor.ratio_pool.cat_bins.get("zlib:ch:tp")
+        assert compressor.time_pool.cat_bins.get("compress:ch:tp")
+        assert compressor.time_pool.cat_bins.get("decompress:ch:tp")
+
+    def test_skipped(self, make_compressor):
+        compressor = make_compressor(min_size=len(DATA) + 1)
+        message = _message(DATA)
+        compressor.compress(message)
+        assert message.payload is DATA
+
+        compressor = make_compressor()
+        random_data = os.urandom(len(DATA))
+        message = _message(random_data)
+        compressor.compress(message)
+        assert message.payload is random_data
+
+        # the peer doesn't support compression
+        message = _message(DATA, destination="site-2")
+        compressor.compress(message)
+        assert message.payload is DATA
+
+    def test_rules(self, make_compressor):
+        compressor = make_compressor(codec="none", rules={"ch": "lzma", "ch:big": "zlib", "other:tp": "none"})
+        expected = {("ch", "tp"): "lzma", ("ch", "big"): "zlib", ("other", "tp"): None, ("x", "y"): None}
+        for (channel, topic), codec in expected.items():
+            message = _message(DATA, channel, topic)
+            compressor.compress(message)
+            assert message.get_header(MessageHeaderKey.COMPRESSION) == codec
+
+        # chunks of a stream are compressed with the channel/topic of the stream
+        message = _message(DATA, channel="stream")
+        message.add_headers({StreamHeaderKey.CHANNEL: "ch", StreamHeaderKey.TOPIC: "big"})
+        compressor.compress(message)
+        assert message.get_header(MessageHeaderKey.COMPRESSION) == "zlib"
+
+    def test_unavailable_codec(self, make_compressor):
+        compressor = make_compressor(codec="foo", rules={"ch": "bar"})
+        assert compressor.default_codec == "none"
+        assert compressor.rules == {"ch": "none"}
+
+    def test_invalid_size(self, make_compressor):
+        compressor = make_compressor()
+        message = _message(DATA)
+        compressor.compress(message)
+        message.set_header(MessageHeaderKey.UNCOMPRESSED_LEN, 2 * 1024 * 1024)
+        with pytest.raises(RuntimeError):
+            compressor.decompress(message)
+
+
+class TestCellCompression:
+    @pytest.fixture
+    def cells(self, request):
+        cells = [
+            Cell(f"{name}-{request.node.name}", "grpc://localhost:0", secure=False, credentials={}).core_cell
+            for name in ["server", "client"]
+        ]
+        for cell in cells:
+            cell.compressor.default_codec = "zlib"
+        yield cells
+        for cell in cells:
+            cell.ALL_CELLS.pop(cell.get_fqcn())
+
+    @staticmethod
+    def _transfer(sender, receiver, payload):
+        """Send a message from the sender over a captured connection, and process it with the receiver.
+
+        Returns: a copy of the message that was sent
+        """
+        sent = []
+        sender.communicator.send = lambda endpoint, app_id, message: sent.append(message)
+        message = Message(
+            {
+                MessageHeaderKey.CHANNEL: "test",
+                MessageHeaderKey.TOPIC: "echo",
+                MessageHeaderKey.MSG_TYPE: MessageType.REQ,
+                MessageHeaderKey.ORIGIN: sender.get_fqcn(),
+                MessageHeaderKey.DESTINATION: receiver.get_fqcn(),
+            },
+            payload,
+        )
+        assert not sender._send_to_endpoint(Endpoint("relay"), message)
+        result = Message(dict(sent[0].headers), sent[0].payload)
+        receiver.process_message(Endpoint("relay"), None, sender.APP_ID, sent[0])
+        return result
+
+    def test_negotiated_compression(self, cells):
+        server, client = cells
+        received = []
+        server.register_request_cb("test", "echo", lambda request: received.append(request.payload))
+        client.register_request_cb("test", "echo", lambda request: received.append(request.payload))
+
+        # the client doesn't know the codecs of the server yet
+        sent = self._transfer(client, server, DATA)
+        assert MessageHeaderKey.COMPRESSION not in sent.headers
+        assert sent.get_header(MessageHeaderKey.ACCEPT_COMPRESSION) == client.compressor.accepted
+
+        # the server knows the codecs of the client
+        sent = self._transfer(server, client, DATA)
+        assert sent.get_header(MessageHeaderKey.COMPRESSION) == "zlib"
+        assert len(sent.payload) < len(DATA)
+
+        assert received == [DATA, DATA]
+        assert server.compressor.ratio_pool.cat_bins.get("zlib:test:echo")
+        assert client.compressor.time_pool.cat_bins.get("decompress:test:echo")
@@ -11,7 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from nvflare.fuel.f3.cellnet.utils import format_size
+from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey
+from nvflare.fuel.f3.cellnet.utils import decode_payload, format_size
+from nvflare.fuel.f3.drivers.buffer_pool import MIN_POOLED_SIZE, ReceiveBufferPool
+from nvflare.fuel.f3.message import Message
+from nvflare.fuel.f3.streaming.stream_const import StreamDataType, StreamHeaderKey
 
 
 class TestUtils:
@@ -49,3 +53,27 @@ class TestUtils:
 
         # String value
         assert format_size("1099511627776", False) == "1.1TB"
+
+    def test_decode_raw_payload(self):
+        pool = ReceiveBufferPool(1024 * 1024)
+
+        # raw payloads are copied out of the receive buffer, with the type they had before buffers were pooled
+        frame = pool.acquire(MIN_POOLED_SIZE)
+        frame[-4:] = b"pong"
+        message = Message({MessageHeaderKey.PAYLOAD_ENCODING: "bytes"}, frame[-4:])
+        decode_payload(message)
+        assert message.payload == bytearray(b"pong")
+        assert type(message.payload) is bytearray
+        # the buffer is back in the pool
+        assert pool.bytes_held > 0
+
+        message = Message({}, memoryview(b"ping")[1:])
+        decode_payload(message)
+        assert message.payload == b"ing"
+        assert type(message.payload) is bytes
+
+        # stream chunks stay views of the receive buffer
+        chunk = pool.acquire(100)
+        message = Message({StreamHeaderKey.DATA_TYPE: StreamDataType.CHUNK}, chunk[10:])
+        decode_payload(message)
+        assert isinstance(message.payload, memoryview)
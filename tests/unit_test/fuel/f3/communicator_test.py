@@ -126,3 +126,42 @@ class TestCommunicator:
 
         comm_b.stop()
         comm_a.stop()
+
+    def test_striped_connections(self):
+        comm_state = CommState()
+        comm_a = get_comm_a(comm_state)
+        comm_b = get_comm_b(comm_state)
+        comm_b.conn_manager.num_conns = 3
+
+        connections = set()
+
+        class _StripeReceiver(MessageReceiver):
+            def process_message(self, endpoint: Endpoint, connection: Connection, app_id: int, message: Message):
+                connections.add(connection.name)
+
+        comm_b.register_message_receiver(APP_ID + 1, _StripeReceiver())
+
+        _, url, _ = comm_a.start_listener("tcp", {"ports": "5000-6000"})
+        comm_a.start()
+        for _ in range(3):
+            comm_b.add_connector(url, Mode.ACTIVE)
+        comm_b.start()
+
+        # The listener side keeps all the connections, as advertised by the connector side
+        for _ in range(100):
+            conns_a = comm_a.conn_manager.get_connections(NODE_B)
+            conns_b = comm_b.conn_manager.get_connections(NODE_A)
+            if conns_a and conns_b and len(conns_a) == 3 and len(conns_b) == 3:
+                break
+            time.sleep(0.1)
+        assert len(comm_a.conn_manager.get_connections(NODE_B)) == 3
+        assert len(comm_b.conn_manager.get_connections(NODE_A)) == 3
+
+        for i in range(9):
+            comm_a.send(Endpoint(NODE_B), APP_ID + 1, Message({}, str(i).encode("utf-8")))
+
+        time.sleep(1)
+        assert len(connections) == 3
+
+        comm_b.stop()
+        comm_a.stop()
@@ -0,0 +1,99 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import socket
+import threading
+import time
+
+from nvflare.fuel.f3.drivers.aio_conn import AioConnection
+from nvflare.fuel.f3.drivers.aio_context import AioContext
+from nvflare.fuel.f3.drivers.connector_info import ConnectorInfo
+from nvflare.fuel.utils.constants import Mode
+
+
+def _read_exactly(sock, size):
+    data = bytearray()
+    while len(data) < size:
+        data += sock.recv(size - len(data))
+    return bytes(data)
+
+
+def _connect(aio_ctx, tx_sock):
+    reader, writer = aio_ctx.run_coro(asyncio.open_connection(sock=tx_sock)).result(timeout=10.0)
+    connector = ConnectorInfo("test", None, {}, Mode.ACTIVE, 0, 0, False, threading.Event())
+    return AioConnection(connector, aio_ctx, reader, writer)
+
+
+class TestAioConnection:
+    def test_send_frame_parts(self):
+        aio_ctx = AioContext("aio_conn_test")
+        loop_thread = threading.Thread(target=aio_ctx.run_aio_loop, daemon=True)
+        loop_thread.start()
+        tx_sock, rx_sock = socket.socketpair()
+        rx_sock.settimeout(10.0)
+        try:
+            conn = _connect(aio_ctx, tx_sock)
+
+            # from another thread
+            conn.send_frame_parts([b"abc", memoryview(b"def")])
+            assert _read_exactly(rx_sock, 6) == b"abcdef"
+
+            # from the event loop, as in the handshake of a new connection: it must not block the loop
+            async def send_in_loop():
+                conn.send_frame_parts([b"ghi", bytearray(b"jkl")])
+
+            aio_ctx.run_coro(send_in_loop()).result(timeout=10.0)
+            assert _read_exactly(rx_sock, 6) == b"ghijkl"
+        finally:
+            aio_ctx.stop_aio_loop()
+            tx_sock.close()
+            rx_sock.close()
+
+    def test_reuse_buffer_with_slow_reader(self):
+        aio_ctx = AioContext("aio_conn_test")
+        loop_thread = threading.Thread(target=aio_ctx.run_aio_loop, daemon=True)
+        loop_thread.start()
+        tx_sock, rx_sock = socket.socketpair()
+        for sock in (tx_sock, rx_sock):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        rx_sock.settimeout(10.0)
+        frame_size = 256 * 1024
+        num_frames = 8
+        received = []
+
+        def read_slowly():
+            for _ in range(num_frames):
+                time.sleep(0.05)
+                received.append(_read_exactly(rx_sock, frame_size))
+
+        reader_thread = threading.Thread(target=read_slowly, daemon=True)
+        try:
+            conn = _connect(aio_ctx, tx_sock)
+            reader_thread.start()
+
+            # the buffer is reused for each frame, as by the stream sender
+            buffer = bytearray(frame_size)
+            for i in range(num_frames):
+                buffer[:] = bytes([i]) * frame_size
+                conn.send_frame_parts([memoryview(buffer)[:16], memoryview(buffer)[16:]])
+                # all the data is sent when the call returns
+                assert conn.writer.transport.get_write_buffer_size() == 0
+
+            reader_thread.join(timeout=30.0)
+            assert [frame == bytes([i]) * frame_size for i, frame in enumerate(received)] == [True] * num_frames
+        finally:
+            aio_ctx.stop_aio_loop()
+            tx_sock.close()
+            rx_sock.close()
@@ -0,0 +1,72 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from nvflare.fuel.f3.drivers.buffer_pool import (
+    MAX_POOLED_SIZE,
+    MIN_POOLED_SIZE,
+    SIZE_CLASS_GRANULARITY,
+    ReceiveBufferPool,
+    release_receive_buffer,
+)
+
+ONE_MB = 1024 * 1024
+
+
+class TestReceiveBufferPool:
+    def test_reuse(self):
+        pool = ReceiveBufferPool(16 * ONE_MB)
+        frame = pool.acquire(ONE_MB + 100)
+        assert len(frame) == ONE_MB + 100
+        buffer = frame.obj
+
+        # Releasing a payload sliced from the frame returns the whole buffer
+        assert release_receive_buffer(frame[100:])
+        assert pool.bytes_held == ONE_MB + SIZE_CLASS_GRANULARITY
+
+        frame = pool.acquire(ONE_MB + 200)
+        assert frame.obj is buffer
+        assert pool.bytes_held == 0
+
+        stats = pool.get_stats()
+        assert stats["hit"] == 1
+        assert stats["miss"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["peak_bytes_held"] == ONE_MB + SIZE_CLASS_GRANULARITY
+
+    def test_double_release(self):
+        pool = ReceiveBufferPool(16 * ONE_MB)
+        frame = pool.acquire(ONE_MB)
+        assert release_receive_buffer(frame)
+        assert release_receive_buffer(frame)
+        assert pool.bytes_held == ONE_MB
+
+    def test_pool_limit(self):
+        pool = ReceiveBufferPool(ONE_MB)
+        frames = [pool.acquire(ONE_MB) for _ in range(2)]
+        assert release_receive_buffer(frames[0])
+        assert not release_receive_buffer(frames[1])
+        assert pool.bytes_held == ONE_MB
+
+    def test_unpooled(self):
+        pool = ReceiveBufferPool(16 * ONE_MB)
+        for size in (MIN_POOLED_SIZE - 1, MAX_POOLED_SIZE + 1):
+            frame = pool.acquire(size)
+            assert len(frame) == size
+            assert not release_receive_buffer(frame)
+
+        assert not release_receive_buffer(b"not pooled")
+        assert not release_receive_buffer(None)
+
+    def test_disabled(self):
+        pool = ReceiveBufferPool(0)
+        assert not release_receive_buffer(pool.acquire(ONE_MB))
@@ -0,0 +1,72 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import socket
+import threading
+
+import msgpack
+
+from nvflare.fuel.f3.drivers.connector_info import ConnectorInfo
+from nvflare.fuel.f3.drivers.socket_conn import SocketConnection
+from nvflare.fuel.f3.endpoint import Endpoint
+from nvflare.fuel.f3.sfm.constants import Types
+from nvflare.fuel.f3.sfm.prefix import PREFIX_LEN, Prefix
+from nvflare.fuel.f3.sfm.sfm_conn import SfmConnection
+from nvflare.fuel.utils.constants import Mode
+
+
+def _make_pair():
+    tx_sock, rx_sock = socket.socketpair()
+    connector = ConnectorInfo("test", None, {}, Mode.ACTIVE, 0, 0, False, threading.Event())
+    return SocketConnection(tx_sock, connector), SocketConnection(rx_sock, connector)
+
+
+class TestSocketConnection:
+    def test_send_frame_parts(self):
+        tx, rx = _make_pair()
+        payload = bytes(range(256)) * 1024
+        prefix = Prefix(PREFIX_LEN + 3 + len(payload), 3, Types.DATA)
+        prefix_buf = bytearray(PREFIX_LEN)
+        prefix.to_buffer(prefix_buf, 0)
+
+        result = {}
+        reader = threading.Thread(target=lambda: result.update(frame=rx.read_frame()))
+        reader.start()
+        tx.send_frame_parts([prefix_buf, b"abc", memoryview(payload)])
+        reader.join()
+
+        assert bytes(result["frame"]) == bytes(prefix_buf) + b"abc" + payload
+        tx.close()
+        rx.close()
+
+    def test_sfm_frame_layout(self):
+        tx, rx = _make_pair()
+        sfm_conn = SfmConnection(tx, Endpoint("test"))
+        headers = {"k": "v"}
+        payload = memoryview(bytearray(b"x" * 100000))
+
+        result = {}
+        reader = threading.Thread(target=lambda: result.update(frame=rx.read_frame()))
+        reader.start()
+        sfm_conn.send_frame(Prefix(type=Types.DATA, app_id=1, stream_id=2), headers, payload)
+        reader.join()
+
+        frame = bytes(result["frame"])
+        prefix = Prefix.from_bytes(frame)
+        assert prefix.length == len(frame)
+        assert prefix.stream_id == 2
+        header_end = PREFIX_LEN + prefix.header_len
+        assert msgpack.unpackb(frame[PREFIX_LEN:header_end]) == headers
+        assert frame[header_end:] == bytes(payload)
+        tx.close()
+        rx.close()
@@ -0,0 +1,86 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+import pytest
+
+from nvflare.fuel.f3.streaming.buffer_downloader import _BufferList, _ChunkConsumer, _ChunkProducer
+from nvflare.fuel.f3.streaming.obj_downloader import ProduceRC
+
+
+class TestBufferDownloader:
+    @pytest.mark.parametrize(
+        "sizes, chunk_size",
+        [
+            ([100], 1000),
+            ([100, 200, 300], 64),
+            ([0, 1000, 0, 7], 333),
+            ([1024, 1024], 1024),
+        ],
+    )
+    def test_round_trip(self, sizes, chunk_size):
+        sources = [os.urandom(s) for s in sizes]
+        targets = [bytearray(s) for s in sizes]
+
+        producer = _ChunkProducer(chunk_size)
+        consumer = _ChunkConsumer(targets)
+        obj = _BufferList(sources)
+
+        state = None
+        while True:
+            rc, data, state = producer.produce("ref", obj, state, "site-1")
+            if rc == ProduceRC.EOF:
+                break
+            assert rc == ProduceRC.OK
+            assert len(data) <= chunk_size
+            state = consumer.consume("ref", state, data)
+
+        assert consumer.total_bytes == sum(sizes)
+        assert [bytes(t) for t in targets] == sources
+
+    def test_read_single_buffer_is_view(self):
+        obj = _BufferList([b"abcdef", b"ghij"])
+        assert isinstance(obj.read(1, 3), memoryview)
+        assert bytes(obj.read(4, 4)) == b"efgh"
+        assert bytes(obj.read(8, 100)) == b"ij"
+
+    def test_too_much_data(self):
+        consumer = _ChunkConsumer([bytearray(4)])
+        with pytest.raises(RuntimeError):
+            consumer.consume("ref", {}, b"12345")
+
+    def test_pipelined_out_of_order(self):
+        sizes = [1000, 2000, 500]
+        sources = [os.urandom(s) for s in sizes]
+        targets = [bytearray(s) for s in sizes]
+
+        producer = _ChunkProducer(300)
+        consumer = _ChunkConsumer(targets)
+        obj = _BufferList(sources)
+
+        _, data, state = producer.produce("ref", obj, None, "site-1")
+        consumer.consume("ref", state, data)
+        states = consumer.get_pipeline_states("ref", state)
+
+        # the last state is for EOF
+        rc, _, _ = producer.produce("ref", obj, states[-1], "site-1")
+        assert rc == ProduceRC.EOF
+
+        replies = [producer.produce("ref", obj, s, "site-1") for s in states[:-1]]
+        for rc, data, state in reversed(replies):
+            assert rc == ProduceRC.OK
+            consumer.consume("ref", state, data)
+
+        assert consumer.total_bytes == sum(sizes)
+        assert [bytes(t) for t in targets] == sources
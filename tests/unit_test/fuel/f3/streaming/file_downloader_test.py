@@ -0,0 +1,166 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import threading
+import time
+
+import pytest
+
+from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey
+from nvflare.fuel.f3.message import Message
+from nvflare.fuel.f3.streaming.file_downloader import FileDownloader, _ChunkProducer, _File
+from nvflare.fuel.f3.streaming.obj_downloader import REQUEST_POOL_SIZE, DownloadStatus, ObjDownloader
+
+
+class _LoopbackCell:
+    """Handles download requests with ObjDownloader in the calling thread, and tracks requests in flight"""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def register_request_cb(self, channel, topic, cb):
+        pass
+
+    def send_request(self, channel, target, topic, request, timeout, secure, optional, abort_signal):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        request.set_header(MessageHeaderKey.ORIGIN, "site-1")
+        try:
+            return ObjDownloader._handle_download(Message(request.headers, request.payload))
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class TestFileDownloader:
+    @pytest.fixture
+    def source_file(self, tmp_path):
+        file_name = str(tmp_path / "source.bin")
+        with open(file_name, "wb") as f:
+            f.write(os.urandom(100 * 1024 + 7))
+        return file_name
+
+    @pytest.mark.parametrize("max_outstanding_requests", [1, 4])
+    def test_download(self, source_file, tmp_path, max_outstanding_requests):
+        cell = _LoopbackCell()
+        downloaded = []
+        tx_id = ObjDownloader.new_transaction(
+            cell=cell, producer=_ChunkProducer(chunk_size=4096), timeout=10.0, timeout_cb=lambda *args: None
+        )
+        ref_id = ObjDownloader.add_download_object(
+            tx_id,
+            _File(source_file),
+            obj_downloaded_cb=lambda rid, to_site, status, obj: downloaded.append(status),
+        )
+
+        err, path = FileDownloader.download_file(
+            from_fqcn="server",
+            ref_id=ref_id,
+            per_request_timeout=5.0,
+            cell=cell,
+            location=str(tmp_path),
+            max_outstanding_requests=max_outstanding_requests,
+        )
+        ObjDownloader.delete_transaction(tx_id)
+
+        assert err is None
+        with open(source_file, "rb") as f1, open(path, "rb") as f2:
+            assert f1.read() == f2.read()
+
+        # the downloaded CB is called once, after all data is received
+        assert downloaded == [DownloadStatus.SUCCESS]
+        assert cell.max_in_flight == max_outstanding_requests
+
+    def test_concurrent_downloads(self, source_file, tmp_path):
+        cell = _LoopbackCell(delay=0.05)
+        tx_id = ObjDownloader.new_transaction(
+            cell=cell, producer=_ChunkProducer(chunk_size=4096), timeout=10.0, timeout_cb=lambda *args: None
+        )
+        ref_id = ObjDownloader.add_download_object(tx_id, _File(source_file))
+        errors = []
+
+        def download(i):
+            location = tmp_path / f"site-{i}"
+            location.mkdir()
+            err, _ = FileDownloader.download_file(
+                from_fqcn="server",
+                ref_id=ref_id,
+                per_request_timeout=5.0,
+                cell=cell,
+                location=str(location),
+                max_outstanding_requests=4,
+            )
+            errors.append(err)
+
+        threads = [threading.Thread(target=download, args=(i,)) for i in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        ObjDownloader.delete_transaction(tx_id)
+
+        assert errors == [None] * 16
+        # the pipelined requests of all downloads are sent by one bounded pool. The first and the last request
+        # of each download are sent by the thread of the download.
+        assert cell.max_in_flight <= REQUEST_POOL_SIZE + 16
+
+    def test_close_during_read(self, source_file, monkeypatch):
+        obj = _File(source_file)
+        obj.read(0, 10)
+        file = obj.file
+
+        reading = threading.Event()
+        resume = threading.Event()
+        pread = os.pread
+
+        def slow_pread(fd, length, offset):
+            reading.set()
+            resume.wait(10.0)
+            return pread(fd, length, offset)
+
+        monkeypatch.setattr(os, "pread", slow_pread)
+        result = []
+        reader = threading.Thread(target=lambda: result.append(obj.read(0, 100)))
+        reader.start()
+        assert reading.wait(10.0)
+
+        # the file is closed when the read is done
+        obj.close()
+        assert not file.closed
+        resume.set()
+        reader.join()
+        assert file.closed and obj.file is None
+        with open(source_file, "rb") as f:
+            assert result == [f.read(100)]
+
+    def test_producer_keeps_file_open(self, source_file):
+        obj = _File(source_file)
+        producer = _ChunkProducer(chunk_size=1000)
+
+        _, chunk1, state = producer.produce("ref", obj, None, "site-1")
+        file = obj.file
+        _, chunk2, _ = producer.produce("ref", obj, state, "site-1")
+        assert obj.file is file
+        assert state == {"received_bytes": 1000, "size": obj.size}
+
+        with open(source_file, "rb") as f:
+            assert chunk1 + chunk2 == f.read(2000)
+
+        producer.release(obj)
+        assert obj.file is None and file.closed
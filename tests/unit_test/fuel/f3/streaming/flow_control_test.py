@@ -0,0 +1,85 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from nvflare.fuel.f3.streaming.flow_control import AdaptiveWindow
+
+MB = 1024 * 1024
+
+
+def _send_window(window: AdaptiveWindow, offset: int, now: float, chunk_size: int = MB) -> int:
+    """Send chunks to fill the window, and return the new offset"""
+    end = offset + window.size
+    while offset < end:
+        offset += chunk_size
+        window.on_send(offset, now)
+    return offset
+
+
+class TestAdaptiveWindow:
+    def test_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            AdaptiveWindow(4 * MB, 8 * MB, 4 * MB)
+
+    def test_initial_size_clamped(self):
+        assert AdaptiveWindow(1 * MB, 4 * MB, 16 * MB).size == 4 * MB
+        assert AdaptiveWindow(32 * MB, 4 * MB, 16 * MB).size == 16 * MB
+
+    def test_grows_when_window_limited(self):
+        # The link is fast, so a whole window is acknowledged after one RTT of 0.1 sec
+        window = AdaptiveWindow(4 * MB, 4 * MB, 256 * MB)
+        now = 0.0
+        offset = 0
+        sizes = []
+        for _ in range(6):
+            offset = _send_window(window, offset, now)
+            now += 0.1
+            window.on_ack(offset, now)
+            sizes.append(window.size)
+
+        assert sizes == sorted(sizes)
+        assert sizes[-1] > 16 * MB
+        assert window.min_rtt == pytest.approx(0.1)
+        assert window.max_window == sizes[-1]
+
+    def test_respects_max_size(self):
+        window = AdaptiveWindow(4 * MB, 4 * MB, 32 * MB)
+        now = 0.0
+        offset = 0
+        for _ in range(10):
+            offset = _send_window(window, offset, now)
+            now += 0.1
+            window.on_ack(offset, now)
+        assert window.size == 32 * MB
+
+    def test_shrinks_with_slow_receiver(self):
+        window = AdaptiveWindow(64 * MB, 4 * MB, 256 * MB)
+        _send_window(window, 0, 0.0)
+
+        # The first ACK comes after the min RTT of 0.1 sec, then the receiver only reads 1MB per second
+        window.on_ack(MB, 0.1)
+        for ack in range(2, 20):
+            window.on_ack(ack * MB, 0.1 + ack - 1)
+
+        assert window.size == 4 * MB
+        assert window.max_rate == pytest.approx(MB, rel=0.2)
+
+    def test_old_ack_ignored(self):
+        window = AdaptiveWindow(4 * MB, 4 * MB, 256 * MB)
+        window.on_send(MB, 0.0)
+        window.on_send(2 * MB, 0.0)
+        window.on_ack(2 * MB, 0.5)
+        window.on_ack(MB, 10.0)
+        assert window.srtt == pytest.approx(0.5)
+        assert window.ack_offset == 2 * MB
@@ -0,0 +1,111 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import io
+import os
+import time
+from zipfile import ZipFile
+
+import pytest
+
+from nvflare.fuel.utils.app_artifacts import (
+    BLOB_PREFIX,
+    AppPackage,
+    ArtifactCache,
+    DeployArtifactManager,
+    MissingArtifactsError,
+    content_hash,
+)
+from nvflare.fuel.utils.zip_utils import zip_directory_to_bytes
+
+
+@pytest.fixture
+def app_dir(tmp_path):
+    root = tmp_path / "app"
+    os.makedirs(root / "config")
+    os.makedirs(root / "custom" / "empty")
+    (root / "config" / "config_fed_client.json").write_text('{"format_version": 2}')
+    (root / "custom" / "trainer.py").write_bytes(os.urandom(5000))
+    (root / "custom" / "copy.py").write_bytes((root / "custom" / "trainer.py").read_bytes())
+    return str(root)
+
+
+def _blobs(deploy_data):
+    with ZipFile(io.BytesIO(deploy_data)) as z:
+        return [n[len(BLOB_PREFIX) :] for n in z.namelist() if n.startswith(BLOB_PREFIX)]
+
+
+class TestAppArtifacts:
+    def test_package(self, app_dir):
+        data = zip_directory_to_bytes(app_dir, "")
+        package = AppPackage.from_zip(data)
+        assert sorted(package.files) == ["config/config_fed_client.json", "custom/copy.py", "custom/trainer.py"]
+        assert package.dirs == ["config", "custom", "custom/empty"]
+        assert len(package.get_digests()) == 2
+
+        # same content, same digest
+        copy = AppPackage.from_zip(package.to_zip())
+        assert copy.digest == package.digest
+        assert copy.files == package.files and copy.dirs == package.dirs
+
+        # the app folder in a job zip
+        job = zip_directory_to_bytes(os.path.dirname(app_dir), "app")
+        assert AppPackage.from_zip(job, folder="app").digest == package.digest
+
+        (open(os.path.join(app_dir, "config", "config_fed_client.json"), "w")).write("{}")
+        assert AppPackage.from_zip(zip_directory_to_bytes(app_dir, "")).digest != package.digest
+
+    def test_deploy(self, app_dir, tmp_path):
+        package = AppPackage.from_zip(zip_directory_to_bytes(app_dir, ""))
+        cache = ArtifactCache(str(tmp_path / "cache"))
+
+        with pytest.raises(MissingArtifactsError) as e:
+            cache.load_package(package.make_deploy_data(package.get_digests()))
+        assert sorted(e.value.digests) == sorted(package.get_digests())
+
+        deploy_data = package.make_deploy_data(set())
+        assert sorted(_blobs(deploy_data)) == sorted(package.get_digests())
+        loaded = cache.load_package(deploy_data)
+        assert loaded.digest == package.digest and loaded.files == package.files
+
+        # only the manifest
+        assert cache.load_package(package.make_deploy_data(package.get_digests())).files == package.files
+
+    def test_cache(self, tmp_path):
+        cache = ArtifactCache(str(tmp_path), max_size=250)
+        digests = []
+        for i in range(3):
+            digests.append(cache.put(bytes([i]) * 100))
+            time.sleep(0.01)
+        assert cache.get(digests[0]) == bytes([0]) * 100
+
+        cache.evict()
+        # the least recently used one is removed
+        assert [cache.has(d) for d in digests] == [True, False, True]
+
+        with pytest.raises(ValueError):
+            cache.put(b"abc", content_hash(b"abd"))
+        with pytest.raises(ValueError):
+            cache.get("../../etc/passwd")
+
+    def test_manager(self, app_dir):
+        manager = DeployArtifactManager(max_cached_apps=1)
+        package = AppPackage.from_zip(zip_directory_to_bytes(app_dir, ""))
+        assert manager.get_app_zip(package) is manager.get_app_zip(package)
+
+        assert manager.get_deploy_data(package, "site-1") is None
+        manager.deployed("site-1", package)
+        assert _blobs(manager.get_deploy_data(package, "site-1")) == []
+
+        manager.reset("site-1")
+        assert manager.get_deploy_data(package, "site-1") is None
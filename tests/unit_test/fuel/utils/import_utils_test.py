@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+import types
+
 import pytest
 
-from nvflare.fuel.utils.import_utils import LazyImportError, optional_import
+from nvflare.fuel.utils.import_utils import LazyImportError, lazy_attributes, optional_import
 
 
 class TestOptionalImport:
@@ -55,3 +58,24 @@ class TestOptionalImport:
             conv, flag = optional_import(module="torch.nn.functional", op=">=", version="42", name="conv1d")
             # trying to use a function from the not successfully imported module (due to unmatched version)
             print(conv())
+
+
+class TestLazyAttributes:
+    def test_lazy_attributes(self):
+        module = types.ModuleType("lazy_test_module")
+        module.__getattr__, module.__dir__ = lazy_attributes(module.__name__, {"OrderedDict": "collections"})
+        sys.modules[module.__name__] = module
+        try:
+            assert "OrderedDict" not in vars(module)
+            assert "OrderedDict" in dir(module)
+
+            from collections import OrderedDict
+
+            assert module.OrderedDict is OrderedDict
+            # cached in the module
+            assert vars(module)["OrderedDict"] is OrderedDict
+
+            with pytest.raises(AttributeError):
+                print(module.Counter)
+        finally:
+            del sys.modules[module.__name__]
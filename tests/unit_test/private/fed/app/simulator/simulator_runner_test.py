@@ -25,9 +25,14 @@ from unittest.mock import Mock, patch
 import pytest
 
 from nvflare.apis.fl_constant import FLContextKey, MachineStatus, WorkspaceConstants
+from nvflare.app_common.decomposers.numpy_decomposers import NumpyArrayDecomposer
+from nvflare.fuel.utils.config_service import ConfigService
+from nvflare.fuel.utils.fobs.decomposers.via_file import set_shared_memory_default
 from nvflare.private.fed.app.simulator.simulator_runner import SimulatorClientRunner, SimulatorRunner
 from nvflare.private.fed.utils.fed_utils import split_gpus
 
+SHARED_MEMORY_ENV_VAR = "NVFLARE_VIA_FILE_SHARED_MEMORY"
+
 
 class MockCell:
     def get_root_url_for_child(self):
@@ -44,6 +49,7 @@ class TestSimulatorRunner:
         os.makedirs(os.path.join(self.cwd, self.workspace_name, WorkspaceConstants.STARTUP_FOLDER_NAME))
 
     def teardown_method(self, method):
+        set_shared_memory_default(False)
         os.chdir(self.cwd)
         shutil.rmtree(os.path.join(self.cwd, self.workspace_name))
 
@@ -62,6 +68,38 @@ class TestSimulatorRunner:
             client_names.append(client)
         assert sorted(client_names) == sorted(expected_clients)
 
+    @patch("nvflare.private.fed.app.deployer.simulator_deployer.SimulatorServer.deploy")
+    @patch("nvflare.private.fed.app.utils.FedAdminServer")
+    @patch("nvflare.private.fed.client.fed_client.FederatedClient.register")
+    @patch("nvflare.private.fed.server.fed_server.BaseServer.get_cell", return_value=MockCell())
+    def test_threads_per_cpu_core(self, mock_deploy, mock_admin, mock_register, mock_cell):
+        job_folder = os.path.join(os.path.dirname(__file__), "../../../../data/jobs/valid_job")
+        runner = SimulatorRunner(job_folder=job_folder, workspace=self.workspace_name, threads=0)
+        assert runner.setup()
+        assert runner.args.threads == min(os.cpu_count(), 2)
+
+    @patch("nvflare.private.fed.app.deployer.simulator_deployer.SimulatorServer.deploy")
+    @patch("nvflare.private.fed.app.utils.FedAdminServer")
+    @patch("nvflare.private.fed.client.fed_client.FederatedClient.register")
+    @patch("nvflare.private.fed.server.fed_server.BaseServer.get_cell", return_value=MockCell())
+    def test_shared_memory_setup(self, mock_deploy, mock_admin, mock_register, mock_cell):
+        job_folder = os.path.join(os.path.dirname(__file__), "../../../../data/jobs/valid_job")
+        runner = SimulatorRunner(job_folder=job_folder, workspace=self.workspace_name, threads=1)
+        with patch.dict(os.environ):
+            os.environ.pop(SHARED_MEMORY_ENV_VAR, None)
+            try:
+                assert runner.setup()
+                # enabled for the decomposers of the simulator, without changing the environment of the clients
+                assert NumpyArrayDecomposer().shared_memory
+                assert SHARED_MEMORY_ENV_VAR not in os.environ
+
+                # the setting of the user is honored
+                os.environ[SHARED_MEMORY_ENV_VAR] = "false"
+                assert not NumpyArrayDecomposer().shared_memory
+            finally:
+                # the value of the var is kept by ConfigService
+                ConfigService.reset()
+
     @patch("nvflare.private.fed.app.deployer.simulator_deployer.SimulatorServer.deploy")
     @patch("nvflare.private.fed.app.utils.FedAdminServer")
     @patch("nvflare.private.fed.client.fed_client.FederatedClient.register")
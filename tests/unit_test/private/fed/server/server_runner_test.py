@@ -0,0 +1,110 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+from unittest.mock import MagicMock, Mock
+
+from nvflare.apis.client import Client
+from nvflare.apis.controller_spec import Task
+from nvflare.apis.fl_constant import FLContextKey
+from nvflare.apis.fl_context import FLContextManager
+from nvflare.apis.impl.wf_comm_server import WFCommServer
+from nvflare.apis.server_engine_spec import ServerEngineSpec
+from nvflare.apis.shareable import Shareable
+from nvflare.private.defs import TaskConstant
+from nvflare.private.fed.server.server_runner import ServerRunner, ServerRunnerConfig
+
+TASK_REQUEST_INTERVAL = 2.0
+
+
+def _setup_runner(max_long_polls=None):
+    client = Client("site-1", "token")
+    engine = Mock(spec=ServerEngineSpec)
+    context_manager = FLContextManager(engine=engine, identity_name="server", job_id="job_1")
+    engine.new_context.side_effect = context_manager.new_context
+    engine.get_clients.return_value = [client]
+
+    communicator = WFCommServer(task_check_period=0.1)
+    communicator.controller = MagicMock()
+    communicator.initialize_run(context_manager.new_context())
+
+    config = ServerRunnerConfig(
+        heartbeat_timeout=60,
+        task_request_interval=TASK_REQUEST_INTERVAL,
+        workflows=[],
+        task_data_filters={},
+        task_result_filters={},
+    )
+    runner = ServerRunner(config=config, job_id="job_1", engine=engine)
+    runner.current_wf = MagicMock()
+    runner.current_wf.controller.communicator = communicator
+    if max_long_polls:
+        runner.max_long_polls = max_long_polls
+    return runner, communicator, context_manager, client
+
+
+class TestServerRunnerLongPoll:
+    def test_held_request_gets_new_task(self):
+        runner, communicator, context_manager, client = _setup_runner()
+        fl_ctx = context_manager.new_context()
+        results = []
+
+        def _get_task():
+            results.append(runner._try_to_get_task(client, context_manager.new_context(), timeout=10.0))
+
+        t = threading.Thread(target=_get_task)
+        t.start()
+        time.sleep(0.3)
+        assert not results
+
+        start = time.time()
+        communicator.broadcast(Task(name="train", data=Shareable()), fl_ctx, targets=[client])
+        t.join(timeout=5.0)
+        assert not t.is_alive()
+        assert time.time() - start < 1.0
+        assert results[0][0] == "train"
+        communicator.finalize_run(fl_ctx)
+
+    def test_held_request_times_out(self):
+        runner, communicator, context_manager, client = _setup_runner()
+        fl_ctx = context_manager.new_context()
+        start = time.time()
+        task_name, _, _ = runner._try_to_get_task(client, fl_ctx, timeout=0.5)
+        assert task_name == ""
+        assert 0.5 <= time.time() - start < 2.0
+
+        # not held without timeout
+        start = time.time()
+        task_name, _, _ = runner._try_to_get_task(client, fl_ctx)
+        assert task_name == ""
+        assert time.time() - start < 0.5
+        communicator.finalize_run(fl_ctx)
+
+    def test_long_poll_limit_and_stats(self):
+        runner, communicator, context_manager, client = _setup_runner(max_long_polls=1)
+        fl_ctx = context_manager.new_context()
+        fl_ctx.set_prop(FLContextKey.GET_TASK_LONG_POLL_TIME, 5.0, private=True, sticky=False)
+        assert runner._reserve_long_poll(fl_ctx) == 5.0
+
+        # the limit is reached
+        assert runner._reserve_long_poll(fl_ctx) == 0.0
+
+        runner._release_long_poll(held_time=5.0, got_task=True)
+        assert runner._reserve_long_poll(fl_ctx) == 5.0
+        assert runner.long_poll_stats == {"held": 1, "rejected": 1, "got_task": 1, "polls_saved": 2}
+
+        # a held request already waited for part of the interval
+        _, _, task_data = runner._task_try_again(held_time=5.0)
+        assert task_data.get_header(TaskConstant.WAIT_TIME) == 0.0
+        communicator.finalize_run(fl_ctx)
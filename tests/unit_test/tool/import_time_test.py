@@ -0,0 +1,60 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from nvflare.tool.import_time import ImportRecord, get_import_secs, parse_import_times, profile_imports
+
+IMPORT_TIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       150 |        150 | _io
+import time:       323 |      91785 | nvflare.client
+import time:     25087 |      41686 |   nvflare
+import time:       567 |        567 |     nvflare._version
+something else
+"""
+
+
+class TestImportTime:
+    def test_parse(self):
+        records = parse_import_times(IMPORT_TIME_OUTPUT)
+        assert records == [
+            ImportRecord("_io", 0.00015, 0.00015, 0),
+            ImportRecord("nvflare.client", 0.000323, 0.091785, 0),
+            ImportRecord("nvflare", 0.025087, 0.041686, 1),
+            ImportRecord("nvflare._version", 0.000567, 0.000567, 2),
+        ]
+        assert get_import_secs(records, "nvflare.client") == 0.091785
+        assert get_import_secs(records, "nvflare.app_opt") == 0.0
+
+    @pytest.mark.parametrize(
+        "module, lazy",
+        [
+            ("nvflare", ["nvflare.job_config", "nvflare.private.fed.app.simulator", "nvflare.client"]),
+            ("nvflare.client", ["nvflare.job_config", "nvflare.private.fed.app.simulator", "nvflare.fuel.f3.cellnet"]),
+        ],
+    )
+    def test_lazy_imports(self, module, lazy):
+        records = profile_imports(module)
+        assert get_import_secs(records, module) > 0
+        imported = [r.module for r in records if any(r.module.startswith(p) for p in lazy)]
+        assert imported == []
+
+    def test_lazy_attributes(self):
+        import nvflare
+        import nvflare.client
+
+        assert nvflare.FedJob.__module__ == "nvflare.job_config.api"
+        assert nvflare.SimulatorRunner.__name__ == "SimulatorRunner"
+        assert nvflare.client.IPCAgent.__module__ == "nvflare.client.ipc.ipc_agent"
+        with pytest.raises(AttributeError):
+            print(nvflare.NoSuchClass)